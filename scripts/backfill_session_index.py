@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Chat Session Index Backfill
+
+Indexes conversations stored before the session sorted-set index existed so that
+GET /api/v1/chat/sessions (history sidebar) lists them. New and updated
+conversations are indexed automatically by save_conversation_turn.
+
+The backfill SCANs conversation:* once, reads each document in pipelined batches
+and upserts the index entries. It is idempotent and safe to re-run.
+
+Usage:
+    python scripts/backfill_session_index.py
+    python scripts/backfill_session_index.py --batch-size 500
+"""
+
+import argparse
+import asyncio
+
+from src.components.memory import get_redis_memory, get_session_index
+
+
+async def main(batch_size: int) -> None:
+    redis_memory = get_redis_memory()
+    try:
+        indexed = await get_session_index().backfill(batch_size=batch_size)
+        print(f"Indexed {indexed} conversation sessions")
+    finally:
+        await redis_memory.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill the chat session index")
+    parser.add_argument(
+        "--batch-size", type=int, default=100, help="SCAN count / pipeline batch size"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size))
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""MessageBus hop latency and Redis ops benchmark.
+
+Runs a ping-pong between two agents (request -> worker -> response) against a
+real Redis and reports per-hop latency and Redis commands per message for:
+
+  - polling: the previous delivery loop (ZPOPMIN + 100 ms sleep while empty)
+  - pubsub:  sender and recipient on different MessageBus instances
+             (Redis queue + pub/sub wakeup, i.e. cross-worker delivery)
+  - local:   sender and recipient on the same MessageBus instance
+             (in-process fast path, no Redis round trip)
+
+Redis ops are read from INFO stats (total_commands_processed), so run it
+against an otherwise idle Redis for clean numbers.
+
+Usage:
+    poetry run python scripts/benchmark_message_bus.py
+    poetry run python scripts/benchmark_message_bus.py --messages 200 --mode pubsub
+    poetry run python scripts/benchmark_message_bus.py --redis-url redis://localhost:6379/5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from redis.asyncio import Redis  # noqa: E402
+
+from src.agents.messaging.message_bus import (  # noqa: E402
+    QUEUE_KEY_PREFIX,
+    AgentMessage,
+    MessageBus,
+    MessageType,
+)
+from src.core.config import settings  # noqa: E402
+
+MODES = ("polling", "pubsub", "local")
+
+
+class PollingMessageBus(MessageBus):
+    """MessageBus with the previous enqueue and polling receive loop, for comparison."""
+
+    async def _enqueue_messages(self, agent_ids: list[str], message: AgentMessage) -> None:
+        redis_client = await self.client
+        message_json = json.dumps(message.to_dict())
+        expiry_time = int(message.timestamp.timestamp()) + message.ttl_seconds
+        for agent_id in agent_ids:
+            queue_key = f"{QUEUE_KEY_PREFIX}{agent_id}"
+            await redis_client.zadd(queue_key, {message_json: message.queue_score})
+            await redis_client.expireat(queue_key, expiry_time)
+
+    async def receive_messages(
+        self,
+        agent_id: str,
+        max_messages: int = 10,
+        timeout_seconds: float | None = None,
+        block: bool = True,
+    ) -> list[AgentMessage]:
+        redis_client = await self.client
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        while True:
+            messages = await self._pop_remote(redis_client, agent_id, max_messages)
+            if messages or not block:
+                return messages
+            if timeout_seconds is not None and loop.time() - start >= timeout_seconds:
+                return []
+            await asyncio.sleep(0.1)
+
+
+async def _commands_processed(redis_client: Redis) -> int:
+    stats = await redis_client.info("stats")
+    return int(stats["total_commands_processed"])
+
+
+async def run_mode(mode: str, redis_url: str, messages: int) -> dict[str, float]:
+    """Run the ping-pong for one delivery mode.
+
+    Args:
+        mode: One of MODES
+        redis_url: Redis connection URL
+        messages: Number of request/response round trips
+
+    Returns:
+        Latency percentiles (ms per hop) and Redis commands per message
+    """
+    bus_class = PollingMessageBus if mode == "polling" else MessageBus
+    requester_bus = bus_class(redis_url=redis_url)
+    worker_bus = requester_bus if mode == "local" else bus_class(redis_url=redis_url)
+    for bus in {id(requester_bus): requester_bus, id(worker_bus): worker_bus}.values():
+        bus.register_agent("bench_coordinator")
+        bus.register_agent("bench_worker")
+        await bus.clear_queue("bench_coordinator")
+        await bus.clear_queue("bench_worker")
+
+    hop_latencies_ms: list[float] = []
+
+    async def worker() -> None:
+        for _ in range(messages):
+            request = await worker_bus.receive_message("bench_worker", timeout_seconds=10.0)
+            if request is None:
+                return
+            hop_latencies_ms.append((time.perf_counter() - request.payload["sent"]) * 1000)
+            await worker_bus.send_message(
+                sender="bench_worker",
+                recipient="bench_coordinator",
+                message_type=MessageType.RESULT_SHARE,
+                payload={"sent": time.perf_counter()},
+                correlation_id=request.correlation_id,
+            )
+
+    stats_client = await Redis.from_url(redis_url, decode_responses=True)
+    # Let both sides subscribe before counting
+    worker_task = asyncio.create_task(worker())
+    await asyncio.sleep(0.2)
+    commands_before = await _commands_processed(stats_client)
+    start = time.perf_counter()
+
+    for _ in range(messages):
+        await requester_bus.send_message(
+            sender="bench_coordinator",
+            recipient="bench_worker",
+            message_type=MessageType.TASK_REQUEST,
+            payload={"sent": time.perf_counter()},
+        )
+        response = await requester_bus.receive_message("bench_coordinator", timeout_seconds=10.0)
+        if response is None:
+            raise RuntimeError(f"{mode}: response timed out")
+        hop_latencies_ms.append((time.perf_counter() - response.payload["sent"]) * 1000)
+
+    elapsed = time.perf_counter() - start
+    await worker_task
+    # INFO itself is one command
+    commands = await _commands_processed(stats_client) - commands_before - 1
+
+    await stats_client.close()
+    await requester_bus.close()
+    if worker_bus is not requester_bus:
+        await worker_bus.close()
+
+    latencies = sorted(hop_latencies_ms)
+    return {
+        "hops": len(latencies),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "mean_ms": statistics.fmean(latencies),
+        "redis_ops_per_message": commands / len(latencies),
+        "elapsed_s": elapsed,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="MessageBus hop latency benchmark")
+    parser.add_argument("--redis-url", default=settings.redis_memory_url)
+    parser.add_argument("--messages", type=int, default=100, help="Round trips per mode")
+    parser.add_argument("--mode", choices=MODES, action="append", help="Mode(s) to run")
+    args = parser.parse_args()
+
+    print(f"{'mode':<10}{'hops':>6}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}{'ops/msg':>10}")
+    for mode in args.mode or MODES:
+        result = await run_mode(mode, args.redis_url, args.messages)
+        print(
+            f"{mode:<10}{result['hops']:>6}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+            f"{result['mean_ms']:>10.2f}{result['redis_ops_per_message']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
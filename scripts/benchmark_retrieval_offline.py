@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Offline microbenchmarks for the retrieval hot path.
+
+Runs FourWayHybridSearch, weighted RRF, QueryCache, CrossEncoderReranker and
+AdaptiveChunker against local stand-ins (Qdrant in-memory mode, Neo4j replay
+client, deterministic embeddings) and reports per-stage timings and
+allocations. No Qdrant, Neo4j or Ollama is needed.
+
+Exits with status 1 if a stage regressed beyond the thresholds compared to
+the baseline (tests/benchmarks/offline/baseline.json by default).
+
+Usage:
+    poetry run python scripts/benchmark_retrieval_offline.py
+    poetry run python scripts/benchmark_retrieval_offline.py --output report.json
+    poetry run python scripts/benchmark_retrieval_offline.py --stage four_way --stage fusion
+    poetry run python scripts/benchmark_retrieval_offline.py --update-baseline
+    poetry run python scripts/benchmark_retrieval_offline.py \\
+        --neo4j-recording recording.json --neo4j-latency-ms 2
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.benchmarks.offline.harness import (  # noqa: E402
+    BASELINE_PATH,
+    SuiteConfig,
+    compare_to_baseline,
+    format_report,
+    load_report,
+    run_suite,
+    save_report,
+)
+
+
+def main() -> int:
+    defaults = SuiteConfig()
+    parser = argparse.ArgumentParser(description="Offline retrieval hot-path benchmarks")
+    parser.add_argument("--iterations", type=int, default=defaults.iterations)
+    parser.add_argument("--warmup", type=int, default=defaults.warmup)
+    parser.add_argument("--alloc-iterations", type=int, default=defaults.alloc_iterations)
+    parser.add_argument("--chunks", type=int, default=defaults.num_chunks, help="Corpus size")
+    parser.add_argument("--top-k", type=int, default=defaults.top_k)
+    parser.add_argument(
+        "--stage", action="append", default=[], help="Only run stages with this name prefix"
+    )
+    parser.add_argument(
+        "--neo4j-recording", help="Replay a recording captured with RecordingNeo4jClient"
+    )
+    parser.add_argument("--neo4j-latency-ms", type=float, default=defaults.neo4j_latency_ms)
+    parser.add_argument("--output", help="Write the JSON report here ('-' for stdout)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Save this run as the new baseline"
+    )
+    parser.add_argument(
+        "--max-latency-regression", type=float, default=1.0, help="Allowed ratio (1.0 = 2x)"
+    )
+    parser.add_argument("--max-memory-regression", type=float, default=0.25)
+    args = parser.parse_args()
+
+    config = SuiteConfig(
+        iterations=args.iterations,
+        warmup=args.warmup,
+        alloc_iterations=args.alloc_iterations,
+        num_chunks=args.chunks,
+        top_k=args.top_k,
+        neo4j_recording=args.neo4j_recording,
+        neo4j_latency_ms=args.neo4j_latency_ms,
+        stages=args.stage,
+    )
+    report = asyncio.run(run_suite(config))
+
+    if args.output == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+        if args.output:
+            save_report(report, args.output)
+            print(f"\nReport written to {args.output}")
+
+    if report["neo4j"].get("misses"):
+        print(f"\nWARNING: {report['neo4j']['misses']} Neo4j queries had no recorded response")
+
+    if args.update_baseline:
+        save_report(report, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; skipping regression gate")
+        return 0
+
+    baseline = load_report(args.baseline)
+    if {**baseline["config"], "stages": []} != {**report["config"], "stages": []}:
+        print("WARNING: baseline was recorded with a different configuration")
+
+    regressions = compare_to_baseline(
+        report,
+        baseline,
+        max_latency_regression=args.max_latency_regression,
+        max_memory_regression=args.max_memory_regression,
+    )
+    if regressions:
+        print("\nPerformance regressions:", file=sys.stderr)
+        for message in regressions:
+            print(f"  {message}", file=sys.stderr)
+        return 1
+
+    print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Import-time profile of the API entry point.
+
+Imports ``src.api.main`` in a fresh interpreter with ``python -X importtime``
+and reports the modules and top-level packages that cost the most, for the
+eager (default) and lazy (API_LAZY_STARTUP=true) startup modes. The lazy
+number is what a replica pays before it can answer ``/health``.
+
+Self time is attributed to each module exactly once, so the per-package
+totals add up to the overall import time; cumulative time includes
+everything a module imported first.
+
+Usage:
+    poetry run python scripts/profile_import_time.py
+    poetry run python scripts/profile_import_time.py --mode lazy --top 30
+    poetry run python scripts/profile_import_time.py --module src.api.v1.chat
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+MODES = {"eager": "false", "lazy": "true"}
+
+# "import time:       123 |        456 |     package.module"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def profile_imports(module: str, lazy: bool) -> list[ImportRecord]:
+    """Import a module in a fresh interpreter and collect import timings.
+
+    Args:
+        module: Module to import (e.g. src.api.main)
+        lazy: Value for API_LAZY_STARTUP
+
+    Returns:
+        Import records in completion order
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    env = {**os.environ, "API_LAZY_STARTUP": "true" if lazy else "false"}
+    result = subprocess.run(  # nosec B603 - fixed interpreter and arguments
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    records = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append(
+                ImportRecord(
+                    module=name,
+                    self_us=int(self_us),
+                    cumulative_us=int(cumulative_us),
+                    depth=len(indent) // 2,
+                )
+            )
+    return records
+
+
+def report(records: list[ImportRecord], top: int) -> None:
+    """Print total time, top packages and top modules.
+
+    Args:
+        records: Import records from profile_imports()
+        top: Number of rows per table
+    """
+    total_us = sum(record.self_us for record in records)
+    print(f"total import time: {total_us / 1e6:.2f}s ({len(records)} modules)\n")
+
+    packages: dict[str, int] = defaultdict(int)
+    for record in records:
+        packages[record.module.split(".")[0]] += record.self_us
+
+    print(f"{'package':<40}{'self s':>10}{'share':>8}")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"{package:<40}{self_us / 1e6:>10.2f}{self_us / total_us:>8.1%}")
+
+    print(f"\n{'module':<60}{'cumulative s':>14}{'self s':>10}")
+    by_cumulative = sorted(records, key=lambda record: -record.cumulative_us)
+    for record in by_cumulative[:top]:
+        print(
+            f"{record.module:<60}{record.cumulative_us / 1e6:>14.2f}{record.self_us / 1e6:>10.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import-time profile of the API entry point")
+    parser.add_argument("--module", default="src.api.main", help="Module to import")
+    parser.add_argument("--mode", choices=MODES, action="append", help="Startup mode(s)")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table")
+    args = parser.parse_args()
+
+    for mode in args.mode or list(MODES):
+        print(f"=== {args.module} (API_LAZY_STARTUP={MODES[mode]}) ===")
+        report(profile_imports(args.module, lazy=mode == "lazy"), args.top)
+        print()
+
+
+if __name__ == "__main__":
+    main()
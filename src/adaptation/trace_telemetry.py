@@ -9,12 +9,16 @@ signals, and structured event logging.
 Architecture:
     The UnifiedTracer logs all pipeline events in JSONL format for easy parsing
     and analysis. Each event captures latency, token usage, cache hits, and
-    stage-specific metadata. Events are persisted to disk with automatic
-    rotation and compression.
+    stage-specific metadata. Events are persisted to hourly segments grouped
+    in daily directories (``traces_segments/YYYY-MM-DD/HH.jsonl``). Finished
+    segments are rolled up into summaries (latency histogram, tokens, cache
+    hits, per-stage counts) that double as a time/stage index, so range
+    queries only touch the relevant segments and mostly read summaries.
 
 Features:
     - Low-overhead event logging (<5ms per event)
     - JSONL format for streaming analysis
+    - Time-partitioned segments with pre-aggregated summaries
     - Time-range metrics aggregation
     - Cache hit tracking
     - Quality signals (relevance scores, citation coverage)
@@ -82,8 +86,13 @@ See Also:
 
 import asyncio
 import json
+import math
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from dataclasses import asdict, dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -165,6 +174,240 @@ class TraceEvent:
     user_id: str | None = None
 
 
+# Segmented trace store layout (Sprint 67.5 follow-up):
+#   data/traces/traces.jsonl                       legacy single log (still read)
+#   data/traces/traces_segments/2026-10-16/14.jsonl  hourly segment (daily directory)
+#   data/traces/traces_segments/2026-10-16/14.summary.json  roll-up of a finished segment
+SEGMENT_DIR_SUFFIX = "_segments"
+SUMMARY_SUFFIX = ".summary.json"
+SUMMARY_VERSION = 1
+
+# A segment without writes for this long is treated as finished and rolled up.
+# Summaries record the segment size they were built from, so a late append
+# simply invalidates the summary until the next roll-up.
+SUMMARY_IDLE_SECONDS = 300.0
+
+# Relative accuracy of percentiles read from summaries (log-bucketed histogram)
+LATENCY_SKETCH_ACCURACY = 0.01
+_SKETCH_GAMMA = (1 + LATENCY_SKETCH_ACCURACY) / (1 - LATENCY_SKETCH_ACCURACY)
+_SKETCH_LOG_GAMMA = math.log(_SKETCH_GAMMA)
+_ZERO_BUCKET = -(2**31)
+
+
+def _partition_time(timestamp: datetime) -> datetime:
+    """Map a timestamp to its naive partition time (UTC for aware timestamps)."""
+    if timestamp.tzinfo is not None:
+        return timestamp.astimezone(UTC).replace(tzinfo=None)
+    return timestamp
+
+
+def trace_segment_paths(
+    log_path: str | Path,
+    time_range: tuple[datetime, datetime] | None = None,
+) -> list[Path]:
+    """List trace files that may contain events in a time range.
+
+    Only hourly segments overlapping ``time_range`` are returned; the legacy
+    single-file log is always included (first) when it exists.
+
+    Args:
+        log_path: Path of the tracer's JSONL log (e.g. data/traces/traces.jsonl)
+        time_range: Optional (start_time, end_time) filter
+
+    Returns:
+        Existing trace files in chronological order
+    """
+    log_path = Path(log_path)
+    paths = [log_path] if log_path.exists() else []
+
+    segment_dir = log_path.parent / f"{log_path.stem}{SEGMENT_DIR_SUFFIX}"
+    if not segment_dir.is_dir():
+        return paths
+
+    start = end = None
+    if time_range:
+        start, end = (_partition_time(bound) for bound in time_range)
+
+    for day_dir in sorted(segment_dir.iterdir()):
+        try:
+            day = datetime.strptime(day_dir.name, "%Y-%m-%d")
+        except ValueError:
+            continue
+        if start and end and not (day <= end and day + timedelta(days=1) > start):
+            continue
+        for segment in sorted(day_dir.glob("[0-9][0-9].jsonl")):
+            hour_start = day + timedelta(hours=int(segment.stem))
+            if (
+                start
+                and end
+                and not (hour_start <= end and hour_start + timedelta(hours=1) > start)
+            ):
+                continue
+            paths.append(segment)
+
+    return paths
+
+
+def _sketch_bucket(latency_ms: float) -> int:
+    if latency_ms <= 0:
+        return _ZERO_BUCKET
+    return math.ceil(math.log(latency_ms) / _SKETCH_LOG_GAMMA)
+
+
+def _sketch_value(bucket: int) -> float:
+    if bucket == _ZERO_BUCKET:
+        return 0.0
+    return 2 * _SKETCH_GAMMA**bucket / (_SKETCH_GAMMA + 1)
+
+
+class _TraceAggregate:
+    """Mergeable latency/token/cache-hit aggregate over trace events.
+
+    Used both for on-the-fly aggregation of raw events and as the on-disk
+    roll-up of a finished segment. Percentiles are exact while only raw events
+    were added and come from the log-bucketed histogram (±1%) once a summary
+    has been merged in.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.latency_sum = 0.0
+        self.latency_buckets: dict[int, int] = {}
+        self.exact_latencies: list[float] | None = []
+        self.total_tokens = 0
+        self.cache_hits = 0
+        self.cache_events = 0
+        self.stages: dict[str, dict[str, float]] = {}
+        self.start: datetime | None = None
+        self.end: datetime | None = None
+        self.segment_bytes = 0
+
+    def add(self, event_dict: dict[str, Any], event_time: datetime) -> None:
+        latency = event_dict["latency_ms"]
+        tokens = event_dict.get("tokens_used")
+
+        self.count += 1
+        self.latency_sum += latency
+        bucket = _sketch_bucket(latency)
+        self.latency_buckets[bucket] = self.latency_buckets.get(bucket, 0) + 1
+        if self.exact_latencies is not None:
+            self.exact_latencies.append(latency)
+        if tokens:
+            self.total_tokens += tokens
+        if event_dict.get("cache_hit") is not None:
+            self.cache_events += 1
+            self.cache_hits += 1 if event_dict["cache_hit"] else 0
+
+        stage = self.stages.setdefault(
+            event_dict["stage"],
+            {"count": 0, "latency_sum": 0.0, "tokens_sum": 0, "tokens_count": 0},
+        )
+        stage["count"] += 1
+        stage["latency_sum"] += latency
+        if tokens:
+            stage["tokens_sum"] += tokens
+            stage["tokens_count"] += 1
+
+        if self.start is None or event_time < self.start:
+            self.start = event_time
+        if self.end is None or event_time > self.end:
+            self.end = event_time
+
+    def merge(self, other: "_TraceAggregate") -> None:
+        self.count += other.count
+        self.latency_sum += other.latency_sum
+        for bucket, count in other.latency_buckets.items():
+            self.latency_buckets[bucket] = self.latency_buckets.get(bucket, 0) + count
+        if self.exact_latencies is not None and other.exact_latencies is not None:
+            self.exact_latencies.extend(other.exact_latencies)
+        else:
+            self.exact_latencies = None
+        self.total_tokens += other.total_tokens
+        self.cache_hits += other.cache_hits
+        self.cache_events += other.cache_events
+        for name, other_stage in other.stages.items():
+            stage = self.stages.setdefault(
+                name, {"count": 0, "latency_sum": 0.0, "tokens_sum": 0, "tokens_count": 0}
+            )
+            for key, value in other_stage.items():
+                stage[key] += value
+        if other.start is not None and (self.start is None or other.start < self.start):
+            self.start = other.start
+        if other.end is not None and (self.end is None or other.end > self.end):
+            self.end = other.end
+
+    def percentile(self, fraction: float) -> float:
+        rank = min(int(self.count * fraction), self.count - 1)
+        if self.exact_latencies is not None:
+            return sorted(self.exact_latencies)[rank]
+
+        seen = 0
+        for bucket in sorted(self.latency_buckets):
+            seen += self.latency_buckets[bucket]
+            if seen > rank:
+                return _sketch_value(bucket)
+        return 0.0
+
+    def to_metrics(self) -> dict[str, Any]:
+        stage_metrics = {}
+        for name, stage in self.stages.items():
+            avg_tokens = stage["tokens_sum"] / stage["tokens_count"] if stage["tokens_count"] else 0
+            stage_metrics[name] = {
+                "count": int(stage["count"]),
+                "avg_latency_ms": round(stage["latency_sum"] / stage["count"], 2),
+                "avg_tokens": round(avg_tokens, 2) if avg_tokens else None,
+            }
+
+        cache_hit_rate = self.cache_hits / self.cache_events if self.cache_events else 0.0
+        return {
+            "total_events": self.count,
+            "avg_latency_ms": round(self.latency_sum / self.count, 2),
+            "p95_latency_ms": round(self.percentile(0.95), 2),
+            "total_tokens": self.total_tokens,
+            "cache_hit_rate": round(cache_hit_rate, 4),
+            "stage_breakdown": stage_metrics,
+        }
+
+    def to_summary(self) -> dict[str, Any]:
+        return {
+            "version": SUMMARY_VERSION,
+            "segment_bytes": self.segment_bytes,
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "count": self.count,
+            "latency_sum": self.latency_sum,
+            "latency_buckets": {str(k): v for k, v in self.latency_buckets.items()},
+            "total_tokens": self.total_tokens,
+            "cache_hits": self.cache_hits,
+            "cache_events": self.cache_events,
+            "stages": self.stages,
+        }
+
+    @classmethod
+    def from_summary(cls, data: dict[str, Any]) -> "_TraceAggregate":
+        aggregate = cls()
+        aggregate.exact_latencies = None
+        aggregate.segment_bytes = data["segment_bytes"]
+        aggregate.start = datetime.fromisoformat(data["start"]) if data["start"] else None
+        aggregate.end = datetime.fromisoformat(data["end"]) if data["end"] else None
+        aggregate.count = data["count"]
+        aggregate.latency_sum = data["latency_sum"]
+        aggregate.latency_buckets = {int(k): v for k, v in data["latency_buckets"].items()}
+        aggregate.total_tokens = data["total_tokens"]
+        aggregate.cache_hits = data["cache_hits"]
+        aggregate.cache_events = data["cache_events"]
+        aggregate.stages = data["stages"]
+        return aggregate
+
+    def within(self, start_time: datetime, end_time: datetime) -> bool:
+        """Whether every aggregated event lies inside [start_time, end_time]."""
+        return self.start is None or (start_time <= self.start and self.end <= end_time)
+
+    def overlaps(self, start_time: datetime, end_time: datetime) -> bool:
+        """Whether any aggregated event may lie inside [start_time, end_time]."""
+        return self.start is not None and self.start <= end_time and self.end >= start_time
+
+
 class UnifiedTracer:
     """Unified tracer for RAG pipeline events.
 
@@ -241,21 +484,31 @@ class UnifiedTracer:
             - Creates parent directories if they don't exist
             - Does NOT load existing events into memory (streaming design)
             - Thread-safe for concurrent event logging
+            - New events go to hourly segments under ``<log stem>_segments/``;
+              an existing ``log_path`` file is still read as legacy log
         """
         self.log_path = Path(log_path)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.segment_dir = self.log_path.parent / f"{self.log_path.stem}{SEGMENT_DIR_SUFFIX}"
 
         # Lock for thread-safe file writes
         self._write_lock = asyncio.Lock()
+        self._known_day_dirs: set[Path] = set()
 
         logger.info(
             "UnifiedTracer initialized",
             log_path=str(self.log_path),
             log_exists=self.log_path.exists(),
+            segment_dir=str(self.segment_dir),
         )
 
+    def _segment_path(self, timestamp: datetime) -> Path:
+        """Get the hourly segment file for an event timestamp."""
+        partition = _partition_time(timestamp)
+        return self.segment_dir / partition.strftime("%Y-%m-%d") / partition.strftime("%H.jsonl")
+
     async def log_event(self, event: TraceEvent) -> None:
-        """Log pipeline event to JSONL trace file.
+        """Log pipeline event to its hourly JSONL trace segment.
 
         Args:
             event: TraceEvent instance with all metrics
@@ -278,7 +531,8 @@ class UnifiedTracer:
             >>> await tracer.log_event(event)
 
         Notes:
-            - Events are appended to JSONL file (one JSON object per line)
+            - Events are appended to <segment_dir>/<YYYY-MM-DD>/<HH>.jsonl
+              (one JSON object per line), partitioned by event timestamp
             - timestamp is serialized to ISO format
             - stage enum is serialized to string value
             - metadata is serialized as-is (must be JSON-serializable)
@@ -296,10 +550,15 @@ class UnifiedTracer:
             # Serialize to JSON line
             json_line = json.dumps(event_dict, ensure_ascii=False) + "\n"
 
+            segment_path = self._segment_path(event.timestamp)
+            if segment_path.parent not in self._known_day_dirs:
+                segment_path.parent.mkdir(parents=True, exist_ok=True)
+                self._known_day_dirs.add(segment_path.parent)
+
             # Async write with lock (Sprint 118 Fix: SIM117 - single with statement)
             async with (
                 self._write_lock,
-                aiofiles.open(self.log_path, mode="a", encoding="utf-8") as f,
+                aiofiles.open(segment_path, mode="a", encoding="utf-8") as f,
             ):
                 await f.write(json_line)
 
@@ -319,6 +578,118 @@ class UnifiedTracer:
                 exc_info=True,
             )
 
+    async def _read_segment(self, segment: Path) -> AsyncIterator[tuple[dict[str, Any], datetime]]:
+        """Stream valid events from one trace file.
+
+        Args:
+            segment: Segment (or legacy log) path
+
+        Yields:
+            (event_dict, event_time) for every well-formed event
+        """
+        # Sprint 118 Fix: UP015 - mode="r" is default
+        async with aiofiles.open(segment, encoding="utf-8") as f:
+            async for line in f:
+                try:
+                    event_dict = json.loads(line.strip())
+
+                    # Validate required fields
+                    if (
+                        "timestamp" not in event_dict
+                        or "latency_ms" not in event_dict
+                        or "stage" not in event_dict
+                    ):
+                        logger.warning("Skipping event with missing required fields")
+                        continue
+
+                    event_time = datetime.fromisoformat(event_dict["timestamp"])
+                except (json.JSONDecodeError, KeyError, ValueError) as e:
+                    logger.warning("Skipping malformed event", error=str(e))
+                    continue
+
+                yield event_dict, event_time
+
+    async def _load_summary(self, segment: Path) -> _TraceAggregate | None:
+        """Load the roll-up of a segment if it matches the segment's current size.
+
+        Args:
+            segment: Segment (or legacy log) path
+
+        Returns:
+            Summary aggregate, or None if missing or stale
+        """
+        summary_path = segment.with_name(f"{segment.stem}{SUMMARY_SUFFIX}")
+        if not summary_path.exists():
+            return None
+
+        try:
+            async with aiofiles.open(summary_path, encoding="utf-8") as f:
+                data = json.loads(await f.read())
+            if (
+                data.get("version") != SUMMARY_VERSION
+                or data.get("segment_bytes") != segment.stat().st_size
+            ):
+                return None
+            return _TraceAggregate.from_summary(data)
+        except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable trace summary", path=str(summary_path), error=str(e)
+            )
+            return None
+
+    async def _write_summary(self, segment: Path, summary: _TraceAggregate) -> None:
+        """Persist the roll-up of a finished segment (atomic replace)."""
+        summary_path = segment.with_name(f"{segment.stem}{SUMMARY_SUFFIX}")
+        tmp_path = summary_path.with_name(f"{summary_path.name}.{os.getpid()}.tmp")
+        try:
+            async with aiofiles.open(tmp_path, mode="w", encoding="utf-8") as f:
+                await f.write(json.dumps(summary.to_summary()))
+            os.replace(tmp_path, summary_path)
+            logger.debug("Trace segment rolled up", segment=str(segment), events=summary.count)
+        except OSError as e:
+            logger.warning("Failed to write trace summary", path=str(summary_path), error=str(e))
+
+    async def _aggregate_segment(
+        self, segment: Path, start_time: datetime, end_time: datetime
+    ) -> _TraceAggregate:
+        """Aggregate the events of one segment that fall into a time range.
+
+        Uses the segment's summary when the whole segment lies inside the
+        range; otherwise scans raw events, rolling the segment up on the way
+        if it is finished (idle for SUMMARY_IDLE_SECONDS) and has no summary.
+
+        Args:
+            segment: Segment (or legacy log) path
+            start_time: Range start (inclusive)
+            end_time: Range end (inclusive)
+
+        Returns:
+            Aggregate over matching events
+        """
+        summary = await self._load_summary(segment)
+        if summary is not None:
+            if summary.within(start_time, end_time):
+                return summary
+            if not summary.overlaps(start_time, end_time):
+                return _TraceAggregate()
+
+        stat = segment.stat()
+        full = None
+        if summary is None and time.time() - stat.st_mtime >= SUMMARY_IDLE_SECONDS:
+            full = _TraceAggregate()
+            full.segment_bytes = stat.st_size
+
+        in_range = _TraceAggregate()
+        async for event_dict, event_time in self._read_segment(segment):
+            if full is not None:
+                full.add(event_dict, event_time)
+            if start_time <= event_time <= end_time:
+                in_range.add(event_dict, event_time)
+
+        if full is not None:
+            await self._write_summary(segment, full)
+        return in_range
+
     async def get_metrics(self, time_range: tuple[datetime, datetime]) -> dict[str, Any]:
         """Aggregate metrics for given time range.
 
@@ -342,118 +713,44 @@ class UnifiedTracer:
             >>> print(f"Cache hit rate: {metrics['cache_hit_rate']:.2%}")
 
         Performance:
-            - Streams file (no in-memory event list)
-            - Efficient aggregation (single pass)
+            - Only reads hourly segments overlapping the range
+            - Finished segments fully inside the range are served from their
+              summary (no raw event reads)
             - Target: <500ms for 10k events
 
         Notes:
             - Returns empty metrics if no events in time range
             - All timestamps are compared in UTC
-            - Percentiles use numpy.percentile() for accuracy
+            - p95 is exact when only raw events were read, otherwise it comes
+              from the merged summary histograms (±1% relative error)
         """
         start_time, end_time = time_range
 
-        # Accumulators
-        events: list[dict[str, Any]] = []
-
-        # Stream events from JSONL file
-        if not self.log_path.exists():
-            logger.warning("Trace file does not exist", log_path=str(self.log_path))
+        segments = trace_segment_paths(self.log_path, time_range)
+        if not segments:
+            logger.warning("No trace segments in time range", log_path=str(self.log_path))
             return self._empty_metrics()
 
+        total = _TraceAggregate()
         try:
-            # Sprint 118 Fix: UP015 - mode="r" is default
-            async with aiofiles.open(self.log_path, encoding="utf-8") as f:
-                async for line in f:
-                    try:
-                        event_dict = json.loads(line.strip())
-
-                        # Validate required fields
-                        if (
-                            "timestamp" not in event_dict
-                            or "latency_ms" not in event_dict
-                            or "stage" not in event_dict
-                        ):
-                            logger.warning("Skipping event with missing required fields")
-                            continue
-
-                        # Parse timestamp
-                        event_time = datetime.fromisoformat(event_dict["timestamp"])
-
-                        # Filter by time range
-                        if start_time <= event_time <= end_time:
-                            events.append(event_dict)
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
-                        logger.warning("Skipping malformed event", error=str(e))
-                        continue
-
+            for segment in segments:
+                total.merge(await self._aggregate_segment(segment, start_time, end_time))
         except Exception as e:
             logger.error("Failed to read trace file", error=str(e), exc_info=True)
             return self._empty_metrics()
 
         # Return empty metrics if no events
-        if not events:
+        if total.count == 0:
             return self._empty_metrics()
 
-        # Aggregate metrics
-        total_events = len(events)
-        latencies = [e["latency_ms"] for e in events]
-        avg_latency = sum(latencies) / len(latencies)
-
-        # P95 latency (sorted and indexed)
-        latencies_sorted = sorted(latencies)
-        p95_index = int(len(latencies_sorted) * 0.95)
-        p95_latency = latencies_sorted[min(p95_index, len(latencies_sorted) - 1)]
-
-        # Token usage (LLM stages only)
-        tokens_list = [e["tokens_used"] for e in events if e.get("tokens_used")]
-        total_tokens = sum(tokens_list) if tokens_list else 0
-
-        # Cache hit rate
-        cache_events = [e for e in events if e.get("cache_hit") is not None]
-        cache_hits = sum(1 for e in cache_events if e["cache_hit"])
-        cache_hit_rate = cache_hits / len(cache_events) if cache_events else 0.0
-
-        # Stage breakdown
-        stage_breakdown: dict[str, dict[str, Any]] = {}
-        for event in events:
-            stage = event["stage"]
-            if stage not in stage_breakdown:
-                stage_breakdown[stage] = {
-                    "count": 0,
-                    "latencies": [],
-                    "tokens": [],
-                }
-            stage_breakdown[stage]["count"] += 1
-            stage_breakdown[stage]["latencies"].append(event["latency_ms"])
-            if event.get("tokens_used"):
-                stage_breakdown[stage]["tokens"].append(event["tokens_used"])
-
-        # Compute averages for each stage
-        stage_metrics = {}
-        for stage, data in stage_breakdown.items():
-            avg_stage_latency = sum(data["latencies"]) / len(data["latencies"])
-            avg_stage_tokens = sum(data["tokens"]) / len(data["tokens"]) if data["tokens"] else 0
-            stage_metrics[stage] = {
-                "count": data["count"],
-                "avg_latency_ms": round(avg_stage_latency, 2),
-                "avg_tokens": round(avg_stage_tokens, 2) if avg_stage_tokens else None,
-            }
-
-        metrics = {
-            "total_events": total_events,
-            "avg_latency_ms": round(avg_latency, 2),
-            "p95_latency_ms": round(p95_latency, 2),
-            "total_tokens": total_tokens,
-            "cache_hit_rate": round(cache_hit_rate, 4),
-            "stage_breakdown": stage_metrics,
-        }
+        metrics = total.to_metrics()
 
         logger.info(
             "Metrics aggregated",
             time_range=(start_time.isoformat(), end_time.isoformat()),
-            total_events=total_events,
+            total_events=metrics["total_events"],
             avg_latency_ms=metrics["avg_latency_ms"],
+            segments=len(segments),
         )
 
         return metrics
@@ -502,33 +799,37 @@ class UnifiedTracer:
             ...     print(f"{event.timestamp}: {event.latency_ms}ms")
 
         Performance:
-            - Streams file (no full load into memory)
+            - Only reads hourly segments overlapping time_range
+            - Skips finished segments whose summary has no events of the
+              requested stage or outside the time range
             - Early termination when limit is reached
             - Target: <200ms for 1k events
 
         Notes:
-            - Events are returned in file order (chronological)
+            - Events are returned in segment order (legacy log first, then
+              hourly segments chronologically; file order within a segment)
             - limit applies AFTER filters
             - Returns empty list if no matching events
         """
         events: list[TraceEvent] = []
 
-        if not self.log_path.exists():
-            return events
-
         try:
-            # Sprint 118 Fix: UP015 - mode="r" is default
-            async with aiofiles.open(self.log_path, encoding="utf-8") as f:
-                async for line in f:
-                    # Early termination if limit reached
-                    if limit and len(events) >= limit:
-                        break
-
-                    try:
-                        event_dict = json.loads(line.strip())
+            for segment in trace_segment_paths(self.log_path, time_range):
+                # Early termination if limit reached
+                if limit and len(events) >= limit:
+                    break
+
+                summary = await self._load_summary(segment)
+                if summary is not None:
+                    if stage and stage.value not in summary.stages:
+                        continue
+                    if time_range and not summary.overlaps(*time_range):
+                        continue
 
-                        # Parse timestamp
-                        event_time = datetime.fromisoformat(event_dict["timestamp"])
+                async with aclosing(self._read_segment(segment)) as segment_events:
+                    async for event_dict, event_time in segment_events:
+                        if limit and len(events) >= limit:
+                            break
 
                         # Apply time range filter
                         if time_range:
@@ -540,22 +841,21 @@ class UnifiedTracer:
                         if stage and event_dict["stage"] != stage.value:
                             continue
 
-                        # Reconstruct TraceEvent
-                        event = TraceEvent(
-                            timestamp=event_time,
-                            stage=PipelineStage(event_dict["stage"]),
-                            latency_ms=event_dict["latency_ms"],
-                            tokens_used=event_dict.get("tokens_used"),
-                            cache_hit=event_dict.get("cache_hit"),
-                            metadata=event_dict.get("metadata", {}),
-                            request_id=event_dict.get("request_id"),
-                            user_id=event_dict.get("user_id"),
-                        )
-                        events.append(event)
-
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
-                        logger.warning("Skipping malformed event", error=str(e))
-                        continue
+                        try:
+                            events.append(
+                                TraceEvent(
+                                    timestamp=event_time,
+                                    stage=PipelineStage(event_dict["stage"]),
+                                    latency_ms=event_dict["latency_ms"],
+                                    tokens_used=event_dict.get("tokens_used"),
+                                    cache_hit=event_dict.get("cache_hit"),
+                                    metadata=event_dict.get("metadata", {}),
+                                    request_id=event_dict.get("request_id"),
+                                    user_id=event_dict.get("user_id"),
+                                )
+                            )
+                        except ValueError as e:
+                            logger.warning("Skipping malformed event", error=str(e))
 
         except Exception as e:
             logger.error("Failed to read events", error=str(e), exc_info=True)
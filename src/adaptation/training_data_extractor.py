@@ -53,6 +53,7 @@ See Also:
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -61,7 +62,11 @@ from typing import Any
 import aiofiles
 import structlog
 
-from src.adaptation.trace_telemetry import PipelineStage
+from src.adaptation.trace_telemetry import (
+    SEGMENT_DIR_SUFFIX,
+    PipelineStage,
+    trace_segment_paths,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -210,6 +215,22 @@ def _compute_quality_score(event: dict[str, Any]) -> float:
     return score
 
 
+async def _iter_trace_lines(trace_files: list[Path]) -> AsyncIterator[str]:
+    """Stream lines from trace files in order.
+
+    Args:
+        trace_files: Legacy log and/or hourly segment paths
+
+    Yields:
+        Raw JSONL lines
+    """
+    for trace_file in trace_files:
+        # Sprint 118 Fix: UP015 - mode="r" is default
+        async with aiofiles.open(trace_file, encoding="utf-8") as f:
+            async for line in f:
+                yield line
+
+
 async def extract_rerank_pairs(
     trace_path: str = "data/traces/traces.jsonl",
     min_quality_score: float = 0.7,
@@ -259,7 +280,8 @@ async def extract_rerank_pairs(
         raise ValueError(f"min_quality_score must be in [0.0, 1.0], got {min_quality_score}")
 
     trace_file = Path(trace_path)
-    if not trace_file.exists():
+    segment_dir = trace_file.parent / f"{trace_file.stem}{SEGMENT_DIR_SUFFIX}"
+    if not trace_file.exists() and not segment_dir.is_dir():
         raise FileNotFoundError(f"Trace file not found: {trace_path}")
 
     logger.info(
@@ -284,80 +306,79 @@ async def extract_rerank_pairs(
     filtered_by_quality = 0
     filtered_by_missing_labels = 0
 
-    # Stream events from JSONL file (Sprint 118 Fix: UP015 - mode="r" is default)
-    async with aiofiles.open(trace_file, encoding="utf-8") as f:
-        async for line in f:
-            try:
-                event = json.loads(line.strip())
-                total_events += 1
-
-                # Filter 1: Stage must be RERANKING
-                if event.get("stage") != PipelineStage.RERANKING.value:
-                    filtered_by_stage += 1
-                    continue
-
-                # Filter 2: Time range
-                event_time = datetime.fromisoformat(event["timestamp"])
-                if not (start_time <= event_time <= end_time):
-                    continue
-
-                # Filter 3: Quality score
-                quality_score = _compute_quality_score(event)
-                if quality_score < min_quality_score:
-                    filtered_by_quality += 1
-                    continue
-
-                # Extract features from metadata
-                metadata = event.get("metadata", {})
-
-                # Filter 4: Must have all required scores
-                semantic_score = metadata.get("semantic_score")
-                keyword_score = metadata.get("keyword_score")
-                recency_score = metadata.get("recency_score")
-                query = metadata.get("query")
-                intent = metadata.get("intent", "default")
-                doc_id = metadata.get("doc_id")
-
-                if not all([semantic_score, keyword_score, recency_score, query, doc_id]):
-                    logger.debug(
-                        "skipping_event_missing_features",
-                        doc_id=doc_id,
-                        has_semantic=semantic_score is not None,
-                        has_keyword=keyword_score is not None,
-                        has_recency=recency_score is not None,
-                        has_query=query is not None,
-                    )
-                    continue
-
-                # Infer relevance label from signals
-                relevance_label = _infer_relevance_from_signals(metadata)
-                if relevance_label is None:
-                    # No relevance signals available
-                    filtered_by_missing_labels += 1
-                    continue
-
-                # Create training pair
-                pair = RerankTrainingPair(
-                    query=query,
-                    intent=intent,
+    # Stream events from the legacy log and the hourly segments in range
+    async for line in _iter_trace_lines(trace_segment_paths(trace_file, time_range)):
+        try:
+            event = json.loads(line.strip())
+            total_events += 1
+
+            # Filter 1: Stage must be RERANKING
+            if event.get("stage") != PipelineStage.RERANKING.value:
+                filtered_by_stage += 1
+                continue
+
+            # Filter 2: Time range
+            event_time = datetime.fromisoformat(event["timestamp"])
+            if not (start_time <= event_time <= end_time):
+                continue
+
+            # Filter 3: Quality score
+            quality_score = _compute_quality_score(event)
+            if quality_score < min_quality_score:
+                filtered_by_quality += 1
+                continue
+
+            # Extract features from metadata
+            metadata = event.get("metadata", {})
+
+            # Filter 4: Must have all required scores
+            semantic_score = metadata.get("semantic_score")
+            keyword_score = metadata.get("keyword_score")
+            recency_score = metadata.get("recency_score")
+            query = metadata.get("query")
+            intent = metadata.get("intent", "default")
+            doc_id = metadata.get("doc_id")
+
+            if not all([semantic_score, keyword_score, recency_score, query, doc_id]):
+                logger.debug(
+                    "skipping_event_missing_features",
                     doc_id=doc_id,
-                    semantic_score=float(semantic_score),
-                    keyword_score=float(keyword_score),
-                    recency_score=float(recency_score),
-                    relevance_label=float(relevance_label),
-                    timestamp=event["timestamp"],
-                    metadata={
-                        "quality_score": quality_score,
-                        "latency_ms": event.get("latency_ms"),
-                        "cache_hit": event.get("cache_hit"),
-                    },
+                    has_semantic=semantic_score is not None,
+                    has_keyword=keyword_score is not None,
+                    has_recency=recency_score is not None,
+                    has_query=query is not None,
                 )
-                pairs.append(pair)
+                continue
 
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                logger.warning("skipping_malformed_event", error=str(e), line=line[:100])
+            # Infer relevance label from signals
+            relevance_label = _infer_relevance_from_signals(metadata)
+            if relevance_label is None:
+                # No relevance signals available
+                filtered_by_missing_labels += 1
                 continue
 
+            # Create training pair
+            pair = RerankTrainingPair(
+                query=query,
+                intent=intent,
+                doc_id=doc_id,
+                semantic_score=float(semantic_score),
+                keyword_score=float(keyword_score),
+                recency_score=float(recency_score),
+                relevance_label=float(relevance_label),
+                timestamp=event["timestamp"],
+                metadata={
+                    "quality_score": quality_score,
+                    "latency_ms": event.get("latency_ms"),
+                    "cache_hit": event.get("cache_hit"),
+                },
+            )
+            pairs.append(pair)
+
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.warning("skipping_malformed_event", error=str(e), line=line[:100])
+            continue
+
     logger.info(
         "extraction_complete",
         total_events=total_events,
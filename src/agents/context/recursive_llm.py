@@ -235,7 +235,7 @@ class RecursiveLLMProcessor:
 
         # Lazy-load embedding service for BGE-M3 scoring (Feature 92.7, 92.8)
         self._embedding_service = None
-        self._multi_vector_model = None
+        self._model_registry = None
 
         logger.info(
             "recursive_llm_processor_initialized",
@@ -757,6 +757,11 @@ Score:"""
                 max_sim_i = max(cosine_sim(q_i, d_j) for all doc tokens d_j)
             MaxSim = mean(max_sim_i for all query tokens)
 
+        Token matrices come from the shared BGE-M3 registry (same model instance
+        as FlagEmbeddingService, encoded off the event loop). Segment matrices
+        are cached by content hash, so repeated dives into the same document
+        only encode the query.
+
         Args:
             segments: List of document segments
             query: User's query
@@ -770,39 +775,22 @@ Score:"""
             - Best for: Specific value lookups, table/figure references
         """
         try:
-            from FlagEmbedding import BGEM3FlagModel
+            import numpy as np
 
-            # Initialize multi-vector model (singleton pattern)
-            if self._multi_vector_model is None:
-                self._multi_vector_model = BGEM3FlagModel(
-                    "BAAI/bge-m3", use_fp16=True, device="auto"
-                )
-                logger.info("multi_vector_model_loaded", model="BAAI/bge-m3")
-
-            # Embed query (token-level)
-            query_result = self._multi_vector_model.encode(
-                [query],
-                return_dense=False,
-                return_sparse=False,
-                return_colbert_vecs=True,  # ColBERT-style token embeddings
-            )
-            query_token_embeddings = query_result["colbert_vecs"][0]  # Shape: (N_q, 1024)
+            # Shared model registry (lazy, model loads on first encode)
+            if self._model_registry is None:
+                from src.components.shared.bge_m3_registry import get_bge_m3_registry
 
-            # Embed all segments (token-level)
+                self._model_registry = get_bge_m3_registry()
+
+            # Embed query + segments (token-level, cached per text)
             segment_texts = [s.content[:2000] for s in segments]
-            segment_results = self._multi_vector_model.encode(
-                segment_texts,
-                return_dense=False,
-                return_sparse=False,
-                return_colbert_vecs=True,
-            )
-            segment_token_embeddings = segment_results["colbert_vecs"]  # List of (N_d, 1024)
+            token_matrices = await self._model_registry.colbert_vectors([query] + segment_texts)
+            query_token_embeddings = token_matrices[0].astype(np.float32)  # Shape: (N_q, 1024)
 
             # Compute MaxSim scores (late interaction)
-            import numpy as np
-
             for i, segment in enumerate(segments):
-                doc_tokens = segment_token_embeddings[i]  # (N_d, 1024)
+                doc_tokens = token_matrices[i + 1].astype(np.float32)  # (N_d, 1024)
 
                 # Compute similarity matrix: (N_q, N_d)
                 sim_matrix = np.dot(query_token_embeddings, doc_tokens.T)
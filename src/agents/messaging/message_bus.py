@@ -12,7 +12,9 @@ Key Features:
     - Priority-based message handling
     - Message TTL and automatic expiration
     - Request-response pattern support
-    - Broadcast messaging
+    - Broadcast messaging (one pipelined round trip for all recipients)
+    - Event-driven delivery: pub/sub wakeups instead of polling, plus an
+      in-process fast path when the recipient is waiting on the same bus
 
 Architecture:
     ┌─────────────────────────────────────────────────┐
@@ -24,9 +26,20 @@ Architecture:
     │                                                 │
     │  Permission Check: PolicyEngine                 │
     │  Storage: Redis (per-agent queues)             │
+    │  Wakeup: Redis pub/sub (agent:notify:{agent})   │
     │  Correlation: Track request-response pairs      │
     └─────────────────────────────────────────────────┘
 
+Delivery:
+    A send pipelines ZADD + EXPIREAT + PUBLISH in one round trip. A blocked
+    receiver subscribes to its agent's notify channel, pops with ZPOPMIN and
+    then sleeps on a local event until a wakeup arrives (re-checking the queue
+    every WAKEUP_RECHECK_SECONDS in case a pub/sub message was lost). If the
+    recipient is currently blocked in receive on the same MessageBus instance,
+    the message is handed over in memory without touching Redis (at most one
+    pending hand-over per blocked receiver; hand-overs left behind when a
+    receiver times out or is cancelled are moved to the Redis queue).
+
 Example:
     >>> from src.agents.messaging import MessageBus, MessageType
     >>> from src.agents.tools.policy import PolicyEngine
@@ -67,6 +80,8 @@ See Also:
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import json
 import uuid
 from dataclasses import dataclass, field
@@ -76,6 +91,7 @@ from typing import TYPE_CHECKING, Any, Callable
 
 import structlog
 from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
 
 from src.core.config import settings
 from src.core.exceptions import MemoryError
@@ -85,6 +101,13 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+QUEUE_KEY_PREFIX = "agent:queue:"
+NOTIFY_CHANNEL_PREFIX = "agent:notify:"
+
+# Re-check the Redis queue at least this often while blocked, in case a
+# pub/sub wakeup was lost (e.g. during a reconnect)
+WAKEUP_RECHECK_SECONDS = 5.0
+
 
 # =============================================================================
 # Data Models
@@ -184,6 +207,16 @@ class AgentMessage:
             "metadata": self.metadata,
         }
 
+    @property
+    def queue_score(self) -> float:
+        """Sorted-set score for priority queues (lower = delivered first)."""
+        return (10 - self.priority.value) * 1e10 + self.timestamp.timestamp()
+
+    @property
+    def is_expired(self) -> bool:
+        """Whether the message outlived its TTL."""
+        return datetime.now(UTC) > self.timestamp + timedelta(seconds=self.ttl_seconds)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AgentMessage:
         """Deserialize message from dict.
@@ -258,6 +291,17 @@ class MessageBus:
         self._pending_responses: dict[str, asyncio.Future] = {}  # correlation_id -> Future
         self._lock = asyncio.Lock()
 
+        # In-process fast path: messages for agents blocked in receive on this bus
+        self._local_queues: dict[str, list[tuple[float, int, AgentMessage]]] = {}
+        self._local_sequence = itertools.count()
+        self._waiting: dict[str, int] = {}  # agent_id -> blocked local receivers
+        self._wakeups: dict[str, asyncio.Event] = {}
+
+        # Pub/sub wakeups for messages sent from other processes
+        self._pubsub: PubSub | None = None
+        self._subscribed: set[str] = set()
+        self._listener_task: asyncio.Task | None = None
+
         logger.info(
             "message_bus_initialized",
             has_policy_engine=policy_engine is not None,
@@ -394,11 +438,10 @@ class MessageBus:
         # Send to queue(s)
         if recipient == "*":
             # Broadcast to all registered agents except sender
-            for agent_id in self._registered_agents:
-                if agent_id != sender:
-                    await self._enqueue_message(agent_id, message)
+            recipients = [agent_id for agent_id in self._registered_agents if agent_id != sender]
         else:
-            await self._enqueue_message(recipient, message)
+            recipients = [recipient]
+        await self._enqueue_messages(recipients, message)
 
         logger.info(
             "message_sent",
@@ -465,11 +508,41 @@ class MessageBus:
                 )
                 # Fail open on policy check errors (allow message)
 
-    async def _enqueue_message(self, agent_id: str, message: AgentMessage) -> None:
-        """Enqueue message in agent's Redis queue with priority.
+    async def _enqueue_messages(self, agent_ids: list[str], message: AgentMessage) -> None:
+        """Enqueue a message for one or more agents.
+
+        Agents with a receiver blocked on this bus get the message in memory,
+        at most one pending hand-over per blocked receiver. All others are
+        written in a single pipeline (ZADD + EXPIREAT + PUBLISH per agent), so
+        a broadcast costs one Redis round trip.
+
+        Args:
+            agent_ids: Agents to receive the message
+            message: Message to enqueue
+
+        Raises:
+            MemoryError: If Redis operation fails
+        """
+        remote_ids: list[str] = []
+        for agent_id in agent_ids:
+            if len(self._local_queues.get(agent_id, ())) < self._waiting.get(agent_id, 0):
+                heapq.heappush(
+                    self._local_queues.setdefault(agent_id, []),
+                    (message.queue_score, next(self._local_sequence), message),
+                )
+                self._wakeup_event(agent_id).set()
+                logger.debug("message_delivered_locally", agent_id=agent_id, message_id=message.id)
+            else:
+                remote_ids.append(agent_id)
+
+        if remote_ids:
+            await self._enqueue_remote(remote_ids, message)
+
+    async def _enqueue_remote(self, agent_ids: list[str], message: AgentMessage) -> None:
+        """Write a message to the agents' Redis queues in one pipeline.
 
         Args:
-            agent_id: Agent to receive message
+            agent_ids: Agents to receive the message
             message: Message to enqueue
 
         Raises:
@@ -477,26 +550,28 @@ class MessageBus:
         """
         try:
             redis_client = await self.client
-            queue_key = f"agent:queue:{agent_id}"
 
             # Serialize message
             message_json = json.dumps(message.to_dict())
 
             # Use sorted set for priority queue
             # Score = priority + timestamp (lower = higher priority)
-            score = (10 - message.priority.value) * 1e10 + message.timestamp.timestamp()
-
-            await redis_client.zadd(queue_key, {message_json: score})
-
-            # Set expiration on message
+            score = message.queue_score
             expiry_time = int(
                 (message.timestamp + timedelta(seconds=message.ttl_seconds)).timestamp()
             )
-            await redis_client.expireat(queue_key, expiry_time)
+
+            pipe = redis_client.pipeline(transaction=False)
+            for agent_id in agent_ids:
+                queue_key = f"{QUEUE_KEY_PREFIX}{agent_id}"
+                pipe.zadd(queue_key, {message_json: score})
+                pipe.expireat(queue_key, expiry_time)
+                pipe.publish(f"{NOTIFY_CHANNEL_PREFIX}{agent_id}", message.id)
+            await pipe.execute()
 
             logger.debug(
                 "message_enqueued",
-                agent_id=agent_id,
+                agent_ids=agent_ids,
                 message_id=message.id,
                 priority=message.priority.value,
             )
@@ -504,103 +579,195 @@ class MessageBus:
         except Exception as e:
             logger.error(
                 "message_enqueue_failed",
-                agent_id=agent_id,
+                agent_ids=agent_ids,
                 message_id=message.id,
                 error=str(e),
             )
             raise MemoryError(
-                operation=f"Failed to enqueue message for agent '{agent_id}'", reason=str(e)
+                operation=f"Failed to enqueue message for agent(s) {', '.join(agent_ids)}",
+                reason=str(e),
             ) from e
 
-    async def receive_message(
+    def _wakeup_event(self, agent_id: str) -> asyncio.Event:
+        """Get the local wakeup event for an agent."""
+        event = self._wakeups.get(agent_id)
+        if event is None:
+            event = self._wakeups[agent_id] = asyncio.Event()
+        return event
+
+    async def _subscribe(self, agent_id: str) -> None:
+        """Subscribe to an agent's notify channel (once per bus).
+
+        Args:
+            agent_id: Agent to receive wakeups for
+        """
+        if agent_id in self._subscribed:
+            return
+
+        async with self._lock:
+            if agent_id in self._subscribed:
+                return
+            if self._pubsub is None:
+                redis_client = await self.client
+                self._pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(f"{NOTIFY_CHANNEL_PREFIX}{agent_id}")
+            self._subscribed.add(agent_id)
+
+            if self._listener_task is None or self._listener_task.done():
+                self._listener_task = asyncio.create_task(self._listen(self._pubsub))
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        """Turn notify channel messages into local wakeups.
+
+        Args:
+            pubsub: Subscribed PubSub connection
+        """
+        try:
+            async for notification in pubsub.listen():
+                channel = notification.get("channel") or ""
+                event = self._wakeups.get(channel[len(NOTIFY_CHANNEL_PREFIX) :])
+                if event is not None:
+                    event.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Blocked receivers fall back to WAKEUP_RECHECK_SECONDS; the next
+            # receive re-subscribes on a fresh connection
+            logger.warning("message_bus_listener_failed", error=str(e))
+            if self._pubsub is pubsub:
+                self._pubsub = None
+                self._subscribed.clear()
+
+    async def _requeue_local(self, agent_id: str) -> None:
+        """Move hand-overs that no blocked receiver is left to take back to Redis.
+
+        Called when a receiver stops waiting (message received, timeout or
+        cancellation). The highest-priority messages stay in memory for the
+        receivers still blocked; the rest go to the agent's Redis queue so other
+        processes can consume them.
+
+        Args:
+            agent_id: Agent whose local hand-overs to trim
+        """
+        queue = self._local_queues.get(agent_id)
+        keep = self._waiting.get(agent_id, 0)
+        if queue is None or len(queue) <= keep:
+            return
+
+        # A sorted list is a valid heap, so the kept prefix needs no heapify
+        queue.sort()
+        surplus = queue[keep:]
+        del queue[keep:]
+        if not queue:
+            del self._local_queues[agent_id]
+
+        for entry in surplus:
+            message = entry[2]
+            if message.is_expired:
+                continue
+            try:
+                await self._enqueue_remote([agent_id], message)
+            except MemoryError:
+                # Keep it in memory; the next receive on this bus still gets it
+                heapq.heappush(self._local_queues.setdefault(agent_id, []), entry)
+
+    def _pop_local(self, agent_id: str, max_messages: int) -> list[AgentMessage]:
+        """Pop messages handed over in memory, highest priority first."""
+        queue = self._local_queues.get(agent_id)
+        messages: list[AgentMessage] = []
+        while queue and len(messages) < max_messages:
+            _score, _seq, message = heapq.heappop(queue)
+            if not message.is_expired:
+                messages.append(message)
+        return messages
+
+    async def _pop_remote(
+        self, redis_client: Redis, agent_id: str, max_messages: int
+    ) -> list[AgentMessage]:
+        """Pop messages from the agent's Redis queue, highest priority first."""
+        result = await redis_client.zpopmin(f"{QUEUE_KEY_PREFIX}{agent_id}", count=max_messages)
+        return [AgentMessage.from_dict(json.loads(message_json)) for message_json, _score in result]
+
+    async def receive_messages(
         self,
         agent_id: str,
+        max_messages: int = 10,
         timeout_seconds: float | None = None,
         block: bool = True,
-    ) -> AgentMessage | None:
-        """Receive message from agent's queue.
+    ) -> list[AgentMessage]:
+        """Receive up to ``max_messages`` messages from agent's queue.
+
+        Blocking receives wait for a wakeup (local hand-over or pub/sub
+        notification) instead of polling, and return as soon as at least one
+        message is available.
 
         Args:
-            agent_id: Agent ID to receive message for
+            agent_id: Agent ID to receive messages for
+            max_messages: Maximum number of messages to return (default: 10)
             timeout_seconds: Timeout for blocking receive (default: None = no timeout)
-            block: Whether to block waiting for message (default: True)
+            block: Whether to block waiting for a message (default: True)
 
         Returns:
-            AgentMessage or None if no message available (non-blocking) or timeout
+            Messages in priority order (empty on timeout or non-blocking miss)
 
         Raises:
             ValueError: If agent not registered
             MemoryError: If Redis operation fails
 
         Example:
-            >>> # Blocking receive with timeout
-            >>> message = await bus.receive_message("vector_agent", timeout_seconds=5.0)
-            >>>
-            >>> # Non-blocking receive
-            >>> message = await bus.receive_message("vector_agent", block=False)
-            >>> if message:
+            >>> messages = await bus.receive_messages("vector_agent", max_messages=50)
+            >>> for message in messages:
             ...     process(message)
         """
         if agent_id not in self._registered_agents:
             raise ValueError(f"Agent '{agent_id}' not registered with message bus")
 
         try:
+            messages = self._pop_local(agent_id, max_messages)
+            if messages:
+                return messages
+
             redis_client = await self.client
-            queue_key = f"agent:queue:{agent_id}"
+            if not block:
+                return await self._pop_remote(redis_client, agent_id, max_messages)
+
+            loop = asyncio.get_running_loop()
+            deadline = None if timeout_seconds is None else loop.time() + timeout_seconds
 
-            if block:
-                # Blocking receive with timeout
-                start_time = asyncio.get_event_loop().time()
+            # Subscribe before the first pop so no wakeup can slip in between
+            await self._subscribe(agent_id)
+            wakeup = self._wakeup_event(agent_id)
+            self._waiting[agent_id] = self._waiting.get(agent_id, 0) + 1
+            try:
                 while True:
-                    # Pop highest priority message (lowest score)
-                    result = await redis_client.zpopmin(queue_key, count=1)
-
-                    if result:
-                        message_json, _score = result[0]
-                        message_dict = json.loads(message_json)
-                        message = AgentMessage.from_dict(message_dict)
-
-                        logger.debug(
-                            "message_received",
-                            agent_id=agent_id,
-                            message_id=message.id,
-                            sender=message.sender,
-                        )
-
-                        return message
-
-                    # Check timeout
-                    if timeout_seconds is not None:
-                        elapsed = asyncio.get_event_loop().time() - start_time
-                        if elapsed >= timeout_seconds:
+                    wakeup.clear()
+                    messages = self._pop_local(agent_id, max_messages)
+                    if not messages:
+                        messages = await self._pop_remote(redis_client, agent_id, max_messages)
+                    if messages:
+                        return messages
+
+                    wait_seconds = WAKEUP_RECHECK_SECONDS
+                    if deadline is not None:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
                             logger.debug(
                                 "receive_timeout",
                                 agent_id=agent_id,
                                 timeout_seconds=timeout_seconds,
                             )
-                            return None
-
-                    # Wait a bit before retrying
-                    await asyncio.sleep(0.1)
-            else:
-                # Non-blocking receive
-                result = await redis_client.zpopmin(queue_key, count=1)
-
-                if not result:
-                    return None
-
-                message_json, _score = result[0]
-                message_dict = json.loads(message_json)
-                message = AgentMessage.from_dict(message_dict)
-
-                logger.debug(
-                    "message_received",
-                    agent_id=agent_id,
-                    message_id=message.id,
-                    sender=message.sender,
-                )
-
-                return message
+                            return []
+                        wait_seconds = min(wait_seconds, remaining)
+
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), timeout=wait_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._waiting[agent_id] -= 1
+                if not self._waiting[agent_id]:
+                    del self._waiting[agent_id]
+                await self._requeue_local(agent_id)
 
         except Exception as e:
             logger.error(
@@ -612,6 +779,50 @@ class MessageBus:
                 operation=f"Failed to receive message for agent '{agent_id}'", reason=str(e)
             ) from e
 
+    async def receive_message(
+        self,
+        agent_id: str,
+        timeout_seconds: float | None = None,
+        block: bool = True,
+    ) -> AgentMessage | None:
+        """Receive message from agent's queue.
+
+        Args:
+            agent_id: Agent ID to receive message for
+            timeout_seconds: Timeout for blocking receive (default: None = no timeout)
+            block: Whether to block waiting for message (default: True)
+
+        Returns:
+            AgentMessage or None if no message available (non-blocking) or timeout
+
+        Raises:
+            ValueError: If agent not registered
+            MemoryError: If Redis operation fails
+
+        Example:
+            >>> # Blocking receive with timeout
+            >>> message = await bus.receive_message("vector_agent", timeout_seconds=5.0)
+            >>>
+            >>> # Non-blocking receive
+            >>> message = await bus.receive_message("vector_agent", block=False)
+            >>> if message:
+            ...     process(message)
+        """
+        messages = await self.receive_messages(
+            agent_id, max_messages=1, timeout_seconds=timeout_seconds, block=block
+        )
+        if not messages:
+            return None
+
+        message = messages[0]
+        logger.debug(
+            "message_received",
+            agent_id=agent_id,
+            message_id=message.id,
+            sender=message.sender,
+        )
+        return message
+
     async def send_response(
         self,
         original_message: AgentMessage,
@@ -746,10 +957,10 @@ class MessageBus:
 
         try:
             redis_client = await self.client
-            queue_key = f"agent:queue:{agent_id}"
+            queue_key = f"{QUEUE_KEY_PREFIX}{agent_id}"
 
             size = await redis_client.zcard(queue_key)
-            return int(size)
+            return int(size) + len(self._local_queues.get(agent_id, []))
 
         except Exception as e:
             logger.error(
@@ -776,9 +987,10 @@ class MessageBus:
 
         try:
             redis_client = await self.client
-            queue_key = f"agent:queue:{agent_id}"
+            queue_key = f"{QUEUE_KEY_PREFIX}{agent_id}"
 
             cleared = await redis_client.delete(queue_key)
+            cleared += len(self._local_queues.pop(agent_id, []))
 
             logger.info(
                 "queue_cleared",
@@ -820,6 +1032,13 @@ class MessageBus:
 
         Should be called on shutdown to properly clean up resources.
         """
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            self._listener_task = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+            self._subscribed.clear()
         if self._client:
             await self._client.close()
             self._client = None
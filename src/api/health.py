@@ -6,12 +6,8 @@ from typing import Any
 import httpx
 from fastapi import APIRouter, status
 from pydantic import BaseModel, Field
-from qdrant_client import QdrantClient
 from redis import Redis
 
-# Import memory health router (Sprint 9 Feature 9.5)
-from src.api.health.memory_health import router as memory_health_router
-from src.components.graph_rag.neo4j_client import get_neo4j_client
 from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.core.models import HealthResponse, HealthStatus, ServiceHealth
@@ -56,12 +52,11 @@ class PrometheusMetricsResponse(BaseModel):
     error: str | None = Field(default=None)
 
 
-# Include memory health endpoints
-router.include_router(memory_health_router)
-
-
 async def check_qdrant() -> ServiceHealth:
     """Check Qdrant vector database health."""
+    # Imported here so /health stays cheap to import in lazy startup mode
+    from qdrant_client import QdrantClient
+
     settings = get_settings()
     start_time = time.time()
 
@@ -84,6 +79,8 @@ async def check_qdrant() -> ServiceHealth:
 
 async def check_neo4j() -> ServiceHealth:
     """Check Neo4j graph database health."""
+    from src.components.graph_rag.neo4j_client import get_neo4j_client
+
     start_time = time.time()
 
     try:
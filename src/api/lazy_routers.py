@@ -0,0 +1,264 @@
+"""Lazy API router registration for fast cold starts.
+
+Importing every v1 router at module load pulls in torch, spaCy, networkx,
+SetFit and DSPy before the first request, so container restarts and
+scale-out replicas spend tens of seconds before ``/health`` answers.
+
+Routers are declared once as a ``RouterSpec`` table (see ``src/api/main.py``)
+and registered in one of two modes:
+
+- Eager (default): ``include_routers()`` imports and includes all routers at
+  module load, exactly like the previous hand-written ``include_router`` list.
+- Lazy (``API_LAZY_STARTUP=true``): ``LazyRouterRegistry`` only imports a
+  router when a request under its ``path_prefix`` arrives, or when the
+  background warmup task (``load_all()``) gets to it. Imports run in a worker
+  thread so the event loop keeps serving ``/health`` meanwhile.
+
+``LazyRouterMiddleware`` sits in front of the router while loading is
+incomplete: requests that already match a registered route pass through,
+requests under a known prefix wait for just those routers, and anything else
+(``/openapi.json``, unknown paths) waits for the full warmup so it sees the
+same routes as in eager mode. Once everything is loaded the middleware is a
+single flag check.
+
+Example:
+    >>> registry = LazyRouterRegistry(app, API_ROUTERS)
+    >>> app.add_middleware(LazyRouterMiddleware, registry=registry)
+    >>> # in lifespan, after startup:
+    >>> asyncio.create_task(registry.load_all())
+"""
+
+import asyncio
+import importlib
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from fastapi import APIRouter, FastAPI
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """Declarative router registration.
+
+    Attributes:
+        module: Dotted module path containing the router
+        attr: Router attribute name in the module
+        prefix: Prefix passed to ``include_router``
+        tags: Tags passed to ``include_router``
+        path_prefix: Full URL prefix served by the router (router prefix
+            included); used to load the router on first use in lazy mode
+    """
+
+    module: str
+    attr: str = "router"
+    prefix: str = ""
+    tags: tuple[str, ...] = ()
+    path_prefix: str = ""
+
+    @property
+    def name(self) -> str:
+        """Human-readable router name for logs."""
+        return f"{self.module}.{self.attr}"
+
+    def include(self, app: FastAPI, router: APIRouter) -> None:
+        """Include the imported router into the app."""
+        kwargs: dict[str, Any] = {}
+        if self.prefix:
+            kwargs["prefix"] = self.prefix
+        if self.tags:
+            kwargs["tags"] = list(self.tags)
+        app.include_router(router, **kwargs)
+        logger.info("router_registered", router=self.name, prefix=self.path_prefix)
+
+
+def include_routers(app: FastAPI, specs: list[RouterSpec]) -> None:
+    """Import and include all routers immediately (eager mode).
+
+    Args:
+        app: FastAPI application
+        specs: Router table in registration order
+    """
+    for spec in specs:
+        module = importlib.import_module(spec.module)
+        spec.include(app, getattr(module, spec.attr))
+
+
+@dataclass
+class _LoadState:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    routes: list[BaseRoute] = field(default_factory=list)
+    loaded: bool = False
+    import_seconds: float = 0.0
+    error: str | None = None
+
+
+class LazyRouterRegistry:
+    """Imports and includes routers on first use or during background warmup.
+
+    Routes are kept in table order after every load, so route matching is the
+    same as in eager mode once all routers are loaded.
+
+    Args:
+        app: FastAPI application
+        specs: Router table in registration order
+    """
+
+    def __init__(self, app: FastAPI, specs: list[RouterSpec]) -> None:
+        """Initialize the registry.
+
+        Args:
+            app: FastAPI application
+            specs: Router table in registration order
+        """
+        self._app = app
+        self.specs = list(specs)
+        self._states = {spec: _LoadState() for spec in self.specs}
+        self._complete = asyncio.Event()
+        self._started_at = time.perf_counter()
+
+    @property
+    def complete(self) -> bool:
+        """Whether every router has been processed (loaded or failed)."""
+        return self._complete.is_set()
+
+    async def load(self, spec: RouterSpec) -> None:
+        """Import a router in a worker thread and include it (idempotent).
+
+        Import errors are logged and the router stays unregistered; the rest
+        of the API keeps working.
+
+        Args:
+            spec: Router to load
+        """
+        state = self._states[spec]
+        if state.loaded or state.error:
+            return
+
+        async with state.lock:
+            if state.loaded or state.error:
+                return
+
+            start = time.perf_counter()
+            try:
+                module = await asyncio.to_thread(importlib.import_module, spec.module)
+                router = getattr(module, spec.attr)
+            except Exception as e:
+                state.error = str(e)
+                logger.error("lazy_router_import_failed", router=spec.name, error=str(e))
+                return
+            state.import_seconds = time.perf_counter() - start
+
+            before = len(self._app.router.routes)
+            spec.include(self._app, router)
+            state.routes = self._app.router.routes[before:]
+            state.loaded = True
+            self._restore_route_order()
+
+            logger.debug(
+                "lazy_router_loaded",
+                router=spec.name,
+                import_ms=round(state.import_seconds * 1000, 1),
+            )
+
+    async def load_all(self) -> None:
+        """Load all routers in table order (background warmup)."""
+        for spec in self.specs:
+            await self.load(spec)
+        self._complete.set()
+
+        slowest = sorted(self._states.items(), key=lambda item: -item[1].import_seconds)
+        logger.info(
+            "lazy_routers_loaded",
+            routers=sum(1 for state in self._states.values() if state.loaded),
+            failed=[spec.name for spec, state in self._states.items() if state.error],
+            elapsed_s=round(time.perf_counter() - self._started_at, 2),
+            slowest=[
+                {"router": spec.name, "import_ms": round(state.import_seconds * 1000, 1)}
+                for spec, state in slowest[:5]
+            ],
+        )
+
+    async def ensure_routes(self, scope: Scope) -> None:
+        """Make sure the routers that may serve a request are loaded.
+
+        Args:
+            scope: ASGI scope of the incoming request
+        """
+        if self.complete:
+            return
+
+        path = scope["path"]
+        if path == self._app.openapi_url:
+            # The schema must list every router, as in eager mode
+            await self._complete.wait()
+            return
+        if self._matches_registered_route(scope):
+            return
+
+        pending = [
+            spec
+            for spec in self.specs
+            if spec.path_prefix
+            and path.startswith(spec.path_prefix)
+            and not self._states[spec].loaded
+        ]
+        if pending:
+            for spec in pending:
+                await self.load(spec)
+            return
+
+        # No router claims this path: answer it like eager mode would
+        await self._complete.wait()
+
+    def status(self) -> dict[str, Any]:
+        """Get loading status (for health/readiness reporting)."""
+        return {
+            "complete": self.complete,
+            "loaded": sum(1 for state in self._states.values() if state.loaded),
+            "total": len(self.specs),
+            "failed": [spec.name for spec, state in self._states.items() if state.error],
+        }
+
+    def _matches_registered_route(self, scope: Scope) -> bool:
+        return any(route.matches(scope)[0] == Match.FULL for route in self._app.router.routes)
+
+    def _restore_route_order(self) -> None:
+        """Reorder routes to base routes first, then routers in table order."""
+        position = {
+            id(route): index
+            for index, spec in enumerate(self.specs, start=1)
+            for route in self._states[spec].routes
+        }
+        self._app.router.routes.sort(key=lambda route: position.get(id(route), 0))
+        # Regenerate the OpenAPI schema with the new routes
+        self._app.openapi_schema = None
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware that loads routers before dispatching (lazy mode only).
+
+    Args:
+        app: Downstream ASGI app
+        registry: Lazy router registry
+    """
+
+    def __init__(self, app: ASGIApp, registry: LazyRouterRegistry) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Downstream ASGI app
+            registry: Lazy router registry
+        """
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and not self.registry.complete:
+            await self.registry.ensure_routes(scope)
+        await self.app(scope, receive, send)
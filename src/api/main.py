@@ -1,8 +1,9 @@
 """FastAPI application entry point."""
 
+import asyncio
 import os
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
@@ -11,8 +12,13 @@ from prometheus_client import Counter, Histogram, make_asgi_app
 from slowapi.errors import RateLimitExceeded
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from src.api import graph_analytics, graph_visualization
 from src.api.health import router as health_router
+from src.api.lazy_routers import (
+    LazyRouterMiddleware,
+    LazyRouterRegistry,
+    RouterSpec,
+    include_routers,
+)
 from src.api.middleware import limiter, rate_limit_handler
 from src.api.middleware.exception_handler import (
     aegis_exception_handler,
@@ -21,66 +27,6 @@ from src.api.middleware.exception_handler import (
     validation_exception_handler,
 )
 from src.api.middleware.request_id import RequestIDMiddleware
-from src.api.routers import graph_viz
-from src.api.v1.admin import router as admin_router
-
-# Sprint 53: Admin module split
-from src.api.v1.admin_costs import router as admin_costs_router
-from src.api.v1.admin_discovery import domain_discovery_router  # Sprint 46 Feature 46.4
-from src.api.v1.admin_graph import router as admin_graph_router
-from src.api.v1.graph_entities import (
-    router as graph_entities_router,
-)  # Sprint 121 Feature 121.5a-d: Entity/Relation Management
-from src.api.v1.admin_indexing import router as admin_indexing_router
-from src.api.v1.admin_llm import router as admin_llm_router
-from src.api.v1.admin_tools import router as admin_tools_router  # Sprint 70 Feature 70.7
-from src.api.v1.admin_chunking import router as admin_chunking_router  # TD-096: Chunking UI
-from src.api.v1.admin_generation import router as admin_generation_router  # TD-097: Generation UI
-from src.api.v1.analytics import router as analytics_router  # Sprint 62 Feature 62.9
-from src.api.v1.gdpr import router as gdpr_router  # Sprint 99 Feature 99.3
-from src.api.v1.audit import router as audit_router  # Sprint 99 Feature 99.4
-from src.api.v1.annotations import router as annotations_router  # Feature 21.6
-from src.api.v1.auth import router as auth_router  # Sprint 22 Feature 22.2.4
-from src.api.v1.chat import router as chat_router
-from src.api.v1.domain_training import router as domain_training_router  # Sprint 45 Feature 45.3
-from src.api.v1.graph_communities import (
-    router as graph_communities_router,  # Sprint 63 Feature 63.5
-)
-from src.api.v1.health import router as v1_health_router
-from src.api.v1.mcp import router as mcp_router  # Sprint 40 Feature 40.2: MCP Tool Discovery
-from src.api.v1.mcp_registry import (
-    router as mcp_registry_router,
-)  # Sprint 107 Feature 107.2: MCP Registry Auto-Discovery
-from src.api.v1.mcp_tools import (
-    router as mcp_tools_router,
-)  # Sprint 103 Feature 103.1: MCP Tool Execution
-from src.api.v1.memory import router as memory_router
-from src.api.v1.research import router as research_router  # Sprint 62 Feature 62.10
-from src.api.v1.deep_research import (
-    router as deep_research_router,
-)  # Sprint 116.10: Deep Research Multi-Step
-from src.api.v1.retrieval import router as retrieval_router
-from src.api.v1.skills import (
-    router as skills_router,
-)  # Sprint 99 Feature 99.1: Skill Management APIs
-from src.api.v1.agents import (
-    router as agents_router,
-)  # Sprint 99 Feature 99.2: Agent Monitoring APIs (Part 1)
-from src.api.v1.orchestration import (
-    router as orchestration_router,
-)  # Sprint 99 Feature 99.2: Agent Monitoring APIs (Part 2)
-from src.api.v1.explainability import (
-    router as explainability_router,
-)  # Sprint 104 Feature 104.10: Explainability API
-from src.api.v1.certification import (
-    router as certification_router,
-)  # Sprint 107 Feature 107.3: Certification API
-from src.api.v1.context import (
-    router as context_router,
-)  # Sprint 112 Feature 112.1: Long Context API
-from src.api.v1.documents import (
-    router as documents_router,
-)  # Sprint 117 Feature 117.11: Manual Domain Override
 from src.core.config import get_settings
 from src.core.exceptions import AegisRAGException
 from src.core.logging import get_logger, setup_logging
@@ -109,30 +55,107 @@ REQUEST_LATENCY = Histogram(
 )
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+# API routers in registration order (route matching follows this order).
+# Health is registered eagerly in both modes so /health answers immediately;
+# the memory health endpoints import the full memory stack and load lazily.
+API_ROUTERS: list[RouterSpec] = [
+    # Sprint 9 Feature 9.5: Memory health endpoints
+    RouterSpec("src.api.health.memory_health", path_prefix="/health/memory"),
+    RouterSpec("src.api.v1.health", path_prefix="/api/v1/health"),
+    RouterSpec("src.api.v1.retrieval", path_prefix="/api/v1/retrieval"),
+    # Feature 21.6: Image Annotations API
+    RouterSpec("src.api.v1.annotations", path_prefix="/api/v1/annotations"),
+    # Sprint 16 Feature 16.3: Admin re-indexing (TD-41: /stats endpoint)
+    RouterSpec("src.api.v1.admin", prefix="/api/v1", path_prefix="/api/v1/admin"),
+    # Sprint 53: Admin module split - Cost, LLM, Graph, Indexing endpoints
+    RouterSpec("src.api.v1.admin_costs", prefix="/api/v1", path_prefix="/api/v1/admin"),
+    RouterSpec("src.api.v1.admin_llm", prefix="/api/v1", path_prefix="/api/v1/admin"),
+    # Sprint 70 Feature 70.7
+    RouterSpec("src.api.v1.admin_tools", prefix="/api/v1", path_prefix="/api/v1/admin"),
+    RouterSpec("src.api.v1.admin_graph", prefix="/api/v1", path_prefix="/api/v1/admin"),
+    # Sprint 121 Feature 121.5a-d: Entity/Relation Management
+    RouterSpec("src.api.v1.graph_entities", prefix="/api/v1", path_prefix="/api/v1/admin"),
+    RouterSpec("src.api.v1.admin_indexing", prefix="/api/v1", path_prefix="/api/v1/admin"),
+    # TD-096: Chunking Parameters UI
+    RouterSpec("src.api.v1.admin_chunking", prefix="/api/v1", path_prefix="/api/v1/admin"),
+    # TD-097: Generation Config UI
+    RouterSpec("src.api.v1.admin_generation", prefix="/api/v1", path_prefix="/api/v1/admin"),
+    # Sprint 63 Feature 63.5: Graph Communities API
+    RouterSpec("src.api.v1.graph_communities", prefix="/api/v1", path_prefix="/api/v1/graph"),
+    # Sprint 62 Feature 62.9: Section Analytics
+    RouterSpec("src.api.v1.analytics", prefix="/api/v1", path_prefix="/api/v1/analytics"),
+    # Sprint 22 Feature 22.2.4: JWT Authentication
+    RouterSpec("src.api.v1.auth", path_prefix="/api/v1/auth"),
+    # Sprint 10 Feature 10.1: Chat API
+    RouterSpec("src.api.v1.chat", prefix="/api/v1", tags=("chat",), path_prefix="/api/v1/chat"),
+    # Sprint 7 Feature 7.6: Memory API
+    RouterSpec(
+        "src.api.v1.memory", prefix="/api/v1", tags=("memory",), path_prefix="/api/v1/memory"
+    ),
+    # Sprint 62 Feature 62.10: Multi-step research workflow with LangGraph
+    RouterSpec("src.api.v1.research", prefix="/api/v1", path_prefix="/api/v1/research"),
+    # Sprint 116.10: Deep research with intermediate results
+    RouterSpec("src.api.v1.deep_research", prefix="/api/v1", path_prefix="/api/v1/research/deep"),
+    # Sprint 40 Feature 40.2: MCP tool discovery and execution
+    RouterSpec("src.api.v1.mcp", path_prefix="/api/v1/mcp"),
+    # Sprint 103 Feature 103.1: Internal tool execution (bash, python, browser)
+    RouterSpec("src.api.v1.mcp_tools", path_prefix="/api/v1/mcp/tools"),
+    # Sprint 107 Feature 107.2: MCP server registry auto-discovery and installation
+    RouterSpec("src.api.v1.mcp_registry", path_prefix="/api/v1/mcp/registry"),
+    # Sprint 99 Feature 99.1: Skill Management APIs
+    RouterSpec("src.api.v1.skills", prefix="/api/v1", path_prefix="/api/v1/skills"),
+    # Sprint 99 Feature 99.2: Agent Monitoring APIs (WebSocket, Blackboard, Hierarchy, Details)
+    RouterSpec("src.api.v1.agents", prefix="/api/v1", path_prefix="/api/v1/agents"),
+    # Sprint 99 Feature 99.2: Agent Monitoring APIs Part 2 (Active, Trace, Metrics)
+    RouterSpec("src.api.v1.orchestration", prefix="/api/v1", path_prefix="/api/v1/orchestration"),
+    # Sprint 45 Feature 45.3: DSPy-based domain training and classification
+    RouterSpec("src.api.v1.domain_training", path_prefix="/api/v1/admin/domains"),
+    # Sprint 46 Feature 46.4: File-based domain auto-discovery with LLM analysis
+    RouterSpec(
+        "src.api.v1.admin_discovery",
+        attr="domain_discovery_router",
+        path_prefix="/api/v1/admin/domains",
+    ),
+    # Sprint 6 Features 6.5 & 6.6: Graph visualization and analytics
+    RouterSpec(
+        "src.api.graph_visualization",
+        prefix="/api/v1",
+        tags=("visualization",),
+        path_prefix="/api/v1/graph",
+    ),
+    RouterSpec(
+        "src.api.graph_analytics",
+        prefix="/api/v1",
+        tags=("analytics",),
+        path_prefix="/api/v1/graph/analytics",
+    ),
+    # Sprint 12 Feature 12.8: Enhanced graph visualization
+    RouterSpec("src.api.routers.graph_viz", path_prefix="/api/v1/graph/viz"),
+    # Sprint 99 Features 99.3 & 99.4: GDPR compliance and audit trail
+    RouterSpec("src.api.v1.gdpr", path_prefix="/api/v1/gdpr"),
+    RouterSpec("src.api.v1.audit", path_prefix="/api/v1/audit"),
+    # Sprint 105 Feature 105.1: Explainability API
+    RouterSpec(
+        "src.api.v1.explainability",
+        prefix="/api/v1/explainability",
+        tags=("explainability",),
+        path_prefix="/api/v1/explainability",
+    ),
+    # Sprint 107 Feature 107.3: Certification compliance status (EU AI Act Article 43)
+    RouterSpec("src.api.v1.certification", prefix="/api/v1", path_prefix="/api/v1/certification"),
+    # Sprint 112 Feature 112.1: Long Context API
+    RouterSpec("src.api.v1.context", prefix="/api/v1", path_prefix="/api/v1/context"),
+    # Sprint 117 Feature 117.11: Manual domain override with audit trail
+    RouterSpec("src.api.v1.documents", prefix="/api/v1", path_prefix="/api/v1/documents"),
+]
+
+
+async def _warm_up_services() -> None:
+    """Pre-load models and connect services (embedding, LLM, Docling, DBs, MCP).
+
+    Runs before the server accepts requests in the default mode and as a
+    background task after startup with API_LAZY_STARTUP.
     """
-    Application lifespan manager.
-
-    Handles startup and shutdown events.
-    """
-    # Startup
-    logger.info(
-        "application_starting",
-        app_name=settings.app_name,
-        version=settings.app_version,
-        environment=settings.environment,
-    )
-
-    # Initialize LangSmith tracing (Sprint 4 Feature 4.5)
-    from src.core.tracing import setup_langsmith_tracing
-
-    tracing_enabled = setup_langsmith_tracing()
-    logger.info(
-        "langsmith_tracing_status",
-        enabled=tracing_enabled,
-        project=settings.langsmith_project if tracing_enabled else None,
-    )
 
     # Sprint 120: BM25 startup initialization REMOVED.
     # Since Sprint 87, lexical search uses BGE-M3 sparse vectors in Qdrant
@@ -394,11 +417,60 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             note="Community detection will not run automatically - use manual trigger API",
         )
 
+
+async def _lazy_warmup(registry: LazyRouterRegistry) -> None:
+    """Background warmup for API_LAZY_STARTUP: routers first, then services."""
+    try:
+        await registry.load_all()
+        await _warm_up_services()
+        logger.info("lazy_startup_warmup_completed", routers=registry.status())
+    except Exception as e:
+        logger.error("lazy_startup_warmup_failed", error=str(e), exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """
+    Application lifespan manager.
+
+    Handles startup and shutdown events.
+    """
+    # Startup
+    logger.info(
+        "application_starting",
+        app_name=settings.app_name,
+        version=settings.app_version,
+        environment=settings.environment,
+        lazy_startup=settings.api_lazy_startup,
+    )
+
+    # Initialize LangSmith tracing (Sprint 4 Feature 4.5)
+    from src.core.tracing import setup_langsmith_tracing
+
+    tracing_enabled = setup_langsmith_tracing()
+    logger.info(
+        "langsmith_tracing_status",
+        enabled=tracing_enabled,
+        project=settings.langsmith_project if tracing_enabled else None,
+    )
+
+    warmup_task = None
+    if settings.api_lazy_startup:
+        # Accept requests right away; routers and services load in the background
+        warmup_task = asyncio.create_task(_lazy_warmup(app.state.lazy_routers))
+    else:
+        await _warm_up_services()
+
     yield
 
     # Shutdown
     logger.info("application_shutting_down")
 
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup_task
+
     # Sprint 126 Feature 126.1: Shutdown community detection scheduler
     try:
         from src.jobs.community_batch_job import shutdown_community_detection_scheduler
@@ -408,6 +480,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning("community_detection_scheduler_shutdown_failed", error=str(e))
 
+    # Drain buffered ingestion job events before the process exits
+    try:
+        from src.components.ingestion.job_tracker import close_job_tracker
+
+        await close_job_tracker()
+    except Exception as e:
+        logger.warning("job_tracker_close_failed", error=str(e))
+
+    # Drain buffered LLM cost rows before the process exits
+    try:
+        from src.domains.llm_integration.cost import close_cost_tracker
+
+        await close_cost_tracker()
+    except Exception as e:
+        logger.warning("cost_tracker_close_failed", error=str(e))
+
+    # Stop PyMuPDF render workers used by VLM parallel page processing
+    try:
+        from src.components.ingestion.page_image_renderer import shutdown_render_pool
+
+        shutdown_render_pool()
+    except Exception as e:
+        logger.warning("page_render_pool_shutdown_failed", error=str(e))
+
     # Sprint 51: Clear pre-warmed Docling client reference (keep container running)
     # Note: We intentionally do NOT stop the container on backend shutdown
     # because it was started externally (docker compose up -d docling)
@@ -533,232 +629,17 @@ async def track_requests(request: Request, call_next) -> None:
 
 # Include routers
 # TD-41: Enhanced router registration logging
-logger.info("registering_routers", phase="startup")
+logger.info("registering_routers", phase="startup", lazy=settings.api_lazy_startup)
 
 app.include_router(health_router)
 logger.info("router_registered", router="health_router", prefix="(default)")
 
-app.include_router(v1_health_router)
-logger.info("router_registered", router="v1_health_router", prefix="/api/v1")
-
-app.include_router(retrieval_router)
-logger.info("router_registered", router="retrieval_router", prefix="/api/v1/retrieval")
-
-# Feature 21.6: Image Annotations API
-app.include_router(annotations_router)
-logger.info("router_registered", router="annotations_router", prefix="/api/v1/annotations")
-
-app.include_router(admin_router, prefix="/api/v1")  # Sprint 16 Feature 16.3: Admin re-indexing
-logger.info(
-    "router_registered",
-    router="admin_router",
-    prefix="/api/v1/admin",
-    note="Sprint 18 TD-41: Admin router with /stats endpoint - prefix fixed!",
-)
-
-# Sprint 53: Admin module split - Cost, LLM, Graph, Indexing endpoints
-app.include_router(admin_costs_router, prefix="/api/v1")
-app.include_router(admin_llm_router, prefix="/api/v1")
-app.include_router(admin_tools_router, prefix="/api/v1")  # Sprint 70 Feature 70.7
-app.include_router(admin_graph_router, prefix="/api/v1")
-app.include_router(graph_entities_router, prefix="/api/v1")  # Sprint 121 Feature 121.5a-d
-app.include_router(admin_indexing_router, prefix="/api/v1")
-app.include_router(admin_chunking_router, prefix="/api/v1")  # TD-096: Chunking Parameters UI
-app.include_router(admin_generation_router, prefix="/api/v1")  # TD-097: Generation Config UI
-logger.info(
-    "admin_split_routers_registered",
-    routers=[
-        "admin_costs",
-        "admin_llm",
-        "admin_graph",
-        "graph_entities",
-        "admin_indexing",
-        "admin_chunking",
-        "admin_generation",
-    ],
-    note="Sprint 53: Admin module split for maintainability + TD-096/TD-097 + Sprint 121 Entity/Relation Management",
-)
-
-# Sprint 63 Feature 63.5: Graph Communities API
-app.include_router(graph_communities_router, prefix="/api/v1")
-logger.info(
-    "router_registered",
-    router="graph_communities_router",
-    prefix="/api/v1/graph",
-    note="Sprint 63 Feature 63.5: Community visualization endpoints",
-)
-
-# Analytics API router (Sprint 62 Feature 62.9: Section Analytics)
-app.include_router(analytics_router, prefix="/api/v1")
-logger.info(
-    "router_registered",
-    router="analytics_router",
-    prefix="/api/v1/analytics",
-    note="Sprint 62: Section analytics endpoint",
-)
-
-# Authentication API router (Sprint 22 Feature 22.2.4: JWT Authentication)
-app.include_router(auth_router)
-logger.info(
-    "router_registered",
-    router="auth_router",
-    prefix="/api/v1/auth",
-    note="Sprint 22: JWT authentication endpoints",
-)
-
-# Chat API router (Sprint 10: Feature 10.1)
-app.include_router(chat_router, prefix="/api/v1", tags=["chat"])
-logger.info("router_registered", router="chat_router", prefix="/api/v1")
-
-# Memory API router (Sprint 7: Feature 7.6)
-app.include_router(memory_router, prefix="/api/v1", tags=["memory"])
-
-# Research API router (Sprint 62: Feature 62.10 - Research Endpoint Backend)
-app.include_router(research_router, prefix="/api/v1")
-logger.info(
-    "router_registered",
-    router="research_router",
-    prefix="/api/v1/research",
-    note="Sprint 62: Multi-step research workflow with LangGraph",
-)
-
-# Deep Research API router (Sprint 116.10: Deep Research Multi-Step)
-app.include_router(deep_research_router, prefix="/api/v1")
-logger.info(
-    "router_registered",
-    router="deep_research_router",
-    prefix="/api/v1/research/deep",
-    note="Sprint 116.10: Enhanced deep research with intermediate results",
-)
-
-# MCP API router (Sprint 40: Feature 40.2 - Tool Discovery & Management)
-app.include_router(mcp_router)
-logger.info(
-    "router_registered",
-    router="mcp_router",
-    prefix="/api/v1/mcp",
-    note="Sprint 40: MCP tool discovery and execution",
-)
-
-# MCP Tool Execution API router (Sprint 103: Feature 103.1 - Internal Tool Execution)
-app.include_router(mcp_tools_router)
-logger.info(
-    "router_registered",
-    router="mcp_tools_router",
-    prefix="/api/v1/mcp/tools",
-    note="Sprint 103: Internal tool execution (bash, python, browser)",
-)
-
-# MCP Registry API router (Sprint 107: Feature 107.2 - Registry Auto-Discovery)
-app.include_router(mcp_registry_router)
-logger.info(
-    "router_registered",
-    router="mcp_registry_router",
-    prefix="/api/v1/mcp/registry",
-    note="Sprint 107: MCP server registry auto-discovery and installation",
-)
-
-# Skills Management API router (Sprint 99: Feature 99.1 - Skill Management APIs)
-app.include_router(skills_router, prefix="/api/v1")
-logger.info(
-    "router_registered",
-    router="skills_router",
-    prefix="/api/v1/skills",
-    note="Sprint 99: Skill Management APIs (9 endpoints for Sprint 90-92 backend)",
-)
-
-# Agent Monitoring API router (Sprint 99: Feature 99.2 - Agent Monitoring APIs)
-app.include_router(agents_router, prefix="/api/v1")
-logger.info(
-    "router_registered",
-    router="agents_router",
-    prefix="/api/v1/agents",
-    note="Sprint 99: Agent Monitoring APIs Part 1 (WebSocket, Blackboard, Hierarchy, Details)",
-)
-
-app.include_router(orchestration_router, prefix="/api/v1")
-logger.info(
-    "router_registered",
-    router="orchestration_router",
-    prefix="/api/v1/orchestration",
-    note="Sprint 99: Agent Monitoring APIs Part 2 (Active, Trace, Metrics)",
-)
-
-# Domain Training API router (Sprint 45: Feature 45.3 - Domain Training API)
-app.include_router(domain_training_router)
-logger.info(
-    "router_registered",
-    router="domain_training_router",
-    prefix="/admin/domains",
-    note="Sprint 45: DSPy-based domain training and classification",
-)
-
-# Domain Discovery API router (Sprint 46: Feature 46.4 - Domain Auto-Discovery)
-app.include_router(domain_discovery_router)
-logger.info(
-    "router_registered",
-    router="domain_discovery_router",
-    prefix="/api/v1/admin/domains",
-    note="Sprint 46: File-based domain auto-discovery with LLM analysis",
-)
-
-# Graph visualization and analytics routers (Sprint 6: Features 6.5 & 6.6)
-app.include_router(graph_visualization.router, prefix="/api/v1", tags=["visualization"])
-app.include_router(graph_analytics.router, prefix="/api/v1", tags=["analytics"])
-
-# Enhanced graph visualization router (Sprint 12: Feature 12.8)
-app.include_router(graph_viz.router)
-
-# GDPR & Audit Trail API routers (Sprint 99: Features 99.3 & 99.4)
-# Sprint 101 Fix: Uncommented routers - all endpoints already have Request parameter
-app.include_router(gdpr_router)
-logger.info(
-    "router_registered",
-    router="gdpr_router",
-    prefix="/api/v1/gdpr",
-    note="Sprint 99 Feature 99.3: GDPR compliance (Articles 6,7,13-22,30)",
-)
-
-app.include_router(audit_router)
-logger.info(
-    "router_registered",
-    router="audit_router",
-    prefix="/api/v1/audit",
-    note="Sprint 99 Feature 99.4: Audit trail with SHA-256 chain (EU AI Act Art. 12)",
-)
-
-app.include_router(explainability_router, prefix="/api/v1/explainability", tags=["explainability"])
-logger.info(
-    "router_registered",
-    router="explainability_router",
-    prefix="/api/v1/explainability",
-    note="Sprint 105 Feature 105.1: Fixed prefix registration (was missing in Sprint 104)",
-)
-
-app.include_router(certification_router, prefix="/api/v1")
-logger.info(
-    "router_registered",
-    router="certification_router",
-    prefix="/api/v1/certification",
-    note="Sprint 107 Feature 107.3: Certification compliance status (EU AI Act Article 43)",
-)
-
-app.include_router(context_router, prefix="/api/v1")
-logger.info(
-    "router_registered",
-    router="context_router",
-    prefix="/api/v1/context",
-    note="Sprint 112 Feature 112.1: Long Context API (documents, chunks, compression, export)",
-)
-
-# Sprint 117 Feature 117.11: Document Management APIs (Domain Override)
-app.include_router(documents_router, prefix="/api/v1")
-logger.info(
-    "router_registered",
-    router="documents_router",
-    prefix="/api/v1/documents",
-    note="Sprint 117 Feature 117.11: Manual domain override with audit trail",
-)
+if settings.api_lazy_startup:
+    # Routers are imported on first use or by the warmup task started in lifespan
+    app.state.lazy_routers = LazyRouterRegistry(app, API_ROUTERS)
+    app.add_middleware(LazyRouterMiddleware, registry=app.state.lazy_routers)
+else:
+    include_routers(app, API_ROUTERS)
 
 # Prometheus metrics endpoint
 metrics_app = make_asgi_app()
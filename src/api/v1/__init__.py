@@ -1,17 +1,24 @@
 """API v1 module.
 
 This module contains all v1 API routers for the AEGIS RAG system.
+Routers are loaded lazily so that importing one v1 module (e.g. for
+API_LAZY_STARTUP) does not import every router and its dependencies.
 """
 
-from src.api.v1.admin import router as admin_router
-from src.api.v1.annotations import router as annotations_router
-from src.api.v1.auth import router as auth_router
-from src.api.v1.chat import router as chat_router
-from src.api.v1.domain_training import router as domain_training_router
-from src.api.v1.health import router as health_router
-from src.api.v1.mcp import router as mcp_router
-from src.api.v1.memory import router as memory_router
-from src.api.v1.retrieval import router as retrieval_router
+import importlib
+from typing import Any
+
+_ROUTER_MODULES = {
+    "admin_router": "src.api.v1.admin",
+    "annotations_router": "src.api.v1.annotations",
+    "auth_router": "src.api.v1.auth",
+    "chat_router": "src.api.v1.chat",
+    "domain_training_router": "src.api.v1.domain_training",
+    "health_router": "src.api.v1.health",
+    "mcp_router": "src.api.v1.mcp",
+    "memory_router": "src.api.v1.memory",
+    "retrieval_router": "src.api.v1.retrieval",
+}
 
 __all__ = [
     "admin_router",
@@ -24,3 +31,20 @@ __all__ = [
     "memory_router",
     "retrieval_router",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import for v1 routers.
+
+    Args:
+        name: Attribute name to load
+
+    Returns:
+        The requested router
+
+    Raises:
+        AttributeError: If attribute doesn't exist
+    """
+    if name in _ROUTER_MODULES:
+        return importlib.import_module(_ROUTER_MODULES[name]).router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,9 +7,12 @@ This module provides endpoints for:
 - Cost statistics by provider and model
 - Historical cost data for charting
 - Budget status and utilization tracking
+
+Sprint 130 Feature 130.14: All endpoints read the cost tracker's in-memory
+daily aggregates (one entry per day/provider/model/task type) instead of
+scanning llm_requests, and include rows still buffered for writing.
 """
 
-import sqlite3
 from datetime import datetime, timedelta
 from typing import Literal
 
@@ -25,6 +28,7 @@ from src.api.models.cost_stats import (
 )
 from src.components.llm_proxy.cost_tracker import get_cost_tracker
 from src.core.config import settings
+from src.domains.llm_integration.cost import CostAggregate, group_aggregates
 
 logger = structlog.get_logger(__name__)
 
@@ -87,53 +91,20 @@ async def get_cost_stats(
             # Current month (from first day to now)
             start_date = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-        # Get request stats from tracker
-        with sqlite3.connect(tracker.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Build WHERE clause
-            conditions = []
-            params = []
-            if start_date:
-                conditions.append("timestamp >= ?")
-                params.append(start_date.isoformat())
-
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-            # Aggregate by provider
-            cursor.execute(  # nosec B608 — parameterized query
-                f"""
-                SELECT
-                    provider,
-                    SUM(cost_usd) as total_cost,
-                    SUM(tokens_total) as total_tokens,
-                    COUNT(*) as total_calls
-                FROM llm_requests
-                WHERE {where_clause}
-                GROUP BY provider
-            """,
-                tuple(params),
-            )
-
-            provider_rows = cursor.fetchall()
-
-            # Aggregate by model
-            cursor.execute(  # nosec B608 — parameterized query
-                f"""
-                SELECT
-                    provider,
-                    model,
-                    SUM(cost_usd) as total_cost,
-                    SUM(tokens_total) as total_tokens,
-                    COUNT(*) as total_calls
-                FROM llm_requests
-                WHERE {where_clause}
-                GROUP BY provider, model
-            """,
-                tuple(params),
-            )
-
-            model_rows = cursor.fetchall()
+        # Aggregate by provider and by model from the daily aggregates
+        aggregates = tracker.get_daily_aggregates(
+            start_day=start_date.date() if start_date else None
+        )
+        provider_rows = [
+            (provider, agg.cost_usd, agg.tokens_total, agg.requests)
+            for (provider,), agg in group_aggregates(aggregates, ("provider",)).items()
+        ]
+        model_rows = [
+            (provider, model, agg.cost_usd, agg.tokens_total, agg.requests)
+            for (provider, model), agg in group_aggregates(
+                aggregates, ("provider", "model")
+            ).items()
+        ]
 
         # Build provider cost breakdown
         by_provider: dict[str, ProviderCost] = {}
@@ -286,36 +257,14 @@ async def get_cost_history(
                 hour=0, minute=0, second=0, microsecond=0
             )
 
-        # Query daily aggregates from database
-        with sqlite3.connect(tracker.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Build WHERE clause
-            conditions = []
-            params = []
-            if start_date:
-                conditions.append("timestamp >= ?")
-                params.append(start_date.isoformat())
-
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-            # Aggregate by date
-            cursor.execute(  # nosec B608 — parameterized query
-                f"""
-                SELECT
-                    date(timestamp) as date,
-                    SUM(cost_usd) as total_cost,
-                    SUM(tokens_total) as total_tokens,
-                    COUNT(*) as total_calls
-                FROM llm_requests
-                WHERE {where_clause}
-                GROUP BY date(timestamp)
-                ORDER BY date ASC
-            """,
-                tuple(params),
-            )
-
-            rows = cursor.fetchall()
+        # Daily aggregates, sorted chronologically
+        aggregates = tracker.get_daily_aggregates(
+            start_day=start_date.date() if start_date else None
+        )
+        rows = [
+            (day, agg.cost_usd, agg.tokens_total, agg.requests)
+            for (day,), agg in sorted(group_aggregates(aggregates, ("day",)).items())
+        ]
 
         # Build response
         history = [
@@ -423,45 +372,26 @@ async def get_cost_timeseries(
         start_date = datetime.strptime(start, "%Y-%m-%d")
         end_date = datetime.strptime(end, "%Y-%m-%d")
 
-        # Query database
-        with sqlite3.connect(tracker.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Build WHERE clause
-            conditions = ["date(timestamp) >= ?", "date(timestamp) <= ?"]
-            params: list = [start, end]
-
-            if provider:
-                conditions.append("provider = ?")
-                params.append(provider)
-
-            where_clause = " AND ".join(conditions)
-
-            # Determine date grouping based on aggregation
-            if aggregation == "weekly":
-                date_group = "strftime('%Y-W%W', timestamp)"
-            elif aggregation == "monthly":
-                date_group = "strftime('%Y-%m', timestamp)"
-            else:
-                date_group = "date(timestamp)"
-
-            # Query with aggregation by provider
-            cursor.execute(  # nosec B608 — parameterized query
-                f"""
-                SELECT
-                    {date_group} as period,
-                    provider,
-                    SUM(tokens_total) as total_tokens,
-                    SUM(cost_usd) as total_cost
-                FROM llm_requests
-                WHERE {where_clause}
-                GROUP BY {date_group}, provider
-                ORDER BY period ASC, provider ASC
-            """,
-                tuple(params),
-            )
-
-            rows = cursor.fetchall()
+        # Determine date grouping based on aggregation
+        if aggregation == "weekly":
+            period_format = "%Y-W%W"
+        elif aggregation == "monthly":
+            period_format = "%Y-%m"
+        else:
+            period_format = "%Y-%m-%d"
+
+        # Re-group the daily aggregates by period and provider
+        periods: dict[tuple[str, str], CostAggregate] = {}
+        for key, agg in tracker.get_daily_aggregates(
+            start_day=start_date.date(), end_day=end_date.date(), provider=provider
+        ).items():
+            period = datetime.strptime(key.day, "%Y-%m-%d").strftime(period_format)
+            periods.setdefault((period, key.provider), CostAggregate()).add(agg)
+
+        rows = [
+            (period, prov, agg.tokens_total, agg.cost_usd)
+            for (period, prov), agg in sorted(periods.items())
+        ]
 
         # Build response data
         data_points: list[TimeseriesDataPoint] = []
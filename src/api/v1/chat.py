@@ -209,6 +209,7 @@ async def save_conversation_turn(
                 session_id=session_id,
                 message_count=len(messages),
             )
+            await _index_session(session_id, conversation_data)
         else:
             logger.error("conversation_save_failed_redis_returned_false", session_id=session_id)
 
@@ -219,6 +220,16 @@ async def save_conversation_turn(
         return False
 
 
+async def _index_session(session_id: str, conversation_data: dict[str, Any]) -> None:
+    """Update the session sidebar index; failures never fail the chat turn."""
+    try:
+        from src.components.memory import get_session_index
+
+        await get_session_index().record(session_id, conversation_data)
+    except Exception as e:
+        logger.warning("session_index_update_failed", session_id=session_id, error=str(e))
+
+
 # Request/Response Models
 
 
@@ -1067,6 +1078,10 @@ async def list_sessions(limit: int = 50, offset: int = 0) -> SessionListResponse
     Sprint 17 Feature 17.2: Implement proper session listing from Redis
     Sprint 65 Feature 65.3: Added pagination to avoid timeout with >100 conversations
 
+    Sessions are read from the sorted-set index maintained by save_conversation_turn
+    (see src/components/memory/session_index.py). Conversations stored before the
+    index existed are added with scripts/backfill_session_index.py.
+
     Args:
         limit: Maximum number of sessions to return (default: 50, max: 100)
         offset: Number of sessions to skip (default: 0)
@@ -1084,57 +1099,20 @@ async def list_sessions(limit: int = 50, offset: int = 0) -> SessionListResponse
     logger.info("session_list_requested", limit=limit, offset=offset)
 
     try:
-        from src.components.memory import get_redis_memory
-
-        redis_memory = get_redis_memory()
-
-        # Get Redis client for scanning
-        redis_client = await redis_memory.client
-
-        # Scan for conversation keys
-        conversation_keys = []
-        cursor = 0
-        while True:
-            cursor, keys = await redis_client.scan(cursor=cursor, match="conversation:*", count=100)
-            conversation_keys.extend(keys)
-            if cursor == 0:
-                break
-
-        # Retrieve session info for each conversation
-        sessions: list[SessionInfo] = []
-        for key in conversation_keys:
-            try:
-                # Extract session_id from key (format: "conversation:{session_id}")
-                session_id = key.split(":", 1)[1] if ":" in key else key
-
-                # Retrieve conversation data
-                conv_data = await redis_memory.retrieve(key=session_id, namespace="conversation")
-
-                if conv_data:
-                    # Extract value from Redis wrapper
-                    if isinstance(conv_data, dict) and "value" in conv_data:
-                        conv_data = conv_data["value"]
-
-                    # Create SessionInfo (Sprint 17 Feature 17.3: Include title)
-                    sessions.append(
-                        SessionInfo(
-                            session_id=session_id,
-                            message_count=conv_data.get("message_count", 0),
-                            last_activity=conv_data.get("updated_at"),
-                            created_at=conv_data.get("created_at"),
-                            title=conv_data.get("title"),  # Auto-generated or user-edited title
-                        )
-                    )
-            except Exception as e:
-                logger.warning("failed_to_retrieve_session", session_id=session_id, error=str(e))
-                continue
-
-        # Sort by last activity (most recent first)
-        sessions.sort(key=lambda s: s.last_activity or "", reverse=True)
-
-        # Sprint 65 Feature 65.3: Apply pagination
-        total_count = len(sessions)
-        paginated_sessions = sessions[offset : offset + limit]
+        from src.components.memory import get_session_index
+
+        # Sorted-set index: one ZREVRANGE + one pipelined HMGET round per page
+        summaries, total_count = await get_session_index().list_sessions(limit=limit, offset=offset)
+        paginated_sessions = [
+            SessionInfo(
+                session_id=summary.session_id,
+                message_count=summary.message_count,
+                last_activity=summary.updated_at,
+                created_at=summary.created_at,
+                title=summary.title,  # Auto-generated or user-edited title
+            )
+            for summary in summaries
+        ]
 
         logger.info(
             "session_list_retrieved",
@@ -1369,6 +1347,10 @@ async def delete_conversation_history(session_id: str) -> SessionDeleteResponse:
         # Delete from Redis
         await memory_api.delete(key=history_key, namespace="memory")
 
+        from src.components.memory import get_session_index
+
+        await get_session_index().remove(session_id)
+
         logger.info("conversation_history_deleted", session_id=session_id)
 
         return SessionDeleteResponse(
@@ -1487,6 +1469,8 @@ async def generate_title_for_session(session_id: str) -> TitleResponse:
             namespace="conversation",
         )
 
+        await _index_title(session_id, generated_title)
+
         logger.info("conversation_title_generated", session_id=session_id, title=generated_title)
 
         return TitleResponse(
@@ -1552,6 +1536,8 @@ async def update_conversation_title(session_id: str, request: UpdateTitleRequest
             namespace="conversation",
         )
 
+        await _index_title(session_id, request.title)
+
         logger.info("conversation_title_updated", session_id=session_id, new_title=request.title)
 
         return TitleResponse(
@@ -1571,6 +1557,16 @@ async def update_conversation_title(session_id: str, request: UpdateTitleRequest
 # Helper functions
 
 
+async def _index_title(session_id: str, title: str) -> None:
+    """Propagate a title change to the session sidebar index."""
+    try:
+        from src.components.memory import get_session_index
+
+        await get_session_index().update_title(session_id, title)
+    except Exception as e:
+        logger.warning("session_index_title_update_failed", session_id=session_id, error=str(e))
+
+
 def _extract_answer(result: dict[str, Any]) -> str:
     """Extract answer from coordinator result.
 
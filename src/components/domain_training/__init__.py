@@ -123,6 +123,7 @@ from src.components.domain_training.domain_analyzer import (
     DomainAnalyzer,
     get_domain_analyzer,
 )
+from src.components.domain_training.domain_catalog import DomainCatalog
 from src.components.domain_training.domain_classifier import (
     DomainClassifier,
     get_domain_classifier,
@@ -164,6 +165,8 @@ __all__ = [
     # Domain Repository (45.1)
     "DomainRepository",
     "get_domain_repository",
+    # Domain Catalog (Sprint 130.10)
+    "DomainCatalog",
     # DSPy Optimizer (45.2)
     "DSPyOptimizer",
     "EntityExtractionSignature",
@@ -344,8 +344,14 @@ class BatchIngestionService:
             documents: Documents to process
             options: Processing options
         """
+        from src.components.graph_rag.neo4j_client import get_neo4j_client
+
         semaphore = asyncio.Semaphore(options.parallel_workers)
 
+        # Sprint 130 Feature 130.11: One graph write buffer for the whole batch, so
+        # chunks, entities and edges of all documents are written in UNWIND batches
+        write_buffer = get_neo4j_client().create_write_buffer()
+
         async def process_with_semaphore(doc: DocumentRequest) -> DocumentResult:
             async with semaphore:
                 return await self._process_single_document(
@@ -354,6 +360,7 @@ class BatchIngestionService:
                     domain_config=domain_config,
                     document=doc,
                     options=options,
+                    write_buffer=write_buffer,
                 )
 
         # Process all documents in parallel
@@ -363,10 +370,26 @@ class BatchIngestionService:
                 return_exceptions=True,
             )
 
+            graph_write_error: str | None = None
+            try:
+                await write_buffer.flush()
+            except Exception as e:
+                graph_write_error = str(e)
+                logger.error("batch_graph_write_failed", batch_id=batch_id, error=str(e))
+
             # Update batch progress with all results
             async with self._batch_locks[batch_id]:
                 batch = self._batches[batch_id]
 
+                if graph_write_error:
+                    batch.errors.append(
+                        {
+                            "document_id": "unknown",
+                            "error": graph_write_error,
+                            "error_code": "GRAPH_WRITE_FAILED",
+                        }
+                    )
+
                 for result in results:
                     if isinstance(result, Exception):
                         # Handle unexpected exceptions
@@ -395,7 +418,7 @@ class BatchIngestionService:
                             )
 
                 # Update final status
-                if batch.failed_count > 0:
+                if batch.failed_count > 0 or graph_write_error:
                     batch.status = "completed_with_errors"
                 else:
                     batch.status = "completed"
@@ -432,6 +455,7 @@ class BatchIngestionService:
         domain_config: dict[str, Any],
         document: DocumentRequest,
         options: IngestionOptions,
+        write_buffer: Any | None = None,
     ) -> DocumentResult:
         """Process a single document with domain-specific extraction.
 
@@ -441,6 +465,8 @@ class BatchIngestionService:
             domain_config: Domain configuration
             document: Document to process
             options: Processing options
+            write_buffer: Shared GraphWriteBuffer of the batch (graph rows are
+                queued and flushed once the batch completes)
 
         Returns:
             Document result with statistics
@@ -526,6 +552,7 @@ class BatchIngestionService:
                     document_path=document.metadata.get("source", f"{document.document_id}.txt"),
                     namespace_id=domain_name,
                     domain_id=domain_name,
+                    write_buffer=write_buffer,
                 )
 
                 entities_count = extraction_result.get("entity_count", 0)
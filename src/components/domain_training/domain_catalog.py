@@ -0,0 +1,302 @@
+"""In-process Domain Catalog for ingestion-time domain lookups.
+
+Sprint 130 Feature 130.10: Domain Catalog
+
+Every document used to compute cosine similarity inside Cypher (``reduce``
+over 1024-element lists for every :Domain node) and every chunk's entity and
+relation pass fetched its prompts with another ``get_domain`` round-trip.
+Domains change rarely (training, admin edits) while lookups happen per chunk,
+so DomainCatalog keeps a versioned snapshot of all :Domain nodes in memory:
+
+    DomainRepository writes ─→ invalidate() ─→ version += 1
+                                                   │
+    get / match ─→ snapshot() ─→ reload on version change or TTL expiry
+                        │
+                        ├── records: name → domain dict (prompts, settings pre-parsed)
+                        └── match_matrix: L2-normalized float32 (n_domains × 1024)
+
+Domain matching becomes one matrix-vector product and prompt lookup a dict
+access. The TTL is a backstop for writes from other processes (API workers,
+training runner) that cannot invalidate this process's snapshot.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+EMBEDDING_DIM = 1024  # BGE-M3
+
+
+@dataclass(frozen=True)
+class DomainCatalogSnapshot:
+    """Immutable view of all domains at one catalog version.
+
+    Attributes:
+        version: Catalog version the snapshot was loaded at
+        loaded_at: Monotonic load time (for TTL expiry)
+        records: Domain name → domain dict (same fields as ``get_domain``)
+        extraction_settings: Domain name → parsed extraction settings
+        match_names: Domain names in ``match_matrix`` row order
+        match_matrix: L2-normalized description embeddings of matchable domains
+    """
+
+    version: int
+    loaded_at: float
+    records: dict[str, dict[str, Any]] = field(default_factory=dict)
+    extraction_settings: dict[str, dict[str, Any]] = field(default_factory=dict)
+    match_names: tuple[str, ...] = ()
+    match_matrix: np.ndarray = field(
+        default_factory=lambda: np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+    )
+
+    def match(self, embedding: list[float], threshold: float) -> tuple[str, float] | None:
+        """Find the most similar matchable domain.
+
+        Args:
+            embedding: Document embedding (1024-dim)
+            threshold: Minimum cosine similarity
+
+        Returns:
+            (domain name, cosine similarity) or None if no domain reaches the threshold
+        """
+        if not self.match_names:
+            return None
+
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return None
+
+        similarities = self.match_matrix @ (query / norm)
+        best = int(np.argmax(similarities))
+        score = float(similarities[best])
+        if score < threshold:
+            return None
+        return self.match_names[best], score
+
+
+def build_snapshot(
+    rows: list[dict[str, Any]],
+    version: int,
+    excluded_from_matching: frozenset[str] = frozenset(),
+) -> DomainCatalogSnapshot:
+    """Build a catalog snapshot from :Domain rows.
+
+    Only domains with status "ready" and a non-zero 1024-dim description
+    embedding take part in matching (same filter as the former Cypher query).
+
+    Args:
+        rows: Domain rows including ``description_embedding`` and
+            ``extraction_settings`` (JSON string)
+        version: Catalog version of the snapshot
+        excluded_from_matching: Domain names never returned by ``match``
+            (e.g. the default domain)
+
+    Returns:
+        DomainCatalogSnapshot
+    """
+    records: dict[str, dict[str, Any]] = {}
+    extraction_settings: dict[str, dict[str, Any]] = {}
+    match_names: list[str] = []
+    vectors: list[np.ndarray] = []
+
+    for row in rows:
+        record = dict(row)
+        name = record["name"]
+        embedding = record.pop("description_embedding", None)
+        settings_json = record.pop("extraction_settings", None)
+
+        try:
+            extraction_settings[name] = json.loads(settings_json) if settings_json else {}
+        except (TypeError, ValueError):
+            logger.warning("domain_catalog_invalid_extraction_settings", name=name)
+            extraction_settings[name] = {}
+
+        records[name] = record
+
+        if (
+            record.get("status") != "ready"
+            or name in excluded_from_matching
+            or not embedding
+            or len(embedding) != EMBEDDING_DIM
+        ):
+            continue
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            continue
+        match_names.append(name)
+        vectors.append(vector / norm)
+
+    match_matrix = np.vstack(vectors) if vectors else np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+
+    return DomainCatalogSnapshot(
+        version=version,
+        loaded_at=time.monotonic(),
+        records=records,
+        extraction_settings=extraction_settings,
+        match_names=tuple(match_names),
+        match_matrix=match_matrix,
+    )
+
+
+class DomainCatalog:
+    """Versioned in-memory cache of all :Domain nodes.
+
+    Example:
+        >>> catalog = DomainCatalog(load_rows, ttl_seconds=60)
+        >>> domain = await catalog.get("tech_docs")
+        >>> match = await catalog.match(doc_embedding, threshold=0.5)
+        >>> catalog.invalidate()  # after any domain write
+    """
+
+    def __init__(
+        self,
+        load_fn: Callable[[], Awaitable[list[dict[str, Any]]]],
+        ttl_seconds: float = 60.0,
+        excluded_from_matching: frozenset[str] = frozenset(),
+    ) -> None:
+        """Initialize domain catalog.
+
+        Args:
+            load_fn: Async function returning all :Domain rows
+            ttl_seconds: Maximum snapshot age before reloading (0 disables caching)
+            excluded_from_matching: Domain names never returned by ``match``
+        """
+        self.load_fn = load_fn
+        self.ttl_seconds = ttl_seconds
+        self.excluded_from_matching = excluded_from_matching
+
+        self._version = 0
+        self._snapshot: DomainCatalogSnapshot | None = None
+        self._load_lock: asyncio.Lock | None = None
+
+        # Metrics
+        self.loads = 0
+        self.hits = 0
+
+    @property
+    def version(self) -> int:
+        """Current catalog version (incremented on every invalidation)."""
+        return self._version
+
+    def invalidate(self) -> None:
+        """Mark the current snapshot stale; the next lookup reloads it."""
+        self._version += 1
+        logger.debug("domain_catalog_invalidated", version=self._version)
+
+    def _is_fresh(self, snapshot: DomainCatalogSnapshot | None) -> bool:
+        """Check whether a snapshot can still be served."""
+        return (
+            snapshot is not None
+            and snapshot.version == self._version
+            and time.monotonic() - snapshot.loaded_at < self.ttl_seconds
+        )
+
+    async def snapshot(self) -> DomainCatalogSnapshot:
+        """Get the current snapshot, reloading it if stale.
+
+        Concurrent callers share a single reload.
+
+        Returns:
+            Current DomainCatalogSnapshot
+
+        Raises:
+            Exception: Whatever ``load_fn`` raises (the previous snapshot stays stale)
+        """
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot):
+            self.hits += 1
+            return snapshot  # type: ignore[return-value]
+
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+
+        async with self._load_lock:
+            snapshot = self._snapshot
+            if self._is_fresh(snapshot):
+                self.hits += 1
+                return snapshot  # type: ignore[return-value]
+
+            version = self._version
+            start = time.perf_counter()
+            rows = await self.load_fn()
+            snapshot = build_snapshot(rows, version, self.excluded_from_matching)
+            self._snapshot = snapshot
+            self.loads += 1
+
+            logger.info(
+                "domain_catalog_loaded",
+                version=version,
+                domains=len(snapshot.records),
+                matchable_domains=len(snapshot.match_names),
+                load_ms=round((time.perf_counter() - start) * 1000, 2),
+            )
+            return snapshot
+
+    async def get(self, name: str) -> dict[str, Any] | None:
+        """Get a domain dict by name.
+
+        Args:
+            name: Domain name
+
+        Returns:
+            Copy of the domain dict or None if not found
+        """
+        record = (await self.snapshot()).records.get(name)
+        return dict(record) if record is not None else None
+
+    async def get_extraction_settings(self, name: str) -> dict[str, Any]:
+        """Get parsed extraction settings of a domain.
+
+        Args:
+            name: Domain name
+
+        Returns:
+            Copy of the extraction settings (empty dict if not set)
+        """
+        return dict((await self.snapshot()).extraction_settings.get(name, {}))
+
+    async def match(
+        self, embedding: list[float], threshold: float
+    ) -> tuple[dict[str, Any], float] | None:
+        """Find the best matching domain for an embedding.
+
+        Args:
+            embedding: Document embedding (1024-dim)
+            threshold: Minimum cosine similarity
+
+        Returns:
+            (domain dict, cosine similarity) or None if no match
+        """
+        snapshot = await self.snapshot()
+        result = snapshot.match(embedding, threshold)
+        if result is None:
+            return None
+        name, score = result
+        return dict(snapshot.records[name]), score
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get catalog statistics.
+
+        Returns:
+            Stats dict with version, load/hit counts and snapshot size
+        """
+        snapshot = self._snapshot
+        return {
+            "version": self._version,
+            "loads": self.loads,
+            "hits": self.hits,
+            "domains": len(snapshot.records) if snapshot else 0,
+            "matchable_domains": len(snapshot.match_names) if snapshot else 0,
+            "ttl_seconds": self.ttl_seconds,
+        }
@@ -2,11 +2,15 @@
 
 Sprint 45 - Feature 45.1: Domain Registry in Neo4j
 Sprint 83 - Feature 83.2: ERExtractionSettings (Cascade Configuration)
+Sprint 130 - Feature 130.10: In-process Domain Catalog
 
 This module provides a repository for managing domain-specific extraction prompts
 and training configurations in Neo4j. Domains are matched to documents using
 semantic similarity of description embeddings.
 
+Ingestion-time lookups (domain matching, prompts, extraction settings) are served
+from an in-process DomainCatalog snapshot that every write method invalidates.
+
 Neo4j Schema:
     (:Domain {
         id: uuid,
@@ -72,6 +76,7 @@ from tenacity import (
     wait_exponential,
 )
 
+from src.components.domain_training.domain_catalog import DomainCatalog
 from src.components.graph_rag.neo4j_client import get_neo4j_client
 from src.core.config import settings
 from src.core.exceptions import DatabaseConnectionError
@@ -86,6 +91,9 @@ DEFAULT_DOMAIN_DESCRIPTION = (
 DEFAULT_SIMILARITY_THRESHOLD = 0.5
 MAX_RETRY_ATTEMPTS = 3
 
+# Domain fields returned by find_best_matching_domain
+MATCH_RESULT_FIELDS = ("id", "name", "description", "entity_prompt", "relation_prompt", "llm_model")
+
 
 # --- Pydantic Models ---
 
@@ -194,6 +202,11 @@ class DomainRepository:
     def __init__(self) -> None:
         """Initialize domain repository with Neo4j client."""
         self.neo4j_client = get_neo4j_client()
+        self.catalog = DomainCatalog(
+            self._load_catalog_rows,
+            ttl_seconds=settings.domain_catalog_ttl_seconds,
+            excluded_from_matching=frozenset({DEFAULT_DOMAIN_NAME}),
+        )
         logger.info(
             "domain_repository_initialized",
             neo4j_uri=settings.neo4j_uri,
@@ -225,6 +238,8 @@ class DomainRepository:
                 except Exception:
                     await tx.rollback()
                     raise
+        # Writes inside the transaction are visible only after commit
+        self.catalog.invalidate()
 
     @retry(
         stop=stop_after_attempt(MAX_RETRY_ATTEMPTS),
@@ -411,6 +426,8 @@ class DomainRepository:
                 await self.neo4j_client.execute_write(query, params)
                 record = None
 
+            self.catalog.invalidate()
+
             logger.info(
                 "domain_created",
                 domain_id=domain_id,
@@ -435,11 +452,40 @@ class DomainRepository:
             logger.error("domain_creation_failed", name=name, error=str(e))
             raise DatabaseConnectionError("Neo4j", f"Domain creation failed: {e}") from e
 
-    async def get_domain(self, name: str) -> dict[str, Any] | None:
+    async def _load_catalog_rows(self) -> list[dict[str, Any]]:
+        """Load all domains for the in-process DomainCatalog.
+
+        Returns:
+            Domain rows with the ``get_domain`` fields plus
+            ``description_embedding`` and ``extraction_settings``
+        """
+        return await self.neo4j_client.execute_read(
+            """
+            MATCH (d:Domain)
+            RETURN d.id as id, d.name as name, d.description as description,
+                   d.entity_prompt as entity_prompt, d.relation_prompt as relation_prompt,
+                   d.entity_examples as entity_examples,
+                   d.relation_examples as relation_examples,
+                   d.llm_model as llm_model, d.training_samples as training_samples,
+                   d.training_metrics as training_metrics, d.status as status,
+                   d.created_at as created_at, d.updated_at as updated_at,
+                   d.trained_at as trained_at,
+                   d.entity_sub_type_mapping as entity_sub_type_mapping,
+                   d.relation_hints as relation_hints,
+                   d.cross_sentence_window_size as cross_sentence_window_size,
+                   d.cross_sentence_overlap as cross_sentence_overlap,
+                   d.description_embedding as description_embedding,
+                   d.extraction_settings as extraction_settings
+            """
+        )
+
+    async def get_domain(self, name: str, cached: bool = False) -> dict[str, Any] | None:
         """Get domain configuration by name.
 
         Args:
             name: Domain name
+            cached: Serve from the in-process domain catalog instead of querying
+                Neo4j (for hot paths such as per-chunk extraction)
 
         Returns:
             Domain configuration dict or None if not found
@@ -447,6 +493,13 @@ class DomainRepository:
         Raises:
             DatabaseConnectionError: If query fails
         """
+        if cached:
+            try:
+                return await self.catalog.get(name)
+            except Exception as e:
+                logger.error("get_domain_failed", name=name, error=str(e), cached=True)
+                raise DatabaseConnectionError("Neo4j", f"Get domain failed: {e}") from e
+
         logger.info("getting_domain", name=name)
 
         try:
@@ -551,6 +604,8 @@ class DomainRepository:
             else:
                 await self.neo4j_client.execute_write(query, params)
 
+            self.catalog.invalidate()
+
             logger.info("domain_status_updated", domain=domain_name, status=status)
 
         except Exception as e:
@@ -629,6 +684,8 @@ class DomainRepository:
             else:
                 await self.neo4j_client.execute_write(query, params)
 
+            self.catalog.invalidate()
+
             logger.info("training_results_saved", domain=domain_name, status=status)
 
         except Exception as e:
@@ -700,6 +757,8 @@ class DomainRepository:
                 },
             )
 
+            self.catalog.invalidate()
+
             logger.info("domain_prompts_updated", name=name, status="ready")
             return True
 
@@ -750,6 +809,8 @@ class DomainRepository:
                 },
             )
 
+            self.catalog.invalidate()
+
             logger.info("extraction_settings_updated", name=name)
             return True
 
@@ -757,13 +818,14 @@ class DomainRepository:
             logger.error("update_extraction_settings_failed", name=name, error=str(e))
             raise DatabaseConnectionError("Neo4j", f"Update extraction settings failed: {e}") from e
 
-    async def get_extraction_settings(self, name: str) -> dict[str, Any]:
+    async def get_extraction_settings(self, name: str, cached: bool = False) -> dict[str, Any]:
         """Get domain extraction settings.
 
         Sprint 83 Feature 83.4: Retrieve ERExtractionSettings for document processing.
 
         Args:
             name: Domain name
+            cached: Serve pre-parsed settings from the in-process domain catalog
 
         Returns:
             Extraction settings dict (empty dict if not set)
@@ -771,6 +833,15 @@ class DomainRepository:
         Raises:
             DatabaseConnectionError: If query fails
         """
+        if cached:
+            try:
+                return await self.catalog.get_extraction_settings(name)
+            except Exception as e:
+                logger.error("get_extraction_settings_failed", name=name, error=str(e), cached=True)
+                raise DatabaseConnectionError(
+                    "Neo4j", f"Get extraction settings failed: {e}"
+                ) from e
+
         logger.info("getting_extraction_settings", name=name)
 
         try:
@@ -811,7 +882,8 @@ class DomainRepository:
             Dict with {"domain": domain_dict, "score": float} or None if no match
 
         Raises:
-            DatabaseConnectionError: If query fails
+            ValueError: If the embedding is not 1024-dim
+            DatabaseConnectionError: If loading the domain catalog fails
         """
         logger.info(
             "finding_best_matching_domain",
@@ -824,34 +896,11 @@ class DomainRepository:
             raise ValueError(f"Embedding must be 1024-dim, got {len(document_embedding)}")
 
         try:
-            # Calculate cosine similarity using Neo4j vector functions
-            # Note: Neo4j uses gds.similarity.cosine for vector similarity
-            # Formula: similarity = dot(a, b) / (norm(a) * norm(b))
-            results = await self.neo4j_client.execute_read(
-                """
-                MATCH (d:Domain)
-                WHERE d.status = 'ready' AND d.name <> $default_domain
-                WITH d,
-                     reduce(dot = 0.0, i IN range(0, size(d.description_embedding)-1) |
-                            dot + d.description_embedding[i] * $doc_embedding[i]) AS dot_product,
-                     sqrt(reduce(sum = 0.0, x IN d.description_embedding | sum + x * x)) AS norm_domain,
-                     sqrt(reduce(sum = 0.0, x IN $doc_embedding | sum + x * x)) AS norm_doc
-                WITH d, dot_product / (norm_domain * norm_doc) AS similarity
-                WHERE similarity >= $threshold
-                RETURN d.id as id, d.name as name, d.description as description,
-                       d.entity_prompt as entity_prompt, d.relation_prompt as relation_prompt,
-                       d.llm_model as llm_model, similarity
-                ORDER BY similarity DESC
-                LIMIT 1
-                """,
-                {
-                    "doc_embedding": document_embedding,
-                    "threshold": threshold,
-                    "default_domain": DEFAULT_DOMAIN_NAME,
-                },
-            )
+            # Cosine similarity against the catalog's normalized embedding matrix
+            # (one matrix-vector product instead of per-node reduce() in Cypher)
+            result = await self.catalog.match(document_embedding, threshold)
 
-            if not results:
+            if result is None:
                 logger.info(
                     "no_matching_domain_found",
                     threshold=threshold,
@@ -859,8 +908,8 @@ class DomainRepository:
                 )
                 return None
 
-            match = results[0]
-            score = match.pop("similarity")
+            domain, score = result
+            match = {key: domain.get(key) for key in MATCH_RESULT_FIELDS}
 
             logger.info(
                 "domain_matched",
@@ -1019,6 +1068,8 @@ class DomainRepository:
                 params,
             )
 
+            self.catalog.invalidate()
+
             # Retrieve updated domain
             updated_domain = await self.get_domain(name)
             if not updated_domain:
@@ -1075,6 +1126,8 @@ class DomainRepository:
                 {"name": name},
             )
 
+            self.catalog.invalidate()
+
             logger.info("domain_deleted", name=name)
             return True
 
@@ -679,6 +679,7 @@ async def run_dspy_optimization(
                 """,
                 {"name": domain_name},
             )
+            repo.catalog.invalidate()
         except Exception as status_error:
             logger.error(
                 "failed_to_update_domain_status",
@@ -8,16 +8,23 @@ Features:
 - PageRank calculation
 - Influential entity detection
 - Knowledge gap identification
-- Uses Neo4j GDS when available, falls back to NetworkX
+- Uses Neo4j GDS when available, falls back to the shared in-memory
+  GraphProjection (CSR adjacency, per-version metric tables)
 - Result caching for expensive calculations
 """
 
+import asyncio
 import time
 from typing import Any, Literal
 
-import networkx as nx
 import structlog
 
+from src.components.graph_rag.graph_projection import (
+    GraphProjection,
+    GraphProjectionStore,
+    ProjectionMetric,
+    get_graph_projection_store,
+)
 from src.components.graph_rag.neo4j_client import Neo4jClient, get_neo4j_client
 from src.core.config import settings
 from src.core.exceptions import DatabaseConnectionError
@@ -30,15 +37,21 @@ CentralityMetric = Literal["degree", "betweenness", "closeness", "eigenvector"]
 
 
 class GraphAnalyticsEngine:
-    """Graph analytics engine with GDS and NetworkX support."""
+    """Graph analytics engine with GDS and in-memory projection support."""
 
-    def __init__(self, neo4j_client: Neo4jClient | None = None) -> None:
+    def __init__(
+        self,
+        neo4j_client: Neo4jClient | None = None,
+        projection_store: GraphProjectionStore | None = None,
+    ) -> None:
         """Initialize the analytics engine.
 
         Args:
             neo4j_client: Neo4j client instance (defaults to singleton)
+            projection_store: Graph projection store (defaults to singleton)
         """
         self.neo4j_client = neo4j_client or get_neo4j_client()
+        self.projection_store = projection_store or get_graph_projection_store()
         self.use_gds = settings.graph_analytics_use_gds
         self.pagerank_iterations = settings.graph_analytics_pagerank_iterations
         self.cache_ttl = settings.graph_analytics_cache_ttl_seconds
@@ -82,6 +95,30 @@ class GraphAnalyticsEngine:
         self._cache[key] = (time.time(), value)
         logger.debug("Value cached", key=key)
 
+    async def _get_projection(self) -> GraphProjection:
+        """Get the shared graph projection for the current graph version.
+
+        Returns:
+            GraphProjection (reloaded from Neo4j only if the graph changed)
+        """
+        return await self.projection_store.get(self.neo4j_client)
+
+    async def _projection_score(self, metric: ProjectionMetric, entity_id: str) -> float:
+        """Read one entity's score from the projection's metric table.
+
+        The table is computed once per graph version; the first call for a
+        metric runs off the event loop.
+
+        Args:
+            metric: Projection metric name
+            entity_id: Entity ID
+
+        Returns:
+            Score (0.0 for unknown entities)
+        """
+        projection = await self._get_projection()
+        return await asyncio.to_thread(projection.score, metric, entity_id)
+
     async def _check_gds_availability(self) -> bool:
         """Check if Neo4j GDS plugin is available.
 
@@ -94,7 +131,9 @@ class GraphAnalyticsEngine:
                 logger.info("Neo4j GDS available", version=result[0].get("version"))
                 return True
         except Exception as e:
-            logger.warning("Neo4j GDS not available, will use NetworkX", error=str(e))
+            logger.warning(
+                "Neo4j GDS not available, will use in-memory graph projection", error=str(e)
+            )
         return False
 
     async def calculate_centrality(
@@ -169,7 +208,7 @@ class GraphAnalyticsEngine:
         return float(result[0].get("degree", 0)) if result else 0.0  # type: ignore[no-any-return]
 
     async def _calculate_betweenness_centrality(self, entity_id: str) -> float:
-        """Calculate betweenness centrality using GDS or NetworkX.
+        """Calculate betweenness centrality using GDS or the graph projection.
 
         Args:
             entity_id: Entity ID
@@ -191,15 +230,13 @@ class GraphAnalyticsEngine:
                 if result:
                     return float(result[0].get("score", 0.0))  # type: ignore[no-any-return]
             except Exception as e:
-                logger.warning("GDS betweenness failed, using NetworkX", error=str(e))
+                logger.warning("GDS betweenness failed, using graph projection", error=str(e))
 
-        # Fallback to NetworkX
-        graph = await self._build_networkx_graph()
-        betweenness = nx.betweenness_centrality(graph)
-        return betweenness.get(entity_id, 0.0)  # type: ignore[no-any-return]
+        # Fallback to the shared projection (sampled for large graphs)
+        return await self._projection_score("betweenness", entity_id)
 
     async def _calculate_closeness_centrality(self, entity_id: str) -> float:
-        """Calculate closeness centrality using NetworkX.
+        """Calculate closeness centrality from the graph projection.
 
         Args:
             entity_id: Entity ID
@@ -207,26 +244,18 @@ class GraphAnalyticsEngine:
         Returns:
             Normalized closeness centrality (0-1)
         """
-        graph = await self._build_networkx_graph()
-        closeness = nx.closeness_centrality(graph)
-        return closeness.get(entity_id, 0.0)  # type: ignore[no-any-return]
+        return await self._projection_score("closeness", entity_id)
 
     async def _calculate_eigenvector_centrality(self, entity_id: str) -> float:
-        """Calculate eigenvector centrality using NetworkX.
+        """Calculate eigenvector centrality from the graph projection.
 
         Args:
             entity_id: Entity ID
 
         Returns:
-            Eigenvector centrality (0-1)
+            Eigenvector centrality (0-1, 0.0 if power iteration did not converge)
         """
-        graph = await self._build_networkx_graph()
-        try:
-            eigenvector = nx.eigenvector_centrality(graph, max_iter=100)
-            return eigenvector.get(entity_id, 0.0)  # type: ignore[no-any-return]
-        except nx.PowerIterationFailedConvergence:
-            logger.warning("Eigenvector centrality failed to converge", entity_id=entity_id)
-            return 0.0
+        return await self._projection_score("eigenvector", entity_id)
 
     async def calculate_pagerank(self, entity_ids: list[str] | None = None) -> list[dict[str, Any]]:
         """Calculate PageRank scores for entities.
@@ -263,19 +292,17 @@ class GraphAnalyticsEngine:
                     query, {"iterations": self.pagerank_iterations, "entity_ids": entity_ids}
                 )
             else:
-                # Fallback to NetworkX
-                graph = await self._build_networkx_graph()
-                pagerank = nx.pagerank(graph, max_iter=self.pagerank_iterations)
+                # Fallback to the shared projection
+                projection = await self._get_projection()
+                ranked = await asyncio.to_thread(projection.ranked, "pagerank")
 
                 if entity_ids:
+                    pagerank = dict(ranked)
                     result = [
                         {"entity_id": eid, "score": pagerank.get(eid, 0.0)} for eid in entity_ids
                     ]
                 else:
-                    result = [
-                        {"entity_id": eid, "score": score}
-                        for eid, score in sorted(pagerank.items(), key=lambda x: x[1], reverse=True)
-                    ]
+                    result = [{"entity_id": eid, "score": score} for eid, score in ranked]
 
             self._set_cached(cache_key, result)
             return result
@@ -346,9 +373,9 @@ class GraphAnalyticsEngine:
             """
             sparse = await self.neo4j_client.execute_query(sparse_query)
 
-            # Count connected components using NetworkX
-            graph = await self._build_networkx_graph()
-            num_components = nx.number_connected_components(graph.to_undirected())
+            # Count connected components on the shared projection
+            projection = await self._get_projection()
+            num_components = projection.num_weak_components
 
             result = {
                 "orphan_entities": orphans,
@@ -457,50 +484,6 @@ class GraphAnalyticsEngine:
                 "Neo4j", f"Graph statistics calculation failed: {e}"
             ) from e
 
-    async def _build_networkx_graph(self) -> nx.DiGraph:
-        """Build a NetworkX graph from Neo4j data for fallback algorithms.
-
-        Returns:
-            NetworkX DiGraph
-
-        Raises:
-            DatabaseConnectionError: If graph construction fails
-        """
-        cache_key = "networkx_graph"
-        cached = self._get_cached(cache_key)
-        if cached:
-            return cached
-
-        logger.info("Building NetworkX graph from Neo4j")
-
-        try:
-            # Fetch all nodes and relationships
-            query = """
-            MATCH (n)-[r]->(m)
-            RETURN n.id AS source, m.id AS target, type(r) AS rel_type
-            """
-            result = await self.neo4j_client.execute_query(query)
-
-            # Build NetworkX graph
-            graph = nx.DiGraph()
-            for row in result:
-                graph.add_edge(row["source"], row["target"], type=row["rel_type"])
-
-            logger.info(
-                "NetworkX graph built", nodes=graph.number_of_nodes(), edges=graph.number_of_edges()
-            )
-
-            # Cache for shorter duration (graph changes frequently)
-            self._set_cached(cache_key, graph)
-
-            return graph
-
-        except Exception as e:
-            logger.error("Failed to build NetworkX graph", error=str(e))
-            raise DatabaseConnectionError(
-                "Neo4j", f"NetworkX graph construction failed: {e}"
-            ) from e
-
 
 # Singleton instance
 _analytics_engine: GraphAnalyticsEngine | None = None
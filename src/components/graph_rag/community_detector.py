@@ -6,6 +6,7 @@ clusters of densely connected entities that share common characteristics.
 
 Sprint 6.3: Feature - Community Detection & Clustering
 Sprint 11.7: Performance Optimization - Caching & Async Execution
+Sprint 130 Feature 130.9: Incremental detection from graph deltas
 
 Supports:
 - Leiden algorithm (primary)
@@ -15,6 +16,8 @@ Supports:
 - Community storage in Neo4j (community_id property)
 - LRU caching for NetworkX operations (10 most recent graphs)
 - Async execution via thread pool for CPU-bound operations
+- Incremental mode: persisted adjacency snapshot, only edges added/removed
+  since the last run are read and only their neighborhood is re-clustered
 """
 
 import asyncio
@@ -23,6 +26,7 @@ import time
 import uuid
 from datetime import UTC, datetime
 from functools import lru_cache
+from pathlib import Path
 
 import networkx as nx
 import structlog
@@ -34,6 +38,7 @@ from tenacity import (
     wait_exponential,
 )
 
+from src.components.graph_rag.community_graph_snapshot import CommunityGraphSnapshot
 from src.components.graph_rag.neo4j_client import Neo4jClient
 from src.core.config import settings
 from src.core.exceptions import DatabaseConnectionError
@@ -41,6 +46,15 @@ from src.core.models import Community
 
 logger = structlog.get_logger(__name__)
 
+# Sprint 130 Feature 130.9: Membership rows per UNWIND write transaction
+COMMUNITY_WRITE_BATCH_SIZE = 10000
+
+# Directed entity edges; self-loops and entities without ID are not clustered
+_EDGES_MATCH = """
+MATCH (e1:base)-[r:RELATES_TO]->(e2:base)
+WHERE e1.entity_id IS NOT NULL AND e2.entity_id IS NOT NULL AND e1 <> e2
+"""
+
 
 def _hash_graph(graph: nx.Graph, algorithm: str, resolution: float) -> str:
     """Generate a hash key for graph structure and parameters.
@@ -166,6 +180,11 @@ class CommunityDetector:
         # Cache for GDS availability check
         self._gds_available: bool | None = None
 
+        # Sprint 130 Feature 130.9: Incremental detection state
+        self.snapshot_path = Path(settings.graph_community_snapshot_path)
+        self._snapshot: CommunityGraphSnapshot | None = None
+        self._incremental_lock = asyncio.Lock()
+
         logger.info(
             "community_detector_initialized",
             algorithm=self.algorithm,
@@ -208,18 +227,23 @@ class CommunityDetector:
         algorithm: str | None = None,
         resolution: float | None = None,
         track_delta: bool = True,
+        incremental: bool | None = None,
     ) -> list[Community]:
         """Run community detection on the knowledge graph.
 
         Sprint 52 Feature 52.1: Added delta tracking for incremental summary updates.
+        Sprint 130 Feature 130.9: Added incremental mode.
 
         Args:
             algorithm: Detection algorithm ('leiden' or 'louvain')
             resolution: Resolution parameter (default: from settings)
             track_delta: Track community changes for incremental updates (default: True)
+            incremental: Re-cluster only the neighborhood of changed edges
+                (default: settings.graph_community_incremental_enabled)
 
         Returns:
-            List of detected Community objects
+            List of detected Community objects (incremental mode: re-clustered
+            communities only)
 
         Raises:
             DatabaseConnectionError: If detection fails
@@ -228,6 +252,11 @@ class CommunityDetector:
         algo = algorithm or self.algorithm
         res = resolution or self.resolution
 
+        if incremental is None:
+            incremental = settings.graph_community_incremental_enabled
+        if incremental:
+            return await self._detect_incremental(algo, res, track_delta)
+
         logger.info("community_detection_started", algorithm=algo, resolution=res)
 
         try:
@@ -256,6 +285,9 @@ class CommunityDetector:
             # Store community IDs on entity nodes
             await self._store_communities(communities)
 
+            # Assignment changed outside the incremental snapshot
+            self._invalidate_snapshot()
+
             # Sprint 52: Track changes and trigger summary updates
             if track_delta and entities_before:
                 from src.components.graph_rag.community_delta_tracker import (
@@ -544,40 +576,253 @@ class CommunityDetector:
     async def _store_communities(self, communities: list[Community]) -> None:
         """Store community IDs on entity nodes in Neo4j.
 
+        Sprint 130 Feature 130.9: All memberships are written in batched UNWIND
+        transactions instead of one transaction per community.
+
         Args:
             communities: List of Community objects
         """
         logger.info("storing_communities", count=len(communities))
 
+        assignments = [
+            {"entity_id": entity_id, "community_id": community.id}
+            for community in communities
+            for entity_id in community.entity_ids
+        ]
+
         try:
-            for community in communities:
-                # Update all entities in this community
-                cypher = """
-                UNWIND $entity_ids AS entity_id
-                MATCH (e:base {entity_id: entity_id})
-                SET e.community_id = $community_id
-                RETURN count(e) AS updated_count
-                """
+            await self._write_assignments(assignments)
+        except Exception as e:
+            logger.error("store_communities_failed", error=str(e))
+            raise
 
-                result = await self.neo4j_client.execute_write(
-                    cypher,
-                    {
-                        "entity_ids": community.entity_ids,
-                        "community_id": community.id,
-                    },
+    async def _write_assignments(self, assignments: list[dict[str, str]]) -> None:
+        """Write entity → community assignments with batched UNWIND.
+
+        Args:
+            assignments: Dicts with 'entity_id' and 'community_id'
+        """
+        cypher = """
+        UNWIND $assignments AS a
+        MATCH (e:base {entity_id: a.entity_id})
+        SET e.community_id = a.community_id
+        """
+
+        for offset in range(0, len(assignments), COMMUNITY_WRITE_BATCH_SIZE):
+            batch = assignments[offset : offset + COMMUNITY_WRITE_BATCH_SIZE]
+            result = await self.neo4j_client.execute_write(cypher, {"assignments": batch})
+
+            # execute_write returns summary dict with properties_set count
+            updated_count = result.get("properties_set", 0) if isinstance(result, dict) else 0
+            logger.debug(
+                "community_assignments_stored",
+                batch_size=len(batch),
+                entities_updated=updated_count,
+            )
+
+    # ------------------------------------------------------------------
+    # Sprint 130 Feature 130.9: Incremental detection
+    # ------------------------------------------------------------------
+
+    async def _detect_incremental(
+        self, algorithm: str, resolution: float, track_delta: bool
+    ) -> list[Community]:
+        """Re-cluster only the neighborhood of edges changed since the last run.
+
+        Flow:
+        1. Load the persisted snapshot (first run: full detection, then seed it)
+        2. Read RELATES_TO edges created since the snapshot cursor
+        3. Compare the distinct edge count; on mismatch (deletions) diff the full edge list
+        4. Re-cluster the affected region in a worker thread
+        5. Write changed memberships in one UNWIND, feed the delta tracker/summarizer
+
+        Args:
+            algorithm: Detection algorithm of the snapshot
+            resolution: Resolution parameter
+            track_delta: Re-summarize changed communities
+
+        Returns:
+            Re-clustered communities (filtered by min_size)
+        """
+        async with self._incremental_lock:
+            start_time = time.time()
+            loop = asyncio.get_event_loop()
+
+            snapshot = self._snapshot
+            if snapshot is None or (snapshot.algorithm, snapshot.resolution) != (
+                algorithm,
+                resolution,
+            ):
+                snapshot = await loop.run_in_executor(
+                    None, CommunityGraphSnapshot.load, self.snapshot_path, algorithm, resolution
                 )
 
-                # execute_write returns summary dict with properties_set count
-                updated_count = result.get("properties_set", 0) if isinstance(result, dict) else 0
-                logger.debug(
-                    "community_stored",
-                    community_id=community.id,
-                    entities_updated=updated_count,
+            if snapshot is None:
+                logger.info("community_snapshot_missing", action="full_detection")
+                communities = await self.detect_communities(
+                    algorithm, resolution, track_delta=track_delta, incremental=False
                 )
+                self._snapshot = await self._build_snapshot(algorithm, resolution)
+                await loop.run_in_executor(None, self._snapshot.save, self.snapshot_path)
+                return communities
 
-        except Exception as e:
-            logger.error("store_communities_failed", error=str(e))
-            raise
+            self._snapshot = snapshot
+
+            # Edges added since the last run (MERGE refreshes created_at, so
+            # re-touched edges show up again and are ignored by the snapshot)
+            added, cursor = await self._read_edges(since=snapshot.cursor)
+            touched = snapshot.apply_edge_changes(added=added)
+
+            removed: list[tuple[str, str]] = []
+            current_count = await self._count_edges()
+            if current_count != snapshot.edge_count:
+                logger.info(
+                    "community_snapshot_edge_mismatch",
+                    neo4j_edges=current_count,
+                    snapshot_edges=snapshot.edge_count,
+                    action="full_edge_diff",
+                )
+                current_edges, cursor = await self._read_edges()
+                missing, removed = snapshot.diff_edges(set(current_edges))
+                touched |= snapshot.apply_edge_changes(added=missing, removed=removed)
+
+            if cursor is not None:
+                snapshot.cursor = cursor
+
+            result = await loop.run_in_executor(
+                None,
+                snapshot.reoptimize,
+                touched,
+                resolution,
+                settings.graph_community_incremental_max_region_ratio,
+            )
+
+            await self._write_assignments(
+                [
+                    {"entity_id": entity_id, "community_id": f"community_{community_id}"}
+                    for entity_id, community_id in sorted(result.changed.items())
+                ]
+            )
+            await loop.run_in_executor(None, snapshot.save, self.snapshot_path)
+
+            if track_delta and result.changed:
+                from src.components.graph_rag.community_delta_tracker import (
+                    track_community_changes,
+                )
+
+                delta = await track_community_changes(result.before, result.after)
+                if delta.has_changes():
+                    from src.components.graph_rag.community_summarizer import (
+                        get_community_summarizer,
+                    )
+
+                    summarizer = get_community_summarizer()
+                    summaries = await summarizer.update_summaries_for_delta(delta)
+
+                    logger.info(
+                        "community_summaries_updated_after_detection",
+                        summaries_generated=len(summaries),
+                    )
+
+            communities = []
+            for community_id in sorted(set(result.after.values())):
+                entity_ids = sorted(snapshot.community_members(community_id))
+                if len(entity_ids) < self.min_size:
+                    continue
+                communities.append(
+                    Community(
+                        id=f"community_{community_id}",
+                        label="",  # Will be filled by labeler
+                        entity_ids=entity_ids,
+                        size=len(entity_ids),
+                        density=snapshot.density(entity_ids),
+                        created_at=datetime.now(UTC),
+                        metadata={
+                            "algorithm": "louvain",  # Region re-clustering uses Louvain
+                            "resolution": resolution,
+                            "method": "networkx_incremental",
+                            "region_size": len(result.region),
+                            "full": result.full,
+                        },
+                    )
+                )
+
+            logger.info(
+                "community_detection_completed",
+                algorithm=algorithm,
+                mode="incremental",
+                edges_added=len(added),
+                edges_removed=len(removed),
+                touched_entities=len(touched),
+                region_size=len(result.region),
+                memberships_changed=len(result.changed),
+                communities_found=len(communities),
+                execution_time_ms=(time.time() - start_time) * 1000,
+            )
+
+            return communities
+
+    async def _read_edges(
+        self, since: str | None = None
+    ) -> tuple[list[tuple[str, str]], str | None]:
+        """Read directed entity edges, optionally only those created since a cursor.
+
+        Args:
+            since: ISO timestamp; only edges with created_at >= since (None = all)
+
+        Returns:
+            Tuple of (edges, highest created_at seen)
+        """
+        where = "AND r.created_at >= datetime($since)" if since else ""
+        cypher = f"""
+        {_EDGES_MATCH}
+        {where}
+        RETURN e1.entity_id AS source, e2.entity_id AS target,
+               toString(r.created_at) AS created_at
+        """
+        records = await self.neo4j_client.execute_read(cypher, {"since": since})
+
+        edges = [(r["source"], r["target"]) for r in records]
+        timestamps = [r["created_at"] for r in records if r.get("created_at")]
+        return edges, max(timestamps, default=since)
+
+    async def _count_edges(self) -> int:
+        """Count distinct directed entity edges in Neo4j."""
+        records = await self.neo4j_client.execute_read(
+            f"""
+            {_EDGES_MATCH}
+            RETURN count(DISTINCT [e1.entity_id, e2.entity_id]) AS edges
+            """
+        )
+        return int(records[0]["edges"]) if records else 0
+
+    async def _build_snapshot(self, algorithm: str, resolution: float) -> CommunityGraphSnapshot:
+        """Seed the incremental snapshot from Neo4j after a full detection."""
+        from src.components.graph_rag.community_delta_tracker import (
+            get_entity_communities_snapshot,
+        )
+
+        edges, cursor = await self._read_edges()
+        membership = await get_entity_communities_snapshot(self.neo4j_client)
+
+        snapshot = CommunityGraphSnapshot.from_edges(
+            edges, membership, cursor, algorithm, resolution
+        )
+        logger.info(
+            "community_snapshot_built",
+            nodes=snapshot.node_count,
+            edges=snapshot.edge_count,
+            communities=len(set(snapshot.membership.values())),
+        )
+        return snapshot
+
+    def _invalidate_snapshot(self) -> None:
+        """Drop the incremental snapshot (assignment was rewritten by a full run)."""
+        self._snapshot = None
+        try:
+            self.snapshot_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("community_snapshot_invalidate_failed", error=str(e))
 
     async def get_community(self, community_id: str) -> Community | None:
         """Get community details by ID.
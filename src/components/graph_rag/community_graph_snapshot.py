@@ -0,0 +1,408 @@
+"""Persisted adjacency snapshot for incremental community detection.
+
+Sprint 130 Feature 130.9: Incremental Community Detection
+
+A full NetworkX run reloads every entity and every RELATES_TO edge from Neo4j,
+rebuilds the graph and re-clusters everything, even if a single document was
+ingested since the last run. The snapshot keeps the entity graph and the
+current community assignment between runs so that only the graph delta has
+to be read and only the affected neighborhood has to be re-clustered:
+
+    Neo4j ──(edges created since cursor)──→ apply_edge_changes() ─→ touched nodes
+                                                                       │
+    region = touched + 1-hop neighbors + all members of their communities
+                                                                       │
+    Louvain on region subgraph ─→ stable ID mapping ─→ changed assignments
+
+Re-clustered communities keep their previous ID when they overlap an old
+community, so unchanged communities keep their IDs (and their summaries).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import networkx as nx
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+Edge = tuple[str, str]
+
+
+@dataclass
+class ReoptimizationResult:
+    """Outcome of re-clustering one graph region.
+
+    Attributes:
+        region: Entity IDs that were re-clustered
+        before: entity_id → community_id (or None) before re-clustering (region only)
+        after: entity_id → community_id after re-clustering (region only)
+        changed: entity_id → community_id for entities whose community changed
+        full: True if the region covered the whole graph
+    """
+
+    region: set[str] = field(default_factory=set)
+    before: dict[str, int | None] = field(default_factory=dict)
+    after: dict[str, int] = field(default_factory=dict)
+    changed: dict[str, int] = field(default_factory=dict)
+    full: bool = False
+
+
+class CommunityGraphSnapshot:
+    """Entity graph and community assignment kept between detection runs.
+
+    Example:
+        snapshot = CommunityGraphSnapshot.from_edges(edges, membership, cursor, "leiden", 1.0)
+        touched = snapshot.apply_edge_changes(added=[("e1", "e9")])
+        result = snapshot.reoptimize(touched)
+        snapshot.save("data/community_graph_snapshot.json")
+    """
+
+    def __init__(self, algorithm: str, resolution: float) -> None:
+        """Initialize an empty snapshot.
+
+        Args:
+            algorithm: Detection algorithm the assignment was produced with
+            resolution: Resolution parameter the assignment was produced with
+        """
+        self.algorithm = algorithm
+        self.resolution = resolution
+        self.cursor: str | None = None  # max RELATES_TO created_at seen (ISO string)
+        self.next_id = 0
+
+        self._out: dict[str, set[str]] = {}  # directed edges as stored in Neo4j
+        self._adjacency: dict[str, set[str]] = {}  # undirected view for clustering
+        self._edge_count = 0
+        self.membership: dict[str, int] = {}
+        self._members: dict[int, set[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: list[Edge],
+        membership: dict[str, int | None],
+        cursor: str | None,
+        algorithm: str,
+        resolution: float,
+    ) -> CommunityGraphSnapshot:
+        """Build a snapshot from a full edge list and the current assignment.
+
+        Args:
+            edges: Directed (source, target) entity ID pairs
+            membership: entity_id → community_id (None = unassigned)
+            cursor: Highest RELATES_TO created_at included in edges
+            algorithm: Detection algorithm
+            resolution: Resolution parameter
+
+        Returns:
+            CommunityGraphSnapshot
+        """
+        snapshot = cls(algorithm, resolution)
+        snapshot.apply_edge_changes(added=edges)
+        for entity_id, community_id in membership.items():
+            if entity_id is not None and community_id is not None:
+                snapshot._assign(entity_id, community_id)
+        snapshot.next_id = max(snapshot._members, default=-1) + 1
+        snapshot.cursor = cursor
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Graph
+    # ------------------------------------------------------------------
+
+    @property
+    def edge_count(self) -> int:
+        """Number of distinct directed edges."""
+        return self._edge_count
+
+    @property
+    def node_count(self) -> int:
+        """Number of entities in the graph or the assignment."""
+        return len(self._adjacency.keys() | self.membership.keys())
+
+    def edges(self) -> set[Edge]:
+        """Get all directed edges."""
+        return {(s, t) for s, targets in self._out.items() for t in targets}
+
+    def apply_edge_changes(
+        self, added: list[Edge] | None = None, removed: list[Edge] | None = None
+    ) -> set[str]:
+        """Apply added/removed directed edges.
+
+        Args:
+            added: Edges created since the last run (re-seen edges are ignored)
+            removed: Edges deleted since the last run
+
+        Returns:
+            Entity IDs whose neighborhood changed
+        """
+        touched: set[str] = set()
+
+        for source, target in added or []:
+            if source is None or target is None or source == target:
+                continue
+            targets = self._out.setdefault(source, set())
+            if target in targets:
+                continue
+            targets.add(target)
+            self._edge_count += 1
+            if target not in self._adjacency.get(source, ()):
+                self._adjacency.setdefault(source, set()).add(target)
+                self._adjacency.setdefault(target, set()).add(source)
+                touched.update((source, target))
+
+        for source, target in removed or []:
+            targets = self._out.get(source)
+            if not targets or target not in targets:
+                continue
+            targets.discard(target)
+            self._edge_count -= 1
+            # Undirected edge survives while the reverse direction exists
+            if source not in self._out.get(target, ()):
+                self._adjacency[source].discard(target)
+                self._adjacency[target].discard(source)
+                touched.update((source, target))
+
+        return touched
+
+    def diff_edges(self, current: set[Edge]) -> tuple[list[Edge], list[Edge]]:
+        """Compare the snapshot with the full current edge set.
+
+        Args:
+            current: All directed edges currently in Neo4j
+
+        Returns:
+            Tuple of (added, removed) edges
+        """
+        known = self.edges()
+        return sorted(current - known), sorted(known - current)
+
+    # ------------------------------------------------------------------
+    # Re-clustering
+    # ------------------------------------------------------------------
+
+    def reoptimize(
+        self,
+        touched: set[str],
+        resolution: float | None = None,
+        max_region_ratio: float = 0.5,
+    ) -> ReoptimizationResult:
+        """Re-cluster the neighborhood of touched entities and update the assignment.
+
+        The region is the touched entities, their neighbors and every member of
+        the communities they belong to, so re-clustered communities are complete.
+        If the region exceeds max_region_ratio of the graph, the whole in-memory
+        graph is re-clustered instead (still without reloading from Neo4j).
+
+        Args:
+            touched: Entity IDs whose neighborhood changed
+            resolution: Resolution parameter (default: snapshot resolution)
+            max_region_ratio: Region size (fraction of all nodes) above which the
+                whole graph is re-clustered
+
+        Returns:
+            ReoptimizationResult with before/after assignment of the region
+        """
+        if not touched:
+            return ReoptimizationResult()
+
+        res = resolution or self.resolution
+
+        frontier = set(touched)
+        for node in touched:
+            frontier.update(self._adjacency.get(node, ()))
+
+        region = set(frontier)
+        for community_id in {self.membership[n] for n in frontier if n in self.membership}:
+            region.update(self._members.get(community_id, ()))
+
+        all_nodes = self._adjacency.keys() | self.membership.keys()
+        full = len(region) > max_region_ratio * len(all_nodes)
+        if full:
+            region = set(all_nodes)
+
+        graph = nx.Graph()
+        graph.add_nodes_from(sorted(region))
+        for node in region:
+            for neighbor in self._adjacency.get(node, ()):
+                if neighbor in region:
+                    graph.add_edge(node, neighbor)
+
+        parts = [
+            sorted(part)
+            for part in nx.community.louvain_communities(graph, resolution=res, seed=42)
+        ]
+
+        before = {node: self.membership.get(node) for node in region}
+        assigned_ids = self._map_community_ids(parts, before)
+
+        after: dict[str, int] = {}
+        for part, community_id in zip(parts, assigned_ids, strict=True):
+            for node in part:
+                after[node] = community_id
+
+        changed = {node: cid for node, cid in after.items() if before.get(node) != cid}
+        for node, community_id in changed.items():
+            self._assign(node, community_id)
+
+        logger.info(
+            "community_region_reoptimized",
+            touched=len(touched),
+            region_size=len(region),
+            region_edges=graph.number_of_edges(),
+            communities=len(parts),
+            changed=len(changed),
+            full=full,
+        )
+
+        return ReoptimizationResult(
+            region=region, before=before, after=after, changed=changed, full=full
+        )
+
+    def _map_community_ids(
+        self, parts: list[list[str]], before: dict[str, int | None]
+    ) -> list[int]:
+        """Assign IDs to re-clustered parts, reusing the best-overlapping old IDs."""
+        candidates = []
+        for idx, part in enumerate(parts):
+            overlap = Counter(before[n] for n in part if before[n] is not None)
+            for old_id, count in overlap.items():
+                candidates.append((-count, old_id, idx))
+        candidates.sort()
+
+        ids: list[int | None] = [None] * len(parts)
+        used: set[int] = set()
+        for _, old_id, idx in candidates:
+            if ids[idx] is None and old_id not in used:
+                ids[idx] = old_id
+                used.add(old_id)
+
+        result = []
+        for community_id in ids:
+            if community_id is None:
+                community_id = self.next_id
+                self.next_id += 1
+            result.append(community_id)
+        return result
+
+    def _assign(self, entity_id: str, community_id: int) -> None:
+        old_id = self.membership.get(entity_id)
+        if old_id is not None:
+            members = self._members.get(old_id)
+            if members is not None:
+                members.discard(entity_id)
+                if not members:
+                    del self._members[old_id]
+        self.membership[entity_id] = community_id
+        self._members.setdefault(community_id, set()).add(entity_id)
+        if community_id >= self.next_id:
+            self.next_id = community_id + 1
+
+    def community_members(self, community_id: int) -> set[str]:
+        """Get the entity IDs of a community."""
+        return set(self._members.get(community_id, ()))
+
+    def density(self, entity_ids: list[str]) -> float:
+        """Calculate the undirected density of a community."""
+        n = len(entity_ids)
+        if n < 2:
+            return 0.0
+        members = set(entity_ids)
+        links = sum(len(self._adjacency.get(node, set()) & members) for node in members) // 2
+        return links / (n * (n - 1) / 2)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the snapshot."""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "algorithm": self.algorithm,
+            "resolution": self.resolution,
+            "cursor": self.cursor,
+            "next_id": self.next_id,
+            "edges": sorted([s, t] for s, t in self.edges()),
+            "membership": self.membership,
+        }
+
+    def save(self, path: str | Path) -> None:
+        """Write the snapshot atomically (temp file + rename).
+
+        Args:
+            path: Snapshot file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+        logger.debug(
+            "community_snapshot_saved",
+            path=str(path),
+            nodes=self.node_count,
+            edges=self.edge_count,
+        )
+
+    @classmethod
+    def load(
+        cls, path: str | Path, algorithm: str, resolution: float
+    ) -> CommunityGraphSnapshot | None:
+        """Load a snapshot if it exists and matches the detection parameters.
+
+        Args:
+            path: Snapshot file path
+            algorithm: Expected detection algorithm
+            resolution: Expected resolution parameter
+
+        Returns:
+            CommunityGraphSnapshot, or None if missing, unreadable or stale
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("community_snapshot_unreadable", path=str(path), error=str(e))
+            return None
+
+        if (
+            data.get("version") != SNAPSHOT_VERSION
+            or data.get("algorithm") != algorithm
+            or data.get("resolution") != resolution
+        ):
+            logger.info(
+                "community_snapshot_stale",
+                path=str(path),
+                algorithm=data.get("algorithm"),
+                resolution=data.get("resolution"),
+            )
+            return None
+
+        snapshot = cls.from_edges(
+            edges=[(s, t) for s, t in data.get("edges", [])],
+            membership=data.get("membership", {}),
+            cursor=data.get("cursor"),
+            algorithm=algorithm,
+            resolution=resolution,
+        )
+        snapshot.next_id = max(snapshot.next_id, data.get("next_id", 0))
+        return snapshot
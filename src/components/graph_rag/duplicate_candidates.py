@@ -0,0 +1,284 @@
+"""Blocking-based candidate generation for duplicate-entity detection.
+
+Sprint 130 Feature 130.12: Scalable Duplicate Candidates
+
+Duplicate detection used to compare every entity with every other one: the
+KG hygiene fallback ran ``MATCH (e1:base), (e2:base)`` with CONTAINS checks
+(a Cartesian product that times out beyond a few thousand entities) and the
+deduplicators built a dense n×n cosine matrix per entity type.
+
+DuplicateCandidateGenerator only emits *plausible* pairs, which callers then
+verify with their exact criteria:
+
+1. Name keys: identical normalized names (case, punctuation, whitespace)
+2. Token blocks: names sharing a token or a token prefix
+   ("Cage" ~ "Nicolas Cage", "Tensor" ~ "TensorFlow")
+3. MinHash/LSH: names whose character n-gram sets have a high Jaccard
+   similarity land in the same band bucket ("Nicolas Cage" ~ "Nicholas Cage")
+4. Embedding top-k: cosine neighbors computed in row chunks, so memory is
+   ``chunk_size × n`` instead of ``n × n``
+
+Blocks larger than ``max_bucket_size`` (stopword-like tokens, degenerate
+buckets) are skipped, which keeps the candidate count near-linear in the
+number of entities. Groups up to ``exhaustive_limit`` entities are compared
+exhaustively, since all pairs are cheap there.
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable
+from itertools import combinations
+from typing import Any
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Mersenne prime for MinHash universal hashing
+_MINHASH_PRIME = (1 << 61) - 1
+
+_NON_ALNUM_PATTERN = re.compile(r"[^\w]+")
+
+
+def normalize_entity_name(name: str) -> str:
+    """Normalize an entity name for blocking.
+
+    Lowercases, replaces punctuation with spaces and collapses whitespace.
+
+    Args:
+        name: Entity name
+
+    Returns:
+        Normalized name (e.g. "Nicolas-Cage " → "nicolas cage")
+    """
+    return " ".join(_NON_ALNUM_PATTERN.sub(" ", name.lower()).split())
+
+
+class DuplicateCandidateGenerator:
+    """Generates candidate duplicate pairs without all-pairs comparison.
+
+    Example:
+        >>> generator = DuplicateCandidateGenerator(exhaustive_limit=0)
+        >>> generator.name_candidates(["Nicolas Cage", "Nicholas Cage", "Berlin"])
+        {(0, 1)}
+        >>> generator.embedding_candidates(embeddings, threshold=0.9)
+        {(0, 3): 0.97}
+    """
+
+    def __init__(
+        self,
+        ngram_size: int = 3,
+        num_perm: int = 32,
+        bands: int = 16,
+        prefix_length: int = 4,
+        min_token_length: int = 3,
+        max_bucket_size: int = 100,
+        exhaustive_limit: int = 64,
+        top_k: int = 50,
+        chunk_size: int = 1024,
+        seed: int = 42,
+    ) -> None:
+        """Initialize candidate generator.
+
+        Args:
+            ngram_size: Character n-gram size for MinHash shingles (default: 3)
+            num_perm: MinHash signature length (default: 32)
+            bands: LSH bands; ``num_perm`` must be divisible by it (default: 16,
+                i.e. 2 rows per band, ~99% recall at Jaccard 0.5)
+            prefix_length: Token prefix length for prefix blocks (default: 4)
+            min_token_length: Shorter tokens form no token blocks (default: 3)
+            max_bucket_size: Larger blocks/buckets are skipped (default: 100)
+            exhaustive_limit: Groups up to this size get all pairs (default: 64)
+            top_k: Embedding neighbors kept per entity (default: 50)
+            chunk_size: Rows per similarity chunk (default: 1024)
+            seed: Seed for the MinHash permutations
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.ngram_size = ngram_size
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.prefix_length = prefix_length
+        self.min_token_length = min_token_length
+        self.max_bucket_size = max_bucket_size
+        self.exhaustive_limit = exhaustive_limit
+        self.top_k = top_k
+        self.chunk_size = chunk_size
+
+        rng = np.random.default_rng(seed)
+        self._perm_a = rng.integers(1, _MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+        self._perm_b = rng.integers(0, _MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+
+    # --- Name-based candidates ---
+
+    def name_candidates(self, names: list[str]) -> set[tuple[int, int]]:
+        """Generate candidate pairs from entity names.
+
+        Args:
+            names: Entity names (index = entity position)
+
+        Returns:
+            Set of (i, j) index pairs with i < j
+        """
+        n = len(names)
+        if n <= self.exhaustive_limit:
+            return set(combinations(range(n), 2))
+
+        normalized = [normalize_entity_name(name) for name in names]
+        pairs: set[tuple[int, int]] = set()
+        skipped_blocks = 0
+
+        # 1. Identical normalized names: a star per block links the whole block
+        key_blocks: dict[str, list[int]] = defaultdict(list)
+        for idx, key in enumerate(normalized):
+            key_blocks[key].append(idx)
+        for members in key_blocks.values():
+            first = members[0]
+            pairs.update((first, other) for other in members[1:])
+
+        # 2. Shared tokens and token prefixes
+        token_blocks: dict[str, list[int]] = defaultdict(list)
+        for key, members in key_blocks.items():
+            for block_key in self._token_keys(key):
+                token_blocks[block_key].extend(members)
+        skipped_blocks += self._add_block_pairs(pairs, token_blocks.values())
+
+        # 3. MinHash/LSH over character n-grams (one signature per distinct name)
+        skipped_blocks += self._add_block_pairs(pairs, self._lsh_buckets(key_blocks))
+
+        logger.debug(
+            "name_candidates_generated",
+            entities=n,
+            candidate_pairs=len(pairs),
+            all_pairs=n * (n - 1) // 2,
+            skipped_blocks=skipped_blocks,
+        )
+        return pairs
+
+    def _token_keys(self, normalized_name: str) -> set[str]:
+        """Token and token-prefix block keys of a normalized name."""
+        keys: set[str] = set()
+        for token in normalized_name.split():
+            if len(token) < self.min_token_length:
+                continue
+            keys.add(f"t:{token}")
+            if len(token) > self.prefix_length:
+                keys.add(f"p:{token[: self.prefix_length]}")
+            else:
+                # Short tokens are their own prefix ("cage" ~ "cages")
+                keys.add(f"p:{token}")
+        return keys
+
+    def _shingles(self, normalized_name: str) -> np.ndarray:
+        """Hashed character n-grams of a name (padded so short names get shingles)."""
+        padded = f" {normalized_name} "
+        grams = {
+            padded[i : i + self.ngram_size]
+            for i in range(max(1, len(padded) - self.ngram_size + 1))
+        }
+        return np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint64, count=len(grams)
+        )
+
+    def minhash_signature(self, normalized_name: str) -> np.ndarray:
+        """Compute the MinHash signature of a normalized name.
+
+        Args:
+            normalized_name: Output of ``normalize_entity_name``
+
+        Returns:
+            uint64 array of length ``num_perm``
+        """
+        shingles = self._shingles(normalized_name)
+        # (num_perm × n_shingles) hashes a·x + b (uint64 arithmetic wraps, which
+        # only changes the hash family), min over shingles
+        hashed = (np.outer(self._perm_a, shingles) + self._perm_b[:, None]) % _MINHASH_PRIME
+        return hashed.min(axis=1)
+
+    def _lsh_buckets(self, key_blocks: dict[str, list[int]]) -> Iterable[list[int]]:
+        """Group entity indices into LSH band buckets."""
+        buckets: dict[tuple[int, bytes], list[int]] = defaultdict(list)
+        for normalized_name, members in key_blocks.items():
+            if not normalized_name:
+                continue
+            signature = self.minhash_signature(normalized_name)
+            for band in range(self.bands):
+                start = band * self.rows_per_band
+                band_key = signature[start : start + self.rows_per_band].tobytes()
+                buckets[(band, band_key)].extend(members)
+        return buckets.values()
+
+    def _add_block_pairs(self, pairs: set[tuple[int, int]], blocks: Iterable[list[int]]) -> int:
+        """Add all pairs within each block; return the number of skipped blocks."""
+        skipped = 0
+        for members in blocks:
+            if len(members) < 2:
+                continue
+            if len(members) > self.max_bucket_size:
+                skipped += 1
+                continue
+            pairs.update((i, j) if i < j else (j, i) for i, j in combinations(members, 2))
+        return skipped
+
+    # --- Embedding-based candidates ---
+
+    def embedding_candidates(
+        self, embeddings: Any, threshold: float
+    ) -> dict[tuple[int, int], float]:
+        """Find embedding neighbors above a cosine threshold.
+
+        Each entity keeps its ``top_k`` most similar entities; similarities are
+        computed in chunks of ``chunk_size`` rows.
+
+        Args:
+            embeddings: Array-like of shape (n, dim)
+            threshold: Minimum cosine similarity
+
+        Returns:
+            Dict mapping (i, j) with i < j to cosine similarity
+        """
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        n = len(matrix)
+        if n < 2:
+            return {}
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms == 0.0, 1.0, norms)
+        k = min(self.top_k, n - 1)
+
+        candidates: dict[tuple[int, int], float] = {}
+        for start in range(0, n, self.chunk_size):
+            block = matrix[start : start + self.chunk_size] @ matrix.T
+            rows = np.arange(len(block))
+            block[rows, rows + start] = -np.inf  # exclude self-similarity
+
+            # Unordered top-k per row, then threshold
+            neighbors = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            scores = np.take_along_axis(block, neighbors, axis=1)
+            for row, col in zip(*np.nonzero(scores >= threshold), strict=True):
+                i, j = start + int(row), int(neighbors[row, col])
+                key = (i, j) if i < j else (j, i)
+                candidates[key] = float(scores[row, col])
+
+        return candidates
+
+
+def candidate_adjacency(pairs: Iterable[tuple[int, int]]) -> dict[int, list[int]]:
+    """Build a forward adjacency list (i → sorted j > i) from candidate pairs.
+
+    Args:
+        pairs: (i, j) pairs with i < j
+
+    Returns:
+        Dict mapping i to its sorted candidate partners j > i
+    """
+    adjacency: dict[int, list[int]] = defaultdict(list)
+    for i, j in pairs:
+        adjacency[i].append(j)
+    for partners in adjacency.values():
+        partners.sort()
+    return adjacency
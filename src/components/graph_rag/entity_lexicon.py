@@ -0,0 +1,451 @@
+"""In-memory entity-name lexicon for graph-local retrieval.
+
+Sprint 130 Feature 130.5: Entity Lexicon (Query → Entity Linking)
+
+Graph-local search previously ran a Cypher label scan per query:
+
+    MATCH (e:base) WHERE toLower(e.entity_name) CONTAINS term OR toLower(e.description) ...
+
+which grows linearly with the graph. EntityLexicon keeps a per-namespace
+token trie over normalized entity names (and aliases) in process memory and
+links query text to entity IDs in microseconds. Cypher then starts from
+those IDs with an indexed ``entity_id`` lookup.
+
+Matching (per namespace):
+1. Phrase matches: every entity name/alias (as a token sequence) that occurs
+   in the query, found in one left-to-right trie walk (longest names first)
+2. Token matches: entities whose name contains a query term as a whole token
+   (e.g. "rag" → "AEGIS RAG"), via an inverted token index
+3. Description matches: entities whose description contains a query term as a
+   whole token (keeps the recall of the legacy ``description CONTAINS`` scan;
+   substrings inside longer words are no longer matched)
+
+Freshness:
+- Full load from Neo4j on first use (paged)
+- Incremental add from GraphWriteBuffer.flush (same process)
+- Periodic delta refresh by ``created_at`` cursor (writes from other processes,
+  e.g. the ingestion container)
+"""
+
+import asyncio
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Page size for full lexicon loads from Neo4j
+LOAD_PAGE_SIZE = 10_000
+
+# Name tokens shorter than this are not indexed for token matches
+MIN_TOKEN_LENGTH = 2
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Trie node key holding the entity IDs that end at this node
+_TERMINAL = "\x00ids"
+
+
+def normalize_tokens(text: str) -> tuple[str, ...]:
+    """Normalize text into lowercase word tokens.
+
+    Args:
+        text: Entity name, alias or query text
+
+    Returns:
+        Tuple of lowercase tokens (punctuation removed)
+
+    Example:
+        >>> normalize_tokens("AEGIS-RAG  System!")
+        ('aegis', 'rag', 'system')
+    """
+    return tuple(_TOKEN_PATTERN.findall(text.lower()))
+
+
+@dataclass
+class LexiconMatch:
+    """Entity linked from query text."""
+
+    entity_id: str
+    entity_name: str
+    namespace_id: str
+    match_type: str  # "phrase", "token" or "description"
+
+
+@dataclass
+class _NamespaceLexicon:
+    """Trie + inverted token index for one namespace."""
+
+    trie: dict[str, Any] = field(default_factory=dict)
+    token_index: dict[str, set[str]] = field(default_factory=dict)
+    names: dict[str, str] = field(default_factory=dict)  # entity_id -> display name
+    keys: dict[str, set[tuple[str, ...]]] = field(default_factory=dict)  # entity_id -> phrases
+    description_index: dict[str, set[str]] = field(default_factory=dict)
+    description_tokens: dict[str, set[str]] = field(default_factory=dict)  # entity_id -> tokens
+
+    def add(
+        self, entity_id: str, name: str, aliases: Iterable[str] = (), description: str = ""
+    ) -> None:
+        if entity_id in self.keys:
+            self.remove(entity_id)
+
+        phrases = {normalize_tokens(n) for n in (name, *aliases) if n}
+        phrases.discard(())
+        self.names[entity_id] = name
+        self.keys[entity_id] = phrases
+
+        for phrase in phrases:
+            node = self.trie
+            for token in phrase:
+                node = node.setdefault(token, {})
+            node.setdefault(_TERMINAL, set()).add(entity_id)
+            for token in phrase:
+                if len(token) >= MIN_TOKEN_LENGTH:
+                    self.token_index.setdefault(token, set()).add(entity_id)
+
+        if description:
+            tokens = {t for t in normalize_tokens(description) if len(t) >= MIN_TOKEN_LENGTH}
+            self.description_tokens[entity_id] = tokens
+            for token in tokens:
+                self.description_index.setdefault(token, set()).add(entity_id)
+
+    def remove(self, entity_id: str) -> None:
+        for phrase in self.keys.pop(entity_id, set()):
+            node = self.trie
+            for token in phrase:
+                node = node.get(token)
+                if node is None:
+                    break
+            else:
+                node.get(_TERMINAL, set()).discard(entity_id)
+            for token in phrase:
+                ids = self.token_index.get(token)
+                if ids is not None:
+                    ids.discard(entity_id)
+                    if not ids:
+                        del self.token_index[token]
+        for token in self.description_tokens.pop(entity_id, set()):
+            ids = self.description_index.get(token)
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del self.description_index[token]
+        self.names.pop(entity_id, None)
+
+    def match_phrases(self, tokens: tuple[str, ...]) -> list[str]:
+        """Find all entity names occurring as token sequences in the query."""
+        found: dict[str, int] = {}
+        for start in range(len(tokens)):
+            node = self.trie
+            for pos in range(start, len(tokens)):
+                node = node.get(tokens[pos])
+                if node is None:
+                    break
+                for entity_id in node.get(_TERMINAL, ()):
+                    length = pos - start + 1
+                    if found.get(entity_id, 0) < length:
+                        found[entity_id] = length
+        # Longest (most specific) names first
+        return sorted(found, key=lambda eid: -found[eid])
+
+    def match_tokens(self, terms: Iterable[str], description: bool = False) -> list[str]:
+        """Find entities whose name (or description) contains a query term as a token."""
+        index = self.description_index if description else self.token_index
+        counts: dict[str, int] = {}
+        for term in terms:
+            for entity_id in index.get(term, ()):
+                counts[entity_id] = counts.get(entity_id, 0) + 1
+        return sorted(counts, key=lambda eid: -counts[eid])
+
+
+class EntityLexicon:
+    """Process-wide entity-name lexicon, partitioned by namespace.
+
+    Example:
+        lexicon = get_entity_lexicon()
+        await lexicon.ensure_loaded(neo4j_client, ["default"])
+        matches = lexicon.match("How does AEGIS RAG use Qdrant?", ["default"])
+        entity_ids = [m.entity_id for m in matches]
+    """
+
+    def __init__(self, refresh_interval_seconds: float = 60.0, max_matches: int = 50):
+        """Initialize entity lexicon.
+
+        Args:
+            refresh_interval_seconds: Minimum interval between delta refreshes from Neo4j
+            max_matches: Maximum entities returned per query
+        """
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.max_matches = max_matches
+        self._namespaces: dict[str, _NamespaceLexicon] = {}
+        self._loaded: set[str] = set()
+        self._cursor: dict[str, str] = {}  # namespace -> max created_at seen (ISO string)
+        self._last_refresh: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        self._load_task: asyncio.Task | None = None
+
+    def is_loaded(self, namespaces: Iterable[str]) -> bool:
+        """Whether all namespaces are fully loaded."""
+        return all(ns in self._loaded for ns in namespaces)
+
+    def __len__(self) -> int:
+        return sum(len(lex.names) for lex in self._namespaces.values())
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def add_entities(self, namespace_id: str, entities: Iterable[dict[str, Any]]) -> int:
+        """Add or update entities in a namespace (incremental refresh).
+
+        Args:
+            namespace_id: Namespace of the entities
+            entities: Dicts with entity_id, entity_name and optional aliases/description
+
+        Returns:
+            Number of entities added
+        """
+        lexicon = self._namespaces.setdefault(namespace_id, _NamespaceLexicon())
+        added = 0
+        for entity in entities:
+            entity_id = entity.get("entity_id")
+            name = entity.get("entity_name") or entity_id
+            if not entity_id or not name:
+                continue
+            lexicon.add(
+                entity_id,
+                name,
+                entity.get("aliases") or (),
+                entity.get("description") or "",
+            )
+            added += 1
+        return added
+
+    def remove_entities(self, namespace_id: str, entity_ids: Iterable[str]) -> None:
+        """Remove entities from a namespace.
+
+        Args:
+            namespace_id: Namespace of the entities
+            entity_ids: Entity IDs to remove
+        """
+        lexicon = self._namespaces.get(namespace_id)
+        if lexicon is None:
+            return
+        for entity_id in entity_ids:
+            lexicon.remove(entity_id)
+
+    def invalidate(self, namespace_id: str | None = None) -> None:
+        """Drop a namespace (or everything) so it is reloaded on next use.
+
+        Args:
+            namespace_id: Namespace to drop (None = all)
+        """
+        targets = [namespace_id] if namespace_id else list(self._namespaces)
+        for ns in targets:
+            self._namespaces.pop(ns, None)
+            self._loaded.discard(ns)
+            self._cursor.pop(ns, None)
+            self._last_refresh.pop(ns, None)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    async def ensure_loaded(self, neo4j_client: Any, namespaces: list[str]) -> None:
+        """Load missing namespaces and schedule delta refreshes for stale ones.
+
+        Args:
+            neo4j_client: Neo4jClient used for loading
+            namespaces: Namespaces required by the current query
+        """
+        missing = [ns for ns in namespaces if ns not in self._loaded]
+        if missing:
+            async with self._lock:
+                missing = [ns for ns in missing if ns not in self._loaded]
+                for ns in missing:
+                    await self._load_namespace(neo4j_client, ns)
+
+        now = time.monotonic()
+        stale = [
+            ns
+            for ns in namespaces
+            if now - self._last_refresh.get(ns, now) >= self.refresh_interval_seconds
+        ]
+        if stale and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._refresh(neo4j_client, stale))
+
+    def schedule_load(self, neo4j_client: Any, namespaces: list[str]) -> None:
+        """Load missing namespaces in the background (callers keep serving meanwhile).
+
+        Args:
+            neo4j_client: Neo4jClient used for loading
+            namespaces: Namespaces to load
+        """
+        if self._load_task is not None and not self._load_task.done():
+            return
+        self._load_task = asyncio.create_task(self._background_load(neo4j_client, namespaces))
+
+    async def _background_load(self, neo4j_client: Any, namespaces: list[str]) -> None:
+        try:
+            await self.ensure_loaded(neo4j_client, namespaces)
+        except Exception as e:
+            logger.warning("entity_lexicon_load_failed", namespaces=namespaces, error=str(e))
+
+    async def _load_namespace(self, neo4j_client: Any, namespace_id: str) -> None:
+        """Full (paged) load of one namespace."""
+        start = time.perf_counter()
+        self._namespaces[namespace_id] = _NamespaceLexicon()
+        self._cursor.pop(namespace_id, None)
+        total = 0
+        skip = 0
+        while True:
+            records = await neo4j_client.execute_read(
+                """
+                MATCH (e:base)
+                WHERE e.namespace_id = $namespace_id AND e.entity_id IS NOT NULL
+                RETURN e.entity_id AS entity_id,
+                       e.entity_name AS entity_name,
+                       e.aliases AS aliases,
+                       e.description AS description,
+                       toString(e.created_at) AS created_at
+                ORDER BY e.entity_id
+                SKIP $skip LIMIT $limit
+                """,
+                {"namespace_id": namespace_id, "skip": skip, "limit": LOAD_PAGE_SIZE},
+            )
+            total += self.add_entities(namespace_id, records)
+            self._advance_cursor(namespace_id, records)
+            if len(records) < LOAD_PAGE_SIZE:
+                break
+            skip += LOAD_PAGE_SIZE
+
+        self._loaded.add(namespace_id)
+        self._last_refresh[namespace_id] = time.monotonic()
+        logger.info(
+            "entity_lexicon_loaded",
+            namespace_id=namespace_id,
+            entities=total,
+            duration_ms=round((time.perf_counter() - start) * 1000, 2),
+        )
+
+    async def _refresh(self, neo4j_client: Any, namespaces: list[str]) -> None:
+        """Delta refresh: pull entities created/updated since the cursor."""
+        for ns in namespaces:
+            try:
+                records = await neo4j_client.execute_read(
+                    """
+                    MATCH (e:base)
+                    WHERE e.namespace_id = $namespace_id
+                      AND e.created_at > datetime($since)
+                    RETURN e.entity_id AS entity_id,
+                           e.entity_name AS entity_name,
+                           e.aliases AS aliases,
+                           e.description AS description,
+                           toString(e.created_at) AS created_at
+                    """,
+                    {"namespace_id": ns, "since": self._cursor.get(ns, "1970-01-01T00:00:00Z")},
+                )
+                added = self.add_entities(ns, records)
+                self._advance_cursor(ns, records)
+                self._last_refresh[ns] = time.monotonic()
+                if added:
+                    logger.info("entity_lexicon_refreshed", namespace_id=ns, entities=added)
+            except Exception as e:
+                logger.warning("entity_lexicon_refresh_failed", namespace_id=ns, error=str(e))
+
+    def _advance_cursor(self, namespace_id: str, records: list[dict[str, Any]]) -> None:
+        stamps = [r["created_at"] for r in records if r.get("created_at")]
+        if stamps:
+            latest = max(stamps)
+            if latest > self._cursor.get(namespace_id, ""):
+                self._cursor[namespace_id] = latest
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def match(
+        self,
+        query: str,
+        namespaces: list[str],
+        terms: list[str] | None = None,
+    ) -> list[LexiconMatch]:
+        """Link query text to entity IDs.
+
+        Args:
+            query: Query text
+            namespaces: Namespaces to match in
+            terms: Query terms for token matching (default: all query tokens)
+
+        Returns:
+            Phrase matches (longest first), then name token matches, then
+            description token matches, deduplicated
+        """
+        tokens = normalize_tokens(query)
+        token_terms = (
+            [t for term in terms for t in normalize_tokens(term)] if terms is not None else tokens
+        )
+
+        matches: list[LexiconMatch] = []
+        seen: set[str] = set()
+        for match_type in ("phrase", "token", "description"):
+            for ns in namespaces:
+                lexicon = self._namespaces.get(ns)
+                if lexicon is None:
+                    continue
+                if match_type == "phrase":
+                    ids = lexicon.match_phrases(tokens)
+                else:
+                    ids = lexicon.match_tokens(token_terms, description=match_type == "description")
+                for entity_id in ids:
+                    if entity_id in seen:
+                        continue
+                    seen.add(entity_id)
+                    matches.append(
+                        LexiconMatch(
+                            entity_id=entity_id,
+                            entity_name=lexicon.names.get(entity_id, entity_id),
+                            namespace_id=ns,
+                            match_type=match_type,
+                        )
+                    )
+                    if len(matches) >= self.max_matches:
+                        return matches
+        return matches
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get lexicon statistics.
+
+        Returns:
+            Stats dict with entity counts per namespace
+        """
+        return {
+            "entities": len(self),
+            "namespaces": {ns: len(lex.names) for ns, lex in self._namespaces.items()},
+            "loaded_namespaces": sorted(self._loaded),
+        }
+
+
+# Global singleton
+_entity_lexicon: EntityLexicon | None = None
+
+
+def get_entity_lexicon() -> EntityLexicon:
+    """Get global EntityLexicon instance (singleton).
+
+    Returns:
+        EntityLexicon instance
+    """
+    global _entity_lexicon
+    if _entity_lexicon is None:
+        from src.core.config import settings
+
+        _entity_lexicon = EntityLexicon(
+            refresh_interval_seconds=settings.entity_lexicon_refresh_seconds,
+        )
+    return _entity_lexicon
@@ -11,7 +11,8 @@ This module handles:
 - KG hygiene validation (self-loops, missing evidence)
 - DSPy training data collection
 - Extraction metrics tracking
-- Neo4j storage via Neo4jClient (chunks, entities, MENTIONED_IN relationships)
+- Neo4j storage via GraphWriteBuffer (chunks, entities, MENTIONED_IN, RELATES_TO
+  in batched UNWIND writes, Sprint 130 Feature 130.11)
 """
 
 import time
@@ -24,6 +25,7 @@ from src.components.graph_rag.extraction_metrics import (
     create_metrics_from_extraction,
     log_extraction_metrics,
 )
+from src.components.graph_rag.graph_write_buffer import GraphWriteBuffer
 from src.components.graph_rag.kg_hygiene import KGHygieneService
 from src.components.graph_rag.neo4j_client import get_neo4j_client
 from src.components.graph_rag.relation_deduplicator import create_relation_deduplicator_from_config
@@ -133,6 +135,7 @@ async def extract_and_store_entities(
     document_path: str = "",
     namespace_id: str = "default",
     domain_id: str | None = None,
+    write_buffer: GraphWriteBuffer | None = None,
 ) -> dict[str, Any]:
     """Extract entities/relations from pre-chunked documents and store in Neo4j.
 
@@ -146,7 +149,7 @@ async def extract_and_store_entities(
     3. Deduplicate relations
     4. KG hygiene validation (filter self-loops)
     5. DSPy training data collection (optional)
-    6. Store chunks + entities + MENTIONED_IN in Neo4j via Neo4jClient
+    6. Store chunks + entities + MENTIONED_IN + RELATES_TO in Neo4j via GraphWriteBuffer
 
     Args:
         chunks: List of pre-chunked documents with chunk_id, text, chunk_index
@@ -154,6 +157,9 @@ async def extract_and_store_entities(
         document_path: Source document path for attribution
         namespace_id: Namespace for multi-tenant isolation
         domain_id: Domain for DSPy-optimized prompts
+        write_buffer: Shared buffer for batch ingestion. Rows are queued and only
+            flushed once the buffer is full; the caller flushes the rest at the end
+            of the batch. Default: a per-document buffer flushed before returning.
 
     Returns:
         Result dict with document_id, status, stats, total_time_seconds
@@ -423,37 +429,43 @@ async def extract_and_store_entities(
             }
         )
 
-    # Store chunks + entities + MENTIONED_IN in Neo4j (NO ainsert_custom_kg!)
-    neo4j_client = get_neo4j_client()
-    provenance_stats = await neo4j_client.store_chunks_and_provenance(
-        chunks=converted_chunks,
-        entities=storage_entities,
-        namespace_id=namespace_id,
-    )
-    aggregate_stats["total_mentioned_in"] = provenance_stats.get("mentioned_in_created", 0)
+    # Store chunks + entities + MENTIONED_IN + RELATES_TO in Neo4j (NO ainsert_custom_kg!)
+    # Sprint 130 Feature 130.11: Queued on a write buffer and flushed as UNWIND batches
+    owns_buffer = write_buffer is None
+    buffer = get_neo4j_client().create_write_buffer() if owns_buffer else write_buffer
+
+    buffer.add_chunks(converted_chunks, namespace_id=namespace_id)
+    buffer.add_entities(storage_entities, namespace_id=namespace_id)
 
-    # Store relations grouped by chunk_id
-    total_relations_stored = 0
     relations_by_chunk: dict[str, list[dict[str, Any]]] = {}
     for rel in all_relations:
         cid = rel.get("chunk_id", "unknown")
         relations_by_chunk.setdefault(cid, []).append(rel)
 
     for cid, rels in relations_by_chunk.items():
-        stored = await neo4j_client.store_relations(
-            relations=rels,
-            chunk_id=cid,
-            namespace_id=namespace_id,
-        )
-        total_relations_stored += stored
+        buffer.add_relations(rels, chunk_id=cid, namespace_id=namespace_id)
 
-    logger.info(
-        "relations_storage_complete",
-        document_id=document_id,
-        relations_extracted=len(all_relations),
-        relations_stored=total_relations_stored,
-        chunks_with_relations=len(relations_by_chunk),
-    )
+    write_stats = await (buffer.flush() if owns_buffer else buffer.flush_if_full())
+
+    if owns_buffer:
+        aggregate_stats["total_mentioned_in"] = write_stats["mentioned_in_written"]
+        logger.info(
+            "relations_storage_complete",
+            document_id=document_id,
+            relations_extracted=len(all_relations),
+            relations_stored=write_stats["relations_written"],
+            chunks_with_relations=len(relations_by_chunk),
+            write_throughput=write_stats["throughput"],
+        )
+    else:
+        logger.info(
+            "graph_writes_queued",
+            document_id=document_id,
+            relations_extracted=len(all_relations),
+            chunks_with_relations=len(relations_by_chunk),
+            pending_rows=buffer.pending_rows,
+            flushed=write_stats is not None,
+        )
 
     aggregate_stats["total_chunks"] = len(converted_chunks)
     aggregate_stats["total_entities"] = len(storage_entities)
@@ -33,6 +33,8 @@ import os
 import re
 import time
 import uuid
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
 from typing import Any
 
 import structlog
@@ -851,6 +853,12 @@ CROSS_SENTENCE_THRESHOLD = 5  # Minimum sentences to trigger windowed extraction
 # Ollama supports OLLAMA_NUM_PARALLEL=4; vLLM supports 256+.
 EXTRACTION_WORKERS = int(os.environ.get("AEGIS_EXTRACTION_WORKERS", "1"))
 
+# Sprint 130 Feature 130.8: Per-batch override of window workers (chunk-level concurrency)
+# Set by ExtractionService.iter_extract_batch for the documents it extracts.
+_window_workers_override: ContextVar[int | None] = ContextVar(
+    "extraction_window_workers", default=None
+)
+
 # Sprint 129.1: Window Bisection Fallback
 # When a window returns 0 relations, bisect into two halves and retry.
 # Minimum sentences required for bisection (smaller windows are genuinely empty).
@@ -1395,7 +1403,7 @@ class ExtractionService:
             # Capacity available, proceed immediately
             return
 
-        # Capacity exhausted - wait with exponential backoff
+        # Capacity exhausted - wait for a slot to free up
         logger.warning(
             "cascade_guard_waiting",
             active_requests=active,
@@ -1405,35 +1413,26 @@ class ExtractionService:
             max_wait_s=max_wait_s,
         )
 
-        wait_time = 5  # Start with 5s
-        total_waited = 0
-
-        while total_waited < max_wait_s:
-            await asyncio.sleep(wait_time)
-            total_waited += wait_time
+        # Sprint 130 Feature 130.7: Event-driven wait on the proxy's admission controller
+        # (woken as soon as a vLLM slot frees instead of 5s → 10s → 20s sleep polling)
+        wait_start = time.perf_counter()
+        released = await self.llm_proxy.wait_for_vllm_capacity(max_workers, timeout_s=max_wait_s)
+        waited_s = round(time.perf_counter() - wait_start, 2)
 
-            # Re-check active requests
-            active = await self.llm_proxy.get_vllm_active_requests()
-
-            if active < max_workers:
-                logger.info(
-                    "cascade_guard_released",
-                    active_requests=active,
-                    max_concurrent=max_workers,
-                    waited_s=total_waited,
-                    rank=rank_config.rank,
-                )
-                return
-
-            # Exponential backoff (5s → 10s → 20s)
-            wait_time = min(wait_time * 2, 20)
+        if released:
+            logger.info(
+                "cascade_guard_released",
+                max_concurrent=max_workers,
+                waited_s=waited_s,
+                rank=rank_config.rank,
+            )
+            return
 
         # Max wait exceeded, proceed anyway
         logger.warning(
             "cascade_guard_timeout",
-            active_requests=active,
             max_concurrent=max_workers,
-            waited_s=total_waited,
+            waited_s=waited_s,
             rank=rank_config.rank,
         )
 
@@ -1475,7 +1474,7 @@ class ExtractionService:
         if domain:
             try:
                 domain_repo = get_domain_repository()
-                domain_config = await domain_repo.get_domain(domain)
+                domain_config = await domain_repo.get_domain(domain, cached=True)
 
                 if (
                     domain_config
@@ -3546,7 +3545,7 @@ class ExtractionService:
                 from src.components.domain_training import get_domain_repository
 
                 repo = get_domain_repository()
-                domain_data = await repo.get_domain(domain)
+                domain_data = await repo.get_domain(domain, cached=True)
                 if domain_data:
                     domain_window_size = domain_data.get("cross_sentence_window_size")
                     domain_overlap = domain_data.get("cross_sentence_overlap")
@@ -3585,7 +3584,7 @@ class ExtractionService:
         cascade = get_cascade_for_domain(domain)
         rank_config = cascade[0]  # Use first rank for windowed extraction
 
-        workers = max(1, EXTRACTION_WORKERS)
+        workers = max(1, _window_workers_override.get() or EXTRACTION_WORKERS)
         semaphore = asyncio.Semaphore(workers)
 
         async def _deduplicate_relations(
@@ -4196,14 +4195,165 @@ class ExtractionService:
 
         return result
 
+    async def _resolve_batch_concurrency(
+        self,
+        document_concurrency: int | None,
+        chunk_concurrency: int | None,
+    ) -> tuple[int, int]:
+        """Resolve document- and chunk-level concurrency for batch extraction.
+
+        Sprint 130 Feature 130.8: Auto mode sizes document concurrency from the
+        proxy's free vLLM slots, so a bulk re-extraction fills vLLM instead of
+        using a single LLM slot. Without vLLM (Ollama) documents stay sequential.
+
+        Args:
+            document_concurrency: Documents in parallel (None = settings, 0 = auto)
+            chunk_concurrency: Windows in parallel per document (None = settings,
+                0 = AEGIS_EXTRACTION_WORKERS)
+
+        Returns:
+            Tuple of (document_concurrency, chunk_concurrency)
+        """
+        from src.core.config import settings
+
+        if chunk_concurrency is None:
+            chunk_concurrency = settings.extraction_batch_chunk_concurrency
+        chunk_concurrency = max(1, chunk_concurrency or EXTRACTION_WORKERS)
+
+        if document_concurrency is None:
+            document_concurrency = settings.extraction_batch_document_concurrency
+        if not document_concurrency:
+            free_slots = await self.llm_proxy.get_vllm_free_slots()
+            document_concurrency = min(
+                settings.extraction_batch_max_document_concurrency,
+                max(1, free_slots // chunk_concurrency),
+            )
+
+        return max(1, document_concurrency), chunk_concurrency
+
+    async def iter_extract_batch(
+        self,
+        documents: list[dict[str, Any]],
+        document_concurrency: int | None = None,
+        chunk_concurrency: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Extract documents concurrently, yielding each result as it finishes.
+
+        Sprint 130 Feature 130.8: Streaming batch extraction. Callers can store or
+        forward each document's entities and relationships immediately instead of
+        holding every GraphEntity of the batch in memory.
+
+        Args:
+            documents: list of {"id": str, "text": str} dicts
+            document_concurrency: Documents in parallel (None = settings, 0 = auto
+                from free vLLM slots)
+            chunk_concurrency: Cross-sentence windows in parallel per document
+                (None = settings, 0 = AEGIS_EXTRACTION_WORKERS)
+
+        Yields:
+            Per-document result in completion order:
+            {
+                "index": int,
+                "document_id": str,
+                "status": "success" | "error",
+                "entities": list[GraphEntity],
+                "relationships": list[GraphRelationship],
+                "entity_count": int,
+                "relationship_count": int,
+                "duration_ms": float,
+                "error": str  # only for status == "error"
+            }
+        """
+        if not documents:
+            return
+
+        doc_workers, chunk_workers = await self._resolve_batch_concurrency(
+            document_concurrency, chunk_concurrency
+        )
+        doc_workers = min(doc_workers, len(documents))
+
+        logger.info(
+            "batch_extraction_concurrency",
+            document_count=len(documents),
+            document_concurrency=doc_workers,
+            chunk_concurrency=chunk_workers,
+        )
+
+        pending: asyncio.Queue[tuple[int, dict[str, Any]]] = asyncio.Queue()
+        for index, doc in enumerate(documents):
+            pending.put_nowait((index, doc))
+        finished: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+        async def _worker() -> None:
+            _window_workers_override.set(chunk_workers)
+            while True:
+                try:
+                    index, doc = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                start = time.perf_counter()
+                try:
+                    extraction_result = await self.extract_and_store(doc["text"], doc["id"])
+                    result = {
+                        "index": index,
+                        "document_id": doc["id"],
+                        "status": "success",
+                        **extraction_result,
+                    }
+                except Exception as e:
+                    logger.error(
+                        "batch_extraction_document_failed",
+                        document_id=doc["id"],
+                        error=str(e),
+                    )
+                    result = {
+                        "index": index,
+                        "document_id": doc["id"],
+                        "status": "error",
+                        "error": str(e),
+                        "entities": [],
+                        "relationships": [],
+                        "entity_count": 0,
+                        "relationship_count": 0,
+                    }
+                result["duration_ms"] = round((time.perf_counter() - start) * 1000, 2)
+                await finished.put(result)
+
+        workers = [asyncio.create_task(_worker()) for _ in range(doc_workers)]
+        try:
+            for completed in range(1, len(documents) + 1):
+                result = await finished.get()
+                logger.info(
+                    "batch_extraction_progress",
+                    progress=f"{completed}/{len(documents)}",
+                    document_id=result["document_id"],
+                    status=result["status"],
+                )
+                yield result
+        finally:
+            # Consumer stopped early (or failed): stop remaining extractions
+            for task in workers:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
     async def extract_batch(
         self,
         documents: list[dict[str, Any]],
+        document_concurrency: int | None = None,
+        chunk_concurrency: int | None = None,
     ) -> dict[str, Any]:
         """Batch extraction from multiple documents.
 
+        Sprint 130 Feature 130.8: Documents are extracted concurrently via
+        iter_extract_batch(); use that method directly to stream results
+        without accumulating all entities.
+
         Args:
             documents: list of {"id": str, "text": str} dicts
+            document_concurrency: Documents in parallel (None = settings, 0 = auto)
+            chunk_concurrency: Windows in parallel per document (None = settings)
 
         Returns:
             Dictionary with batch extraction results:
@@ -4213,53 +4363,57 @@ class ExtractionService:
                 "failed_count": int,
                 "entities": list[GraphEntity],
                 "relationships": list[GraphRelationship],
-                "results": list[dict]
+                "results": list[dict],  # in input order
+                "stats": dict  # duration_s, documents_per_minute, tokens_per_second
             }
         """
         logger.info("batch_extraction_started", document_count=len(documents))
 
-        all_entities: list[GraphEntity] = []
-        all_relationships: list[GraphRelationship] = []
+        start = time.perf_counter()
+        tokens_before = self.llm_proxy.get_metrics_summary().get("total_tokens", 0)
+
+        by_index: dict[int, dict[str, Any]] = {}
+        async for result in self.iter_extract_batch(
+            documents,
+            document_concurrency=document_concurrency,
+            chunk_concurrency=chunk_concurrency,
+        ):
+            by_index[result["index"]] = result
+
+        ordered = [by_index[i] for i in sorted(by_index)]
+        all_entities: list[GraphEntity] = [e for r in ordered for e in r["entities"]]
+        all_relationships: list[GraphRelationship] = [
+            rel for r in ordered for rel in r["relationships"]
+        ]
         results = []
-
-        for i, doc in enumerate(documents):
-            try:
-                extraction_result = await self.extract_and_store(
-                    doc["text"],
-                    doc["id"],
-                )
-                all_entities.extend(extraction_result["entities"])
-                all_relationships.extend(extraction_result["relationships"])
+        for r in ordered:
+            if r["status"] == "success":
                 results.append(
                     {
-                        "document_id": doc["id"],
+                        "document_id": r["document_id"],
                         "status": "success",
-                        "entity_count": extraction_result["entity_count"],
-                        "relationship_count": extraction_result["relationship_count"],
+                        "entity_count": r["entity_count"],
+                        "relationship_count": r["relationship_count"],
                     }
                 )
-
-                logger.info(
-                    "batch_extraction_progress",
-                    progress=f"{i + 1}/{len(documents)}",
-                )
-
-            except Exception as e:
-                logger.error(
-                    "batch_extraction_document_failed",
-                    document_id=doc["id"],
-                    error=str(e),
-                )
+            else:
                 results.append(
-                    {
-                        "document_id": doc["id"],
-                        "status": "error",
-                        "error": str(e),
-                    }
+                    {"document_id": r["document_id"], "status": "error", "error": r["error"]}
                 )
 
         success_count = sum(1 for r in results if r["status"] == "success")
 
+        duration_s = time.perf_counter() - start
+        tokens = self.llm_proxy.get_metrics_summary().get("total_tokens", 0) - tokens_before
+        stats = {
+            "duration_s": round(duration_s, 2),
+            "documents_per_minute": (
+                round(success_count / duration_s * 60, 2) if duration_s > 0 else 0.0
+            ),
+            "tokens": tokens,
+            "tokens_per_second": round(tokens / duration_s, 2) if duration_s > 0 else 0.0,
+        }
+
         logger.info(
             "batch_extraction_complete",
             documents=len(documents),
@@ -4267,6 +4421,7 @@ class ExtractionService:
             failed=len(documents) - success_count,
             total_entities=len(all_entities),
             total_relationships=len(all_relationships),
+            **stats,
         )
 
         return {
@@ -4276,6 +4431,7 @@ class ExtractionService:
             "entities": all_entities,
             "relationships": all_relationships,
             "results": results,
+            "stats": stats,
         }
 
 
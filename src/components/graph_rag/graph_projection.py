@@ -0,0 +1,532 @@
+"""Shared in-memory graph projection for analytics and traversal.
+
+GraphAnalyticsEngine used to rebuild a full ``networkx.DiGraph`` for every
+non-GDS centrality call and then run e.g. ``nx.betweenness_centrality`` over the
+whole graph just to read one entity's score. This module keeps one process-wide,
+versioned projection instead:
+
+- Integer node IDs with a name table (``names[i]`` -> entity id, ``index`` reverse)
+- Compact CSR adjacency (``scipy.sparse.csr_matrix``, directed, binarized)
+- Per-metric score arrays computed once per version in vectorized form
+  (PageRank, closeness, eigenvector, betweenness, weak components) and served
+  per entity from that table
+- Approximate betweenness via sampled Brandes sources for large graphs
+
+The projection is versioned by ``(write version, node count, relationship count)``.
+The write version is a process-local counter bumped by ``Neo4jClient.execute_write``
+(``bump_graph_write_version``); the counts come from Neo4j's count store (O(1)) and
+catch writes that bypass ``execute_write``. A version change triggers a single
+(single-flight) reload of the id-only edge list; unchanged versions are served
+from memory.
+
+Example:
+    >>> store = get_graph_projection_store()
+    >>> projection = await store.get(neo4j_client)
+    >>> projection.score("pagerank", "entity_42")
+    0.0137
+    >>> projection.neighbors("entity_42")
+    ['entity_7', 'entity_9']
+"""
+
+import asyncio
+import time
+from typing import Any, Literal
+
+import networkx as nx
+import numpy as np
+import structlog
+from scipy import sparse
+from scipy.sparse import csgraph
+
+logger = structlog.get_logger(__name__)
+
+ProjectionMetric = Literal["degree", "pagerank", "closeness", "eigenvector", "betweenness"]
+
+# Process-wide write version, bumped whenever this process writes to the graph
+_graph_write_version = 0
+
+
+def bump_graph_write_version() -> int:
+    """Mark the graph as changed by a write in this process.
+
+    Returns:
+        New write version
+    """
+    global _graph_write_version
+    _graph_write_version += 1
+    return _graph_write_version
+
+
+def get_graph_write_version() -> int:
+    """Get the current process-wide graph write version."""
+    return _graph_write_version
+
+
+class GraphProjection:
+    """Immutable CSR snapshot of the graph for one version.
+
+    Metric arrays are computed lazily on first use and then reused for every
+    entity until the projection is replaced by a newer version.
+    """
+
+    def __init__(
+        self,
+        edges: list[tuple[str, str]],
+        version: tuple[int, ...] = (),
+        pagerank_iterations: int = 20,
+        betweenness_exact_max_nodes: int = 2000,
+        betweenness_samples: int = 256,
+        seed: int = 42,
+    ) -> None:
+        """Build the projection from directed (source, target) entity-id pairs.
+
+        Args:
+            edges: Directed edges as entity-id pairs (duplicates are merged)
+            version: Version key this projection was built for
+            pagerank_iterations: Maximum PageRank power iterations
+            betweenness_exact_max_nodes: Use exact betweenness up to this many nodes
+            betweenness_samples: Sampled sources for approximate betweenness
+            seed: Random seed for source sampling (reproducible scores per version)
+        """
+        self.version = version
+        self.built_at = time.time()
+        self.pagerank_iterations = pagerank_iterations
+        self.betweenness_exact_max_nodes = betweenness_exact_max_nodes
+        self.betweenness_samples = betweenness_samples
+        self.seed = seed
+
+        self.index: dict[str, int] = {}
+        self.names: list[str] = []
+        sources: list[int] = []
+        targets: list[int] = []
+        for source, target in edges:
+            if source is None or target is None:
+                continue
+            sources.append(self._intern(source))
+            targets.append(self._intern(target))
+
+        n = len(self.names)
+        adjacency = sparse.csr_matrix(
+            (np.ones(len(sources), dtype=np.float64), (sources, targets)), shape=(n, n)
+        )
+        adjacency.sum_duplicates()
+        adjacency.data[:] = 1.0  # Binarize (DiGraph semantics)
+        self.adjacency: sparse.csr_matrix = adjacency
+
+        self._reverse: sparse.csr_matrix | None = None
+        self._scores: dict[str, np.ndarray] = {}
+        self._component_labels: np.ndarray | None = None
+        self._num_components = 0
+
+    def _intern(self, name: str) -> int:
+        node = self.index.get(name)
+        if node is None:
+            node = len(self.names)
+            self.index[name] = node
+            self.names.append(name)
+        return node
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes (entities with at least one relationship)."""
+        return len(self.names)
+
+    @property
+    def reverse(self) -> sparse.csr_matrix:
+        """Transposed adjacency in CSR form (in-edges as rows)."""
+        if self._reverse is None:
+            self._reverse = self.adjacency.T.tocsr()
+        return self._reverse
+
+    @property
+    def num_edges(self) -> int:
+        """Number of distinct directed edges."""
+        return int(self.adjacency.nnz)
+
+    # ------------------------------------------------------------------
+    # Traversal
+    # ------------------------------------------------------------------
+
+    def neighbors(
+        self, entity_id: str, direction: Literal["out", "in", "both"] = "both"
+    ) -> list[str]:
+        """Get direct neighbors of an entity.
+
+        Args:
+            entity_id: Entity ID
+            direction: Edge direction to follow
+
+        Returns:
+            Neighbor entity IDs (empty if entity is unknown)
+        """
+        node = self.index.get(entity_id)
+        if node is None:
+            return []
+        return [self.names[i] for i in self._neighbor_ids(np.array([node]), direction)]
+
+    def k_hop_neighborhood(
+        self, entity_id: str, hops: int = 2, direction: Literal["out", "in", "both"] = "both"
+    ) -> dict[str, int]:
+        """Get all entities within ``hops`` steps, with their hop distance.
+
+        Args:
+            entity_id: Start entity ID
+            hops: Maximum number of hops
+            direction: Edge direction to follow
+
+        Returns:
+            Mapping entity ID -> hop distance (start entity excluded)
+        """
+        start = self.index.get(entity_id)
+        if start is None:
+            return {}
+
+        distance = np.full(self.num_nodes, -1, dtype=np.int64)
+        distance[start] = 0
+        frontier = np.array([start])
+        for hop in range(1, hops + 1):
+            candidates = self._neighbor_ids(frontier, direction)
+            frontier = candidates[distance[candidates] < 0]
+            if frontier.size == 0:
+                break
+            distance[frontier] = hop
+
+        reached = np.nonzero(distance > 0)[0]
+        return {self.names[i]: int(distance[i]) for i in reached}
+
+    def _neighbor_ids(self, nodes: np.ndarray, direction: str) -> np.ndarray:
+        parts = []
+        if direction in ("out", "both"):
+            parts.append(self.adjacency[nodes].indices)
+        if direction in ("in", "both"):
+            parts.append(self.reverse[nodes].indices)
+        if not parts:
+            return np.array([], dtype=np.int64)
+        return np.unique(np.concatenate(parts))
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Materialize the projection as a NetworkX DiGraph keyed by entity ID."""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.names)
+        coo = self.adjacency.tocoo()
+        graph.add_edges_from(
+            (self.names[s], self.names[t]) for s, t in zip(coo.row, coo.col, strict=True)
+        )
+        return graph
+
+    # ------------------------------------------------------------------
+    # Score table
+    # ------------------------------------------------------------------
+
+    def score(self, metric: ProjectionMetric, entity_id: str) -> float:
+        """Get one entity's score from the per-version score table.
+
+        Args:
+            metric: Metric name
+            entity_id: Entity ID
+
+        Returns:
+            Score (0.0 for entities not in the projection)
+        """
+        node = self.index.get(entity_id)
+        if node is None:
+            return 0.0
+        return float(self.scores(metric)[node])
+
+    def scores(self, metric: ProjectionMetric) -> np.ndarray:
+        """Get the full score array for a metric (computed once per version)."""
+        if metric not in self._scores:
+            start = time.perf_counter()
+            compute = {
+                "degree": self._degree,
+                "pagerank": self._pagerank,
+                "closeness": self._closeness,
+                "eigenvector": self._eigenvector,
+                "betweenness": self._betweenness,
+            }[metric]
+            self._scores[metric] = compute()
+            logger.info(
+                "graph_projection_metric_computed",
+                metric=metric,
+                nodes=self.num_nodes,
+                edges=self.num_edges,
+                duration_ms=round((time.perf_counter() - start) * 1000, 1),
+            )
+        return self._scores[metric]
+
+    def ranked(self, metric: ProjectionMetric, top_k: int | None = None) -> list[tuple[str, float]]:
+        """Get entities ordered by score, highest first.
+
+        Args:
+            metric: Metric name
+            top_k: Limit results (None = all)
+
+        Returns:
+            List of (entity_id, score)
+        """
+        values = self.scores(metric)
+        order = np.argsort(-values, kind="stable")
+        if top_k is not None:
+            order = order[:top_k]
+        return [(self.names[i], float(values[i])) for i in order]
+
+    @property
+    def num_weak_components(self) -> int:
+        """Number of weakly connected components."""
+        self._components()
+        return self._num_components
+
+    def component_of(self, entity_id: str) -> int | None:
+        """Get the weak component label of an entity (None if unknown)."""
+        node = self.index.get(entity_id)
+        if node is None:
+            return None
+        return int(self._components()[node])
+
+    def _components(self) -> np.ndarray:
+        if self._component_labels is None:
+            self._num_components, self._component_labels = csgraph.connected_components(
+                self.adjacency, directed=True, connection="weak"
+            )
+        return self._component_labels
+
+    # ------------------------------------------------------------------
+    # Vectorized metrics
+    # ------------------------------------------------------------------
+
+    def _degree(self) -> np.ndarray:
+        """Distinct neighbors in either direction."""
+        undirected = (self.adjacency + self.adjacency.T).tocsr()
+        return np.diff(undirected.indptr).astype(np.float64)
+
+    def _pagerank(self, alpha: float = 0.85, tol: float = 1.0e-6) -> np.ndarray:
+        """PageRank by sparse power iteration (NetworkX semantics, uniform dangling)."""
+        n = self.num_nodes
+        if n == 0:
+            return np.zeros(0)
+
+        out_degree = np.asarray(self.adjacency.sum(axis=1)).ravel()
+        dangling = out_degree == 0
+        inv_out = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+        transition_t = (sparse.diags(inv_out) @ self.adjacency).T.tocsr()
+
+        x = np.full(n, 1.0 / n)
+        for _ in range(self.pagerank_iterations):
+            previous = x
+            x = alpha * (transition_t @ previous + previous[dangling].sum() / n) + (1 - alpha) / n
+            if np.abs(x - previous).sum() < n * tol:
+                break
+        return x / x.sum()
+
+    def _closeness(self, block_size: int = 256) -> np.ndarray:
+        """Closeness on incoming distances with Wasserman-Faust scaling (NetworkX default)."""
+        n = self.num_nodes
+        result = np.zeros(n)
+        if n <= 1:
+            return result
+
+        reverse = self.reverse
+        for start in range(0, n, block_size):
+            rows = np.arange(start, min(start + block_size, n))
+            dist = csgraph.shortest_path(reverse, unweighted=True, indices=rows)
+            finite = np.isfinite(dist)
+            total = np.where(finite, dist, 0.0).sum(axis=1)
+            reachable = finite.sum(axis=1)  # Includes the node itself
+            with np.errstate(divide="ignore", invalid="ignore"):
+                closeness = (reachable - 1) / total * (reachable - 1) / (n - 1)
+            result[rows] = np.where(total > 0, closeness, 0.0)
+        return result
+
+    def _eigenvector(self, max_iter: int = 100, tol: float = 1.0e-6) -> np.ndarray:
+        """Eigenvector centrality of in-edges by power iteration on (A^T + I)."""
+        n = self.num_nodes
+        if n == 0:
+            return np.zeros(0)
+
+        x = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            previous = x
+            x = self.reverse @ previous + previous
+            norm = np.linalg.norm(x)
+            if norm == 0:
+                return np.zeros(n)
+            x = x / norm
+            if np.abs(x - previous).sum() < n * tol:
+                return x
+        logger.warning("graph_projection_eigenvector_not_converged", nodes=n)
+        return np.zeros(n)
+
+    def _betweenness(self) -> np.ndarray:
+        """Normalized betweenness via level-synchronous Brandes.
+
+        Exact for graphs up to betweenness_exact_max_nodes; above that, Brandes runs
+        from betweenness_samples random sources and is rescaled by n/k (the same
+        estimator as ``nx.betweenness_centrality(G, k=...)``).
+        """
+        n = self.num_nodes
+        centrality = np.zeros(n)
+        if n <= 2:
+            return centrality
+
+        if n <= self.betweenness_exact_max_nodes:
+            sources = np.arange(n)
+        else:
+            rng = np.random.default_rng(self.seed)
+            sources = rng.choice(n, size=min(self.betweenness_samples, n), replace=False)
+
+        adjacency = self.adjacency
+
+        for source in sources:
+            distance = np.full(n, -1, dtype=np.int64)
+            sigma = np.zeros(n)
+            distance[source] = 0
+            sigma[source] = 1.0
+            levels = [np.array([source])]
+
+            # Forward BFS: count shortest paths level by level
+            while True:
+                frontier = levels[-1]
+                reach = adjacency[frontier].T @ sigma[frontier]
+                new = np.nonzero((reach > 0) & (distance < 0))[0]
+                if new.size == 0:
+                    break
+                distance[new] = len(levels)
+                sigma[new] = reach[new]
+                levels.append(new)
+
+            # Backward pass: accumulate dependencies onto predecessors
+            delta = np.zeros(n)
+            for depth in range(len(levels) - 1, 0, -1):
+                successors = levels[depth]
+                predecessors = levels[depth - 1]
+                coefficient = (1.0 + delta[successors]) / sigma[successors]
+                delta[predecessors] += sigma[predecessors] * (
+                    adjacency[predecessors][:, successors] @ coefficient
+                )
+            delta[source] = 0.0
+            centrality += delta
+
+        scale = 1.0 / ((n - 1) * (n - 2))
+        if len(sources) < n:
+            scale *= n / len(sources)
+        return centrality * scale
+
+
+class GraphProjectionStore:
+    """Process-wide holder of the current GraphProjection.
+
+    Checks the version on every access and reloads the projection from Neo4j
+    only when the version changed. Concurrent callers share one reload.
+    """
+
+    _EDGES_QUERY = """
+    MATCH (n)-[r]->(m)
+    RETURN n.id AS source, m.id AS target
+    """
+
+    _VERSION_QUERY = """
+    CALL { MATCH (n) RETURN count(n) AS nodes }
+    CALL { MATCH ()-[r]->() RETURN count(r) AS relationships }
+    RETURN nodes, relationships
+    """
+
+    def __init__(
+        self,
+        pagerank_iterations: int = 20,
+        betweenness_exact_max_nodes: int = 2000,
+        betweenness_samples: int = 256,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            pagerank_iterations: Maximum PageRank power iterations
+            betweenness_exact_max_nodes: Use exact betweenness up to this many nodes
+            betweenness_samples: Sampled sources for approximate betweenness
+        """
+        self.pagerank_iterations = pagerank_iterations
+        self.betweenness_exact_max_nodes = betweenness_exact_max_nodes
+        self.betweenness_samples = betweenness_samples
+        self._projection: GraphProjection | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def current(self) -> GraphProjection | None:
+        """Most recently loaded projection (may be stale)."""
+        return self._projection
+
+    def invalidate(self) -> None:
+        """Drop the current projection so the next access reloads it."""
+        self._projection = None
+
+    async def _current_version(self, neo4j_client: Any) -> tuple[int, ...]:
+        rows = await neo4j_client.execute_query(self._VERSION_QUERY)
+        row = rows[0] if rows else {}
+        return (
+            get_graph_write_version(),
+            int(row.get("nodes") or 0),
+            int(row.get("relationships") or 0),
+        )
+
+    async def get(self, neo4j_client: Any) -> GraphProjection:
+        """Get a projection that reflects the current graph version.
+
+        Args:
+            neo4j_client: Neo4j client used for the version check and reload
+
+        Returns:
+            Current GraphProjection
+        """
+        version = await self._current_version(neo4j_client)
+        projection = self._projection
+        if projection is not None and projection.version == version:
+            return projection
+
+        async with self._lock:
+            # Another caller may have reloaded while we waited
+            projection = self._projection
+            if projection is not None and projection.version == version:
+                return projection
+
+            start = time.perf_counter()
+            rows = await neo4j_client.execute_query(self._EDGES_QUERY)
+            edges = [(row.get("source"), row.get("target")) for row in rows]
+            projection = await asyncio.to_thread(
+                GraphProjection,
+                edges,
+                version,
+                self.pagerank_iterations,
+                self.betweenness_exact_max_nodes,
+                self.betweenness_samples,
+            )
+            self._projection = projection
+
+            logger.info(
+                "graph_projection_loaded",
+                version=version,
+                nodes=projection.num_nodes,
+                edges=projection.num_edges,
+                duration_ms=round((time.perf_counter() - start) * 1000, 1),
+            )
+            return projection
+
+
+# Singleton instance
+_projection_store: GraphProjectionStore | None = None
+
+
+def get_graph_projection_store() -> GraphProjectionStore:
+    """Get singleton GraphProjectionStore instance.
+
+    Returns:
+        GraphProjectionStore instance
+    """
+    global _projection_store
+    if _projection_store is None:
+        from src.core.config import settings
+
+        _projection_store = GraphProjectionStore(
+            pagerank_iterations=settings.graph_analytics_pagerank_iterations,
+            betweenness_exact_max_nodes=settings.graph_analytics_betweenness_exact_max_nodes,
+            betweenness_samples=settings.graph_analytics_betweenness_samples,
+        )
+    return _projection_store
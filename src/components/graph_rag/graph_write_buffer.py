@@ -0,0 +1,532 @@
+"""Batched UNWIND writer for chunk, entity and provenance storage.
+
+Sprint 130 Feature 130.11: Graph Write Buffer
+
+Neo4jClient.store_chunks_and_provenance used to issue one ``MERGE (c:chunk)``
+per chunk, one ``MERGE (e:base)`` per entity and one MENTIONED_IN statement per
+chunk, and store_relations one statement per chunk. A 300-chunk document meant
+thousands of sequential round-trips.
+
+GraphWriteBuffer collects rows across chunks (and across documents of a batch)
+and flushes them as parameterized UNWIND statements:
+
+    add_chunks / add_entities / add_relations ─→ pending rows (deduplicated)
+                                                      │
+    flush() ─→ :chunk ─→ :base (one statement per entity type label)
+             ─→ MENTIONED_IN ─→ RELATES_TO
+             (UNWIND batches of ``batch_size`` rows, one transaction each)
+
+Phases run in dependency order (relations MATCH the entities written before).
+Each batch is retried on transient errors (deadlocks, lock timeouts) with
+exponential backoff; MERGE makes the retry idempotent. Rows of a failed flush
+are put back so a later flush can retry them.
+
+Example:
+    >>> buffer = GraphWriteBuffer(batch_size=500)
+    >>> buffer.add_chunks(chunks, namespace_id="default")
+    >>> buffer.add_entities(entities, namespace_id="default")
+    >>> buffer.add_relations(relations, chunk_id="chunk_1", namespace_id="default")
+    >>> stats = await buffer.flush()
+    >>> stats["throughput"]["chunk"]["rows_per_second"]
+    4210.5
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from neo4j.exceptions import ServiceUnavailable, TransientError
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from src.components.graph_rag.graph_projection import bump_graph_write_version
+from src.core.config import settings
+from src.core.exceptions import DatabaseConnectionError
+
+logger = structlog.get_logger(__name__)
+
+# Transient errors (DeadlockDetected, LockClientStopped, ...) are retried per batch
+TRANSIENT_RETRY_ATTEMPTS = 5
+
+CHUNK_UNWIND_QUERY = """
+UNWIND $rows AS row
+MERGE (c:chunk {chunk_id: row.chunk_id})
+SET c.text = row.text,
+    c.document_id = row.document_id,
+    c.document_path = row.document_path,
+    c.chunk_index = row.chunk_index,
+    c.tokens = row.tokens,
+    c.start_token = row.start_token,
+    c.end_token = row.end_token,
+    c.namespace_id = row.namespace_id,
+    c.domain_id = row.domain_id,
+    c.created_at = datetime()
+RETURN count(c) AS written
+"""
+
+# Labels cannot be parameterized: one statement per entity type ({labels} is filled in)
+ENTITY_UNWIND_QUERY = """
+UNWIND $rows AS row
+MERGE (e:{labels} {{entity_id: row.entity_id}})
+SET e.entity_name = row.entity_name,
+    e.entity_type = row.entity_type,
+    e.entity_sub_type = coalesce(row.entity_sub_type, e.entity_sub_type),
+    e.description = row.description,
+    e.source_id = row.source_id,
+    e.file_path = row.file_path,
+    e.chunk_index = row.chunk_index,
+    e.namespace_id = row.namespace_id,
+    e.domain_id = row.domain_id,
+    e.created_at = datetime()
+RETURN count(e) AS written
+"""
+
+MENTIONED_IN_UNWIND_QUERY = """
+UNWIND $rows AS row
+MATCH (e:base {entity_id: row.entity_id})
+MATCH (c:chunk {chunk_id: row.chunk_id})
+MERGE (e)-[r:MENTIONED_IN]->(c)
+SET r.created_at = datetime(),
+    r.source_chunk_id = row.chunk_id,
+    r.namespace_id = row.namespace_id
+RETURN count(r) AS written
+"""
+
+RELATES_TO_UNWIND_QUERY = """
+UNWIND $rows AS rel
+MATCH (e1:base {entity_name: rel.source})
+MATCH (e2:base {entity_name: rel.target})
+WHERE e1 <> e2
+MERGE (e1)-[r:RELATES_TO]->(e2)
+SET r.weight = toFloat(rel.strength) / 10.0,
+    r.description = rel.description,
+    r.relation_type = CASE
+        WHEN rel.relation_type <> 'RELATES_TO' THEN rel.relation_type
+        WHEN r.relation_type IS NOT NULL AND r.relation_type <> 'RELATES_TO' THEN r.relation_type
+        ELSE rel.relation_type
+    END,
+    r.source_chunk_id = rel.chunk_id,
+    r.namespace_id = rel.namespace_id,
+    r.created_at = datetime()
+RETURN count(r) AS written
+"""
+
+
+@dataclass
+class LabelWriteStats:
+    """Write statistics of one node label or relationship type.
+
+    Attributes:
+        rows: Rows sent to Neo4j
+        written: Nodes/relationships matched or merged (from ``RETURN count``)
+        batches: UNWIND statements executed
+        retries: Batches retried after transient errors
+        duration_seconds: Time spent in Neo4j for this label
+    """
+
+    rows: int = 0
+    written: int = 0
+    batches: int = 0
+    retries: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Write throughput in rows per second."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.rows / self.duration_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to a JSON-serializable dict."""
+        return {
+            "rows": self.rows,
+            "written": self.written,
+            "batches": self.batches,
+            "retries": self.retries,
+            "duration_ms": round(self.duration_seconds * 1000, 2),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+@dataclass
+class _PendingWrites:
+    """Rows collected since the last flush.
+
+    Chunks and entities are keyed so that a later add overwrites an earlier one
+    (same result as sequential MERGE + SET). Relations keep their order because
+    the relation_type CASE depends on the previous write.
+    """
+
+    chunks: dict[str, dict[str, Any]] = field(default_factory=dict)
+    entities: dict[tuple[str, str], dict[str, Any]] = field(default_factory=dict)
+    mentions: dict[tuple[str, str], dict[str, Any]] = field(default_factory=dict)
+    relations: list[dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.chunks) + len(self.entities) + len(self.mentions) + len(self.relations)
+
+    def prepend(self, older: "_PendingWrites") -> None:
+        """Put rows of an earlier (failed) flush in front of the current rows."""
+        self.chunks = {**older.chunks, **self.chunks}
+        self.entities = {**older.entities, **self.entities}
+        self.mentions = {**older.mentions, **self.mentions}
+        self.relations = older.relations + self.relations
+
+
+class GraphWriteBuffer:
+    """Collects chunk/entity/provenance rows and writes them in UNWIND batches.
+
+    Not thread-safe; intended for use from one event loop. Concurrent flushes
+    are serialized.
+    """
+
+    def __init__(
+        self,
+        client: Any | None = None,
+        batch_size: int | None = None,
+        flush_threshold: int | None = None,
+    ) -> None:
+        """Initialize graph write buffer.
+
+        Args:
+            client: Neo4jClient (default: global client)
+            batch_size: Rows per UNWIND statement (default: settings.graph_write_batch_size)
+            flush_threshold: Pending rows that make ``flush_if_full`` flush
+                (default: settings.graph_write_flush_threshold)
+        """
+        if client is None:
+            from src.components.graph_rag.neo4j_client import get_neo4j_client
+
+            client = get_neo4j_client()
+
+        self.client = client
+        self.batch_size = batch_size or settings.graph_write_batch_size
+        self.flush_threshold = flush_threshold or settings.graph_write_flush_threshold
+
+        self._pending = _PendingWrites()
+        self._flush_lock: asyncio.Lock | None = None
+
+        # Metrics (cumulative over all flushes)
+        self.entities_skipped = 0
+        self.flushes = 0
+        self.label_stats: dict[str, LabelWriteStats] = {}
+
+    @property
+    def pending_rows(self) -> int:
+        """Number of rows waiting for the next flush."""
+        return len(self._pending)
+
+    def add_chunks(self, chunks: list[dict[str, Any]], namespace_id: str = "default") -> int:
+        """Queue :chunk nodes.
+
+        Args:
+            chunks: Chunk dicts with chunk_id, text (or content), document_id, chunk_index
+            namespace_id: Namespace for multi-tenant isolation
+
+        Returns:
+            Number of chunks queued
+        """
+        for chunk in chunks:
+            tokens = chunk.get("tokens", chunk.get("token_count", 0))
+            self._pending.chunks[chunk["chunk_id"]] = {
+                "chunk_id": chunk["chunk_id"],
+                "text": chunk.get("text", chunk.get("content", "")),
+                "document_id": chunk["document_id"],
+                "document_path": chunk.get("document_path", ""),
+                "chunk_index": chunk["chunk_index"],
+                "tokens": tokens,
+                "start_token": chunk.get("start_token", 0),
+                "end_token": chunk.get("end_token", tokens),
+                "namespace_id": namespace_id,
+                "domain_id": chunk.get("domain_id"),
+            }
+        return len(chunks)
+
+    def add_entities(self, entities: list[dict[str, Any]], namespace_id: str = "default") -> int:
+        """Queue :base entity nodes and their MENTIONED_IN edges.
+
+        An entity's ``source_id`` is the chunk it was extracted from; a
+        MENTIONED_IN edge to that chunk is queued alongside the node.
+
+        Args:
+            entities: Entity dicts with entity_id, entity_name, entity_type, source_id
+            namespace_id: Namespace for multi-tenant isolation
+
+        Returns:
+            Number of entities queued (entities without entity_id are skipped)
+        """
+        queued = 0
+        for entity in entities:
+            entity_id = entity.get("entity_id", "")
+            if not entity_id:
+                self.entities_skipped += 1
+                continue
+
+            entity_type = entity.get("entity_type", "UNKNOWN")
+            source_id = entity.get("source_id", "")
+            self._pending.entities[(entity_type, entity_id)] = {
+                "entity_id": entity_id,
+                "entity_name": entity.get("entity_name", entity_id),
+                "entity_type": entity_type,
+                "entity_sub_type": entity.get("entity_sub_type"),
+                "description": entity.get("description", ""),
+                "source_id": source_id,
+                "file_path": entity.get("file_path", ""),
+                "chunk_index": entity.get("chunk_index", 0),
+                "namespace_id": namespace_id,
+                "domain_id": entity.get("domain_id"),
+            }
+            if source_id:
+                self._pending.mentions[(entity_id, source_id)] = {
+                    "entity_id": entity_id,
+                    "chunk_id": source_id,
+                    "namespace_id": namespace_id,
+                }
+            queued += 1
+        return queued
+
+    def add_relations(
+        self,
+        relations: list[dict[str, Any]],
+        chunk_id: str,
+        namespace_id: str = "default",
+    ) -> int:
+        """Queue RELATES_TO edges between entities (matched by entity_name).
+
+        Args:
+            relations: Relations with source, target, description, strength, type
+            chunk_id: Source chunk ID for provenance
+            namespace_id: Namespace for multi-tenant isolation
+
+        Returns:
+            Number of relations queued
+        """
+        for r in relations:
+            self._pending.relations.append(
+                {
+                    "source": r["source"],
+                    "target": r["target"],
+                    "description": r.get("description", ""),
+                    "strength": r.get("strength", 5),
+                    "relation_type": r.get("type")
+                    or r.get("relation_type")
+                    or r.get("relation", "RELATES_TO"),
+                    "chunk_id": chunk_id,
+                    "namespace_id": namespace_id,
+                }
+            )
+        return len(relations)
+
+    async def flush_if_full(self) -> dict[str, Any] | None:
+        """Flush if at least ``flush_threshold`` rows are pending.
+
+        Returns:
+            Flush stats or None if the buffer was below the threshold
+        """
+        if self.pending_rows < self.flush_threshold:
+            return None
+        return await self.flush()
+
+    async def flush(self) -> dict[str, Any]:
+        """Write all pending rows to Neo4j.
+
+        Returns:
+            Dict with chunks_written, entities_written, mentioned_in_written,
+            relations_written and per-label ``throughput`` stats of this flush
+
+        Raises:
+            DatabaseConnectionError: If a batch still fails after retries
+                (the unwritten rows stay queued)
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            pending, self._pending = self._pending, _PendingWrites()
+            if not pending:
+                return self._flush_result({})
+
+            flush_start = time.perf_counter()
+            flush_stats: dict[str, LabelWriteStats] = {}
+
+            try:
+                async with self.client.driver.session(database=self.client.database) as session:
+                    await self._write_rows(
+                        session,
+                        "chunk",
+                        CHUNK_UNWIND_QUERY,
+                        list(pending.chunks.values()),
+                        flush_stats,
+                    )
+
+                    entities_by_type: dict[str, list[dict[str, Any]]] = {}
+                    for (entity_type, _), row in pending.entities.items():
+                        entities_by_type.setdefault(entity_type, []).append(row)
+                    for entity_type, rows in entities_by_type.items():
+                        # Sanitize entity_type label for Cypher safety
+                        sanitized_type = entity_type.replace("`", "\\`")
+                        query = ENTITY_UNWIND_QUERY.format(labels=f"base:`{sanitized_type}`")
+                        await self._write_rows(session, "base", query, rows, flush_stats)
+
+                    await self._write_rows(
+                        session,
+                        "MENTIONED_IN",
+                        MENTIONED_IN_UNWIND_QUERY,
+                        list(pending.mentions.values()),
+                        flush_stats,
+                    )
+                    await self._write_rows(
+                        session,
+                        "RELATES_TO",
+                        RELATES_TO_UNWIND_QUERY,
+                        pending.relations,
+                        flush_stats,
+                    )
+            except Exception as e:
+                # MERGE is idempotent: already written batches are simply rewritten
+                self._pending.prepend(pending)
+                logger.error(
+                    "graph_write_buffer_flush_failed",
+                    pending_rows=len(self._pending),
+                    error=str(e),
+                )
+                raise DatabaseConnectionError("Neo4j", f"Graph write flush failed: {e}") from e
+
+            self.flushes += 1
+            for label, stats in flush_stats.items():
+                total = self.label_stats.setdefault(label, LabelWriteStats())
+                total.rows += stats.rows
+                total.written += stats.written
+                total.batches += stats.batches
+                total.retries += stats.retries
+                total.duration_seconds += stats.duration_seconds
+
+            bump_graph_write_version()
+            self._update_entity_lexicon(pending)
+
+            result = self._flush_result(flush_stats)
+            logger.info(
+                "graph_write_buffer_flushed",
+                duration_ms=round((time.perf_counter() - flush_start) * 1000, 2),
+                batch_size=self.batch_size,
+                **{
+                    f"{label.lower()}_rows_per_second": stats["rows_per_second"]
+                    for label, stats in result["throughput"].items()
+                },
+            )
+            return result
+
+    async def _write_rows(
+        self,
+        session: Any,
+        label: str,
+        query: str,
+        rows: list[dict[str, Any]],
+        flush_stats: dict[str, LabelWriteStats],
+    ) -> None:
+        """Write rows of one label in UNWIND batches."""
+        if not rows:
+            return
+
+        stats = flush_stats.setdefault(label, LabelWriteStats())
+        for offset in range(0, len(rows), self.batch_size):
+            batch = rows[offset : offset + self.batch_size]
+            start = time.perf_counter()
+            written = await self._run_batch(session, query, batch, stats)
+            stats.duration_seconds += time.perf_counter() - start
+            stats.rows += len(batch)
+            stats.written += written
+            stats.batches += 1
+
+    @retry(
+        stop=stop_after_attempt(TRANSIENT_RETRY_ATTEMPTS),
+        wait=wait_exponential(multiplier=0.2, min=0.2, max=5),
+        retry=retry_if_exception_type((TransientError, ServiceUnavailable)),
+        reraise=True,
+    )
+    async def _run_batch(
+        self,
+        session: Any,
+        query: str,
+        rows: list[dict[str, Any]],
+        stats: LabelWriteStats,
+    ) -> int:
+        """Run one UNWIND statement (auto-commit transaction), retried on transient errors."""
+        try:
+            result = await session.run(query, rows=rows)
+            record = await result.single()
+        except (TransientError, ServiceUnavailable) as e:
+            stats.retries += 1
+            logger.warning("graph_write_batch_retry", rows=len(rows), error=str(e))
+            raise
+        return record["written"] if record else 0
+
+    def _update_entity_lexicon(self, pending: _PendingWrites) -> None:
+        """Keep the in-memory entity lexicon fresh for loaded namespaces.
+
+        Sprint 130 Feature 130.5: unloaded namespaces pick the entities up on
+        their first full load.
+        """
+        if not pending.entities:
+            return
+
+        from src.components.graph_rag.entity_lexicon import get_entity_lexicon
+
+        lexicon = get_entity_lexicon()
+        by_namespace: dict[str, list[dict[str, Any]]] = {}
+        for row in pending.entities.values():
+            by_namespace.setdefault(row["namespace_id"], []).append(
+                {
+                    "entity_id": row["entity_id"],
+                    "entity_name": row["entity_name"],
+                    "description": row.get("description", ""),
+                }
+            )
+        for namespace_id, stored_entities in by_namespace.items():
+            if lexicon.is_loaded([namespace_id]):
+                lexicon.add_entities(namespace_id, stored_entities)
+
+    @staticmethod
+    def _flush_result(flush_stats: dict[str, LabelWriteStats]) -> dict[str, Any]:
+        """Build the flush result dict."""
+
+        def written(label: str) -> int:
+            return flush_stats[label].written if label in flush_stats else 0
+
+        return {
+            "chunks_written": written("chunk"),
+            "entities_written": written("base"),
+            "mentioned_in_written": written("MENTIONED_IN"),
+            "relations_written": written("RELATES_TO"),
+            "throughput": {label: stats.to_dict() for label, stats in flush_stats.items()},
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cumulative write statistics.
+
+        Returns:
+            Stats dict with flush count, pending rows and per-label throughput
+        """
+        return {
+            "flushes": self.flushes,
+            "pending_rows": self.pending_rows,
+            "entities_skipped": self.entities_skipped,
+            "batch_size": self.batch_size,
+            "throughput": {label: stats.to_dict() for label, stats in self.label_stats.items()},
+        }
+
+    async def __aenter__(self) -> "GraphWriteBuffer":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, _exc_val, _exc_tb) -> None:
+        """Flush pending rows unless the block raised."""
+        if exc_type is None:
+            await self.flush()
@@ -13,6 +13,10 @@ Best Practice Reference:
 word distance to find potential duplicates. This involves defining a vector
 index on entities in the graph using Cypher queries with cosine similarity."
 — LlamaIndex Blog: Customizing Property Graph Index
+
+Sprint 130 Feature 130.12: The name-similarity fallback of find_duplicate_entities
+loads entity names once and compares only blocking candidates in process instead
+of running a Cartesian ``MATCH (e1:base), (e2:base)`` in Cypher.
 """
 
 from dataclasses import dataclass
@@ -20,6 +24,7 @@ from typing import Any
 
 import structlog
 
+from src.components.graph_rag.duplicate_candidates import DuplicateCandidateGenerator
 from src.components.graph_rag.neo4j_client import get_neo4j_client
 from src.core.models import GraphRelationship
 
@@ -162,6 +167,7 @@ class KGHygieneService:
     def __init__(self) -> None:
         """Initialize KG hygiene service."""
         self.neo4j_client = get_neo4j_client()
+        self.candidate_generator = DuplicateCandidateGenerator()
         logger.info("kg_hygiene_service_initialized")
 
     async def analyze_graph(self, namespace_id: str | None = None) -> HygieneReport:
@@ -347,33 +353,56 @@ class KGHygieneService:
                     error=str(vector_error),
                 )
 
-            # Fallback: Name-based similarity (simple substring/prefix matching)
-            results = await self.neo4j_client.execute_read(
+            # Fallback: Name-based similarity (substring/equality on blocking candidates)
+            namespace_where = "AND e.namespace_id = $namespace_id" if namespace_id else ""
+            rows = await self.neo4j_client.execute_read(
                 f"""
-                MATCH (e1:base), (e2:base)
-                {namespace_filter.replace("e1.", "e1.")} {"AND" if namespace_filter else "WHERE"}
-                e1 <> e2
-                AND toLower(e1.entity_name) < toLower(e2.entity_name)
-                AND (
-                    toLower(e1.entity_name) CONTAINS toLower(e2.entity_name)
-                    OR toLower(e2.entity_name) CONTAINS toLower(e1.entity_name)
-                    OR toLower(e1.entity_name) = toLower(e2.entity_name)
-                )
-                RETURN e1.entity_name AS entity1,
-                       e2.entity_name AS entity2,
-                       1.0 AS similarity
-                ORDER BY entity1
-                LIMIT $limit
+                MATCH (e:base)
+                WHERE e.entity_name IS NOT NULL {namespace_where}
+                RETURN DISTINCT e.entity_name AS entity_name
                 """,
                 params,
             )
-            logger.info("duplicate_detection_used_name_similarity", count=len(results))
-            return [(r["entity1"], r["entity2"], r["similarity"]) for r in results]
+            duplicates = self._find_name_duplicates([r["entity_name"] for r in rows], limit)
+            logger.info(
+                "duplicate_detection_used_name_similarity",
+                count=len(duplicates),
+                entities=len(rows),
+            )
+            return duplicates
 
         except Exception as e:
             logger.error("find_duplicate_entities_failed", error=str(e))
             return []
 
+    def _find_name_duplicates(
+        self, entity_names: list[str], limit: int
+    ) -> list[tuple[str, str, float]]:
+        """Find entity pairs whose lowercase names are equal or contain each other.
+
+        Only blocking candidates (shared name key, token, token prefix or MinHash
+        bucket) are compared, so runtime stays near-linear in the entity count.
+
+        Args:
+            entity_names: Distinct entity names
+            limit: Maximum duplicates to return
+
+        Returns:
+            List of (entity1_name, entity2_name, 1.0) tuples with
+            lower(entity1) < lower(entity2), ordered by entity1
+        """
+        lowered = [name.lower() for name in entity_names]
+        duplicates: list[tuple[str, str, float]] = []
+
+        for i, j in self.candidate_generator.name_candidates(entity_names):
+            key_i, key_j = (lowered[i], entity_names[i]), (lowered[j], entity_names[j])
+            a, b = (i, j) if key_i < key_j else (j, i)
+            if lowered[a] == lowered[b] or lowered[a] in lowered[b] or lowered[b] in lowered[a]:
+                duplicates.append((entity_names[a], entity_names[b], 1.0))
+
+        duplicates.sort(key=lambda d: (d[0], d[1]))
+        return duplicates[:limit]
+
     async def remove_self_loops(self, namespace_id: str | None = None) -> int:
         """Remove self-loop relations (entity -> same entity).
 
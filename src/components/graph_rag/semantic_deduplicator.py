@@ -23,6 +23,10 @@ Sprint 49 Feature 49.9: BGE-M3 Migration (ADR-024)
 - Async batch embedding for better performance
 - Removes sentence-transformers dependency
 
+Sprint 130 Feature 130.12: Blocking-based candidate generation
+- String criteria only run on candidate pairs (name keys, token blocks, MinHash/LSH)
+- Semantic matching uses chunked top-k neighbors instead of a dense n×n matrix
+
 Author: Claude Code
 Date: 2025-10-24, Updated: 2025-12-16
 """
@@ -33,8 +37,11 @@ from typing import Any
 
 import numpy as np
 import structlog
-from sklearn.metrics.pairwise import cosine_similarity
 
+from src.components.graph_rag.duplicate_candidates import (
+    DuplicateCandidateGenerator,
+    candidate_adjacency,
+)
 from src.components.shared.embedding_service import get_embedding_service
 
 logger = structlog.get_logger(__name__)
@@ -105,6 +112,7 @@ class SemanticDeduplicator:
         self.embedding_service = get_embedding_service()
         self.threshold = threshold
         self.batch_size = batch_size
+        self.candidate_generator = DuplicateCandidateGenerator()
 
         logger.info(
             "semantic_deduplicator_initialized",
@@ -324,11 +332,13 @@ class SemanticDeduplicator:
         )
         embeddings = [emb["dense"] if isinstance(emb, dict) else emb for emb in batch_result]
 
-        # Convert to numpy for sklearn
         embeddings_np = np.array(embeddings)
 
-        # Compute pairwise cosine similarity
-        similarity_matrix = cosine_similarity(embeddings_np)
+        # Sprint 130 Feature 130.12: Chunked top-k neighbors above threshold
+        # (instead of a dense n×n cosine matrix)
+        neighbors = candidate_adjacency(
+            self.candidate_generator.embedding_candidates(embeddings_np, self.threshold)
+        )
 
         # Find clusters using greedy clustering
         used = set()
@@ -340,8 +350,8 @@ class SemanticDeduplicator:
 
             # Find all similar entities (cluster)
             similar = [i]
-            for j in range(i + 1, len(entities)):
-                if j not in used and similarity_matrix[i, j] >= self.threshold:
+            for j in neighbors.get(i, []):
+                if j not in used:
                     similar.append(j)
                     used.add(j)
 
@@ -393,8 +403,9 @@ class MultiCriteriaDeduplicator(SemanticDeduplicator):
     - Substring: only for entities >= 6 chars (prevents "AI" in "NVIDIA")
 
     Performance:
-    - Criteria 1-3 are O(n²) string operations (very fast)
-    - Criterion 4 uses batch embeddings (existing optimization)
+    - Criteria 1-3 only run on candidate pairs from DuplicateCandidateGenerator
+      (all pairs for small groups, blocking/LSH for large ones - Sprint 130.12)
+    - Criterion 4 uses batch embeddings and chunked top-k neighbors
     - Two-phase: fast criteria first, semantic only for unmatched
 
     Example:
@@ -506,7 +517,7 @@ class MultiCriteriaDeduplicator(SemanticDeduplicator):
         """Deduplicate entities using multi-criteria matching.
 
         Two-phase approach for efficiency:
-        1. Fast phase: Check criteria 1-3 (string operations, O(n²) but fast)
+        1. Fast phase: Check criteria 1-3 on candidate pairs (string operations)
         2. Slow phase: Check semantic similarity for remaining unmatched entities
 
         Args:
@@ -525,6 +536,9 @@ class MultiCriteriaDeduplicator(SemanticDeduplicator):
         names = [e.get("name", e.get("entity_name", "UNKNOWN")) for e in entities]
 
         # Phase 1: Fast criteria (exact, edit distance, substring)
+        # Sprint 130 Feature 130.12: Only candidate pairs are checked
+        candidates = candidate_adjacency(self.candidate_generator.name_candidates(names))
+
         # Build clusters using union-find style approach
         used = set()
         clusters: list[tuple[int, list[int]]] = []  # (representative_idx, member_indices)
@@ -536,7 +550,7 @@ class MultiCriteriaDeduplicator(SemanticDeduplicator):
             cluster_members = [i]
             used.add(i)
 
-            for j in range(i + 1, len(entities)):
+            for j in candidates.get(i, []):
                 if j in used:
                     continue
 
@@ -567,7 +581,10 @@ class MultiCriteriaDeduplicator(SemanticDeduplicator):
             )
             embeddings = [emb["dense"] if isinstance(emb, dict) else emb for emb in batch_result]
             embeddings_np = np.array(embeddings)
-            similarity_matrix = cosine_similarity(embeddings_np)
+            similar_pairs = self.candidate_generator.embedding_candidates(
+                embeddings_np, self.threshold
+            )
+            neighbors = candidate_adjacency(similar_pairs)
 
             # Merge clusters based on semantic similarity
             merged_used = set()
@@ -579,21 +596,20 @@ class MultiCriteriaDeduplicator(SemanticDeduplicator):
 
                 merged_members = list(members_i)
 
-                for jdx in range(idx + 1, len(clusters)):
+                for jdx in neighbors.get(idx, []):
                     if jdx in merged_used:
                         continue
 
-                    if similarity_matrix[idx, jdx] >= self.threshold:
-                        rep_j, members_j = clusters[jdx]
-                        merged_members.extend(members_j)
-                        merged_used.add(jdx)
-                        logger.debug(
-                            "semantic_match",
-                            entity1=names[rep_i],
-                            entity2=names[rep_j],
-                            similarity=float(similarity_matrix[idx, jdx]),
-                            type=entity_type,
-                        )
+                    rep_j, members_j = clusters[jdx]
+                    merged_members.extend(members_j)
+                    merged_used.add(jdx)
+                    logger.debug(
+                        "semantic_match",
+                        entity1=names[rep_i],
+                        entity2=names[rep_j],
+                        similarity=similar_pairs[(idx, jdx)],
+                        type=entity_type,
+                    )
 
                 final_clusters.append((rep_i, merged_members))
         else:
@@ -5,7 +5,8 @@ storing job metadata, events, and file-level progress in SQLite database.
 
 Architecture:
   - SQLite database with 3 tables: ingestion_jobs, ingestion_events, ingestion_files
-  - Thread-safe database operations with connection pooling
+  - One long-lived connection in WAL mode, used from a single worker thread
+  - Write-behind queue for events and file progress, flushed in batched transactions
   - Retention policy for automatic cleanup of old jobs
   - Structured logging integration for debugging
 
@@ -43,16 +44,22 @@ Example:
 Notes:
   - Database path: data/jobs/ingestion_jobs.db
   - Retention default: 90 days
-  - Thread-safe: Uses asyncio locks for concurrent access
+  - Thread-safe: All SQLite access is serialized on one worker thread
+  - Write-behind: add_event/update_file rows are buffered and flushed every
+    flush_batch_size rows or flush_interval_ms milliseconds, whichever comes first.
+    Reads (get_job, get_jobs, get_events, cleanup) flush first, so callers always
+    read their own writes. close() drains the buffer on shutdown.
   - Cleanup: Automatically run on startup and via scheduled task
 """
 
 import asyncio
 import json
 import sqlite3
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, TypeVar
 
 import structlog
 
@@ -61,6 +68,18 @@ logger = structlog.get_logger(__name__)
 # Database path (relative to project root)
 DB_PATH = Path("data/jobs/ingestion_jobs.db")
 
+# Write-behind defaults: flush after this many buffered rows or this many milliseconds
+DEFAULT_FLUSH_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL_MS = 250
+
+_INSERT_EVENT_SQL = """
+    INSERT INTO ingestion_events (
+        job_id, timestamp, level, phase, file_name, page_number, chunk_id, message, details
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+T = TypeVar("T")
+
 # Job status literals
 JobStatus = Literal["running", "completed", "failed", "cancelled"]
 EventLevel = Literal["INFO", "DEBUG", "WARN", "ERROR"]
@@ -79,8 +98,13 @@ class IngestionJobTracker:
     Attributes:
         db_path: Path to SQLite database file
         retention_days: Number of days to retain completed jobs (default 90)
-        _lock: Asyncio lock for thread-safe database access
+        flush_batch_size: Buffered rows that trigger an immediate flush
+        flush_interval_ms: Maximum time a buffered row waits before being flushed
+        _lock: Asyncio lock guarding database initialization
         _initialized: Database initialization flag
+        _conn: Long-lived SQLite connection (WAL mode)
+        _executor: Single worker thread that owns all SQLite calls
+        _pending: Buffered (sql, params) writes awaiting the next flush
 
     Methods:
         create_job: Create new ingestion job
@@ -93,6 +117,8 @@ class IngestionJobTracker:
         get_events: Get events for specific job
         get_errors: Get only ERROR-level events
         cleanup_old_jobs: Delete jobs older than retention_days
+        flush: Write buffered events/file updates in one transaction
+        close: Drain the write buffer and close the connection
 
     Example:
         >>> tracker = IngestionJobTracker()
@@ -101,12 +127,20 @@ class IngestionJobTracker:
         >>> await tracker.update_job_status(job_id, "completed")
     """
 
-    def __init__(self, db_path: Path | None = None, retention_days: int = 90) -> None:
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        retention_days: int = 90,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+    ) -> None:
         """Initialize job tracker with database path and retention policy.
 
         Args:
             db_path: Path to SQLite database (default: data/jobs/ingestion_jobs.db)
             retention_days: Days to retain completed jobs (default 90)
+            flush_batch_size: Buffered rows that trigger a flush (default 200)
+            flush_interval_ms: Max delay before buffered rows are flushed (default 250)
 
         Example:
             >>> tracker = IngestionJobTracker()
@@ -115,9 +149,17 @@ class IngestionJobTracker:
         """
         self.db_path = db_path or DB_PATH
         self.retention_days = retention_days
+        self.flush_batch_size = max(1, flush_batch_size)
+        self.flush_interval_ms = flush_interval_ms
         self._lock = asyncio.Lock()
         self._initialized = False
 
+        self._conn: sqlite3.Connection | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: list[tuple[str, tuple[Any, ...]]] = []
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -125,6 +167,18 @@ class IngestionJobTracker:
             "job_tracker_initialized",
             db_path=str(self.db_path),
             retention_days=retention_days,
+            flush_batch_size=self.flush_batch_size,
+            flush_interval_ms=flush_interval_ms,
+        )
+
+    async def _run(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run fn(conn) on the tracker's worker thread.
+
+        The single worker thread serializes all SQLite calls in submission order,
+        which is what makes flush-before-read give read-your-writes.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, lambda: fn(self._conn)
         )
 
     async def _init_db(self) -> None:
@@ -135,6 +189,9 @@ class IngestionJobTracker:
         - ingestion_events: Event-level logging
         - ingestion_files: File-level progress
 
+        Opens the long-lived connection in WAL mode (readers never block the
+        writer, and commits skip the per-transaction rollback-journal fsync).
+
         Thread-safe: Uses asyncio lock to prevent concurrent initialization.
 
         Example:
@@ -145,8 +202,15 @@ class IngestionJobTracker:
             if self._initialized:
                 return
 
+            def open_connection() -> None:
+                """Open the shared connection (run on the worker thread)."""
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn = conn
+
             def init_schema(conn: sqlite3.Connection) -> None:
-                """Create database schema (run in thread pool)."""
+                """Create database schema (run on the worker thread)."""
                 cursor = conn.cursor()
 
                 # Table 1: ingestion_jobs
@@ -237,13 +301,87 @@ class IngestionJobTracker:
 
                 logger.info("job_tracker_schema_initialized", db_path=str(self.db_path))
 
-            # Run in thread pool (SQLite blocks async event loop)
-            await asyncio.get_event_loop().run_in_executor(
-                None, lambda: init_schema(sqlite3.connect(self.db_path, check_same_thread=False))
-            )
+            # Run on the worker thread (SQLite blocks async event loop)
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-tracker")
+            await asyncio.get_running_loop().run_in_executor(self._executor, open_connection)
+            await self._run(init_schema)
 
             self._initialized = True
 
+    def _enqueue(self, sql: str, params: tuple[Any, ...]) -> None:
+        """Buffer a write for the next batched flush.
+
+        Flushes immediately once flush_batch_size rows are pending, otherwise
+        arms a timer so no row waits longer than flush_interval_ms.
+        """
+        self._pending.append((sql, params))
+
+        if len(self._pending) >= self.flush_batch_size:
+            self._schedule_flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self.flush_interval_ms / 1000, self._schedule_flush
+            )
+
+    def _schedule_flush(self) -> None:
+        """Start a background flush task (keeps a reference until it finishes)."""
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> None:
+        """Write all buffered events and file updates in one transaction.
+
+        Failures are logged and the batch is dropped: tracking must never fail
+        the ingestion it describes.
+
+        Example:
+            >>> await tracker.add_event(job_id, "INFO", "parsing", None, None, None, "Started")
+            >>> await tracker.flush()  # Event is now durable
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if not self._pending or self._conn is None:
+            return
+
+        batch, self._pending = self._pending, []
+
+        def write_batch(conn: sqlite3.Connection) -> None:
+            with conn:  # Single transaction: commit on success, rollback on error
+                for sql, params in batch:
+                    conn.execute(sql, params)
+
+        try:
+            await self._run(write_batch)
+        except Exception as e:
+            logger.error("job_tracker_flush_failed", rows=len(batch), error=str(e))
+
+    async def close(self) -> None:
+        """Drain buffered writes and close the connection.
+
+        Called on application shutdown. The tracker re-opens lazily if used again.
+
+        Example:
+            >>> await tracker.close()
+        """
+        async with self._lock:
+            if not self._initialized:
+                return
+
+            await self.flush()
+            if self._flush_tasks:
+                await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+            await self._run(lambda conn: conn.close())
+            self._executor.shutdown(wait=True)
+            self._conn = None
+            self._executor = None
+            self._initialized = False
+
+            logger.info("job_tracker_closed", db_path=str(self.db_path))
+
     async def create_job(
         self,
         directory_path: str,
@@ -302,9 +440,7 @@ class IngestionJobTracker:
             )
             conn.commit()
 
-        await asyncio.get_event_loop().run_in_executor(
-            None, lambda: insert_job(sqlite3.connect(self.db_path, check_same_thread=False))
-        )
+        await self._run(insert_job)
 
         logger.info(
             "job_created",
@@ -336,6 +472,8 @@ class IngestionJobTracker:
             >>> await tracker.update_job_status("job_123", "completed", processed_files=10)
         """
         await self._init_db()
+        # Keep status changes ordered after the events that led to them
+        await self.flush()
 
         def update_job(conn: sqlite3.Connection) -> None:
             cursor = conn.cursor()
@@ -366,9 +504,7 @@ class IngestionJobTracker:
             cursor.execute(query, params)
             conn.commit()
 
-        await asyncio.get_event_loop().run_in_executor(
-            None, lambda: update_job(sqlite3.connect(self.db_path, check_same_thread=False))
-        )
+        await self._run(update_job)
 
         logger.info(
             "job_status_updated",
@@ -390,6 +526,8 @@ class IngestionJobTracker:
     ) -> None:
         """Log ingestion event.
 
+        The row is buffered and written by the next batched flush.
+
         Args:
             job_id: Job ID
             level: Event level (INFO/DEBUG/WARN/ERROR)
@@ -416,30 +554,19 @@ class IngestionJobTracker:
         timestamp = datetime.now()
         details_json = json.dumps(details) if details else None
 
-        def insert_event(conn: sqlite3.Connection) -> None:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO ingestion_events (
-                    job_id, timestamp, level, phase, file_name, page_number, chunk_id, message, details
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    job_id,
-                    timestamp,
-                    level,
-                    phase,
-                    file_name,
-                    page_number,
-                    chunk_id,
-                    message,
-                    details_json,
-                ),
-            )
-            conn.commit()
-
-        await asyncio.get_event_loop().run_in_executor(
-            None, lambda: insert_event(sqlite3.connect(self.db_path, check_same_thread=False))
+        self._enqueue(
+            _INSERT_EVENT_SQL,
+            (
+                job_id,
+                timestamp,
+                level,
+                phase,
+                file_name,
+                page_number,
+                chunk_id,
+                message,
+                details_json,
+            ),
         )
 
         # Log ERROR events to structlog
@@ -509,9 +636,7 @@ class IngestionJobTracker:
             conn.commit()
             return cursor.lastrowid
 
-        file_id = await asyncio.get_event_loop().run_in_executor(
-            None, lambda: insert_file(sqlite3.connect(self.db_path, check_same_thread=False))
-        )
+        file_id = await self._run(insert_file)
 
         return file_id
 
@@ -529,6 +654,8 @@ class IngestionJobTracker:
     ) -> None:
         """Update file progress.
 
+        The update is buffered and written by the next batched flush.
+
         Args:
             file_id: File record ID
             status: New status (pending/processing/completed/failed/skipped)
@@ -550,60 +677,52 @@ class IngestionJobTracker:
         """
         await self._init_db()
 
-        def update_file_record(conn: sqlite3.Connection) -> None:
-            cursor = conn.cursor()
+        # Build UPDATE query dynamically
+        updates = []
+        params: list[Any] = []
 
-            # Build UPDATE query dynamically
-            updates = []
-            params = []
-
-            if status is not None:
-                updates.append("status = ?")
-                params.append(status)
+        if status is not None:
+            updates.append("status = ?")
+            params.append(status)
 
-                if status in ("completed", "failed", "skipped"):
-                    updates.append("completed_at = ?")
-                    params.append(datetime.now())
+            if status in ("completed", "failed", "skipped"):
+                updates.append("completed_at = ?")
+                params.append(datetime.now())
 
-            if pages_processed is not None:
-                updates.append("pages_processed = ?")
-                params.append(pages_processed)
+        if pages_processed is not None:
+            updates.append("pages_processed = ?")
+            params.append(pages_processed)
 
-            if chunks_created is not None:
-                updates.append("chunks_created = ?")
-                params.append(chunks_created)
+        if chunks_created is not None:
+            updates.append("chunks_created = ?")
+            params.append(chunks_created)
 
-            if entities_extracted is not None:
-                updates.append("entities_extracted = ?")
-                params.append(entities_extracted)
+        if entities_extracted is not None:
+            updates.append("entities_extracted = ?")
+            params.append(entities_extracted)
 
-            if relations_extracted is not None:
-                updates.append("relations_extracted = ?")
-                params.append(relations_extracted)
+        if relations_extracted is not None:
+            updates.append("relations_extracted = ?")
+            params.append(relations_extracted)
 
-            if vlm_images_processed is not None:
-                updates.append("vlm_images_processed = ?")
-                params.append(vlm_images_processed)
+        if vlm_images_processed is not None:
+            updates.append("vlm_images_processed = ?")
+            params.append(vlm_images_processed)
 
-            if processing_time_ms is not None:
-                updates.append("processing_time_ms = ?")
-                params.append(processing_time_ms)
+        if processing_time_ms is not None:
+            updates.append("processing_time_ms = ?")
+            params.append(processing_time_ms)
 
-            if error_message is not None:
-                updates.append("error_message = ?")
-                params.append(error_message)
+        if error_message is not None:
+            updates.append("error_message = ?")
+            params.append(error_message)
 
-            if not updates:
-                return
+        if not updates:
+            return
 
-            params.append(file_id)
-            query = f"UPDATE ingestion_files SET {', '.join(updates)} WHERE id = ?"  # nosec B608
-            cursor.execute(query, params)
-            conn.commit()
-
-        await asyncio.get_event_loop().run_in_executor(
-            None, lambda: update_file_record(sqlite3.connect(self.db_path, check_same_thread=False))
-        )
+        params.append(file_id)
+        query = f"UPDATE ingestion_files SET {', '.join(updates)} WHERE id = ?"  # nosec B608
+        self._enqueue(query, tuple(params))
 
     async def get_job(self, job_id: str) -> dict[str, Any] | None:
         """Retrieve job by ID.
@@ -620,6 +739,7 @@ class IngestionJobTracker:
             'completed'
         """
         await self._init_db()
+        await self.flush()  # Read-your-writes
 
         def fetch_job(conn: sqlite3.Connection) -> dict[str, Any] | None:
             cursor = conn.cursor()
@@ -638,9 +758,7 @@ class IngestionJobTracker:
 
             return job_dict
 
-        return await asyncio.get_event_loop().run_in_executor(
-            None, lambda: fetch_job(sqlite3.connect(self.db_path, check_same_thread=False))
-        )
+        return await self._run(fetch_job)
 
     async def get_jobs(
         self,
@@ -664,6 +782,7 @@ class IngestionJobTracker:
             10
         """
         await self._init_db()
+        await self.flush()  # Read-your-writes
 
         def fetch_jobs(conn: sqlite3.Connection) -> list[dict[str, Any]]:
             cursor = conn.cursor()
@@ -687,9 +806,7 @@ class IngestionJobTracker:
 
             return jobs
 
-        return await asyncio.get_event_loop().run_in_executor(
-            None, lambda: fetch_jobs(sqlite3.connect(self.db_path, check_same_thread=False))
-        )
+        return await self._run(fetch_jobs)
 
     async def get_events(
         self,
@@ -711,6 +828,7 @@ class IngestionJobTracker:
             >>> events = await tracker.get_events("job_123", level="ERROR")
         """
         await self._init_db()
+        await self.flush()  # Read-your-writes
 
         def fetch_events(conn: sqlite3.Connection) -> list[dict[str, Any]]:
             cursor = conn.cursor()
@@ -736,9 +854,7 @@ class IngestionJobTracker:
 
             return events
 
-        return await asyncio.get_event_loop().run_in_executor(
-            None, lambda: fetch_events(sqlite3.connect(self.db_path, check_same_thread=False))
-        )
+        return await self._run(fetch_events)
 
     async def get_errors(self, job_id: str) -> list[dict[str, Any]]:
         """Get only ERROR-level events for job.
@@ -769,6 +885,7 @@ class IngestionJobTracker:
             15
         """
         await self._init_db()
+        await self.flush()
 
         retention = retention_days or self.retention_days
         cutoff_date = datetime.now() - timedelta(days=retention)
@@ -786,9 +903,7 @@ class IngestionJobTracker:
 
             return deleted_count
 
-        deleted = await asyncio.get_event_loop().run_in_executor(
-            None, lambda: delete_old_jobs(sqlite3.connect(self.db_path, check_same_thread=False))
-        )
+        deleted = await self._run(delete_old_jobs)
 
         logger.info(
             "job_tracker_cleanup_complete",
@@ -817,3 +932,13 @@ def get_job_tracker() -> IngestionJobTracker:
     if _tracker is None:
         _tracker = IngestionJobTracker()
     return _tracker
+
+
+async def close_job_tracker() -> None:
+    """Drain and close the singleton tracker (application shutdown).
+
+    Example:
+        >>> await close_job_tracker()
+    """
+    if _tracker is not None:
+        await _tracker.close()
@@ -12,6 +12,7 @@ Nodes:
 - llamaindex_parse_node: Fallback for LlamaIndex-exclusive formats
 """
 
+import asyncio
 import time
 from contextlib import suppress
 from pathlib import Path
@@ -43,6 +44,10 @@ async def _run_vlm_parallel_pages(
     Sprint 129.6g (ADR-063): Renders all pages as PNG, sends to Nemotron VL v1
     via asyncio.gather(), and stores results in state["vlm_page_results"].
 
+    Pages are rendered by a PyMuPDF process pool and streamed into the VLM
+    semaphore, so the VLM starts on page 1 while later pages are still rendering.
+    With vlm_page_prefilter_enabled, only pages with table candidates are sent.
+
     This runs AFTER Docling parsing completes (Docling is batch-only).
     """
     import redis.asyncio as aioredis
@@ -95,28 +100,46 @@ async def _run_vlm_parallel_pages(
         )
         return
 
-    logger.info(
-        "vlm_parallel_pages_starting",
-        document_id=state["document_id"],
-        num_pages=len(page_dimensions),
-    )
+    page_numbers = sorted(page_dimensions)
 
     try:
-        from src.components.ingestion.page_image_renderer import render_all_pages
+        from src.components.ingestion.page_image_renderer import (
+            StreamingPageRenderer,
+            select_table_candidate_pages,
+        )
         from src.components.ingestion.vlm_page_processor import VLMPageProcessor
 
-        # Render all pages as PNG
-        page_images = render_all_pages(str(doc_path))
-        if not page_images:
-            logger.warning(
-                "vlm_parallel_pages_no_images",
+        # Optional pre-filter: skip pages without table candidates
+        if settings.vlm_page_prefilter_enabled:
+            page_numbers = await asyncio.to_thread(
+                select_table_candidate_pages,
+                str(doc_path),
+                state.get("parsed_tables") or [],
+                page_numbers,
+            )
+            logger.info(
+                "vlm_parallel_pages_prefiltered",
                 document_id=state["document_id"],
+                total_pages=len(page_dimensions),
+                candidate_pages=len(page_numbers),
             )
-            return
+            if not page_numbers:
+                return
+
+        logger.info(
+            "vlm_parallel_pages_starting",
+            document_id=state["document_id"],
+            num_pages=len(page_numbers),
+        )
 
-        # Process all pages through VLM
+        # Render pages in a process pool and stream them into the bounded VLM stage
+        renderer = StreamingPageRenderer(
+            str(doc_path),
+            page_numbers=page_numbers,
+            max_workers=settings.vlm_page_render_workers,
+        )
         processor = VLMPageProcessor(vlm_url=settings.nemotron_vlm_url)
-        result = await processor.process_all_pages(page_images)
+        result = await processor.process_page_stream(renderer, total_pages=len(page_numbers))
 
         if result.vlm_available and result.page_results:
             # Store VLM tables per page in state
@@ -134,6 +157,9 @@ async def _run_vlm_parallel_pages(
                 pages_with_tables=result.pages_with_tables,
                 total_tables=result.total_tables,
                 total_time_ms=result.total_processing_time_ms,
+                render_pages_per_second=renderer.stats.pages_per_second,
+                render_peak_rss_mb=round(renderer.stats.peak_rss_mb, 1),
+                render_worker_peak_rss_mb=round(renderer.stats.worker_peak_rss_mb, 1),
             )
         else:
             logger.warning(
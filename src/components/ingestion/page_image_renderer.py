@@ -4,13 +4,31 @@ Sprint 129.6c: Renders individual PDF pages as PNG images for
 VLM-based table cross-validation.
 Sprint 129.6g: Added render_all_pages() for parallel VLM page processing.
 
+StreamingPageRenderer rasterizes pages in a PyMuPDF process pool and yields them
+as an async stream, so the VLM starts on the first pages while later pages are
+still being rendered and only a bounded number of PNGs is held in memory.
+select_table_candidate_pages() optionally narrows the pages to render to those
+with Docling tables or cheap table hints (ruling lines, full-page scans).
+
 Note: Docling uses 1-based page numbers, PyMuPDF uses 0-based.
 """
 
+import asyncio
+import multiprocessing
+import time
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Page pre-filter heuristics (select_table_candidate_pages)
+MIN_RULING_LINES = 4  # Horizontal/vertical lines or rectangles that hint at a table grid
+MIN_IMAGE_COVERAGE = 0.5  # Page fraction covered by images (scanned page, table may be raster)
+
 
 def render_page_image(pdf_path: str, page_no: int, dpi: int = 200) -> bytes:
     """Render a single PDF page as PNG bytes.
@@ -101,3 +119,274 @@ def render_all_pages(pdf_path: str, dpi: int = 200) -> dict[int, bytes]:
         return pages
     finally:
         doc.close()
+
+
+@dataclass
+class RenderStats:
+    """Throughput and memory figures of a streaming render run."""
+
+    pages_rendered: int = 0
+    total_bytes: int = 0
+    elapsed_s: float = 0.0
+    pages_per_second: float = 0.0
+    peak_rss_mb: float = 0.0  # Parent (event loop) process
+    worker_peak_rss_mb: float = 0.0  # Largest render worker process
+
+
+def _rss_mb() -> float:
+    """Current resident set size of this process in MB."""
+    import psutil
+
+    return psutil.Process().memory_info().rss / (1024**2)
+
+
+def _render_page_batch(
+    pdf_path: str, page_nos: list[int], dpi: int
+) -> tuple[list[tuple[int, bytes]], float]:
+    """Render a batch of pages in a worker process.
+
+    Opens the PDF once per batch instead of once per page.
+
+    Args:
+        pdf_path: Path to PDF file
+        page_nos: 1-based page numbers to render
+        dpi: Resolution for rendering
+
+    Returns:
+        Tuple of ([(page_no, png_bytes), ...], peak worker RSS in MB)
+    """
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(pdf_path)
+    try:
+        zoom = dpi / 72.0
+        mat = fitz.Matrix(zoom, zoom)
+        rendered: list[tuple[int, bytes]] = []
+        peak_rss_mb = 0.0
+
+        for page_no in page_nos:
+            page_idx = page_no - 1
+            if page_idx < 0 or page_idx >= len(doc):
+                continue
+            pix = doc[page_idx].get_pixmap(matrix=mat)
+            rendered.append((page_no, pix.tobytes("png")))
+            peak_rss_mb = max(peak_rss_mb, _rss_mb())
+
+        return rendered, peak_rss_mb
+    finally:
+        doc.close()
+
+
+def _count_pages(pdf_path: str) -> int:
+    """Return the number of pages in a PDF."""
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(pdf_path)
+    try:
+        return len(doc)
+    finally:
+        doc.close()
+
+
+# Shared render pool (spawn: forking an event-loop process with threads is unsafe)
+_render_pool: ProcessPoolExecutor | None = None
+
+
+def _get_render_pool() -> Executor:
+    """Get the shared PyMuPDF render process pool, creating it on first use.
+
+    The pool is sized once from ``settings.vlm_page_render_workers`` and shared by
+    all documents; each StreamingPageRenderer bounds its own in-flight batches.
+    """
+    global _render_pool
+    if _render_pool is None:
+        from src.core.config import settings
+
+        max_workers = settings.vlm_page_render_workers
+        _render_pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info("page_render_pool_started", max_workers=max_workers)
+    return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """Shut down the shared render process pool (application shutdown)."""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=False, cancel_futures=True)
+        _render_pool = None
+
+
+class StreamingPageRenderer:
+    """Render PDF pages in a process pool and yield them as they finish.
+
+    Iterating yields ``(page_no, png_bytes)`` in completion order. Renders run on
+    the shared process pool; each document keeps at most ``max_workers`` batches
+    in flight and only submits new ones when the consumer pulls, so a slow
+    consumer (VLM) applies backpressure instead of the whole document piling up
+    in memory, and concurrent documents share the pool instead of resizing it.
+
+    Example:
+        >>> renderer = StreamingPageRenderer("/data/manual.pdf", page_numbers=[3, 7])
+        >>> async for page_no, png in renderer:
+        ...     await send_to_vlm(page_no, png)
+        >>> renderer.stats.pages_per_second
+        42.0
+    """
+
+    def __init__(
+        self,
+        pdf_path: str,
+        page_numbers: Iterable[int] | None = None,
+        dpi: int = 200,
+        max_workers: int = 2,
+        pages_per_task: int = 2,
+    ) -> None:
+        """Initialize the renderer.
+
+        Args:
+            pdf_path: Path to PDF file
+            page_numbers: 1-based pages to render (default: all pages)
+            dpi: Resolution for rendering (default 200)
+            max_workers: Batches this document keeps in flight on the shared pool
+                (default 2)
+            pages_per_task: Pages rendered per worker task (default 2)
+        """
+        self.pdf_path = pdf_path
+        self.page_numbers = sorted(set(page_numbers)) if page_numbers is not None else None
+        self.dpi = dpi
+        self.max_workers = max(1, max_workers)
+        self.pages_per_task = max(1, pages_per_task)
+        self.stats = RenderStats()
+
+    def __aiter__(self) -> AsyncIterator[tuple[int, bytes]]:
+        return self._stream()
+
+    async def _stream(self) -> AsyncIterator[tuple[int, bytes]]:
+        loop = asyncio.get_running_loop()
+        pool = _get_render_pool()
+        start = time.perf_counter()
+
+        page_numbers = self.page_numbers
+        if page_numbers is None:
+            num_pages = await loop.run_in_executor(pool, _count_pages, self.pdf_path)
+            page_numbers = list(range(1, num_pages + 1))
+
+        batches = [
+            page_numbers[i : i + self.pages_per_task]
+            for i in range(0, len(page_numbers), self.pages_per_task)
+        ]
+        next_batch = 0
+        in_flight: set[asyncio.Future[Any]] = set()
+        self.stats.peak_rss_mb = _rss_mb()
+
+        try:
+            while next_batch < len(batches) or in_flight:
+                while next_batch < len(batches) and len(in_flight) < self.max_workers:
+                    in_flight.add(
+                        loop.run_in_executor(
+                            pool, _render_page_batch, self.pdf_path, batches[next_batch], self.dpi
+                        )
+                    )
+                    next_batch += 1
+
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    rendered, worker_rss_mb = future.result()
+                    self.stats.worker_peak_rss_mb = max(
+                        self.stats.worker_peak_rss_mb, worker_rss_mb
+                    )
+                    self.stats.peak_rss_mb = max(self.stats.peak_rss_mb, _rss_mb())
+                    for page_no, png_bytes in rendered:
+                        self.stats.pages_rendered += 1
+                        self.stats.total_bytes += len(png_bytes)
+                        yield page_no, png_bytes
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+            self.stats.elapsed_s = round(time.perf_counter() - start, 3)
+            if self.stats.elapsed_s > 0:
+                self.stats.pages_per_second = round(
+                    self.stats.pages_rendered / self.stats.elapsed_s, 2
+                )
+            logger.info(
+                "page_render_stream_complete",
+                pdf_path=self.pdf_path,
+                pages_rendered=self.stats.pages_rendered,
+                pages_requested=len(page_numbers),
+                pages_per_second=self.stats.pages_per_second,
+                peak_rss_mb=round(self.stats.peak_rss_mb, 1),
+                worker_peak_rss_mb=round(self.stats.worker_peak_rss_mb, 1),
+                total_bytes=self.stats.total_bytes,
+            )
+
+
+def select_table_candidate_pages(
+    pdf_path: str,
+    parsed_tables: list[dict[str, Any]] | None = None,
+    page_numbers: Iterable[int] | None = None,
+) -> list[int]:
+    """Select pages that may contain tables, without rasterizing anything.
+
+    A page is a candidate if Docling found a table on it, if it has at least
+    MIN_RULING_LINES straight lines/rectangles (table grid), or if images cover
+    at least MIN_IMAGE_COVERAGE of it (scanned page whose tables Docling may miss).
+
+    Blocking (PyMuPDF), call via asyncio.to_thread().
+
+    Args:
+        pdf_path: Path to PDF file
+        parsed_tables: Docling tables (state["parsed_tables"]) with 1-based page_no
+        page_numbers: Pages to consider (default: all pages)
+
+    Returns:
+        Sorted 1-based candidate page numbers
+    """
+    import fitz  # PyMuPDF
+
+    candidates = {t["page_no"] for t in parsed_tables or [] if t.get("page_no")}
+
+    doc = fitz.open(pdf_path)
+    try:
+        pages = page_numbers if page_numbers is not None else range(1, len(doc) + 1)
+        for page_no in pages:
+            if page_no in candidates or not 1 <= page_no <= len(doc):
+                continue
+            page = doc[page_no - 1]
+
+            ruling_lines = 0
+            for drawing in page.get_drawings():
+                for item in drawing.get("items", []):
+                    if item[0] == "re":
+                        ruling_lines += 1
+                    elif item[0] == "l":
+                        p1, p2 = item[1], item[2]
+                        if abs(p1.x - p2.x) < 1 or abs(p1.y - p2.y) < 1:
+                            ruling_lines += 1
+                if ruling_lines >= MIN_RULING_LINES:
+                    break
+            if ruling_lines >= MIN_RULING_LINES:
+                candidates.add(page_no)
+                continue
+
+            page_area = abs(page.rect) or 1.0
+            image_area = sum(abs(fitz.Rect(info["bbox"])) for info in page.get_image_info())
+            if image_area / page_area >= MIN_IMAGE_COVERAGE:
+                candidates.add(page_no)
+
+        selected = sorted(p for p in candidates if 1 <= p <= len(doc))
+    finally:
+        doc.close()
+
+    logger.debug(
+        "table_candidate_pages_selected",
+        pdf_path=pdf_path,
+        candidates=len(selected),
+        docling_table_pages=len(
+            {t.get("page_no") for t in parsed_tables or [] if t.get("page_no")}
+        ),
+    )
+    return selected
@@ -5,8 +5,8 @@ for parallel table extraction. Results are stored in ingestion state and used
 by the cross-validator to compare with Docling's heuristic extraction.
 
 Architecture:
-    1. Render all pages as PNG (PyMuPDF, ~20ms/page)
-    2. Send all pages to VLM in parallel (asyncio.gather, ~12-15s/page)
+    1. Render pages as PNG (PyMuPDF, ~20ms/page), streamed from a process pool
+    2. Send pages to VLM as they arrive, bounded by a semaphore (~12-15s/page)
     3. Collect VLM-extracted tables per page
     4. Store in state["vlm_page_results"] for downstream use
 
@@ -16,6 +16,7 @@ as the extraction vLLM (aegis-vllm-eugr) — zero additional disk space.
 
 import asyncio
 import time
+from collections.abc import AsyncIterable, AsyncIterator
 from dataclasses import dataclass, field
 
 import structlog
@@ -50,8 +51,8 @@ class VLMProcessingResult:
 class VLMPageProcessor:
     """Processes all document pages through VLM for table extraction.
 
-    Renders all pages as PNG, sends them to VLM in parallel via asyncio.gather(),
-    and returns structured results per page.
+    Consumes rendered pages (a dict or an async stream), sends them to VLM in
+    parallel bounded by a semaphore, and returns structured results per page.
     """
 
     def __init__(self, vlm_url: str = "http://localhost:8002"):
@@ -78,11 +79,40 @@ class VLMPageProcessor:
         Returns:
             VLMProcessingResult with per-page table extraction results
         """
-        start = time.perf_counter()
-        result = VLMProcessingResult(total_pages=len(page_images))
-
         if not page_images:
-            return result
+            return VLMProcessingResult()
+
+        async def _sorted_pages() -> AsyncIterator[tuple[int, bytes]]:
+            for page_no, image_bytes in sorted(page_images.items()):
+                yield page_no, image_bytes
+
+        return await self.process_page_stream(
+            _sorted_pages(), max_concurrent=max_concurrent, total_pages=len(page_images)
+        )
+
+    async def process_page_stream(
+        self,
+        pages: AsyncIterable[tuple[int, bytes]],
+        max_concurrent: int = 4,
+        total_pages: int | None = None,
+    ) -> VLMProcessingResult:
+        """Send pages to VLM as they arrive from an async stream.
+
+        The next page is only pulled once a VLM slot is free, so a streaming
+        renderer (StreamingPageRenderer) is throttled to the VLM's pace and only
+        a bounded number of page images is held in memory. Nothing is pulled
+        (or rendered) if the VLM is unavailable.
+
+        Args:
+            pages: Async iterable of (1-based page number, PNG bytes)
+            max_concurrent: Maximum concurrent VLM requests (default 4)
+            total_pages: Expected page count (default: number of pages consumed)
+
+        Returns:
+            VLMProcessingResult with per-page table extraction results
+        """
+        start = time.perf_counter()
+        result = VLMProcessingResult(total_pages=total_pages or 0)
 
         # Check VLM availability
         result.vlm_available = await self.check_availability()
@@ -94,7 +124,7 @@ class VLMPageProcessor:
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def _process_page(page_no: int, image_bytes: bytes) -> VLMPageResult:
-            async with semaphore:
+            try:
                 page_start = time.perf_counter()
                 try:
                     tables = await self._client.extract_tables_from_page(image_bytes)
@@ -117,13 +147,23 @@ class VLMPageProcessor:
                         processing_time_ms=round(elapsed_ms, 1),
                         error=repr(e),
                     )
-
-        # Process all pages in parallel (bounded by semaphore)
-        tasks = [
-            _process_page(page_no, image_bytes)
-            for page_no, image_bytes in sorted(page_images.items())
-        ]
-        page_results = await asyncio.gather(*tasks)
+            finally:
+                semaphore.release()
+
+        # Start each page as soon as it arrives and a slot is free
+        tasks: list[asyncio.Task[VLMPageResult]] = []
+        try:
+            async for page_no, image_bytes in pages:
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(_process_page(page_no, image_bytes)))
+            page_results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if total_pages is None:
+            result.total_pages = len(page_results)
 
         # Aggregate results
         for pr in page_results:
@@ -141,7 +181,7 @@ class VLMPageProcessor:
             pages_with_tables=result.pages_with_tables,
             total_tables=result.total_tables,
             total_time_ms=result.total_processing_time_ms,
-            avg_time_per_page_ms=(round(total_ms / len(page_images), 1) if page_images else 0),
+            avg_time_per_page_ms=(round(total_ms / len(page_results), 1) if page_results else 0),
         )
 
         return result
@@ -15,6 +15,7 @@ Key Components:
 - MemoryConsolidationPipeline: Automatic memory consolidation with relevance scoring
 - RelevanceScorer: Importance calculation for consolidation decisions
 - UnifiedMemoryAPI: Single facade for all memory operations
+- ConversationSessionIndex: Sorted-set index for paginated chat session listing
 """
 
 from src.components.memory.consolidation import (
@@ -58,6 +59,11 @@ from src.components.memory.routing_strategy import (
     RecencyBasedStrategy,
     RoutingStrategy,
 )
+from src.components.memory.session_index import (
+    ConversationSessionIndex,
+    SessionSummary,
+    get_session_index,
+)
 from src.components.memory.temporal_queries import (
     TemporalMemoryQuery,
     get_temporal_query,
@@ -105,6 +111,10 @@ __all__ = [
     "RelevanceScorer",
     "RelevanceScore",
     "get_relevance_scorer",
+    # Chat session index
+    "ConversationSessionIndex",
+    "SessionSummary",
+    "get_session_index",
     # Unified API
     "UnifiedMemoryAPI",
     "get_unified_memory_api",
@@ -9,12 +9,15 @@ This module provides automatic consolidation between memory layers:
 """
 
 import asyncio
+import json
+import uuid
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import numpy as np
 import structlog
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from qdrant_client.models import PointStruct
 
 from src.components.memory.graphiti_wrapper import get_graphiti_wrapper
 from src.components.memory.redis_memory import get_redis_memory
@@ -181,8 +184,8 @@ class MemoryConsolidationPipeline:
                 logger.info("No items to consolidate to Qdrant")
                 return {"processed": 0, "consolidated": 0, "skipped": 0}
 
-            consolidated_count = 0
             skipped_count = 0
+            candidates = []
 
             for item in items:
                 # Check consolidation policies
@@ -200,20 +203,10 @@ class MemoryConsolidationPipeline:
                     skipped_count += 1
                     continue
 
-                # Consolidate to Qdrant
-                # NOTE: This is a placeholder - in production would:
-                # 1. Generate embedding for item value
-                # 2. Create PointStruct with embedding + payload
-                # 3. Upsert to Qdrant collection
-                # 4. Optionally delete from Redis or extend TTL
-
-                logger.debug(
-                    "Would consolidate to Qdrant",
-                    key=item.get("key"),
-                    access_count=item.get("access_count"),
-                )
+                candidates.append(item)
 
-                consolidated_count += 1
+            # Embed and upsert all candidates in bulk
+            consolidated_count = await self._upsert_to_qdrant(candidates, namespace)
 
             logger.info(
                 "Completed Redis → Qdrant consolidation",
@@ -232,6 +225,64 @@ class MemoryConsolidationPipeline:
             logger.error("Redis → Qdrant consolidation failed", error=str(e))
             raise MemoryError(operation="Redis → Qdrant consolidation failed", reason=str(e)) from e
 
+    async def _upsert_to_qdrant(self, items: list[dict[str, Any]], namespace: str) -> int:
+        """Embed items with one batch call and upsert them to the long-term collection.
+
+        Point IDs are derived from the Redis key, so re-consolidating an item
+        updates its point instead of duplicating it.
+
+        Args:
+            items: Items from RedisMemoryManager.get_frequently_accessed
+            namespace: Redis namespace the items came from
+
+        Returns:
+            Number of upserted points
+        """
+        if not items:
+            return 0
+
+        from src.components.shared.embedding_service import get_embedding_service
+
+        texts = [
+            item["value"] if isinstance(item["value"], str) else json.dumps(item["value"])
+            for item in items
+        ]
+        embeddings = await get_embedding_service().embed_batch(texts)
+        # Handle both list (Ollama/ST) and dict (FlagEmbedding) returns
+        vectors = [e["dense"] if isinstance(e, dict) else e for e in embeddings]
+
+        collection_name = settings.memory_consolidation_collection
+        await self.qdrant_client.create_collection(
+            collection_name=collection_name, vector_size=len(vectors[0])
+        )
+
+        consolidated_at = datetime.now(UTC).isoformat()
+        points = [
+            PointStruct(
+                id=str(uuid.uuid5(uuid.NAMESPACE_URL, f"redis-memory:{namespace}:{item['key']}")),
+                vector=vector,
+                payload={
+                    "key": item["key"],
+                    "namespace": namespace,
+                    "value": item["value"],
+                    "text": text,
+                    "access_count": item.get("access_count", 0),
+                    "stored_at": item.get("stored_at"),
+                    "last_accessed_at": item.get("last_accessed_at"),
+                    "consolidated_at": consolidated_at,
+                },
+            )
+            for item, text, vector in zip(items, texts, vectors, strict=True)
+        ]
+        await self.qdrant_client.upsert_points(collection_name=collection_name, points=points)
+
+        logger.debug(
+            "Upserted consolidated memories to Qdrant",
+            collection_name=collection_name,
+            points=len(points),
+        )
+        return len(points)
+
     def _calculate_cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
         """Calculate cosine similarity between two vectors.
 
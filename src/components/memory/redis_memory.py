@@ -5,9 +5,17 @@ This module provides Redis-based working memory for:
 - Temporary query results
 - Session-based state
 - Fast access to frequently used data
+
+Access counts are mirrored into a per-namespace sorted set
+(``access_index:{namespace}``, score = access count), so consolidation can
+select candidates with one ZREVRANGEBYSCORE instead of SCANning every key,
+and fetches their values/TTLs in pipelined MGET/TTL batches. A companion set
+(``access_expiry:{namespace}``, score = expire-at epoch seconds) lets store()
+drop index entries of expired keys, so the index tracks live keys only.
 """
 
 import json
+import time
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -23,6 +31,27 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Keys fetched per pipelined MGET/TTL round-trip when reading consolidation candidates
+DEFAULT_READ_BATCH_SIZE = 500
+
+# Expired index entries dropped per store() (more than one keeps up with expiry)
+EXPIRY_PRUNE_BATCH_SIZE = 100
+
+
+def access_index_key(namespace: str) -> str:
+    """Key of the sorted set indexing access counts of a namespace."""
+    return f"access_index:{namespace}"
+
+
+def access_expiry_key(namespace: str) -> str:
+    """Key of the sorted set holding expire-at times of indexed keys."""
+    return f"access_expiry:{namespace}"
+
+
+def access_index_marker_key(namespace: str) -> str:
+    """Key marking that the access index of a namespace has been rebuilt."""
+    return f"access_index_built:{namespace}"
+
 
 class RedisMemoryManager:
     """Redis-based working memory manager for short-term storage.
@@ -116,8 +145,18 @@ class RedisMemoryManager:
                 }
             )
 
+            now = time.time()
+            expiry_key = access_expiry_key(namespace)
             redis_client = await self.client
-            await redis_client.setex(namespaced_key, ttl, serialized)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.setex(namespaced_key, ttl, serialized)
+                pipe.zadd(access_index_key(namespace), {key: 0})
+                pipe.zadd(expiry_key, {key: now + ttl})
+                pipe.zrangebyscore(expiry_key, "-inf", now, start=0, num=EXPIRY_PRUNE_BATCH_SIZE)
+                *_, expired = await pipe.execute()
+
+            if expired:
+                await self._prune_index(redis_client, namespace, expired)
 
             logger.debug(
                 "Stored value in working memory",
@@ -157,6 +196,9 @@ class RedisMemoryManager:
             serialized = await redis_client.get(namespaced_key)
             if not serialized:
                 logger.debug("Key not found in working memory", key=namespaced_key)
+                if track_access:
+                    # Expired keys leave stale index entries behind
+                    await self._prune_index(redis_client, namespace, [key])
                 return None
 
             # Deserialize and update access count
@@ -167,14 +209,11 @@ class RedisMemoryManager:
                 data["access_count"] = data.get("access_count", 0) + 1
                 data["last_accessed_at"] = datetime.now(UTC).isoformat()
 
-                # Update with same TTL
-                ttl = await redis_client.ttl(namespaced_key)
-                if ttl > 0:
-                    await redis_client.setex(
-                        namespaced_key,
-                        ttl,
-                        json.dumps(data),
-                    )
+                # Update in place with the same TTL, and mirror the count into the index
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.set(namespaced_key, json.dumps(data), xx=True, keepttl=True)
+                    pipe.zadd(access_index_key(namespace), {key: data["access_count"]})
+                    await pipe.execute()
 
             logger.debug(
                 "Retrieved value from working memory",
@@ -246,7 +285,11 @@ class RedisMemoryManager:
             namespaced_key = f"{namespace}:{key}"
             redis_client = await self.client
 
-            deleted = await redis_client.delete(namespaced_key)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(namespaced_key)
+                pipe.zrem(access_index_key(namespace), key)
+                pipe.zrem(access_expiry_key(namespace), key)
+                deleted, *_ = await pipe.execute()
 
             logger.debug(
                 "Deleted from working memory",
@@ -265,45 +308,58 @@ class RedisMemoryManager:
         min_access_count: int = 3,
         namespace: str = "memory",
         limit: int = 100,
+        read_batch_size: int = DEFAULT_READ_BATCH_SIZE,
     ) -> list[dict[str, Any]]:
         """Get frequently accessed items for consolidation.
 
+        Candidates come from the namespace's access-count index (highest count
+        first); values and TTLs are fetched in pipelined MGET/TTL batches.
+        Index entries of expired keys are pruned along the way.
+
         Args:
             min_access_count: Minimum access count threshold (default: 3)
             namespace: Key namespace prefix (default: "memory")
             limit: Maximum number of items to return (default: 100)
+            read_batch_size: Keys per pipelined round-trip (default: 500)
 
         Returns:
-            list of frequently accessed items with metadata
+            list of frequently accessed items with metadata, by access count descending
         """
         try:
             redis_client = await self.client
-            pattern = f"{namespace}:*"
-
-            items = []
-            async for key in redis_client.scan_iter(match=pattern, count=100):
-                serialized = await redis_client.get(key)
-                if not serialized:
-                    continue
-
-                data = json.loads(serialized)
-                access_count = data.get("access_count", 0)
-
-                if access_count >= min_access_count:
-                    ttl = await redis_client.ttl(key)
-                    items.append(
-                        {
-                            "key": key.replace(f"{namespace}:", ""),
-                            "value": data.get("value"),
-                            "access_count": access_count,
-                            "stored_at": data.get("stored_at"),
-                            "last_accessed_at": data.get("last_accessed_at"),
-                            "ttl_seconds": ttl if ttl > 0 else None,
-                        }
-                    )
-
-                # Respect limit
-                if len(items) >= limit:
+            index_key = access_index_key(namespace)
+
+            # Rebuild once for keys stored before the index existed
+            if not await redis_client.exists(index_key, access_index_marker_key(namespace)):
+                await self.rebuild_access_index(namespace, read_batch_size=read_batch_size)
+
+            items: list[dict[str, Any]] = []
+            offset = 0
+            while len(items) < limit:
+                page_size = min(read_batch_size, limit - len(items))
+                keys = await redis_client.zrevrangebyscore(
+                    index_key,
+                    "+inf",
+                    min_access_count,
+                    start=offset,
+                    num=page_size,
+                )
+                if not keys:
+                    break
+                offset += len(keys)
+
+                batch = await self._read_batch(redis_client, keys, namespace)
+                stale = [key for key, item in zip(keys, batch, strict=True) if item is None]
+                if stale:
+                    await self._prune_index(redis_client, namespace, stale)
+                    offset -= len(stale)
+
+                items.extend(
+                    item
+                    for item in batch
+                    if item is not None and item["access_count"] >= min_access_count
+                )
+                if len(keys) < page_size:
                     break
 
             # Sort by access count descending
@@ -311,7 +367,7 @@ class RedisMemoryManager:
 
             logger.info(
                 "Retrieved frequently accessed items",
-                count=len(items),
+                count=min(len(items), limit),
                 min_access_count=min_access_count,
             )
 
@@ -321,6 +377,118 @@ class RedisMemoryManager:
             logger.error("Failed to get frequently accessed items", error=str(e))
             return []
 
+    async def _prune_index(self, redis_client: Redis, namespace: str, keys: list[str]) -> None:
+        """Drop keys from the access index and its expiry set.
+
+        Args:
+            redis_client: Redis client
+            namespace: Key namespace prefix
+            keys: Storage keys (without namespace)
+        """
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.zrem(access_index_key(namespace), *keys)
+            pipe.zrem(access_expiry_key(namespace), *keys)
+            await pipe.execute()
+
+    async def _read_batch(
+        self,
+        redis_client: Redis,
+        keys: list[str],
+        namespace: str,
+    ) -> list[dict[str, Any] | None]:
+        """Fetch values and TTLs of keys in one pipelined round-trip.
+
+        Args:
+            redis_client: Redis client
+            keys: Storage keys (without namespace)
+            namespace: Key namespace prefix
+
+        Returns:
+            Item dict per key in input order, None for missing keys
+        """
+        namespaced_keys = [f"{namespace}:{key}" for key in keys]
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.mget(namespaced_keys)
+            for namespaced_key in namespaced_keys:
+                pipe.ttl(namespaced_key)
+            values, *ttls = await pipe.execute()
+
+        items: list[dict[str, Any] | None] = []
+        for key, serialized, ttl in zip(keys, values, ttls, strict=True):
+            if not serialized:
+                items.append(None)
+                continue
+            data = json.loads(serialized)
+            items.append(
+                {
+                    "key": key,
+                    "value": data.get("value"),
+                    "access_count": data.get("access_count", 0),
+                    "stored_at": data.get("stored_at"),
+                    "last_accessed_at": data.get("last_accessed_at"),
+                    "ttl_seconds": ttl if ttl > 0 else None,
+                }
+            )
+        return items
+
+    async def rebuild_access_index(
+        self,
+        namespace: str = "memory",
+        read_batch_size: int = DEFAULT_READ_BATCH_SIZE,
+    ) -> int:
+        """Rebuild the access-count index of a namespace from its keys.
+
+        One SCAN over the namespace with pipelined MGET/TTL batches. Needed once
+        for keys stored before the index existed; afterwards the index is
+        maintained by store/retrieve/delete. A marker key records the rebuild,
+        so an empty namespace is not rescanned on every consolidation run.
+
+        Args:
+            namespace: Key namespace prefix (default: "memory")
+            read_batch_size: Keys per pipelined round-trip (default: 500)
+
+        Returns:
+            Number of indexed keys
+        """
+        redis_client = await self.client
+        prefix = f"{namespace}:"
+        indexed = 0
+
+        async def flush(namespaced_keys: list[str]) -> int:
+            keys = [namespaced_key.removeprefix(prefix) for namespaced_key in namespaced_keys]
+            items = [item for item in await self._read_batch(redis_client, keys, namespace) if item]
+            if not items:
+                return 0
+            now = time.time()
+            expire_at = {
+                item["key"]: now + item["ttl_seconds"] for item in items if item["ttl_seconds"]
+            }
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zadd(
+                    access_index_key(namespace),
+                    {item["key"]: item["access_count"] for item in items},
+                )
+                if expire_at:
+                    pipe.zadd(access_expiry_key(namespace), expire_at)
+                await pipe.execute()
+            return len(items)
+
+        pending: list[str] = []
+        async for namespaced_key in redis_client.scan_iter(
+            match=f"{prefix}*", count=read_batch_size
+        ):
+            pending.append(namespaced_key)
+            if len(pending) >= read_batch_size:
+                indexed += await flush(pending)
+                pending = []
+        if pending:
+            indexed += await flush(pending)
+
+        await redis_client.set(access_index_marker_key(namespace), datetime.now(UTC).isoformat())
+
+        logger.info("Rebuilt access index", namespace=namespace, indexed=indexed)
+        return indexed
+
     async def store_conversation_context(
         self,
         session_id: str,
@@ -386,7 +554,10 @@ class RedisMemoryManager:
                 return False
 
             new_ttl = current_ttl + additional_seconds
-            await redis_client.expire(namespaced_key, new_ttl)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.expire(namespaced_key, new_ttl)
+                pipe.zadd(access_expiry_key(namespace), {key: time.time() + new_ttl}, xx=True)
+                await pipe.execute()
 
             logger.debug(
                 "Extended TTL",
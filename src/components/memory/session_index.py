@@ -0,0 +1,285 @@
+"""Sorted-set session index for the chat history sidebar.
+
+Listing sessions used to SCAN the whole ``conversation:*`` keyspace and load every
+conversation before applying limit/offset, so the sidebar got slower with every
+conversation ever stored. This module maintains a secondary index next to the
+conversation documents:
+
+- ``conversation_index:sessions``: sorted set of session IDs scored by
+  last-activity time (epoch seconds)
+- ``conversation_index:summary:{session_id}``: compact hash with ``message_count``,
+  ``created_at``, ``updated_at`` and ``title``
+
+A page is one ZREVRANGE plus one pipelined round of HMGETs. The index is written
+by ``save_conversation_turn`` and the title endpoints; existing conversations are
+indexed once via ``scripts/backfill_session_index.py``.
+
+Summary hashes carry the same TTL as the conversation they describe. Deleting or
+archiving a conversation removes it from the index; sorted-set members whose
+summary has expired or whose ``conversation:{id}`` key is gone anyway are pruned
+lazily the next time they show up in a page.
+
+Index keys deliberately do not use the ``conversation:`` prefix so the backfill
+SCAN never picks them up.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+
+from src.components.memory.redis_memory import RedisMemoryManager, get_redis_memory
+
+logger = structlog.get_logger(__name__)
+
+SESSION_INDEX_KEY = "conversation_index:sessions"
+SESSION_SUMMARY_PREFIX = "conversation_index:summary:"
+CONVERSATION_KEY_PREFIX = "conversation:"
+
+# Conversations are stored with a 7-day TTL (see save_conversation_turn)
+DEFAULT_CONVERSATION_TTL_SECONDS = 604800
+
+_SUMMARY_FIELDS = ("message_count", "created_at", "updated_at", "title")
+
+
+@dataclass
+class SessionSummary:
+    """Compact per-session data needed by the history sidebar."""
+
+    session_id: str
+    message_count: int
+    created_at: str | None
+    updated_at: str | None
+    title: str | None
+
+
+def _activity_score(updated_at: str | None) -> float:
+    """Convert an ISO timestamp into a sorted-set score (epoch seconds)."""
+    if updated_at:
+        try:
+            parsed = datetime.fromisoformat(updated_at)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=UTC)
+            return parsed.timestamp()
+        except ValueError:
+            pass
+    return datetime.now(UTC).timestamp()
+
+
+class ConversationSessionIndex:
+    """Secondary Redis index of chat sessions ordered by last activity."""
+
+    def __init__(
+        self,
+        redis_memory: RedisMemoryManager | None = None,
+        ttl_seconds: int = DEFAULT_CONVERSATION_TTL_SECONDS,
+    ) -> None:
+        """Initialize the session index.
+
+        Args:
+            redis_memory: Redis memory manager (default: global instance)
+            ttl_seconds: TTL for summary hashes, should match the conversation TTL
+        """
+        self._redis_memory = redis_memory
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def redis_memory(self) -> RedisMemoryManager:
+        """Get the Redis memory manager (lazy, so tests can patch the singleton)."""
+        if self._redis_memory is None:
+            self._redis_memory = get_redis_memory()
+        return self._redis_memory
+
+    @staticmethod
+    def _summary_key(session_id: str) -> str:
+        return f"{SESSION_SUMMARY_PREFIX}{session_id}"
+
+    def _queue_upsert(
+        self,
+        pipe: Any,
+        session_id: str,
+        conversation: dict[str, Any],
+        ttl_seconds: int | None = None,
+    ) -> None:
+        """Queue the ZADD/HSET/EXPIRE commands for one session on a pipeline."""
+        summary_key = self._summary_key(session_id)
+        updated_at = conversation.get("updated_at") or conversation.get("created_at")
+
+        pipe.zadd(SESSION_INDEX_KEY, {session_id: _activity_score(updated_at)})
+        pipe.hset(
+            summary_key,
+            mapping={
+                "message_count": int(conversation.get("message_count") or 0),
+                "created_at": conversation.get("created_at") or "",
+                "updated_at": updated_at or "",
+                "title": conversation.get("title") or "",
+            },
+        )
+        pipe.expire(summary_key, ttl_seconds or self.ttl_seconds)
+
+    async def record(self, session_id: str, conversation: dict[str, Any]) -> None:
+        """Index a conversation after it has been written.
+
+        Args:
+            session_id: Session ID
+            conversation: Conversation document as stored under ``conversation:{id}``
+        """
+        redis_client = await self.redis_memory.client
+        pipe = redis_client.pipeline(transaction=False)
+        self._queue_upsert(pipe, session_id, conversation)
+        await pipe.execute()
+
+    async def update_title(self, session_id: str, title: str) -> None:
+        """Update the indexed title without touching the activity score.
+
+        Args:
+            session_id: Session ID
+            title: New conversation title
+        """
+        redis_client = await self.redis_memory.client
+        summary_key = self._summary_key(session_id)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hset(summary_key, "title", title)
+        pipe.expire(summary_key, self.ttl_seconds)
+        await pipe.execute()
+
+    async def remove(self, session_id: str) -> None:
+        """Drop a session from the index.
+
+        Args:
+            session_id: Session ID
+        """
+        redis_client = await self.redis_memory.client
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.zrem(SESSION_INDEX_KEY, session_id)
+        pipe.delete(self._summary_key(session_id))
+        await pipe.execute()
+
+    async def list_sessions(self, limit: int, offset: int = 0) -> tuple[list[SessionSummary], int]:
+        """Return one page of sessions, most recently active first.
+
+        Args:
+            limit: Maximum number of sessions to return
+            offset: Number of sessions to skip
+
+        Returns:
+            Tuple of (session summaries, total indexed session count)
+        """
+        redis_client = await self.redis_memory.client
+
+        session_ids = await redis_client.zrevrange(SESSION_INDEX_KEY, offset, offset + limit - 1)
+        if not session_ids:
+            return [], await redis_client.zcard(SESSION_INDEX_KEY)
+
+        pipe = redis_client.pipeline(transaction=False)
+        for session_id in session_ids:
+            pipe.hmget(self._summary_key(session_id), *_SUMMARY_FIELDS)
+            pipe.exists(f"{CONVERSATION_KEY_PREFIX}{session_id}")
+        results = await pipe.execute()
+
+        sessions: list[SessionSummary] = []
+        stale: list[str] = []
+        for i, session_id in enumerate(session_ids):
+            row, conversation_exists = results[2 * i], results[2 * i + 1]
+            message_count, created_at, updated_at, title = row
+            if message_count is None or not conversation_exists:
+                # Summary expired, or the conversation was archived/deleted elsewhere
+                stale.append(session_id)
+                continue
+            sessions.append(
+                SessionSummary(
+                    session_id=session_id,
+                    message_count=int(message_count),
+                    created_at=created_at or None,
+                    updated_at=updated_at or None,
+                    title=title or None,
+                )
+            )
+
+        if stale:
+            prune_pipe = redis_client.pipeline(transaction=False)
+            prune_pipe.zrem(SESSION_INDEX_KEY, *stale)
+            prune_pipe.delete(*(self._summary_key(session_id) for session_id in stale))
+            await prune_pipe.execute()
+            logger.info("session_index_pruned", stale_count=len(stale))
+
+        total_count = await redis_client.zcard(SESSION_INDEX_KEY)
+        return sessions, total_count
+
+    async def backfill(self, batch_size: int = 100) -> int:
+        """Index all existing ``conversation:*`` documents.
+
+        One-off migration for conversations stored before the index existed.
+        Safe to re-run: entries are upserted.
+
+        Args:
+            batch_size: SCAN count hint and pipeline batch size
+
+        Returns:
+            Number of sessions indexed
+        """
+        redis_client = await self.redis_memory.client
+        indexed = 0
+        cursor = 0
+
+        while True:
+            cursor, keys = await redis_client.scan(
+                cursor=cursor, match=f"{CONVERSATION_KEY_PREFIX}*", count=batch_size
+            )
+            if keys:
+                read_pipe = redis_client.pipeline(transaction=False)
+                for key in keys:
+                    read_pipe.get(key)
+                    read_pipe.ttl(key)
+                results = await read_pipe.execute()
+
+                write_pipe = redis_client.pipeline(transaction=False)
+                queued = 0
+                for i, key in enumerate(keys):
+                    serialized, ttl = results[2 * i], results[2 * i + 1]
+                    if not serialized:
+                        continue
+                    try:
+                        conversation = json.loads(serialized).get("value")
+                    except (ValueError, AttributeError):
+                        logger.warning("session_index_backfill_unparseable", key=key)
+                        continue
+                    if not isinstance(conversation, dict):
+                        continue
+
+                    session_id = key[len(CONVERSATION_KEY_PREFIX) :]
+                    self._queue_upsert(
+                        write_pipe,
+                        session_id,
+                        conversation,
+                        ttl_seconds=ttl if ttl and ttl > 0 else None,
+                    )
+                    queued += 1
+
+                if queued:
+                    await write_pipe.execute()
+                    indexed += queued
+
+            if cursor == 0:
+                break
+
+        logger.info("session_index_backfilled", indexed=indexed)
+        return indexed
+
+
+# Global instance (singleton pattern)
+_session_index: ConversationSessionIndex | None = None
+
+
+def get_session_index() -> ConversationSessionIndex:
+    """Get global conversation session index instance (singleton).
+
+    Returns:
+        ConversationSessionIndex instance
+    """
+    global _session_index
+    if _session_index is None:
+        _session_index = ConversationSessionIndex()
+    return _session_index
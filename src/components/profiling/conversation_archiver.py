@@ -15,7 +15,7 @@ from typing import Any
 import structlog
 from qdrant_client.models import Distance, FieldCondition, Filter, MatchValue, PointStruct
 
-from src.components.memory import get_redis_memory
+from src.components.memory import get_redis_memory, get_session_index
 from src.components.shared import get_embedding_service
 from src.components.vector_search import get_qdrant_client
 from src.core.exceptions import MemoryError, VectorSearchError
@@ -212,6 +212,10 @@ class ConversationArchiver:
 
             # Delete from Redis (conversation is now archived)
             await self.redis_memory.delete(key=session_id, namespace="conversation")
+            try:
+                await get_session_index().remove(session_id)
+            except Exception as e:
+                logger.warning("session_index_remove_failed", session_id=session_id, error=str(e))
 
             return point_id
 
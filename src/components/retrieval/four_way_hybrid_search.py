@@ -34,6 +34,7 @@ from typing import Any
 import structlog
 from qdrant_client.models import FieldCondition, Filter, MatchAny
 
+from src.components.graph_rag.entity_lexicon import EntityLexicon, get_entity_lexicon
 from src.components.graph_rag.neo4j_client import Neo4jClient
 from src.components.retrieval.filters import MetadataFilters
 from src.components.retrieval.intent_classifier import (
@@ -41,6 +42,7 @@ from src.components.retrieval.intent_classifier import (
     IntentClassificationResult,
     classify_intent,
 )
+from src.components.retrieval.query_embedding import QueryEmbeddingContext
 from src.components.vector_search.hybrid_search import HybridSearch
 from src.components.vector_search.multi_vector_search import MultiVectorHybridSearch
 from src.core.namespace import DEFAULT_NAMESPACE
@@ -111,6 +113,8 @@ class FourWaySearchMetadata:
     # Sprint 115: Vector-First Graph-Augment (ADR-057 Option 3)
     entity_expansion_results_count: int = 0  # Chunks found via entity overlap
     entity_expansion_latency_ms: float = 0.0  # Entity expansion latency
+    # Sprint 130: Query embedding passes for this request (0 on exact cache hit, else 1)
+    query_embeddings_count: int = 0
     # Deprecated fields (kept for backward compatibility)
     vector_results_count: int = 0  # DEPRECATED: Use dense_results_count
     bm25_results_count: int = 0  # DEPRECATED: Use sparse_results_count
@@ -144,6 +148,7 @@ class FourWayHybridSearch:
         multi_vector_search: MultiVectorHybridSearch | None = None,
         neo4j_client: Neo4jClient | None = None,
         rrf_k: int = 60,
+        entity_lexicon: EntityLexicon | None = None,
     ):
         """Initialize 4-Way Hybrid Search.
 
@@ -152,11 +157,18 @@ class FourWayHybridSearch:
             multi_vector_search: MultiVectorHybridSearch instance (Sprint 88)
             neo4j_client: Neo4j client for graph queries
             rrf_k: RRF constant (default: 60)
+            entity_lexicon: Entity lexicon for graph-local entity linking (Sprint 130),
+                default: global lexicon if ``entity_lexicon_enabled``
         """
+        from src.core.config import settings
+
         self.hybrid_search = hybrid_search or HybridSearch()
         self.multi_vector_search = multi_vector_search or MultiVectorHybridSearch()
         self.neo4j_client = neo4j_client or Neo4jClient()
         self.rrf_k = rrf_k
+        if entity_lexicon is None and settings.entity_lexicon_enabled:
+            entity_lexicon = get_entity_lexicon()
+        self.entity_lexicon = entity_lexicon
 
         logger.info(
             "FourWayHybridSearch initialized",
@@ -208,14 +220,21 @@ class FourWayHybridSearch:
         if allowed_namespaces is None:
             allowed_namespaces = [DEFAULT_NAMESPACE, "general"]
 
+        # Sprint 130 Feature 130.2: One BGE-M3 pass shared by cache lookup,
+        # dense/sparse channels and cache store
+        query_embedding = QueryEmbeddingContext(query)
+
         # Sprint 68 Feature 68.4: Check query cache first
         if use_cache:
             from src.components.retrieval.query_cache import get_query_cache
 
             cache = get_query_cache()
-            cached_result = await cache.get(query, namespaces=allowed_namespaces)
+            cached_result = await cache.get(
+                query, namespaces=allowed_namespaces, query_embedding=query_embedding
+            )
 
             if cached_result:
+                query_embedding.record_metrics()
                 cache_latency_ms = (time.perf_counter() - start_time) * 1000
 
                 logger.info(
@@ -284,7 +303,9 @@ class FourWayHybridSearch:
         # Execute if either vector or bm25 weight > 0
         multivector_weight = max(weights.vector, weights.bm25)
         if multivector_weight > 0:
-            tasks.append(self._multivector_search(query, top_k * 3, allowed_namespaces))
+            tasks.append(
+                self._multivector_search(query, top_k * 3, allowed_namespaces, query_embedding)
+            )
             channels_executed.append("multivector")
 
         # Graph Local search (Entity → Chunk)
@@ -426,6 +447,7 @@ class FourWayHybridSearch:
                     query=query,
                     documents=fused_results[: top_k * 2],
                     top_k=top_k,
+                    intent_result=intent_result,
                 )
                 final_results = []
                 for rerank_result in reranked:
@@ -478,6 +500,7 @@ class FourWayHybridSearch:
             # Sprint 115: Vector-First Graph-Augment stats (ADR-057 Option 3)
             entity_expansion_results_count=entity_expansion_count,
             entity_expansion_latency_ms=entity_expansion_latency_ms,
+            query_embeddings_count=query_embedding.embed_calls,
             # Deprecated fields (for backward compatibility)
             vector_results_count=multivector_count,
             bm25_results_count=0,  # Deprecated: sparse vectors replace BM25
@@ -495,6 +518,7 @@ class FourWayHybridSearch:
             global_count=metadata.graph_global_results_count,
             entity_expansion_count=entity_expansion_count,  # Sprint 115: Entity expansion
             entity_expansion_ms=round(entity_expansion_latency_ms, 2),
+            query_embeddings=query_embedding.embed_calls,
         )
 
         # Sprint 68 Feature 68.4: Store results in cache
@@ -507,8 +531,11 @@ class FourWayHybridSearch:
                 results=final_results,
                 metadata=metadata,
                 namespaces=allowed_namespaces,
+                query_embedding=query_embedding,
             )
 
+        query_embedding.record_metrics()
+
         return {
             "query": query,
             "results": final_results,
@@ -522,6 +549,7 @@ class FourWayHybridSearch:
         query: str,
         top_k: int,
         allowed_namespaces: list[str] | None = None,
+        query_embedding: QueryEmbeddingContext | None = None,
     ) -> list[dict[str, Any]]:
         """Execute multi-vector search (dense + sparse) via Qdrant Query API.
 
@@ -532,6 +560,7 @@ class FourWayHybridSearch:
             query: Search query
             top_k: Number of results
             allowed_namespaces: Namespaces to search in
+            query_embedding: Request-scoped embedding context (Sprint 130 Feature 130.2)
 
         Returns:
             List of search results with namespace info
@@ -546,6 +575,7 @@ class FourWayHybridSearch:
                 top_k=top_k,
                 prefetch_limit=min(top_k * 2, 100),  # Prefetch more for better recall
                 namespace_filter=namespace_filter,
+                query_embedding=query_embedding,
             )
 
             # Format results for RRF compatibility
@@ -581,7 +611,9 @@ class FourWayHybridSearch:
                 query=query[:50],
             )
             # Fallback to legacy vector search
-            return await self._vector_search_legacy(query, top_k, None, allowed_namespaces)
+            return await self._vector_search_legacy(
+                query, top_k, None, allowed_namespaces, query_embedding
+            )
 
     async def _vector_search_legacy(
         self,
@@ -589,6 +621,7 @@ class FourWayHybridSearch:
         top_k: int,
         filters: MetadataFilters | None = None,
         allowed_namespaces: list[str] | None = None,
+        query_embedding: QueryEmbeddingContext | None = None,
     ) -> list[dict[str, Any]]:
         """Legacy vector search (dense only) via HybridSearch.
 
@@ -599,6 +632,7 @@ class FourWayHybridSearch:
             top_k: Number of results
             filters: Additional metadata filters
             allowed_namespaces: Namespaces to search in
+            query_embedding: Request-scoped embedding context (Sprint 130 Feature 130.2)
 
         Returns:
             List of search results with namespace info
@@ -631,19 +665,15 @@ class FourWayHybridSearch:
 
         # Use raw Qdrant search with namespace filter
         # (HybridSearch.vector_search uses MetadataFilters which we need to bypass)
-        from src.components.shared.embedding_service import get_embedding_service
-
-        embedding_service = get_embedding_service()
-        # Sprint 92 Fix: Handle both list (Ollama/ST) and dict (FlagEmbedding) returns
-        embedding_result = await embedding_service.embed_single(query)
-        query_embedding = (
-            embedding_result["dense"] if isinstance(embedding_result, dict) else embedding_result
-        )
+        # Sprint 130 Feature 130.2: Reuse the request's embedding if already computed
+        if query_embedding is None:
+            query_embedding = QueryEmbeddingContext(query)
+        dense_embedding = await query_embedding.get_dense()
 
         # Search with namespace filter
         results = await self.hybrid_search.qdrant_client.search(
             collection_name=self.hybrid_search.collection_name,
-            query_vector=query_embedding,
+            query_vector=dense_embedding,
             limit=top_k,
             query_filter=namespace_filter,
         )
@@ -745,10 +775,13 @@ class FourWayHybridSearch:
         Uses the MENTIONED_IN relationship from TD-057.
 
         Sprint 41 Feature 41.3: Added namespace filtering for multi-tenant isolation.
+        Sprint 130 Feature 130.5: Entities are linked via the in-memory EntityLexicon and
+        looked up by indexed entity_id. The CONTAINS label scan is only used while the
+        lexicon is loading (or as opt-in fallback when nothing is linked).
 
         Cypher pattern:
             MATCH (e:base)-[:MENTIONED_IN]->(c:chunk)
-            WHERE e.namespace_id IN allowed_namespaces AND e.entity_name matches query
+            WHERE e.entity_id IN linked_entity_ids AND e.namespace_id IN allowed_namespaces
             RETURN chunks ordered by mention count
 
         Args:
@@ -757,57 +790,21 @@ class FourWayHybridSearch:
             allowed_namespaces: List of namespaces to filter by (Sprint 41.3)
         """
         try:
-            # Extract potential entity names from query (simple approach)
-            # More sophisticated: use NER or entity linking
             query_terms = filter_stop_words(query.lower().split())
 
-            # Search for entities matching query terms with namespace filtering
-            if allowed_namespaces:
-                cypher = """
-                WITH $query_terms AS terms
-                MATCH (e:base)
-                WHERE e.namespace_id IN $allowed_namespaces
-                  AND (any(term IN terms WHERE toLower(e.entity_name) CONTAINS term)
-                       OR any(term IN terms WHERE toLower(e.description) CONTAINS term))
-                WITH e
-                MATCH (e)-[:MENTIONED_IN]->(c:chunk)
-                WHERE c.namespace_id IN $allowed_namespaces
-                WITH c, count(DISTINCT e) AS entity_matches, collect(DISTINCT e.entity_name) AS matched_entities
-                RETURN c.chunk_id AS id,
-                       c.text AS text,
-                       c.document_id AS document_id,
-                       c.document_path AS source,
-                       c.namespace_id AS namespace_id,
-                       entity_matches AS relevance,
-                       matched_entities AS entities
-                ORDER BY entity_matches DESC
-                LIMIT $top_k
-                """
-                params = {
-                    "query_terms": query_terms,
-                    "top_k": top_k,
-                    "allowed_namespaces": allowed_namespaces,
-                }
+            entity_ids = await self._link_query_entities(query, query_terms, allowed_namespaces)
+
+            if entity_ids is not None:
+                if not entity_ids:
+                    logger.debug("graph_local_no_linked_entities", query=query[:50])
+                    return []
+                cypher, params = self._graph_local_lookup_cypher(
+                    entity_ids, top_k, allowed_namespaces
+                )
             else:
-                # Fallback: No namespace filtering (for backward compatibility)
-                cypher = """
-                WITH $query_terms AS terms
-                MATCH (e:base)
-                WHERE any(term IN terms WHERE toLower(e.entity_name) CONTAINS term)
-                   OR any(term IN terms WHERE toLower(e.description) CONTAINS term)
-                WITH e
-                MATCH (e)-[:MENTIONED_IN]->(c:chunk)
-                WITH c, count(DISTINCT e) AS entity_matches, collect(DISTINCT e.entity_name) AS matched_entities
-                RETURN c.chunk_id AS id,
-                       c.text AS text,
-                       c.document_id AS document_id,
-                       c.document_path AS source,
-                       entity_matches AS relevance,
-                       matched_entities AS entities
-                ORDER BY entity_matches DESC
-                LIMIT $top_k
-                """
-                params = {"query_terms": query_terms, "top_k": top_k}
+                cypher, params = self._graph_local_scan_cypher(
+                    query_terms, top_k, allowed_namespaces
+                )
 
             results = await self.neo4j_client.execute_read(cypher, params)
 
@@ -833,6 +830,7 @@ class FourWayHybridSearch:
                 "graph_local_search_completed",
                 query=query[:50],
                 namespaces=allowed_namespaces,
+                linked_entities=len(entity_ids) if entity_ids is not None else None,
                 results=len(formatted),
             )
 
@@ -842,6 +840,119 @@ class FourWayHybridSearch:
             logger.warning("graph_local_search_failed", error=str(e))
             return []
 
+    async def _link_query_entities(
+        self,
+        query: str,
+        query_terms: list[str],
+        allowed_namespaces: list[str] | None,
+    ) -> list[str] | None:
+        """Link query text to entity IDs via the entity lexicon (Sprint 130 Feature 130.5).
+
+        Returns:
+            Linked entity IDs, or None if the legacy CONTAINS scan should be used
+            (lexicon disabled, no namespace filter, lexicon still loading, or
+            opt-in fallback when nothing was linked)
+        """
+        from src.core.config import settings
+
+        if self.entity_lexicon is None or not allowed_namespaces:
+            return None
+
+        if not self.entity_lexicon.is_loaded(allowed_namespaces):
+            # Serve this query with the scan; load the lexicon off the request path
+            self.entity_lexicon.schedule_load(self.neo4j_client, allowed_namespaces)
+            return None
+
+        await self.entity_lexicon.ensure_loaded(self.neo4j_client, allowed_namespaces)
+        matches = self.entity_lexicon.match(query, allowed_namespaces, terms=query_terms)
+        if not matches and settings.graph_local_lexicon_fallback_scan:
+            return None
+        return [m.entity_id for m in matches]
+
+    @staticmethod
+    def _graph_local_lookup_cypher(
+        entity_ids: list[str], top_k: int, allowed_namespaces: list[str]
+    ) -> tuple[str, dict[str, Any]]:
+        """Build Cypher starting from lexicon-linked entity IDs (index lookup)."""
+        cypher = """
+        MATCH (e:base)
+        WHERE e.entity_id IN $entity_ids
+          AND e.namespace_id IN $allowed_namespaces
+        WITH e
+        MATCH (e)-[:MENTIONED_IN]->(c:chunk)
+        WHERE c.namespace_id IN $allowed_namespaces
+        WITH c, count(DISTINCT e) AS entity_matches, collect(DISTINCT e.entity_name) AS matched_entities
+        RETURN c.chunk_id AS id,
+               c.text AS text,
+               c.document_id AS document_id,
+               c.document_path AS source,
+               c.namespace_id AS namespace_id,
+               entity_matches AS relevance,
+               matched_entities AS entities
+        ORDER BY entity_matches DESC
+        LIMIT $top_k
+        """
+        params = {
+            "entity_ids": entity_ids,
+            "top_k": top_k,
+            "allowed_namespaces": allowed_namespaces,
+        }
+        return cypher, params
+
+    @staticmethod
+    def _graph_local_scan_cypher(
+        query_terms: list[str], top_k: int, allowed_namespaces: list[str] | None
+    ) -> tuple[str, dict[str, Any]]:
+        """Build legacy Cypher scanning entity names/descriptions with CONTAINS."""
+        # Search for entities matching query terms with namespace filtering
+        if allowed_namespaces:
+            cypher = """
+            WITH $query_terms AS terms
+            MATCH (e:base)
+            WHERE e.namespace_id IN $allowed_namespaces
+              AND (any(term IN terms WHERE toLower(e.entity_name) CONTAINS term)
+                   OR any(term IN terms WHERE toLower(e.description) CONTAINS term))
+            WITH e
+            MATCH (e)-[:MENTIONED_IN]->(c:chunk)
+            WHERE c.namespace_id IN $allowed_namespaces
+            WITH c, count(DISTINCT e) AS entity_matches, collect(DISTINCT e.entity_name) AS matched_entities
+            RETURN c.chunk_id AS id,
+                   c.text AS text,
+                   c.document_id AS document_id,
+                   c.document_path AS source,
+                   c.namespace_id AS namespace_id,
+                   entity_matches AS relevance,
+                   matched_entities AS entities
+            ORDER BY entity_matches DESC
+            LIMIT $top_k
+            """
+            params = {
+                "query_terms": query_terms,
+                "top_k": top_k,
+                "allowed_namespaces": allowed_namespaces,
+            }
+        else:
+            # Fallback: No namespace filtering (for backward compatibility)
+            cypher = """
+            WITH $query_terms AS terms
+            MATCH (e:base)
+            WHERE any(term IN terms WHERE toLower(e.entity_name) CONTAINS term)
+               OR any(term IN terms WHERE toLower(e.description) CONTAINS term)
+            WITH e
+            MATCH (e)-[:MENTIONED_IN]->(c:chunk)
+            WITH c, count(DISTINCT e) AS entity_matches, collect(DISTINCT e.entity_name) AS matched_entities
+            RETURN c.chunk_id AS id,
+                   c.text AS text,
+                   c.document_id AS document_id,
+                   c.document_path AS source,
+                   entity_matches AS relevance,
+                   matched_entities AS entities
+            ORDER BY entity_matches DESC
+            LIMIT $top_k
+            """
+            params = {"query_terms": query_terms, "top_k": top_k}
+        return cypher, params
+
     async def _graph_global_search(
         self,
         query: str,
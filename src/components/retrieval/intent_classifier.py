@@ -28,17 +28,22 @@ Academic References:
 - C-LARA Framework (Amazon Science) - Intent Detection in the Age of LLMs
 """
 
+import asyncio
 import math
 import os
 import re
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import httpx
 import structlog
+from cachetools import TTLCache
+
+from src.components.retrieval.micro_batch_executor import MicroBatchExecutor
 
 if TYPE_CHECKING:
     from setfit import SetFitModel
@@ -228,6 +233,10 @@ class IntentClassifier:
         timeout: float = 10.0,
         method: str = "setfit",
         setfit_model_path: str | None = None,
+        cache_max_size: int | None = None,
+        cache_ttl_seconds: float | None = None,
+        batch_window_ms: float | None = None,
+        max_batch_queries: int | None = None,
     ):
         """Initialize Intent Classifier.
 
@@ -237,6 +246,10 @@ class IntentClassifier:
             timeout: Request timeout in seconds (for LLM fallback)
             method: Classification method: "setfit" (default), "embedding", "rule_based", or "llm"
             setfit_model_path: Path to SetFit model directory (default: models/intent_classifier)
+            cache_max_size: Max cached classifications, LRU-evicted (default: 10000)
+            cache_ttl_seconds: Lifetime of cached classifications (default: 3600)
+            batch_window_ms: Time to coalesce concurrent SetFit queries (default: 2.0)
+            max_batch_queries: Max queries per SetFit predict call (default: 64)
         """
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.model = model or os.getenv("OLLAMA_MODEL_INTENT", "nemotron-3-nano")
@@ -251,10 +264,29 @@ class IntentClassifier:
         self.use_setfit = os.getenv("USE_SETFIT_CLASSIFIER", "true").lower() == "true"
         self.setfit_model: SetFitModel | None = None
         self.setfit_initialized = False
+        self._setfit_load_lock = threading.Lock()
 
-        # Cache for query classifications (LRU)
-        self._cache: dict[str, tuple[Intent, float]] = {}
-        self._cache_max_size = 1000
+        # SetFit inference runs in a worker thread, concurrent queries share one predict call
+        self.batch_window_ms = (
+            batch_window_ms
+            if batch_window_ms is not None
+            else float(os.getenv("INTENT_BATCH_WINDOW_MS", "2.0"))
+        )
+        self.max_batch_queries = max_batch_queries or int(
+            os.getenv("INTENT_MAX_BATCH_QUERIES", "64")
+        )
+        self._setfit_executor: MicroBatchExecutor[str, tuple[CLARAIntent, float]] | None = None
+
+        # Cache for query classifications (LRU + TTL), shared by retrieval and rerank weighting
+        self._cache_max_size = cache_max_size or int(os.getenv("INTENT_CACHE_MAX_SIZE", "10000"))
+        self._cache_ttl_seconds = cache_ttl_seconds or float(
+            os.getenv("INTENT_CACHE_TTL_SECONDS", "3600")
+        )
+        self._cache: TTLCache[str, Any] = TTLCache(
+            maxsize=self._cache_max_size, ttl=self._cache_ttl_seconds
+        )
+        # In-flight classifications, so concurrent callers of one query share a single run
+        self._inflight: dict[str, asyncio.Task] = {}
 
         # Sprint 52: Cache for intent description embeddings
         self._intent_embeddings: dict[Intent, list[float]] = {}
@@ -272,11 +304,18 @@ class IntentClassifier:
         """Initialize SetFit model (lazy loading).
 
         Sprint 67: Loads the C-LARA trained SetFit model for intent classification.
-        Model is loaded once and cached for subsequent use.
+        Model is loaded once and cached for subsequent use. Thread-safe, so the
+        async path can load it in a worker thread.
         """
         if self.setfit_initialized:
             return
 
+        with self._setfit_load_lock:
+            if not self.setfit_initialized:
+                self._load_setfit_model()
+
+    def _load_setfit_model(self) -> None:
+        """Load the SetFit model from disk (called under the load lock)."""
         if not self.use_setfit:
             logger.info("setfit_model_disabled", reason="USE_SETFIT_CLASSIFIER=false")
             self.setfit_initialized = True
@@ -357,6 +396,19 @@ class IntentClassifier:
             # Don't set initialized - will retry on next call
             raise
 
+    @property
+    def setfit_executor(self) -> MicroBatchExecutor[str, tuple[CLARAIntent, float]]:
+        """Micro-batching executor running SetFit predict in a worker thread (lazy)."""
+        if self._setfit_executor is None:
+            self._setfit_executor = MicroBatchExecutor(
+                self._predict_setfit_batch,
+                batch_window_ms=self.batch_window_ms,
+                max_batch_items=self.max_batch_queries,
+                name="setfit",
+                thread_name_prefix="intent-setfit",
+            )
+        return self._setfit_executor
+
     def _classify_with_setfit(self, query: str) -> tuple[CLARAIntent, float]:
         """Classify using C-LARA trained SetFit model.
 
@@ -369,6 +421,23 @@ class IntentClassifier:
         Returns:
             Tuple of (CLARAIntent, confidence)
 
+        Raises:
+            ValueError: If SetFit model is not loaded
+        """
+        return self._predict_setfit_batch([query])[0]
+
+    def _predict_setfit_batch(self, queries: list[str]) -> list[tuple[CLARAIntent, float]]:
+        """Classify a batch of queries with one SetFit predict call.
+
+        Runs synchronously; ``classify`` calls it through the SetFit executor's
+        worker thread.
+
+        Args:
+            queries: User queries
+
+        Returns:
+            (CLARAIntent, confidence) per query, in input order
+
         Raises:
             ValueError: If SetFit model is not loaded
         """
@@ -377,12 +446,53 @@ class IntentClassifier:
 
         # Run prediction
         predict_start = time.perf_counter()
-        predictions = self.setfit_model.predict([query])
+        predictions = self.setfit_model.predict(queries)
         predict_time_ms = (time.perf_counter() - predict_start) * 1000
 
-        # Get predicted label - handle both string, int, and tensor predictions
-        prediction = predictions[0]
+        intents = [self._setfit_label_to_intent(prediction) for prediction in predictions]
+
+        # Get prediction probabilities for confidence
+        try:
+            confidences = []
+            margins = []
+            for probs in self.setfit_model.predict_proba(queries):
+                # Convert tensor to list/array if needed
+                if hasattr(probs, "tolist"):
+                    probs = probs.tolist()
+                elif hasattr(probs, "numpy"):
+                    probs = probs.numpy().tolist()
+                confidences.append(float(max(probs)))
+
+                # Calculate margin (difference between top 2 predictions)
+                sorted_probs = sorted(probs, reverse=True)
+                margins.append(sorted_probs[0] - sorted_probs[1] if len(sorted_probs) > 1 else 0.0)
+
+            logger.debug(
+                "setfit_classification_complete",
+                batch_size=len(queries),
+                intents=[intent.value for intent in intents],
+                confidences=[round(c, 4) for c in confidences],
+                margins=[round(m, 4) for m in margins],
+                predict_time_ms=round(predict_time_ms, 2),
+            )
+
+        except AttributeError:
+            # Model doesn't support predict_proba, use default confidence
+            confidences = [0.85] * len(queries)  # Default for SetFit models
+            logger.debug(
+                "setfit_classification_complete",
+                batch_size=len(queries),
+                intents=[intent.value for intent in intents],
+                confidence=0.85,
+                predict_time_ms=round(predict_time_ms, 2),
+                note="predict_proba not available, using default confidence",
+            )
+
+        return list(zip(intents, confidences, strict=True))
 
+    @staticmethod
+    def _setfit_label_to_intent(prediction: Any) -> CLARAIntent:
+        """Map a SetFit label (string, int or tensor) to CLARAIntent."""
         # Convert tensor to native Python type if needed
         if hasattr(prediction, "item"):
             # PyTorch/NumPy tensor - convert to Python scalar
@@ -394,7 +504,6 @@ class IntentClassifier:
         # Sprint 81: C-LARA 5-class model returns string labels
         if isinstance(prediction, str):
             # Direct string label from SetFit
-            label_str = prediction.lower()
             string_to_intent = {
                 "factual": CLARAIntent.FACTUAL,
                 "procedural": CLARAIntent.PROCEDURAL,
@@ -402,105 +511,59 @@ class IntentClassifier:
                 "recommendation": CLARAIntent.RECOMMENDATION,
                 "navigation": CLARAIntent.NAVIGATION,
             }
-            intent = string_to_intent.get(label_str, CLARAIntent.FACTUAL)
-        else:
-            # Legacy: Integer label (0-4 for C-LARA 5-class)
-            predicted_label = int(prediction)
-            label_to_intent = {
-                0: CLARAIntent.FACTUAL,
-                1: CLARAIntent.PROCEDURAL,
-                2: CLARAIntent.COMPARISON,
-                3: CLARAIntent.RECOMMENDATION,
-                4: CLARAIntent.NAVIGATION,
-            }
-            intent = label_to_intent.get(predicted_label, CLARAIntent.FACTUAL)
-
-        # Get prediction probabilities for confidence
-        try:
-            probs = self.setfit_model.predict_proba([query])[0]
-            # Convert tensor to list/array if needed
-            if hasattr(probs, "tolist"):
-                probs = probs.tolist()
-            elif hasattr(probs, "numpy"):
-                probs = probs.numpy().tolist()
-            confidence = float(max(probs))
-
-            # Calculate margin (difference between top 2 predictions)
-            sorted_probs = sorted(probs, reverse=True)
-            margin = sorted_probs[0] - sorted_probs[1] if len(sorted_probs) > 1 else 0.0
-
-            logger.debug(
-                "setfit_classification_complete",
-                query=query[:50],
-                intent=intent.value,
-                confidence=round(confidence, 4),
-                margin=round(margin, 4),
-                predict_time_ms=round(predict_time_ms, 2),
-            )
-
-        except AttributeError:
-            # Model doesn't support predict_proba, use default confidence
-            confidence = 0.85  # Default for SetFit models
-            logger.debug(
-                "setfit_classification_complete",
-                query=query[:50],
-                intent=intent.value,
-                confidence=confidence,
-                predict_time_ms=round(predict_time_ms, 2),
-                note="predict_proba not available, using default confidence",
-            )
-
-        return intent, confidence
+            return string_to_intent.get(prediction.lower(), CLARAIntent.FACTUAL)
+
+        # Legacy: Integer label (0-4 for C-LARA 5-class)
+        label_to_intent = {
+            0: CLARAIntent.FACTUAL,
+            1: CLARAIntent.PROCEDURAL,
+            2: CLARAIntent.COMPARISON,
+            3: CLARAIntent.RECOMMENDATION,
+            4: CLARAIntent.NAVIGATION,
+        }
+        return label_to_intent.get(int(prediction), CLARAIntent.FACTUAL)
 
     async def classify(self, query: str) -> "IntentClassificationResult":
         """Classify query intent and return weights.
 
+        Results are cached (LRU + TTL) per normalized query, and concurrent calls
+        for the same query share one classification, so retrieval weighting and
+        rerank weighting classify each query only once.
+
         Args:
             query: User query string
 
         Returns:
             IntentClassificationResult with intent, weights, and metadata
         """
-        start_time = time.perf_counter()
-
         # Normalize query for cache lookup
         cache_key = query.lower().strip()
 
-        # Check cache first (cache stores tuple of (intent_value, weights, clara_intent_value))
-        if cache_key in self._cache:
-            cached_data = self._cache[cache_key]
-            if len(cached_data) == 3:
-                cached_intent_val, cached_weights, cached_clara_val = cached_data
-            else:
-                # Legacy cache format
-                cached_intent, cached_time = cached_data
-                cached_intent_val = (
-                    cached_intent.value if hasattr(cached_intent, "value") else str(cached_intent)
-                )
-                cached_weights = INTENT_WEIGHT_PROFILES.get(
-                    cached_intent, INTENT_WEIGHT_PROFILES[Intent.FACTUAL]
-                )
-                cached_clara_val = None
-
-            logger.debug("intent_cache_hit", query=query[:50], intent=cached_intent_val)
-            # Reconstruct intent enum
-            try:
-                legacy_intent = (
-                    Intent(cached_intent_val)
-                    if cached_intent_val in [e.value for e in Intent]
-                    else Intent.FACTUAL
-                )
-            except ValueError:
-                legacy_intent = Intent.FACTUAL
-
-            return IntentClassificationResult(
-                intent=legacy_intent,
-                weights=cached_weights,
-                confidence=1.0,
-                latency_ms=0.0,
-                method="cache",
-                clara_intent=CLARAIntent(cached_clara_val) if cached_clara_val else None,
-            )
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("intent_cache_hit", query=query[:50], intent=cached.intent.value)
+            return replace(cached, latency_ms=0.0, method="cache")
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(cache_key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            # Same query is already being classified (e.g. retrieval and rerank in parallel)
+            result = await asyncio.shield(task)
+            return replace(result, latency_ms=0.0, method="cache")
+
+        task = loop.create_task(self._classify_uncached(query, cache_key))
+        self._inflight[cache_key] = task
+        task.add_done_callback(lambda done: self._forget_inflight(cache_key, done))
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, cache_key: str, task: asyncio.Task) -> None:
+        """Drop a finished classification from the in-flight map."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+
+    async def _classify_uncached(self, query: str, cache_key: str) -> "IntentClassificationResult":
+        """Classify query with the configured method and cache the result."""
+        start_time = time.perf_counter()
 
         # Classify based on configured method
         intent: Intent | None = None
@@ -512,9 +575,10 @@ class IntentClassifier:
         # Sprint 67/81: Try SetFit first if enabled (returns CLARAIntent)
         if self.method == "setfit":
             try:
-                self._ensure_setfit_model()
+                if not self.setfit_initialized:
+                    await asyncio.to_thread(self._ensure_setfit_model)
                 if self.setfit_model is not None:
-                    clara_intent, confidence = self._classify_with_setfit(query)
+                    [(clara_intent, confidence)] = await self.setfit_executor.submit([query])
                     weights = CLARA_INTENT_WEIGHT_PROFILES[clara_intent]
                     # Map CLARAIntent to legacy Intent for backward compatibility
                     intent = self._clara_to_legacy_intent(clara_intent)
@@ -568,16 +632,6 @@ class IntentClassifier:
             confidence = 0.7
             method = "rule_based"
 
-        # Update cache (with LRU eviction)
-        if len(self._cache) >= self._cache_max_size:
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-        self._cache[cache_key] = (
-            intent.value,
-            weights,
-            clara_intent.value if clara_intent else None,
-        )
-
         latency_ms = (time.perf_counter() - start_time) * 1000
 
         logger.info(
@@ -590,7 +644,7 @@ class IntentClassifier:
             latency_ms=round(latency_ms, 2),
         )
 
-        return IntentClassificationResult(
+        result = IntentClassificationResult(
             intent=intent,
             weights=weights,
             confidence=confidence,
@@ -598,6 +652,8 @@ class IntentClassifier:
             method=method,
             clara_intent=clara_intent,
         )
+        self._cache[cache_key] = result
+        return result
 
     def _clara_to_legacy_intent(self, clara: CLARAIntent) -> Intent:
         """Map C-LARA 5-class intent to legacy 4-class Intent.
@@ -834,8 +890,11 @@ class IntentClassifier:
         return Intent.EXPLORATORY
 
     async def close(self) -> None:
-        """Close HTTP client."""
+        """Close HTTP client and stop the SetFit worker thread."""
         await self.client.aclose()
+        if self._setfit_executor is not None:
+            self._setfit_executor.shutdown()
+            self._setfit_executor = None
 
     def clear_cache(self) -> None:
         """Clear the intent classification cache."""
@@ -0,0 +1,201 @@
+"""Off-event-loop, micro-batched model inference.
+
+Synchronous model calls (cross-encoder forward pass, SetFit predict) block
+the event loop when called from ``async`` code. MicroBatchExecutor moves
+them to a dedicated worker thread (torch releases the GIL during inference)
+and coalesces items from concurrent requests into shared batches:
+
+    request A (20 items) ─┐
+    request B (1 item)   ─┼─ window (5ms) ─→ predict(41 items) ─→ split per request
+    request C (20 items) ─┘
+
+Batches are flushed when the window elapses or ``max_batch_items`` is
+reached. One worker thread per executor keeps inference serialized (models
+are not thread-safe) while the event loop stays free.
+
+Used by RerankExecutor (cross-encoder pairs) and IntentClassifier (SetFit
+queries).
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+@dataclass
+class _PendingRequest(Generic[ItemT]):
+    """Items from one request awaiting a batch slot."""
+
+    items: list[ItemT]
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class MicroBatchExecutor(Generic[ItemT, ResultT]):
+    """Micro-batching executor for synchronous batch inference.
+
+    Example:
+        executor = MicroBatchExecutor(model.predict, batch_window_ms=2.0, name="setfit")
+        labels = await executor.submit(["What is RAG?"])
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[list[ItemT]], Sequence[ResultT]],
+        batch_window_ms: float = 5.0,
+        max_batch_items: int = 256,
+        name: str = "model",
+        thread_name_prefix: str | None = None,
+    ) -> None:
+        """Initialize micro-batch executor.
+
+        Args:
+            predict_fn: Synchronous batch function, one result per item in input
+                order (runs in the worker thread)
+            batch_window_ms: Time to wait for more requests before flushing a batch
+            max_batch_items: Flush immediately once this many items are queued
+            name: Executor name (logging / thread name)
+            thread_name_prefix: Worker thread name prefix (default: name)
+        """
+        self.predict_fn = predict_fn
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_items = max(1, max_batch_items)
+        self.name = name
+
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=thread_name_prefix or name
+        )
+        self._queue: asyncio.Queue[_PendingRequest[ItemT]] | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Metrics
+        self.batches = 0
+        self.requests = 0
+        self.items_processed = 0
+        self.inference_ms_total = 0.0
+        self.queue_wait_ms_total = 0.0
+
+    def _ensure_worker(self) -> asyncio.Queue[_PendingRequest[ItemT]]:
+        """Start the batching task on the running loop (restarts after loop change)."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        assert self._queue is not None
+        return self._queue
+
+    async def submit(self, items: list[ItemT]) -> list[ResultT]:
+        """Run items through the model in a shared batch.
+
+        Args:
+            items: Model inputs of one request
+
+        Returns:
+            Model outputs, one per item in input order
+        """
+        if not items:
+            return []
+
+        queue = self._ensure_worker()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await queue.put(_PendingRequest(items=list(items), future=future))
+        return await future
+
+    async def _run(self, queue: asyncio.Queue[_PendingRequest[ItemT]]) -> None:
+        """Collect pending requests into batches and dispatch them to the worker thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await queue.get()
+            batch = [first]
+            item_count = len(first.items)
+
+            # Coalesce concurrent requests within the batching window
+            deadline = loop.time() + self.batch_window_ms / 1000
+            while item_count < self.max_batch_items:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(request)
+                item_count += len(request.items)
+
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: list[_PendingRequest[ItemT]]) -> None:
+        """Run one coalesced batch in the worker thread and resolve each request."""
+        loop = asyncio.get_running_loop()
+        all_items = [item for request in batch for item in request.items]
+        dispatch_start = time.perf_counter()
+
+        try:
+            results = await loop.run_in_executor(self._thread_pool, self.predict_fn, all_items)
+        except Exception as e:
+            logger.error("micro_batch_failed", executor=self.name, error=str(e))
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        inference_ms = (time.perf_counter() - dispatch_start) * 1000
+        results = list(results)
+
+        offset = 0
+        for request in batch:
+            n = len(request.items)
+            if not request.future.done():
+                request.future.set_result(results[offset : offset + n])
+            offset += n
+            self.queue_wait_ms_total += (dispatch_start - request.enqueued_at) * 1000
+
+        self.batches += 1
+        self.requests += len(batch)
+        self.items_processed += len(all_items)
+        self.inference_ms_total += inference_ms
+
+        logger.debug(
+            "micro_batch_processed",
+            executor=self.name,
+            requests=len(batch),
+            items=len(all_items),
+            inference_ms=round(inference_ms, 2),
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics.
+
+        Returns:
+            Stats dict with batch counts and average batch size / latency
+        """
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "items_processed": self.items_processed,
+            "avg_requests_per_batch": self.requests / self.batches if self.batches else 0.0,
+            "avg_items_per_batch": self.items_processed / self.batches if self.batches else 0.0,
+            "avg_inference_ms": self.inference_ms_total / self.batches if self.batches else 0.0,
+            "avg_queue_wait_ms": self.queue_wait_ms_total / self.requests if self.requests else 0.0,
+            "batch_window_ms": self.batch_window_ms,
+            "max_batch_items": self.max_batch_items,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the batching task and worker thread."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+        self._thread_pool.shutdown(wait=False, cancel_futures=True)
@@ -27,6 +27,16 @@ Comparison to CrossEncoderReranker:
     | Docker Size | No increase | +2GB |
     | Multilingual | Yes | No (English only) |
 
+Scoring Modes (Sprint 130 Feature 130.3):
+    - sequential: One Ollama call per document, awaited one after another (legacy)
+    - concurrent: One call per document, up to ``max_concurrency`` in flight
+    - batch: ``batch_size`` passages scored in a single multi-document prompt
+    All modes honour a per-request deadline; documents that are not scored in
+    time are appended after the scored ones (original order, score 0.0), so
+    callers always get a complete, partially reranked list.
+    ``last_rerank_stats`` reports per-document latency to pick the faster mode
+    per deployment.
+
 Typical usage:
     reranker = OllamaReranker()
     reranked_results = await reranker.rerank(
@@ -42,7 +52,10 @@ Academic References:
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import re
+import time
+from typing import Any, Literal
 
 import aiohttp
 import structlog
@@ -51,6 +64,11 @@ from src.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
+RerankMode = Literal["sequential", "concurrent", "batch"]
+
+# Matches "[3]: 7.5" / "3: 7" / "Passage 3 = 7" lines in batch responses
+_BATCH_SCORE_PATTERN = re.compile(r"(?:passage\s*)?\[?(\d+)\]?\s*[:=\-]\s*(-?\d+(?:\.\d+)?)", re.I)
+
 
 class OllamaReranker:
     """Reranker using BAAI/bge-reranker-v2-m3 via Ollama.
@@ -70,6 +88,11 @@ class OllamaReranker:
         model: Ollama model name for reranking (default: bge-reranker-v2-m3)
         top_k: Number of top documents to return (default: 10)
         ollama_url: Ollama API endpoint URL
+        mode: Scoring mode ("sequential", "concurrent", "batch")
+        max_concurrency: Maximum in-flight Ollama calls per rerank request
+        batch_size: Passages per call in batch mode
+        deadline_ms: Per-request deadline in ms (None = no deadline)
+        last_rerank_stats: Latency statistics of the most recent rerank call
 
     Example:
         >>> reranker = OllamaReranker(model="bge-reranker-v2-m3", top_k=10)
@@ -78,22 +101,45 @@ class OllamaReranker:
         >>> # Returns [(0, 0.95), (1, 0.23)] - (doc_index, score) pairs
     """
 
-    def __init__(self, model: str | None = None, top_k: int = 10) -> None:
+    def __init__(
+        self,
+        model: str | None = None,
+        top_k: int = 10,
+        mode: RerankMode | None = None,
+        max_concurrency: int | None = None,
+        batch_size: int | None = None,
+        deadline_ms: int | None = None,
+    ) -> None:
         """Initialize Ollama reranker.
 
         Args:
             model: Ollama model name for reranking (default: from settings.reranker_ollama_model)
             top_k: Number of top documents to return (default: 10)
+            mode: Scoring mode (default: settings.reranker_ollama_mode)
+            max_concurrency: In-flight call limit (default: settings.reranker_ollama_max_concurrency)
+            batch_size: Passages per batch call (default: settings.reranker_ollama_batch_size)
+            deadline_ms: Per-request deadline, 0 disables (default: settings.reranker_ollama_deadline_ms)
         """
         self.model = model or settings.reranker_ollama_model
         self.top_k = top_k
         self.ollama_url = f"{settings.ollama_base_url}/api/generate"
+        self.mode: RerankMode = mode or settings.reranker_ollama_mode
+        self.max_concurrency = max(1, max_concurrency or settings.reranker_ollama_max_concurrency)
+        self.batch_size = max(1, batch_size or settings.reranker_ollama_batch_size)
+        if deadline_ms is None:
+            deadline_ms = settings.reranker_ollama_deadline_ms
+        self.deadline_ms: int | None = deadline_ms if deadline_ms and deadline_ms > 0 else None
+        self.last_rerank_stats: dict[str, Any] = {}
 
         logger.info(
             "ollama_reranker_initialized",
             model=self.model,
             top_k=top_k,
             ollama_url=self.ollama_url,
+            mode=self.mode,
+            max_concurrency=self.max_concurrency,
+            batch_size=self.batch_size,
+            deadline_ms=self.deadline_ms,
         )
 
     async def rerank(
@@ -105,8 +151,9 @@ class OllamaReranker:
         """Rerank documents using Ollama reranker model.
 
         This method scores each document's relevance to the query using the
-        bge-reranker-v2-m3 model via Ollama's API. Documents are scored
-        independently and then sorted by relevance.
+        bge-reranker-v2-m3 model via Ollama's API. Depending on ``mode``,
+        documents are scored one call at a time, with bounded concurrency, or
+        several per call, and then sorted by relevance.
 
         Args:
             query: User query string
@@ -118,8 +165,9 @@ class OllamaReranker:
             Example: [(2, 0.95), (0, 0.87), (1, 0.23)]
 
         Fallback Behavior:
-            If reranking fails (API error, timeout, parse failure), returns
-            original ranking with inverse rank scores: [(0, 1.0), (1, 0.5), (2, 0.33)]
+            Documents whose scoring call fails get score 0.0. Documents not scored
+            before ``deadline_ms`` are appended after the scored ones in original
+            order with score 0.0 (partial ranking).
 
         Example:
             >>> reranker = OllamaReranker()
@@ -144,27 +192,74 @@ class OllamaReranker:
             top_k=k,
         )
 
-        # Score each document independently
-        scores: list[float] = []
-        for i, doc in enumerate(documents):
-            try:
-                score = await self._score_document(query, doc)
-                scores.append(score)
-            except Exception as e:
-                logger.warning(
-                    "ollama_rerank_document_failed",
-                    doc_index=i,
-                    error=str(e),
-                )
-                # Assign low score on failure
-                scores.append(0.0)
-
-        # Sort by score descending and return top-k
-        ranked = sorted(
-            enumerate(scores),
-            key=lambda x: x[1],
-            reverse=True,
-        )[:k]
+        start = time.perf_counter()
+        scores: list[float | None] = [None] * len(documents)
+        latencies_ms: list[float] = []
+
+        # Sprint 130 Feature 130.3: Build scoring units (1 doc or N docs per Ollama call)
+        if self.mode == "batch":
+            groups = [
+                list(range(offset, min(offset + self.batch_size, len(documents))))
+                for offset in range(0, len(documents), self.batch_size)
+            ]
+        else:
+            groups = [[i] for i in range(len(documents))]
+
+        concurrency = 1 if self.mode == "sequential" else self.max_concurrency
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def score_group(indices: list[int]) -> None:
+            async with semaphore:
+                call_start = time.perf_counter()
+                try:
+                    if len(indices) == 1 and self.mode != "batch":
+                        group_scores = [await self._score_document(query, documents[indices[0]])]
+                    else:
+                        group_scores = await self._score_documents_batch(
+                            query, [documents[i] for i in indices]
+                        )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(
+                        "ollama_rerank_document_failed",
+                        doc_index=indices[0] if len(indices) == 1 else indices,
+                        error=str(e),
+                    )
+                    # Assign low score on failure
+                    group_scores = [0.0] * len(indices)
+                call_ms = (time.perf_counter() - call_start) * 1000
+                latencies_ms.extend([call_ms / len(indices)] * len(indices))
+                for idx, score in zip(indices, group_scores, strict=False):
+                    scores[idx] = score
+
+        tasks = [asyncio.create_task(score_group(group)) for group in groups]
+        deadline_s = self.deadline_ms / 1000 if self.deadline_ms else None
+        _, pending = await asyncio.wait(tasks, timeout=deadline_s)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Scored documents sorted by score descending, then unscored (deadline) in
+        # original order so callers still receive a complete ranking
+        scored = [(i, s) for i, s in enumerate(scores) if s is not None]
+        unscored = [(i, 0.0) for i, s in enumerate(scores) if s is None]
+        ranked = (sorted(scored, key=lambda x: x[1], reverse=True) + unscored)[:k]
+
+        total_ms = (time.perf_counter() - start) * 1000
+        self.last_rerank_stats = {
+            "mode": self.mode,
+            "num_documents": len(documents),
+            "ollama_calls": len(groups),
+            "scored_documents": len(scored),
+            "deadline_exceeded": bool(unscored),
+            "total_ms": round(total_ms, 2),
+            "per_document_ms": round(total_ms / len(documents), 2),
+            "avg_call_ms_per_document": (
+                round(sum(latencies_ms) / len(latencies_ms), 2) if latencies_ms else None
+            ),
+        }
 
         logger.info(
             "ollama_rerank_completed",
@@ -172,6 +267,7 @@ class OllamaReranker:
             num_documents=len(documents),
             returned=len(ranked),
             top_score=ranked[0][1] if ranked else None,
+            **{k_: v for k_, v in self.last_rerank_stats.items() if k_ != "num_documents"},
         )
 
         return ranked
@@ -191,6 +287,59 @@ class OllamaReranker:
         """
         prompt = self._build_rerank_prompt(query, document)
 
+        logger.debug(
+            "ollama_rerank_request",
+            query=query[:30],
+            doc=document[:50],
+        )
+
+        response_text = await self._generate(prompt, num_predict=10)  # Only need a single number
+
+        # Parse score from response
+        score = self._parse_score(response_text)
+
+        logger.debug(
+            "ollama_rerank_response",
+            response=response_text[:100],
+            parsed_score=score,
+        )
+
+        return score
+
+    async def _score_documents_batch(self, query: str, documents: list[str]) -> list[float]:
+        """Score several query-document pairs in a single Ollama call.
+
+        Sprint 130 Feature 130.3: Multi-document prompt variant.
+
+        Args:
+            query: User query
+            documents: Document texts (scored together)
+
+        Returns:
+            Relevance scores (0.0 to 1.0), one per document in input order.
+            Passages missing from the response get the neutral score 0.5.
+
+        Raises:
+            Exception: If Ollama API call fails
+        """
+        prompt = self._build_batch_rerank_prompt(query, documents)
+        # ~8 tokens per "[n]: score" line
+        response_text = await self._generate(prompt, num_predict=8 * len(documents) + 8)
+        return self._parse_batch_scores(response_text, len(documents))
+
+    async def _generate(self, prompt: str, num_predict: int) -> str:
+        """Send a deterministic generate request to Ollama.
+
+        Args:
+            prompt: Prompt text
+            num_predict: Maximum tokens to generate
+
+        Returns:
+            Raw response text
+
+        Raises:
+            Exception: If Ollama API call fails
+        """
         async with aiohttp.ClientSession() as session:
             payload = {
                 "model": self.model,
@@ -198,16 +347,10 @@ class OllamaReranker:
                 "stream": False,
                 "options": {
                     "temperature": 0.0,  # Deterministic scoring
-                    "num_predict": 10,  # Only need a single number
+                    "num_predict": num_predict,
                 },
             }
 
-            logger.debug(
-                "ollama_rerank_request",
-                query=query[:30],
-                doc=document[:50],
-            )
-
             timeout = aiohttp.ClientTimeout(total=30)
             async with session.post(self.ollama_url, json=payload, timeout=timeout) as resp:
                 if resp.status != 200:
@@ -220,18 +363,7 @@ class OllamaReranker:
                     raise Exception(f"Ollama API returned status {resp.status}")
 
                 result = await resp.json()
-                response_text = result.get("response", "")
-
-                # Parse score from response
-                score = self._parse_score(response_text)
-
-                logger.debug(
-                    "ollama_rerank_response",
-                    response=response_text[:100],
-                    parsed_score=score,
-                )
-
-                return score
+                return result.get("response", "")
 
     def _build_rerank_prompt(self, query: str, document: str) -> str:
         """Build prompt for BGE reranker model.
@@ -262,6 +394,66 @@ class OllamaReranker:
         )
         return prompt
 
+    def _build_batch_rerank_prompt(self, query: str, documents: list[str]) -> str:
+        """Build multi-passage prompt scoring all documents in one call.
+
+        Args:
+            query: User query
+            documents: Document texts (each truncated to 500 chars)
+
+        Returns:
+            Formatted prompt string
+        """
+        passages = "\n\n".join(
+            f"[{i}] " + (doc[:500] + "..." if len(doc) > 500 else doc)
+            for i, doc in enumerate(documents, start=1)
+        )
+
+        prompt = (
+            "Given the following query and numbered passages, rate the relevance of "
+            "EACH passage to the query on a scale from 0 to 10, where:\n"
+            "- 0 = completely irrelevant\n"
+            "- 5 = somewhat relevant\n"
+            "- 10 = highly relevant and directly answers the query\n\n"
+            f"Query: {query}\n\n"
+            f"Passages:\n{passages}\n\n"
+            "Respond with ONLY one line per passage in the format [number]: score. "
+            "No explanation needed.\n\n"
+            "Relevance Scores:"
+        )
+        return prompt
+
+    def _parse_batch_scores(self, response: str, num_docs: int) -> list[float]:
+        """Parse per-passage scores from a batch response.
+
+        Args:
+            response: Raw response text from Ollama
+            num_docs: Number of passages in the prompt
+
+        Returns:
+            Normalized scores (0.0 to 1.0) in passage order, 0.5 for missing passages
+
+        Example:
+            >>> reranker._parse_batch_scores("[1]: 8\n[2]: 3", 3)
+            [0.8, 0.3, 0.5]
+        """
+        scores = [0.5] * num_docs
+        found = 0
+        for match in _BATCH_SCORE_PATTERN.finditer(response):
+            idx = int(match.group(1)) - 1
+            if 0 <= idx < num_docs:
+                scores[idx] = min(max(float(match.group(2)) / 10.0, 0.0), 1.0)
+                found += 1
+
+        if found < num_docs:
+            logger.warning(
+                "ollama_rerank_batch_parse_incomplete",
+                expected=num_docs,
+                parsed=found,
+                response=response[:100],
+            )
+        return scores
+
     def _parse_score(self, response: str) -> float:
         """Parse relevance score from model response.
 
@@ -284,8 +476,6 @@ class OllamaReranker:
         """
         try:
             # Extract first number from response
-            import re
-
             # Try to find a decimal number (e.g., "7.5" or "8")
             # Also handle negative numbers
             match = re.search(r"-?\d+\.?\d*", response.strip())
@@ -334,6 +524,10 @@ class OllamaReranker:
             "top_k": self.top_k,
             "ollama_url": self.ollama_url,
             "backend": "ollama",
+            "mode": self.mode,
+            "max_concurrency": self.max_concurrency,
+            "batch_size": self.batch_size,
+            "deadline_ms": self.deadline_ms,
         }
 
 
@@ -6,6 +6,9 @@ This module implements a two-tier caching strategy:
 1. Exact match cache: Normalized query strings (lowercase, stemmed)
 2. Semantic cache: Embed query and find similar queries (cosine similarity > 0.95)
 
+Sprint 130 Feature 130.1: The semantic tier is backed by SemanticCacheIndex
+(one pre-normalized NumPy matrix per namespace-set, matrix-vector top-1 lookup).
+
 Cache hit rate target: >50%
 Expected latency reduction: 50-80% for cached queries
 """
@@ -18,6 +21,9 @@ from typing import Any
 import structlog
 from cachetools import TTLCache
 
+from src.components.retrieval.query_embedding import QueryEmbeddingContext
+from src.components.retrieval.semantic_cache_index import SemanticCacheIndex
+
 logger = structlog.get_logger(__name__)
 
 # Cache configuration
@@ -77,11 +83,9 @@ class QueryCache:
         # Tier 1: Exact match cache (normalized query → results)
         self.exact_cache: TTLCache = TTLCache(maxsize=exact_cache_size, ttl=ttl_seconds)
 
-        # Tier 2: Semantic cache (query embedding → results)
-        self.semantic_cache: TTLCache = TTLCache(maxsize=semantic_cache_size, ttl=ttl_seconds)
-
-        # Embedding cache (query → embedding vector)
-        self.embedding_cache: dict[str, list[float]] = {}
+        # Tier 2: Semantic cache (namespace-set → normalized embedding matrix → results)
+        # Sprint 130 Feature 130.1: Replaces TTLCache + unbounded embedding dict
+        self.semantic_cache = SemanticCacheIndex(maxsize=semantic_cache_size, ttl=ttl_seconds)
 
         self.ttl_seconds = ttl_seconds
         self.semantic_threshold = semantic_threshold
@@ -138,13 +142,25 @@ class QueryCache:
         Returns:
             Cache key string
         """
-        ns_str = ",".join(sorted(namespaces)) if namespaces else "default"
-        return f"{query}|{ns_str}"
+        return f"{query}|{self._namespace_key(namespaces)}"
+
+    @staticmethod
+    def _namespace_key(namespaces: list[str] | None = None) -> str:
+        """Build namespace-set key used to partition the semantic index.
+
+        Args:
+            namespaces: Namespace list (sorted for consistency)
+
+        Returns:
+            Namespace-set key string
+        """
+        return ",".join(sorted(namespaces)) if namespaces else "default"
 
     async def get(
         self,
         query: str,
         namespaces: list[str] | None = None,
+        query_embedding: QueryEmbeddingContext | None = None,
     ) -> dict[str, Any] | None:
         """Get cached results for query.
 
@@ -153,6 +169,9 @@ class QueryCache:
         Args:
             query: User query
             namespaces: Namespaces to search in
+            query_embedding: Request-scoped embedding context (Sprint 130 Feature 130.2).
+                The semantic lookup computes the embedding once and leaves it in the
+                context for the retrieval channels and ``set()``.
 
         Returns:
             Cached results dict or None if not found
@@ -181,7 +200,7 @@ class QueryCache:
             }
 
         # Tier 2: Semantic match (if embedding service available)
-        semantic_result = await self._semantic_match(query, namespaces)
+        semantic_result = await self._semantic_match(query, namespaces, query_embedding)
         if semantic_result:
             self.hits_semantic += 1
             logger.info(
@@ -213,6 +232,7 @@ class QueryCache:
         results: list[dict[str, Any]],
         metadata: dict[str, Any],
         namespaces: list[str] | None = None,
+        query_embedding: QueryEmbeddingContext | None = None,
     ) -> None:
         """Store results in cache.
 
@@ -221,6 +241,7 @@ class QueryCache:
             results: Search results
             metadata: Search metadata
             namespaces: Namespaces searched
+            query_embedding: Request-scoped embedding context (reused if already computed)
         """
         import time
 
@@ -240,7 +261,7 @@ class QueryCache:
         self.exact_cache[cache_key] = cached
 
         # Store embedding in semantic cache
-        await self._store_semantic(query, cached, namespaces)
+        await self._store_semantic(query, cached, namespaces, query_embedding)
 
         logger.debug(
             "query_cache_set",
@@ -253,61 +274,39 @@ class QueryCache:
         self,
         query: str,
         namespaces: list[str] | None = None,
+        query_embedding: QueryEmbeddingContext | None = None,
     ) -> dict[str, Any] | None:
         """Find semantically similar cached query.
 
         Args:
             query: User query
             namespaces: Namespaces to match
+            query_embedding: Request-scoped embedding context
 
         Returns:
             Cached results if similar query found, else None
         """
         try:
-            # Get query embedding
-            from src.components.shared.embedding_service import get_embedding_service
-
-            embedding_service = get_embedding_service()
-            # Sprint 92 Fix: Handle both list (Ollama/ST) and dict (FlagEmbedding) returns
-            embedding_result = await embedding_service.embed_single(query)
-            query_embedding = (
-                embedding_result["dense"]
-                if isinstance(embedding_result, dict)
-                else embedding_result
+            # Sprint 130 Feature 130.2: Reuse the request's single embedding pass
+            if query_embedding is None:
+                query_embedding = QueryEmbeddingContext(query)
+            dense_embedding = await query_embedding.get_dense()
+
+            # Sprint 130 Feature 130.1: Vectorized top-1 lookup in namespace-set matrix
+            # (entries below the threshold are not touched, so misses don't skew LRU)
+            match = self.semantic_cache.best_match(
+                self._namespace_key(namespaces),
+                dense_embedding,
+                min_similarity=self.semantic_threshold,
             )
+            if match is None or not match.value:
+                return None
 
-            # Find most similar cached query
-            best_similarity = 0.0
-            best_cached = None
-
-            for cached_key, cached_entry in self.semantic_cache.items():
-                # Check namespace match
-                if namespaces:
-                    cached_ns = cached_key.split("|")[1] if "|" in cached_key else "default"
-                    current_ns = ",".join(sorted(namespaces))
-                    if cached_ns != current_ns:
-                        continue
-
-                # Compute cosine similarity
-                cached_embedding = self.embedding_cache.get(cached_key)
-                if not cached_embedding:
-                    continue
-
-                similarity = self._cosine_similarity(query_embedding, cached_embedding)
-
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_cached = cached_entry
-
-            # Return if above threshold
-            if best_similarity >= self.semantic_threshold and best_cached:
-                return {
-                    "results": best_cached.results,
-                    "metadata": best_cached.metadata,
-                    "similarity": best_similarity,
-                }
-
-            return None
+            return {
+                "results": match.value.results,
+                "metadata": match.value.metadata,
+                "similarity": match.similarity,
+            }
 
         except Exception as e:
             logger.warning("semantic_cache_lookup_failed", error=str(e))
@@ -318,6 +317,7 @@ class QueryCache:
         query: str,
         cached: CachedResult,
         namespaces: list[str] | None = None,
+        query_embedding: QueryEmbeddingContext | None = None,
     ) -> None:
         """Store query embedding in semantic cache.
 
@@ -325,26 +325,21 @@ class QueryCache:
             query: User query
             cached: Cached result entry
             namespaces: Namespaces
+            query_embedding: Request-scoped embedding context
         """
         try:
-            # Get query embedding
-            from src.components.shared.embedding_service import get_embedding_service
-
-            embedding_service = get_embedding_service()
-            # Sprint 92 Fix: Handle both list (Ollama/ST) and dict (FlagEmbedding) returns
-            embedding_result = await embedding_service.embed_single(query)
-            query_embedding = (
-                embedding_result["dense"]
-                if isinstance(embedding_result, dict)
-                else embedding_result
-            )
+            # Sprint 130 Feature 130.2: Reuse the request's single embedding pass
+            if query_embedding is None:
+                query_embedding = QueryEmbeddingContext(query)
+            dense_embedding = await query_embedding.get_dense()
 
             # Build cache key
             cache_key = self._build_cache_key(cached.query_normalized, namespaces)
 
-            # Store in semantic cache
-            self.semantic_cache[cache_key] = cached
-            self.embedding_cache[cache_key] = query_embedding
+            # Store in semantic cache (slot reuse on TTL/LRU eviction)
+            self.semantic_cache.put(
+                cache_key, self._namespace_key(namespaces), dense_embedding, cached
+            )
 
         except Exception as e:
             logger.warning("semantic_cache_store_failed", error=str(e))
@@ -401,13 +396,13 @@ class QueryCache:
             "semantic_cache_size": len(self.semantic_cache),
             "exact_cache_maxsize": self.exact_cache.maxsize,
             "semantic_cache_maxsize": self.semantic_cache.maxsize,
+            "semantic_index": self.semantic_cache.get_stats(),
         }
 
     def clear(self) -> None:
         """Clear all caches."""
         self.exact_cache.clear()
         self.semantic_cache.clear()
-        self.embedding_cache.clear()
         self.hits_exact = 0
         self.hits_semantic = 0
         self.misses = 0
@@ -0,0 +1,132 @@
+"""Per-request query embedding context.
+
+Sprint 130 Feature 130.2: Single Embedding Pass per Request
+
+Before this feature a single cache-miss search embedded the same query three
+times: QueryCache.get (semantic lookup), MultiVectorHybridSearch.hybrid_search
+(dense + sparse Qdrant prefetch) and QueryCache.set (semantic store).
+
+QueryEmbeddingContext computes the BGE-M3 output (dense + sparse) lazily,
+exactly once, and is passed through every consumer of the request:
+
+    ctx = QueryEmbeddingContext(query)
+    await cache.get(query, namespaces, query_embedding=ctx)        # embeds (1)
+    await multi_vector_search.hybrid_search(query, query_embedding=ctx)  # reuses
+    await cache.set(query, results, metadata, query_embedding=ctx)  # reuses
+    ctx.embed_calls  # -> 1
+
+Exact cache hits never trigger the embedding at all (0 embeddings).
+The per-request count is exported as the ``aegis_query_embeddings_per_request``
+histogram so the p50 path can be verified in Grafana.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class QueryEmbedding:
+    """BGE-M3 output for a query.
+
+    Attributes:
+        dense: Dense vector (1024-dim semantic)
+        sparse: Sparse lexical weights {token_id: weight} (None if backend is dense-only)
+        latency_ms: Time spent computing the embedding
+    """
+
+    dense: list[float]
+    sparse: dict[int, float] | None
+    latency_ms: float
+
+
+class QueryEmbeddingContext:
+    """Lazily computed, request-scoped query embedding.
+
+    Concurrent consumers (e.g. parallel retrieval channels) share one
+    computation: the first caller embeds, the others await the same result.
+
+    Attributes:
+        query: Query text the embedding belongs to
+        embed_calls: Number of embedding service calls made for this request
+    """
+
+    def __init__(self, query: str, embedding_service: Any | None = None):
+        """Initialize query embedding context.
+
+        Args:
+            query: Query text
+            embedding_service: Embedding service (default: configured backend)
+        """
+        self.query = query
+        self.embed_calls = 0
+        self._embedding_service = embedding_service
+        self._embedding: QueryEmbedding | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_computed(self) -> bool:
+        """Whether the embedding has already been computed."""
+        return self._embedding is not None
+
+    def _get_embedding_service(self) -> Any:
+        if self._embedding_service is None:
+            from src.components.shared.embedding_service import get_embedding_service
+
+            self._embedding_service = get_embedding_service()
+        return self._embedding_service
+
+    async def get(self) -> QueryEmbedding:
+        """Return the query embedding, computing it on first use.
+
+        Returns:
+            QueryEmbedding with dense (and sparse, if available) vectors
+        """
+        if self._embedding is not None:
+            return self._embedding
+
+        async with self._lock:
+            if self._embedding is not None:
+                return self._embedding
+
+            start = time.perf_counter()
+            # Sprint 92 Fix: Handle both list (Ollama/ST) and dict (FlagEmbedding) returns
+            result = await self._get_embedding_service().embed_single(self.query)
+            self.embed_calls += 1
+
+            if isinstance(result, dict):
+                dense = result["dense"]
+                sparse = result.get("sparse")
+            else:
+                dense = result
+                sparse = None
+
+            self._embedding = QueryEmbedding(
+                dense=dense,
+                sparse=sparse,
+                latency_ms=(time.perf_counter() - start) * 1000,
+            )
+
+            logger.debug(
+                "query_embedding_computed",
+                query=self.query[:50],
+                latency_ms=round(self._embedding.latency_ms, 2),
+                has_sparse=sparse is not None,
+            )
+
+        return self._embedding
+
+    async def get_dense(self) -> list[float]:
+        """Return the dense query vector."""
+        return (await self.get()).dense
+
+    def record_metrics(self) -> None:
+        """Export the number of embedding calls made for this request."""
+        from src.core.metrics import track_query_embeddings
+
+        track_query_embeddings(self.embed_calls)
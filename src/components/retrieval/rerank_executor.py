@@ -0,0 +1,100 @@
+"""Off-event-loop, micro-batched cross-encoder inference.
+
+Sprint 130 Feature 130.4: Rerank Executor
+
+``CrossEncoder.predict`` is a synchronous forward pass. Calling it directly
+inside ``async def rerank`` blocked the FastAPI event loop for the whole
+pass, so every other endpoint stalled while a chat request was reranking.
+
+RerankExecutor moves inference to a dedicated worker thread (torch releases
+the GIL during the forward pass) and coalesces query-document pairs from
+concurrent requests into shared batches:
+
+    request A (20 pairs) ─┐
+    request B (20 pairs) ─┼─ window (5ms) ─→ predict(60 pairs) ─→ split per request
+    request C (20 pairs) ─┘
+
+Batches are flushed when the window elapses or ``max_batch_pairs`` is reached.
+One worker thread per executor keeps GPU/CPU inference serialized (the model
+is not thread-safe) while the event loop stays free. The batching itself is
+implemented by MicroBatchExecutor.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from src.components.retrieval.micro_batch_executor import MicroBatchExecutor
+
+PredictFn = Callable[[list[tuple[str, str]]], Sequence[float]]
+
+
+class RerankExecutor(MicroBatchExecutor[tuple[str, str], float]):
+    """Micro-batching executor for cross-encoder scoring.
+
+    Example:
+        executor = RerankExecutor(lambda pairs: model.predict(pairs, batch_size=32))
+        scores = await executor.score([("query", "doc text"), ...])
+    """
+
+    def __init__(
+        self,
+        predict_fn: PredictFn,
+        batch_window_ms: float = 5.0,
+        max_batch_pairs: int = 256,
+        name: str = "cross_encoder",
+    ) -> None:
+        """Initialize rerank executor.
+
+        Args:
+            predict_fn: Synchronous scoring function (runs in the worker thread)
+            batch_window_ms: Time to wait for more requests before flushing a batch
+            max_batch_pairs: Flush immediately once this many pairs are queued
+            name: Executor name (logging / thread name)
+        """
+        super().__init__(
+            predict_fn,
+            batch_window_ms=batch_window_ms,
+            max_batch_items=max_batch_pairs,
+            name=name,
+            thread_name_prefix=f"rerank-{name}",
+        )
+
+    @property
+    def max_batch_pairs(self) -> int:
+        """Flush threshold in query-document pairs."""
+        return self.max_batch_items
+
+    @property
+    def pairs_scored(self) -> int:
+        """Total number of pairs scored."""
+        return self.items_processed
+
+    async def score(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """Score query-document pairs in a shared batch.
+
+        Args:
+            pairs: (query, document) pairs
+
+        Returns:
+            Raw cross-encoder scores, one per pair in input order
+        """
+        return [float(s) for s in await self.submit(pairs)]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics.
+
+        Returns:
+            Stats dict with batch counts and average batch size / latency
+        """
+        stats = super().get_stats()
+        return {
+            "batches": stats["batches"],
+            "requests": stats["requests"],
+            "pairs_scored": stats["items_processed"],
+            "avg_requests_per_batch": stats["avg_requests_per_batch"],
+            "avg_pairs_per_batch": stats["avg_items_per_batch"],
+            "avg_inference_ms": stats["avg_inference_ms"],
+            "avg_queue_wait_ms": stats["avg_queue_wait_ms"],
+            "batch_window_ms": stats["batch_window_ms"],
+            "max_batch_pairs": stats["max_batch_items"],
+        }
@@ -5,6 +5,8 @@ Reranking improves precision by scoring query-document pairs more accurately
 than vector similarity alone.
 
 Sprint 67 Feature 67.8: Adaptive Reranker v1 with intent-aware weights.
+Sprint 130 Feature 130.4: Inference runs off the event loop via RerankExecutor
+(micro-batched across concurrent requests), in parallel with intent classification.
 
 Typical usage:
     reranker = CrossEncoderReranker()
@@ -17,6 +19,7 @@ Typical usage:
 
 from __future__ import annotations
 
+import asyncio
 import time
 from collections.abc import Sequence
 from dataclasses import dataclass
@@ -26,6 +29,7 @@ from typing import TYPE_CHECKING, Any
 import structlog
 from pydantic import BaseModel, Field
 
+from src.components.retrieval.rerank_executor import RerankExecutor
 from src.core.config import settings
 
 # Sprint 24 Feature 24.15: Lazy import for optional reranking dependency
@@ -234,6 +238,7 @@ class CrossEncoderReranker:
         batch_size: int = 32,
         cache_dir: str | None = None,
         use_adaptive_weights: bool = True,
+        offload_inference: bool | None = None,
     ) -> None:
         """Initialize reranker.
 
@@ -243,6 +248,8 @@ class CrossEncoderReranker:
             batch_size: Batch size for scoring (default: 32)
             cache_dir: Model cache directory (default: ./data/models)
             use_adaptive_weights: Enable intent-aware adaptive weights (Sprint 67.8)
+            offload_inference: Score via micro-batched worker thread (Sprint 130.4)
+                               Defaults to settings.reranker_offload_enabled
         """
         self.model_name = model_name or settings.reranker_model
         self.batch_size = batch_size
@@ -255,12 +262,19 @@ class CrossEncoderReranker:
 
         self._model: CrossEncoder | None = None
 
+        # Sprint 130.4: Micro-batched, off-event-loop inference (lazy-created)
+        self.offload_inference = (
+            settings.reranker_offload_enabled if offload_inference is None else offload_inference
+        )
+        self._executor: RerankExecutor | None = None
+
         logger.info(
             "initialized_reranker",
             model=self.model_name,
             batch_size=self.batch_size,
             cache_dir=str(self.cache_dir),
             adaptive_weights=self.use_adaptive_weights,
+            offload_inference=self.offload_inference,
         )
 
     @property
@@ -314,6 +328,42 @@ class CrossEncoderReranker:
             logger.info("cross_encoder_model_loaded", model=self.model_name)
         return self._model
 
+    @property
+    def executor(self) -> RerankExecutor:
+        """Lazy-create the micro-batching rerank executor.
+
+        Sprint 130.4: The model is loaded (first access) and used inside the
+        executor's worker thread, so neither loading nor inference blocks the
+        event loop.
+
+        Returns:
+            RerankExecutor bound to this reranker's model
+        """
+        if self._executor is None:
+            self._executor = RerankExecutor(
+                predict_fn=self._predict_sync,
+                batch_window_ms=settings.reranker_batch_window_ms,
+                max_batch_pairs=settings.reranker_max_batch_pairs,
+                name=self.model_name.rsplit("/", 1)[-1],
+            )
+        return self._executor
+
+    def _predict_sync(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """Score pairs synchronously (runs in the executor worker thread)."""
+        return [float(s) for s in self.model.predict(pairs, batch_size=self.batch_size)]
+
+    async def _score_pairs(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """Score query-document pairs, off the event loop if offloading is enabled."""
+        if self.offload_inference:
+            return await self.executor.score(pairs)
+        # Legacy path: synchronous predict on the event loop
+        return list(self.model.predict(pairs, batch_size=self.batch_size))
+
+    async def _classify_intent(self, query: str) -> Any:
+        """Classify query intent for adaptive weighting (Sprint 67.8)."""
+        classifier = self._get_intent_classifier()
+        return await classifier.classify(query)
+
     def _get_intent_classifier(self) -> Any:
         """Lazy-load intent classifier for adaptive reranking.
 
@@ -381,6 +431,7 @@ class CrossEncoderReranker:
         score_threshold: float | None = None,
         section_filter: str | list[str] | None = None,
         section_boost: float = 0.1,
+        intent_result: Any = None,
     ) -> list[RerankResult]:
         """Rerank documents using cross-encoder model with optional section boost.
 
@@ -395,6 +446,8 @@ class CrossEncoderReranker:
                 - Single section: "1.2"
                 - Multiple sections: ["1.1", "1.2", "2.1"]
             section_boost: Boost to add for matching sections (0.0 - 0.5, default: 0.1)
+            intent_result: IntentClassificationResult the caller already computed for
+                this query (skips re-classification for adaptive weights)
 
         Returns:
             Reranked results sorted by relevance (highest first)
@@ -428,16 +481,34 @@ class CrossEncoderReranker:
         )
 
         # Sprint 67.8: Classify query intent for adaptive weighting
+        # Sprint 130.4: Intent classification runs concurrently with cross-encoder scoring
         intent_str = "default"
         weights = INTENT_RERANK_WEIGHTS["default"]
         intent_latency_ms = 0.0
 
+        intent_task: asyncio.Task | None = None
+        intent_start = time.perf_counter()
+        if self.use_adaptive_weights and intent_result is None:
+            intent_task = asyncio.create_task(self._classify_intent(query))
+
+        # Prepare query-document pairs for cross-encoder
+        pairs = [(query, doc.get("text", "")) for doc in documents]
+
+        # Score all pairs in the rerank executor (worker thread, coalesced batches)
+        crossenc_start = time.perf_counter()
+        try:
+            rerank_scores = await self._score_pairs(pairs)
+        except BaseException:
+            if intent_task is not None:
+                intent_task.cancel()
+            raise
+        crossenc_latency_ms = (time.perf_counter() - crossenc_start) * 1000
+
         if self.use_adaptive_weights:
             try:
-                intent_start = time.perf_counter()
-                classifier = self._get_intent_classifier()
-                intent_result = await classifier.classify(query)
-                intent_latency_ms = (time.perf_counter() - intent_start) * 1000
+                if intent_task is not None:
+                    intent_result = await intent_task
+                    intent_latency_ms = (time.perf_counter() - intent_start) * 1000
 
                 # Map intent classifier result to rerank weight profile
                 intent_str = intent_result.intent.value
@@ -462,15 +533,6 @@ class CrossEncoderReranker:
                 )
                 # Continue with default weights on failure
 
-        # Prepare query-document pairs for cross-encoder
-        pairs = [(query, doc.get("text", "")) for doc in documents]
-
-        # Score all pairs (blocking operation, but fast on CPU)
-        # Note: sentence-transformers CrossEncoder.predict() is synchronous
-        crossenc_start = time.perf_counter()
-        rerank_scores = self.model.predict(pairs, batch_size=self.batch_size)
-        crossenc_latency_ms = (time.perf_counter() - crossenc_start) * 1000
-
         # Apply section boost if section_filter provided (Sprint 62.5)
         if section_filter is not None:
             # Normalize section_filter to list
@@ -648,4 +710,6 @@ class CrossEncoderReranker:
             "is_loaded": self._model is not None,
             "adaptive_weights_enabled": self.use_adaptive_weights,
             "intent_classifier_loaded": self._intent_classifier is not None,
+            "offload_inference": self.offload_inference,
+            "executor": self._executor.get_stats() if self._executor else None,
         }
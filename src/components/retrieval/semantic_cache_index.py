@@ -0,0 +1,313 @@
+"""Vectorized ANN index for the semantic tier of QueryCache.
+
+Sprint 130 Feature 130.1: Semantic Cache Matrix Index
+
+The semantic tier previously walked every cached entry and computed cosine
+similarity with a pure-Python loop over 1024-dim lists (O(N·d) interpreted
+work per cache miss). This module replaces that loop with one contiguous,
+pre-normalized float32 matrix per namespace-set so the top-1 lookup is a
+single matrix-vector product.
+
+Design:
+- One ``_NamespaceMatrix`` per namespace-set key ("default", "a,b", ...)
+- Rows are L2-normalized on insert -> cosine similarity == dot product
+- Freed rows (TTL expiry, LRU eviction, overwrite) go to a free list and
+  are reused by the next insert, so the matrix never fragments
+- Capacity grows by doubling up to ``maxsize`` (shared across namespaces)
+- TTL is enforced lazily: expired rows are masked out of lookups and
+  reclaimed on the next insert or lookup in that namespace-set
+
+Performance (1024-dim, CPU, see tests/benchmarks/test_query_cache_performance.py):
+- 500 entries: ~0.1ms per lookup (vs ~60ms pure-Python loop)
+- 5k entries: ~1ms per lookup
+- 50k entries: ~17ms per lookup
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Initial row capacity per namespace-set matrix (grows by doubling)
+INITIAL_CAPACITY = 64
+
+
+@dataclass
+class SemanticMatch:
+    """Best semantic match for a query embedding."""
+
+    key: str
+    value: Any
+    similarity: float
+
+
+class _NamespaceMatrix:
+    """Contiguous embedding matrix for one namespace-set.
+
+    Attributes:
+        dim: Embedding dimensionality
+        vectors: (capacity, dim) float32 matrix of L2-normalized embeddings
+        expires_at: Per-row expiry timestamp (-inf marks a free row)
+        last_used: Per-row last access timestamp (LRU ordering)
+        keys: Per-row cache key (None for free rows)
+        values: Per-row cached value (None for free rows)
+        slot_of: Cache key -> row index
+        free_slots: Stack of reusable row indices below ``high_water``
+        high_water: Number of rows ever handed out (rows >= high_water are unused)
+    """
+
+    def __init__(self, dim: int, capacity: int):
+        self.dim = dim
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.expires_at = np.full(capacity, -np.inf, dtype=np.float64)
+        self.last_used = np.zeros(capacity, dtype=np.float64)
+        self.keys: list[str | None] = [None] * capacity
+        self.values: list[Any] = [None] * capacity
+        self.slot_of: dict[str, int] = {}
+        self.free_slots: list[int] = []
+        self.high_water = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.vectors.shape[0]
+
+    def __len__(self) -> int:
+        return len(self.slot_of)
+
+    def _grow(self, new_capacity: int) -> None:
+        """Grow row capacity, preserving existing rows."""
+        extra = new_capacity - self.capacity
+        self.vectors = np.vstack([self.vectors, np.zeros((extra, self.dim), dtype=np.float32)])
+        self.expires_at = np.concatenate(
+            [self.expires_at, np.full(extra, -np.inf, dtype=np.float64)]
+        )
+        self.last_used = np.concatenate([self.last_used, np.zeros(extra, dtype=np.float64)])
+        self.keys.extend([None] * extra)
+        self.values.extend([None] * extra)
+
+    def allocate(self, max_capacity: int) -> int:
+        """Return a free row index, growing the matrix if needed."""
+        if self.free_slots:
+            return self.free_slots.pop()
+        if self.high_water >= self.capacity:
+            self._grow(min(max(self.capacity * 2, 1), max(max_capacity, self.capacity + 1)))
+        slot = self.high_water
+        self.high_water += 1
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Free a row for reuse."""
+        key = self.keys[slot]
+        if key is not None:
+            self.slot_of.pop(key, None)
+        self.keys[slot] = None
+        self.values[slot] = None
+        self.expires_at[slot] = -np.inf
+        self.free_slots.append(slot)
+
+    def expire(self, now: float) -> int:
+        """Release all rows whose TTL has passed. Returns number released."""
+        live = self.expires_at[: self.high_water]
+        expired = np.flatnonzero((live != -np.inf) & (live <= now))
+        for slot in expired.tolist():
+            self.release(slot)
+        return len(expired)
+
+    def lru_slot(self) -> tuple[int, float] | None:
+        """Return (slot, last_used) of the least recently used live row."""
+        if not self.slot_of:
+            return None
+        used = self.last_used[: self.high_water]
+        masked = np.where(self.expires_at[: self.high_water] == -np.inf, np.inf, used)
+        slot = int(np.argmin(masked))
+        return slot, float(masked[slot])
+
+
+class SemanticCacheIndex:
+    """Namespace-partitioned cosine-similarity index with TTL + LRU eviction.
+
+    Drop-in replacement for the ``TTLCache`` + ``embedding_cache`` pair that
+    previously backed the semantic tier of ``QueryCache``.
+
+    Example:
+        index = SemanticCacheIndex(maxsize=500, ttl=3600)
+        index.put("what is rag|default", "default", embedding, cached_result)
+        match = index.best_match("default", query_embedding)
+        if match and match.similarity >= 0.95:
+            return match.value
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize semantic cache index.
+
+        Args:
+            maxsize: Maximum number of entries across all namespace-sets
+                (<= 0 disables the index: put() stores nothing)
+            ttl: Time-to-live for entries in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._matrices: dict[str, _NamespaceMatrix] = {}
+        self.evictions_ttl = 0
+        self.evictions_lru = 0
+
+    def __len__(self) -> int:
+        return sum(len(m) for m in self._matrices.values())
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in m.slot_of for m in self._matrices.values())
+
+    @staticmethod
+    def _normalize(embedding: list[float] | np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return vector
+        return vector / norm
+
+    def _expire_all(self, now: float) -> None:
+        for matrix in self._matrices.values():
+            self.evictions_ttl += matrix.expire(now)
+
+    def _evict_lru(self) -> None:
+        """Evict the globally least recently used entry."""
+        victim: tuple[_NamespaceMatrix, int] | None = None
+        oldest = np.inf
+        for matrix in self._matrices.values():
+            candidate = matrix.lru_slot()
+            if candidate is not None and candidate[1] < oldest:
+                oldest = candidate[1]
+                victim = (matrix, candidate[0])
+        if victim is not None:
+            victim[0].release(victim[1])
+            self.evictions_lru += 1
+
+    def put(
+        self,
+        key: str,
+        namespace_key: str,
+        embedding: list[float] | np.ndarray,
+        value: Any,
+    ) -> None:
+        """Insert or overwrite an entry.
+
+        Args:
+            key: Cache key (unique across namespace-sets)
+            namespace_key: Namespace-set partition key
+            embedding: Query embedding (normalized on insert)
+            value: Cached value returned on match
+        """
+        if self.maxsize <= 0:
+            return
+
+        vector = self._normalize(embedding)
+        now = time.monotonic()
+
+        matrix = self._matrices.get(namespace_key)
+        if matrix is not None and matrix.dim != vector.shape[0]:
+            # Embedding model changed dimensionality - drop stale partition
+            logger.warning(
+                "semantic_cache_dim_mismatch",
+                namespace_key=namespace_key,
+                old_dim=matrix.dim,
+                new_dim=vector.shape[0],
+            )
+            del self._matrices[namespace_key]
+            matrix = None
+
+        if matrix is None:
+            matrix = _NamespaceMatrix(
+                dim=vector.shape[0],
+                capacity=max(1, min(INITIAL_CAPACITY, self.maxsize)),
+            )
+            self._matrices[namespace_key] = matrix
+
+        slot = matrix.slot_of.get(key)
+        if slot is None:
+            if len(self) >= self.maxsize:
+                self._expire_all(now)
+            while len(self) >= self.maxsize:
+                self._evict_lru()
+            slot = matrix.allocate(self.maxsize)
+
+        matrix.vectors[slot] = vector
+        matrix.expires_at[slot] = now + self.ttl
+        matrix.last_used[slot] = now
+        matrix.keys[slot] = key
+        matrix.values[slot] = value
+        matrix.slot_of[key] = slot
+
+    def best_match(
+        self,
+        namespace_key: str,
+        embedding: list[float] | np.ndarray,
+        min_similarity: float | None = None,
+    ) -> SemanticMatch | None:
+        """Return the most similar live entry in a namespace-set (top-1).
+
+        Only a returned match counts as a use for LRU eviction, so near misses
+        below ``min_similarity`` do not keep entries alive.
+
+        Args:
+            namespace_key: Namespace-set partition key
+            embedding: Query embedding
+            min_similarity: Cosine similarity a match must reach (default: any)
+
+        Returns:
+            SemanticMatch or None if the partition is empty or nothing is similar enough
+        """
+        matrix = self._matrices.get(namespace_key)
+        if matrix is None or not matrix.slot_of:
+            return None
+
+        query = self._normalize(embedding)
+        if query.shape[0] != matrix.dim:
+            return None
+
+        now = time.monotonic()
+        n = matrix.high_water
+        scores = matrix.vectors[:n] @ query
+        expires = matrix.expires_at[:n]
+        live = expires > now
+        if not live.all():
+            # Reclaim expired rows lazily (free rows already hold -inf)
+            self.evictions_ttl += matrix.expire(now)
+            if not live.any():
+                return None
+            scores = np.where(live, scores, -np.inf)
+
+        slot = int(np.argmax(scores))
+        similarity = float(scores[slot])
+        if min_similarity is not None and similarity < min_similarity:
+            return None
+
+        matrix.last_used[slot] = now
+        return SemanticMatch(
+            key=matrix.keys[slot],  # type: ignore[arg-type]
+            value=matrix.values[slot],
+            similarity=similarity,
+        )
+
+    def clear(self) -> None:
+        """Drop all entries and partitions."""
+        self._matrices.clear()
+        self.evictions_ttl = 0
+        self.evictions_lru = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index statistics.
+
+        Returns:
+            Stats dict with partition sizes and eviction counters
+        """
+        return {
+            "partitions": len(self._matrices),
+            "entries": len(self),
+            "allocated_rows": sum(m.capacity for m in self._matrices.values()),
+            "evictions_ttl": self.evictions_ttl,
+            "evictions_lru": self.evictions_lru,
+        }
@@ -0,0 +1,352 @@
+"""Process-wide BGE-M3 model registry.
+
+BGE-M3 (~2GB) used to be loaded twice per process: once by FlagEmbeddingService
+(dense + sparse) and once by RecursiveLLMProcessor for ColBERT scoring, which
+also called ``encode`` synchronously on the event loop. This registry owns the
+single model instance per (model, device, precision) and serves all three
+output types from it:
+
+- ``get_model()``: Thread-safe lazy load (double-checked locking)
+- ``run()`` / ``encode()``: Off-loop execution on one dedicated worker thread.
+  Encodes against the shared model are serialized, which also keeps the
+  HuggingFace tokenizer from being used concurrently ("Already borrowed").
+- ``colbert_vectors()``: ColBERT token matrices with a byte-bounded LRU keyed by
+  text hash, so repeated dives into the same document skip re-encoding.
+  Matrices are stored as float16 (~1KB per token).
+
+Example:
+    >>> registry = get_bge_m3_registry()
+    >>> output = await registry.encode(["Hello world"], return_colbert_vecs=True)
+    >>> matrices = await registry.colbert_vectors(["query", "segment text"])
+    >>> matrices[1].shape
+    (5, 1024)
+"""
+
+import asyncio
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MODEL_NAME = "BAAI/bge-m3"
+
+
+def resolve_device(device: str) -> str:
+    """Resolve 'auto' to 'cuda' if available, else 'cpu'.
+
+    Args:
+        device: Device string ('auto', 'cuda', 'cpu')
+
+    Returns:
+        PyTorch device string
+    """
+    if device == "auto":
+        import torch
+
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    return device
+
+
+class TokenMatrixCache:
+    """LRU cache of ColBERT token matrices bounded by total bytes.
+
+    Not thread-safe: only accessed from the event loop thread.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of cached matrices
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Get a cached matrix and mark it as recently used."""
+        matrix = self._entries.get(key)
+        if matrix is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return matrix
+
+    def set(self, key: str, matrix: np.ndarray) -> None:
+        """Add a matrix, evicting least recently used entries over the byte budget."""
+        if matrix.nbytes > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes
+        self._entries[key] = matrix
+        self._bytes += matrix.nbytes
+
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Drop all cached matrices."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class BGEM3ModelRegistry:
+    """Owns the shared BGE-M3 model instance(s) and the encode executor.
+
+    Callers that don't pass model/device/precision get the registry defaults,
+    which match the FlagEmbeddingService configuration (``st_*`` settings), so
+    both end up on the same instance.
+
+    Args:
+        model_name: Default HuggingFace model name
+        device: Default device ('auto', 'cuda', 'cpu')
+        use_fp16: Default precision
+        colbert_cache_mb: Byte budget for cached ColBERT token matrices
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        device: str = "auto",
+        use_fp16: bool = True,
+        colbert_cache_mb: int = 256,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            model_name: Default HuggingFace model name
+            device: Default device ('auto', 'cuda', 'cpu')
+            use_fp16: Default precision
+            colbert_cache_mb: Byte budget for cached ColBERT token matrices (MB)
+        """
+        self.model_name = model_name
+        self.device = device
+        self.use_fp16 = use_fp16
+        self._models: dict[tuple[str, str, bool], Any] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bge-m3")
+        self.colbert_cache = TokenMatrixCache(max_bytes=colbert_cache_mb * 1024 * 1024)
+
+    def get_model(
+        self,
+        model_name: str | None = None,
+        device: str | None = None,
+        use_fp16: bool | None = None,
+    ) -> Any:
+        """Get the shared model instance, loading it on first use.
+
+        Args:
+            model_name: HuggingFace model name (default: registry default)
+            device: Device ('auto', 'cuda', 'cpu') (default: registry default)
+            use_fp16: Use half precision (default: registry default)
+
+        Returns:
+            BGEM3FlagModel instance
+
+        Raises:
+            ImportError: If FlagEmbedding is not installed
+        """
+        model_name = model_name or self.model_name
+        use_fp16 = self.use_fp16 if use_fp16 is None else use_fp16
+        key = (model_name, resolve_device(device or self.device), use_fp16)
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                return model
+
+            try:
+                from FlagEmbedding import BGEM3FlagModel
+            except ImportError as e:
+                logger.error(
+                    "flag_embedding_import_failed",
+                    error=str(e),
+                    hint="Install with: pip install FlagEmbedding",
+                )
+                raise
+
+            model = BGEM3FlagModel(model_name, use_fp16=use_fp16, device=key[1])
+            self._models[key] = model
+            logger.info(
+                "bge_m3_model_registered",
+                model=model_name,
+                device=key[1],
+                use_fp16=use_fp16,
+                loaded_models=len(self._models),
+            )
+            return model
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on the model worker thread.
+
+        Args:
+            fn: Callable that uses the shared model
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Result of ``fn``
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def encode_sync(
+        self,
+        texts: list[str],
+        return_dense: bool = True,
+        return_sparse: bool = False,
+        return_colbert_vecs: bool = False,
+        batch_size: int = 32,
+        model_name: str | None = None,
+        device: str | None = None,
+        use_fp16: bool | None = None,
+    ) -> dict[str, Any]:
+        """Encode texts with the shared model (blocking).
+
+        Args:
+            texts: Texts to encode
+            return_dense: Return ``dense_vecs``
+            return_sparse: Return ``lexical_weights``
+            return_colbert_vecs: Return ``colbert_vecs`` (token matrices)
+            batch_size: Encode batch size
+            model_name: HuggingFace model name (default: registry default)
+            device: Device ('auto', 'cuda', 'cpu') (default: registry default)
+            use_fp16: Use half precision (default: registry default)
+
+        Returns:
+            FlagEmbedding output dict
+        """
+        model = self.get_model(model_name, device=device, use_fp16=use_fp16)
+        return model.encode(  # type: ignore[no-any-return]
+            texts,
+            batch_size=batch_size,
+            return_dense=return_dense,
+            return_sparse=return_sparse,
+            return_colbert_vecs=return_colbert_vecs,
+        )
+
+    async def encode(self, texts: list[str], **kwargs: Any) -> dict[str, Any]:
+        """Encode texts off the event loop (see ``encode_sync`` for arguments)."""
+        return await self.run(self.encode_sync, texts, **kwargs)
+
+    async def colbert_vectors(
+        self,
+        texts: list[str],
+        model_name: str | None = None,
+        device: str | None = None,
+        use_fp16: bool | None = None,
+    ) -> list[np.ndarray]:
+        """Get ColBERT token matrices, encoding only texts not in the LRU.
+
+        Args:
+            texts: Texts to encode (queries or segments)
+            model_name: HuggingFace model name (default: registry default)
+            device: Device ('auto', 'cuda', 'cpu') (default: registry default)
+            use_fp16: Use half precision (default: registry default)
+
+        Returns:
+            One float16 matrix of shape (num_tokens, 1024) per text
+        """
+        prefix = model_name or self.model_name
+        keys = [f"{prefix}:{hashlib.sha256(text.encode()).hexdigest()}" for text in texts]
+        matrices: list[np.ndarray | None] = [self.colbert_cache.get(key) for key in keys]
+
+        missing = [i for i, matrix in enumerate(matrices) if matrix is None]
+        if missing:
+            output = await self.encode(
+                [texts[i] for i in missing],
+                return_dense=False,
+                return_sparse=False,
+                return_colbert_vecs=True,
+                model_name=model_name,
+                device=device,
+                use_fp16=use_fp16,
+            )
+            for i, vectors in zip(missing, output["colbert_vecs"], strict=True):
+                matrix = np.asarray(vectors, dtype=np.float16)
+                matrices[i] = matrix
+                self.colbert_cache.set(keys[i], matrix)
+
+        logger.debug(
+            "colbert_vectors_resolved",
+            texts=len(texts),
+            encoded=len(missing),
+            cache_bytes=self.colbert_cache.stats()["bytes"],
+        )
+        return matrices  # type: ignore[return-value]
+
+    def stats(self) -> dict[str, Any]:
+        """Get registry statistics (loaded models, ColBERT cache)."""
+        return {
+            "models": [
+                {"model": name, "device": device, "use_fp16": fp16}
+                for name, device, fp16 in self._models
+            ],
+            "colbert_cache": self.colbert_cache.stats(),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker thread and drop cached matrices."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.colbert_cache.clear()
+
+
+# Global singleton instance
+_bge_m3_registry: BGEM3ModelRegistry | None = None
+
+
+def get_bge_m3_registry() -> BGEM3ModelRegistry:
+    """Get global BGE-M3 model registry (singleton).
+
+    Returns:
+        BGEM3ModelRegistry instance
+    """
+    global _bge_m3_registry
+    if _bge_m3_registry is None:
+        from src.core.config import settings
+
+        _bge_m3_registry = BGEM3ModelRegistry(
+            model_name=getattr(settings, "st_model_name", DEFAULT_MODEL_NAME),
+            device=getattr(settings, "st_device", "auto"),
+            use_fp16=getattr(settings, "st_use_fp16", True),
+            colbert_cache_mb=getattr(settings, "st_colbert_cache_mb", 256),
+        )
+    return _bge_m3_registry
+
+
+def reset_bge_m3_registry() -> None:
+    """Reset the global registry (testing only)."""
+    global _bge_m3_registry
+    if _bge_m3_registry is not None:
+        _bge_m3_registry.shutdown()
+    _bge_m3_registry = None
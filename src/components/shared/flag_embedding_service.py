@@ -70,6 +70,7 @@ Feature Flag:
 
 Notes:
     - Model is loaded lazily on first embedding request
+    - Model instance and encode thread are shared via bge_m3_registry
     - LRU cache deduplicates identical texts (10,000 entries)
     - Batch processing is 5-10x faster than sequential calls
     - Device 'auto' uses CUDA if available, else CPU
@@ -81,7 +82,6 @@ See Also:
     - docs/adr/ADR-042-bge-m3-native-hybrid.md: Architecture decision
 """
 
-import asyncio
 import hashlib
 import threading
 import time
@@ -90,6 +90,7 @@ from typing import Any
 
 import structlog
 
+from src.components.shared.bge_m3_registry import get_bge_m3_registry
 from src.components.shared.sparse_vector_utils import (
     hash_token,
     lexical_to_sparse_vector,
@@ -312,6 +313,8 @@ class FlagEmbeddingService:
 
         Notes:
             - Model is loaded only once and cached in self._model
+            - The instance comes from the process-wide BGE-M3 registry, so the
+              ColBERT scorer (RecursiveLLMProcessor) shares the same weights
             - First load downloads model from HuggingFace (~400MB for BGE-M3)
             - Subsequent loads use cached model from disk
             - use_fp16=True requires CUDA (auto-falls back to fp32 on CPU)
@@ -324,27 +327,17 @@ class FlagEmbeddingService:
                 if self._model is not None:
                     return self._model
 
-                # Lazy import for optional dependency
-                try:
-                    from FlagEmbedding import BGEM3FlagModel
-                except ImportError as e:
-                    logger.error(
-                        "flag_embedding_import_failed",
-                        error=str(e),
-                        hint="Install with: pip install FlagEmbedding",
-                    )
-                    raise
-
                 # Resolve 'auto' to actual device (Sprint 88 fix)
                 resolved_device = self._resolve_device()
 
                 load_start = time.perf_counter()
 
-                # Load model with specified device and precision
-                self._model = BGEM3FlagModel(
+                # Shared model with specified device and precision (raises ImportError
+                # if FlagEmbedding is not installed)
+                self._model = get_bge_m3_registry().get_model(
                     self.model_name,
-                    use_fp16=self.use_fp16,
                     device=resolved_device,
+                    use_fp16=self.use_fp16,
                 )
 
                 load_duration_ms = (time.perf_counter() - load_start) * 1000
@@ -464,7 +457,7 @@ class FlagEmbeddingService:
             >>> result["sparse_vector"]
             SparseVector(indices=[12345, 67890], values=[0.8, 0.6])
         """
-        return await asyncio.to_thread(self._embed_single_sync, text)
+        return await get_bge_m3_registry().run(self._embed_single_sync, text)
 
     def _embed_batch_sync(self, texts: list[str]) -> list[dict[str, Any]]:
         """Synchronous batch embedding (internal use).
@@ -605,7 +598,7 @@ class FlagEmbeddingService:
             - Results are cached for future requests
             - Show progress bar for batches >100 texts
         """
-        return await asyncio.to_thread(self._embed_batch_sync, texts)
+        return await get_bge_m3_registry().run(self._embed_batch_sync, texts)
 
     # Backward compatibility methods (dense-only)
 
@@ -63,7 +63,7 @@ See Also:
 """
 
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from qdrant_client.models import Filter, Fusion, FusionQuery, NamedVector, Prefetch, ScoredPoint
@@ -74,6 +74,9 @@ from src.components.vector_search.qdrant_client import QdrantClientWrapper
 from src.core.config import settings
 from src.core.exceptions import VectorSearchError
 
+if TYPE_CHECKING:
+    from src.components.retrieval.query_embedding import QueryEmbeddingContext
+
 logger = structlog.get_logger(__name__)
 
 
@@ -132,6 +135,7 @@ class MultiVectorHybridSearch:
         top_k: int = 10,
         prefetch_limit: int = 50,
         namespace_filter: str | None = None,
+        query_embedding: "QueryEmbeddingContext | None" = None,
     ) -> list[dict[str, Any]]:
         """Perform hybrid search with server-side RRF fusion.
 
@@ -147,6 +151,8 @@ class MultiVectorHybridSearch:
                 Higher values improve recall but increase latency
             namespace_filter: Filter by namespace_id for multi-tenant isolation (default: None)
                 Example: "default", "ragas_phase2", "customer_123"
+            query_embedding: Request-scoped embedding context (Sprint 130 Feature 130.2).
+                Reused if it carries sparse weights, otherwise the query is embedded here.
 
         Returns:
             List of search results, each dict with:
@@ -181,12 +187,21 @@ class MultiVectorHybridSearch:
 
         try:
             # 1. Generate query embeddings (dense + sparse)
+            # Sprint 130 Feature 130.2: Reuse the request's single BGE-M3 pass
             embed_start = time.perf_counter()
-            query_embedding = await self.embedding_service.embed_single(query)
+            shared = await query_embedding.get() if query_embedding is not None else None
+            if shared is not None and shared.sparse is not None:
+                dense_vector = shared.dense
+                sparse_dict = shared.sparse
+            else:
+                embedding_result = await self.embedding_service.embed_single(query)
+                dense_vector = embedding_result["dense"]
+                sparse_dict = embedding_result["sparse"]
+                if query_embedding is not None:
+                    # Dense-only backend in the context: count the extra pass honestly
+                    query_embedding.embed_calls += 1
             embed_duration_ms = (time.perf_counter() - embed_start) * 1000
 
-            dense_vector = query_embedding["dense"]
-            sparse_dict = query_embedding["sparse"]
             sparse_vector = dict_to_sparse_vector(sparse_dict)
 
             logger.debug(
@@ -308,6 +308,13 @@ class Settings(BaseSettings):
     api_port: int = Field(default=8000, description="API server port")
     api_workers: int = Field(default=1, description="Number of Uvicorn workers")
     api_reload: bool = Field(default=False, description="Enable auto-reload")
+    api_lazy_startup: bool = Field(
+        default=False,
+        description=(
+            "Fast cold start: serve /health immediately, import v1 routers on first "
+            "use or in a background warmup task, and run model/DB warmup after startup"
+        ),
+    )
 
     # API Security
     api_auth_enabled: bool = Field(
@@ -386,6 +393,11 @@ class Settings(BaseSettings):
         default=None,
         description="FlagEmbedding: Keep only top-k sparse tokens (None = keep all, 100 = typical)",
     )
+    st_colbert_cache_mb: int = Field(
+        default=256,
+        ge=0,
+        description="BGE-M3 registry: memory budget for cached ColBERT token matrices (MB)",
+    )
 
     # Router Configuration (Sprint 4 Feature 4.2)
     router_temperature: float = Field(
@@ -426,6 +438,20 @@ class Settings(BaseSettings):
         description="Monthly budget limit for OpenAI in USD (null = unlimited)",
     )
 
+    # Sprint 130 Feature 130.14: Buffered cost ledger (write-behind)
+    cost_ledger_flush_batch_size: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Buffered LLM cost rows that trigger a batched SQLite write",
+    )
+    cost_ledger_flush_interval_ms: int = Field(
+        default=1000,
+        ge=10,
+        le=60000,
+        description="Max time (ms) a buffered LLM cost row waits before being written",
+    )
+
     # Feature 21.6: Qwen3-VL Image Processing
     qwen3vl_model: str = Field(
         default="qwen3-vl:4b-instruct",
@@ -505,6 +531,23 @@ class Settings(BaseSettings):
         description="HuggingFace cross-encoder model for reranking. BAAI/bge-reranker-v2-m3 is multilingual and pairs with BGE-M3 embeddings.",
     )
     reranker_batch_size: int = Field(default=32, description="Batch size for reranking inference")
+    # Sprint 130 Feature 130.4: Off-event-loop, micro-batched cross-encoder inference
+    reranker_offload_enabled: bool = Field(
+        default=True,
+        description="Run cross-encoder inference in a worker thread and coalesce concurrent "
+        "rerank requests into shared batches (False = legacy inline predict)",
+    )
+    reranker_batch_window_ms: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=100.0,
+        description="Time window to coalesce pairs from concurrent rerank requests",
+    )
+    reranker_max_batch_pairs: int = Field(
+        default=256,
+        ge=1,
+        description="Flush a coalesced rerank batch once this many pairs are queued",
+    )
     reranker_cache_dir: str = Field(
         default="./data/models", description="Directory for caching HuggingFace models"
     )
@@ -529,6 +572,31 @@ class Settings(BaseSettings):
         description="Number of documents to return after reranking",
     )
 
+    # Sprint 130 Feature 130.3: Concurrent / batched Ollama reranking
+    reranker_ollama_mode: Literal["sequential", "concurrent", "batch"] = Field(
+        default="concurrent",
+        description="Ollama reranker scoring mode: 'sequential' (one call per doc, serial), "
+        "'concurrent' (one call per doc, bounded parallelism) or 'batch' (N passages per call)",
+    )
+    reranker_ollama_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum in-flight Ollama scoring calls per rerank request",
+    )
+    reranker_ollama_batch_size: int = Field(
+        default=5,
+        ge=1,
+        le=20,
+        description="Passages scored per Ollama call in 'batch' mode",
+    )
+    reranker_ollama_deadline_ms: int = Field(
+        default=5000,
+        ge=0,
+        description="Per-request rerank deadline in ms (0 = no deadline). Documents not "
+        "scored by the deadline are returned after the scored ones in original order",
+    )
+
     # Sprint 67 Feature 67.8: Adaptive Reranking with Intent-Aware Weights
     adaptive_reranking_enabled: bool = Field(
         default=True,
@@ -669,6 +737,28 @@ class Settings(BaseSettings):
         description="Timeout per chunk extraction in seconds (Sprint 37)",
     )
 
+    # Sprint 130 Feature 130.8: Concurrent batch extraction
+    extraction_batch_document_concurrency: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Documents extracted concurrently by ExtractionService.extract_batch "
+        "(0 = auto: free vLLM slots / chunk concurrency, 1 without vLLM)",
+    )
+    extraction_batch_max_document_concurrency: int = Field(
+        default=16,
+        ge=1,
+        le=64,
+        description="Upper bound for auto document concurrency in batch extraction",
+    )
+    extraction_batch_chunk_concurrency: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Concurrent cross-sentence windows per document during batch extraction "
+        "(0 = AEGIS_EXTRACTION_WORKERS)",
+    )
+
     # Cross-Sentence Window Configuration (Sprint 128)
     cross_sentence_window_size: int = Field(
         default=3, ge=2, le=10, description="Number of entity groups per cross-sentence window"
@@ -700,6 +790,31 @@ class Settings(BaseSettings):
         default=30, ge=5, le=300, description="Query execution timeout in seconds"
     )
 
+    # Graph Write Buffer (Sprint 130 Feature 130.11: batched UNWIND chunk/provenance writes)
+    graph_write_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Rows per UNWIND statement when writing chunks, entities and edges",
+    )
+    graph_write_flush_threshold: int = Field(
+        default=5000,
+        ge=1,
+        le=1000000,
+        description="Pending rows after which a shared (cross-document) write buffer flushes",
+    )
+
+    # Domain Catalog (in-process cache of :Domain nodes for ingestion lookups)
+    domain_catalog_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        le=3600,
+        description=(
+            "Max age of the in-process domain catalog before reloading from Neo4j "
+            "(backstop for domain writes from other processes, 0 disables caching)"
+        ),
+    )
+
     # Community Detection Configuration (Sprint 6.3: Community Detection & Clustering)
     # Sprint 126 Feature 126.1: Scheduled Community Detection
     graph_community_detection_mode: Literal["sync", "scheduled", "disabled"] = Field(
@@ -723,6 +838,27 @@ class Settings(BaseSettings):
     graph_community_use_gds: bool = Field(
         default=True, description="Try Neo4j GDS first, fallback to NetworkX"
     )
+    # Sprint 130 Feature 130.9: Incremental Community Detection
+    graph_community_incremental_enabled: bool = Field(
+        default=False,
+        description=(
+            "Re-cluster only the neighborhood of RELATES_TO edges added/removed since the "
+            "last run, using a persisted adjacency snapshot (first run is a full detection)"
+        ),
+    )
+    graph_community_snapshot_path: str = Field(
+        default="./data/community_graph_snapshot.json",
+        description="Adjacency + community assignment snapshot for incremental detection",
+    )
+    graph_community_incremental_max_region_ratio: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Re-cluster the whole in-memory graph when the affected region exceeds "
+            "this fraction of all entities"
+        ),
+    )
     graph_community_labeling_enabled: bool = Field(
         default=True, description="Enable automatic community labeling with LLM"
     )
@@ -751,6 +887,14 @@ class Settings(BaseSettings):
     graph_analytics_cache_ttl_seconds: int = Field(
         default=600, ge=0, le=3600, description="Cache TTL for analytics results (10 min default)"
     )
+    graph_analytics_betweenness_exact_max_nodes: int = Field(
+        default=2000,
+        ge=3,
+        description="Compute exact betweenness up to this many nodes, sampled above",
+    )
+    graph_analytics_betweenness_samples: int = Field(
+        default=256, ge=1, description="Source nodes sampled for approximate betweenness"
+    )
     graph_recommendations_top_k: int = Field(
         default=5, ge=1, le=50, description="Number of recommendations to return"
     )
@@ -779,6 +923,26 @@ class Settings(BaseSettings):
         default=True, description="Enable semantic reranking of graph entities (BGE-M3)"
     )
 
+    # Sprint 130 Feature 130.5: In-memory entity lexicon for graph-local retrieval
+    entity_lexicon_enabled: bool = Field(
+        default=True,
+        description="Link query text to entity IDs via the in-memory entity-name lexicon "
+        "instead of scanning all :base nodes with CONTAINS (False = legacy Cypher scan)",
+    )
+    entity_lexicon_refresh_seconds: float = Field(
+        default=60.0,
+        ge=1.0,
+        description="Minimum interval between delta refreshes of the entity lexicon from Neo4j "
+        "(picks up entities written by other processes)",
+    )
+    graph_local_lexicon_fallback_scan: bool = Field(
+        default=False,
+        description="Fall back to the legacy entity name/description CONTAINS scan when the "
+        "lexicon links no entities. The lexicon already matches whole-word name and "
+        "description tokens; the scan only adds substring matches inside longer words "
+        "(full label scan cost)",
+    )
+
     # Sprint 80 Feature 80.1: Faithfulness Optimization
     # Activated 2026-01-09 for RAGAS Faithfulness testing (Sprint 80.3+)
     strict_faithfulness_enabled: bool = Field(
@@ -1081,6 +1245,27 @@ class Settings(BaseSettings):
         default="nvidia/NVIDIA-Nemotron-3-Nano-30B-A3B-NVFP4",
         description="vLLM model name for extraction tasks (Sprint 125.2)",
     )
+    # Sprint 130 Feature 130.7: Push-based vLLM admission control
+    vllm_max_concurrent_requests: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum concurrent vLLM requests admitted per process; further requests "
+        "queue locally and are woken as soon as a slot frees",
+    )
+    vllm_metrics_reconcile_interval_s: float = Field(
+        default=5.0,
+        gt=0.0,
+        description="Interval for background reconciliation of local vLLM load with vLLM "
+        "/metrics (only runs while abandoned or external requests are outstanding)",
+    )
+
+    # Sprint 130 Feature 130.6: In-flight request coalescing in AegisLLMProxy
+    llm_request_coalescing_enabled: bool = Field(
+        default=True,
+        description="Coalesce identical concurrent LLM requests (namespace, model, prompt, "
+        "generation params) so followers await the leader's response instead of calling the "
+        "provider again",
+    )
 
     # Sprint 33 Performance: Parallel Ingestion Settings
     ingestion_parallel_files: int = Field(
@@ -1140,6 +1325,10 @@ class Settings(BaseSettings):
     memory_consolidation_min_access_count: int = Field(
         default=3, description="Minimum access count for consolidation"
     )
+    memory_consolidation_collection: str = Field(
+        default="memory_long_term",
+        description="Qdrant collection receiving consolidated Redis memories (Layer 2)",
+    )
 
     # Temporal Memory Retention Policy (Sprint 11: Feature 11.8)
     # Configurable retention for Graphiti temporal memory versions
@@ -1173,6 +1362,18 @@ class Settings(BaseSettings):
         "Provides maximum table quality via dual-source validation. "
         "Persisted in Redis, toggleable via API/frontend. Requires aegis-vlm-table container.",
     )
+    vlm_page_render_workers: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="PyMuPDF worker processes that render pages for VLM parallel page "
+        "processing. Pages are streamed to the VLM as they are rendered.",
+    )
+    vlm_page_prefilter_enabled: bool = Field(
+        default=False,
+        description="Only send pages with table candidates to the VLM (pages with Docling "
+        "tables, table-like ruling lines, or full-page scans). Skips text-only pages.",
+    )
     # Legacy: kept for backward compatibility but unused since ADR-063
     granite_docling_url: str = Field(
         default="http://localhost:8083",
@@ -223,6 +223,33 @@ def update_budget_metrics(
         monthly_budget_remaining_usd.labels(provider=provider).set(-1.0)
 
 
+# vLLM admission control (Sprint 130 Feature 130.7)
+# Labels: kind (in_flight, orphaned, external)
+vllm_admission_load = Gauge(
+    "aegis_vllm_admission_load",
+    "vLLM load as seen by the local admission controller",
+    ["kind"],
+)
+
+
+def update_vllm_admission_metrics(in_flight: int, orphaned: int, external: int) -> None:
+    """Update vLLM admission controller gauges.
+
+    **Sprint 130 Feature 130.7: Push-based vLLM Admission Control**
+
+    Args:
+        in_flight: Requests currently sent by this process
+        orphaned: Abandoned requests (client timeout/cancel) likely still running in vLLM
+        external: Requests from other processes (reconciled from vLLM /metrics)
+
+    Example:
+        update_vllm_admission_metrics(in_flight=4, orphaned=1, external=0)
+    """
+    vllm_admission_load.labels(kind="in_flight").set(in_flight)
+    vllm_admission_load.labels(kind="orphaned").set(orphaned)
+    vllm_admission_load.labels(kind="external").set(external)
+
+
 # ============================================================================
 # SYSTEM METRICS (Sprint 25 - Feature 25.1)
 # ============================================================================
@@ -305,6 +332,14 @@ cache_misses_total = Counter(
     ["cache_type"],
 )
 
+# Sprint 130 Feature 130.2: Query embeddings per retrieval request
+# Expected: 0 (exact cache hit) or 1 (everything else)
+query_embeddings_per_request = Histogram(
+    "aegis_query_embeddings_per_request",
+    "Number of query embedding passes per retrieval request",
+    buckets=(0, 1, 2, 3, 4, float("inf")),
+)
+
 # Memory metrics (Graphiti temporal memory)
 memory_facts_count = Gauge(
     "aegis_memory_facts_count",
@@ -382,6 +417,20 @@ def track_cache_miss(cache_type: str) -> None:
     cache_misses_total.labels(cache_type=cache_type).inc()
 
 
+def track_query_embeddings(count: int) -> None:
+    """Track how many query embedding passes a retrieval request needed.
+
+    **Sprint 130 Feature 130.2: Single Embedding Pass**
+
+    Args:
+        count: Number of embedding service calls for the request
+
+    Example:
+        track_query_embeddings(1)
+    """
+    query_embeddings_per_request.observe(count)
+
+
 def update_memory_facts(fact_type: str, count: int) -> None:
     """Update memory facts count.
 
@@ -0,0 +1,132 @@
+"""
+In-flight request coalescing (single-flight) for LLM calls.
+
+Sprint 130 Feature 130.6: Request Coalescing
+
+The prompt cache only helps once a response has been stored. Identical
+prompts arriving at the same time (gleaning retries, duplicate chunks in
+parallel extraction, many users asking the same FAQ) all miss the cache and
+all hit vLLM/Ollama.
+
+SingleFlight keeps one in-flight task per key. The first caller (leader)
+starts the provider call; concurrent callers with the same key (followers)
+await the leader's result:
+
+    request A ─→ miss ─→ leader: provider call ──────→ response
+    request B ─→ miss ─→ follower ─────── await ──────→ response (shared)
+    request C ─→ miss ─→ follower ─────── await ──────→ response (shared)
+
+The call runs in its own task, so cancelling one waiter (e.g. a client
+disconnect) does not cancel the call for the others.
+
+Key Strategy:
+    Format: {namespace}:{model}:{sha256(prompt + generation params)}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def build_inflight_key(
+    namespace: str, model: str, prompt: str, params: dict[str, Any] | None = None
+) -> str:
+    """
+    Build a deterministic in-flight key for an LLM request.
+
+    Args:
+        namespace: Tenant namespace
+        model: Model name
+        prompt: Full prompt text
+        params: Generation parameters that change the response (temperature, max_tokens, ...)
+
+    Returns:
+        Key in format {namespace}:{model}:{sha256}
+
+    Example:
+        >>> build_inflight_key("default", "llama3.2:8b", "Hi", {"temperature": 0.1})[:20]
+        'default:llama3.2:8b:'
+    """
+    payload = json.dumps({"prompt": prompt, "params": params or {}}, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{namespace}:{model}:{digest}"
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent async calls by key.
+
+    Example:
+        flight = SingleFlight()
+        result, shared = await flight.do(key, lambda: proxy_call(task))
+        # shared=True if this caller reused another caller's in-flight result
+    """
+
+    def __init__(self) -> None:
+        """Initialize single-flight group."""
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """
+        Run fn once per key among concurrent callers.
+
+        Args:
+            key: Deduplication key
+            fn: Coroutine factory (only called by the leader)
+
+        Returns:
+            Tuple of (result, shared) where shared is True for followers
+
+        Raises:
+            Exception: Whatever the leader's call raised (propagated to all waiters)
+        """
+        task = self._inflight.get(key)
+        if task is not None and not task.done():
+            self.coalesced += 1
+            logger.debug("llm_request_coalesced", key=key[:80], coalesced_total=self.coalesced)
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        self.leaders += 1
+        task.add_done_callback(lambda t, k=key: self._release(k, t))
+        return await asyncio.shield(task), False
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark exception as retrieved when every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def inflight(self) -> int:
+        """Number of calls currently in flight."""
+        return len(self._inflight)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dict with leader calls, coalesced calls and current in-flight count
+        """
+        total = self.leaders + self.coalesced
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "coalesce_rate": self.coalesced / total if total else 0.0,
+            "inflight": self.inflight,
+        }
@@ -9,9 +9,20 @@ Usage:
     spending = tracker.get_monthly_spending()
 """
 
-from src.domains.llm_integration.cost.cost_tracker import CostTracker, get_cost_tracker
+from src.domains.llm_integration.cost.cost_tracker import (
+    CostAggregate,
+    CostTracker,
+    DailyCostKey,
+    close_cost_tracker,
+    get_cost_tracker,
+    group_aggregates,
+)
 
 __all__ = [
+    "CostAggregate",
     "CostTracker",
+    "DailyCostKey",
+    "close_cost_tracker",
     "get_cost_tracker",
+    "group_aggregates",
 ]
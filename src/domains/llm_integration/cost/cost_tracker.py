@@ -12,26 +12,202 @@ Features:
 - Daily/monthly aggregations
 - Budget alerts
 - Export to CSV/JSON for analysis
+
+Sprint 130 Feature 130.14: Buffered Cost Ledger
+- Rolling per-day/provider/model/task-type aggregates are kept in memory and
+  persisted as daily_summary rows in the same transaction as the raw rows.
+  Budget checks and the admin cost dashboards read these aggregates instead
+  of scanning llm_requests.
+- Write-behind mode (used by the shared tracker): track_request only updates
+  the in-memory aggregates and buffers the row; buffered rows are written in
+  batches on a worker thread every flush_batch_size rows or
+  flush_interval_ms milliseconds, whichever comes first. close() drains the
+  buffer on shutdown.
 """
 
+import asyncio
 import sqlite3
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Write-behind defaults: flush after this many buffered rows or this many milliseconds
+DEFAULT_FLUSH_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_MS = 1000
+
+_INSERT_REQUEST_SQL = """
+    INSERT INTO llm_requests (
+        timestamp, provider, model, task_type, task_id,
+        tokens_input, tokens_output, tokens_total,
+        cost_usd, latency_ms, routing_reason, fallback_used
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_DAILY_SUMMARY_SQL = """
+    INSERT INTO daily_summary (
+        day, provider, model, task_type, requests,
+        tokens_input, tokens_output, tokens_total, cost_usd,
+        latency_ms_sum, latency_count, fallback_count
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(day, provider, model, task_type) DO UPDATE SET
+        requests = requests + excluded.requests,
+        tokens_input = tokens_input + excluded.tokens_input,
+        tokens_output = tokens_output + excluded.tokens_output,
+        tokens_total = tokens_total + excluded.tokens_total,
+        cost_usd = cost_usd + excluded.cost_usd,
+        latency_ms_sum = latency_ms_sum + excluded.latency_ms_sum,
+        latency_count = latency_count + excluded.latency_count,
+        fallback_count = fallback_count + excluded.fallback_count,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# One-time rebuild of daily_summary for databases created before Sprint 130
+_BACKFILL_DAILY_SUMMARY_SQL = """
+    INSERT INTO daily_summary (
+        day, provider, model, task_type, requests,
+        tokens_input, tokens_output, tokens_total, cost_usd,
+        latency_ms_sum, latency_count, fallback_count
+    )
+    SELECT
+        date(timestamp), provider, model, task_type, COUNT(*),
+        SUM(tokens_input), SUM(tokens_output), SUM(tokens_total), SUM(cost_usd),
+        COALESCE(SUM(latency_ms), 0), COUNT(latency_ms),
+        SUM(CASE WHEN fallback_used = 1 THEN 1 ELSE 0 END)
+    FROM llm_requests
+    GROUP BY date(timestamp), provider, model, task_type
+"""
+
+
+class DailyCostKey(NamedTuple):
+    """Grouping key of a daily cost aggregate."""
+
+    day: str  # YYYY-MM-DD
+    provider: str
+    model: str
+    task_type: str
+
+
+@dataclass
+class CostAggregate:
+    """Summed cost metrics of a group of LLM requests."""
+
+    requests: int = 0
+    tokens_input: int = 0
+    tokens_output: int = 0
+    tokens_total: int = 0
+    cost_usd: float = 0.0
+    latency_ms_sum: float = 0.0
+    latency_count: int = 0
+    fallback_count: int = 0
+
+    def add(self, other: "CostAggregate") -> None:
+        """Add another aggregate into this one."""
+        self.requests += other.requests
+        self.tokens_input += other.tokens_input
+        self.tokens_output += other.tokens_output
+        self.tokens_total += other.tokens_total
+        self.cost_usd += other.cost_usd
+        self.latency_ms_sum += other.latency_ms_sum
+        self.latency_count += other.latency_count
+        self.fallback_count += other.fallback_count
+
+    @property
+    def avg_cost_per_request(self) -> float:
+        """Average cost per request in USD."""
+        return self.cost_usd / self.requests if self.requests else 0.0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        """Average latency of requests that reported one."""
+        return self.latency_ms_sum / self.latency_count if self.latency_count else 0.0
+
+    def to_row(self) -> tuple[Any, ...]:
+        """Metric columns in daily_summary order."""
+        return (
+            self.requests,
+            self.tokens_input,
+            self.tokens_output,
+            self.tokens_total,
+            self.cost_usd,
+            self.latency_ms_sum,
+            self.latency_count,
+            self.fallback_count,
+        )
+
+
+def _request_aggregate(row: tuple[Any, ...]) -> tuple[DailyCostKey, CostAggregate]:
+    """Key and single-request aggregate of an llm_requests insert row."""
+    (
+        timestamp,
+        provider,
+        model,
+        task_type,
+        _task_id,
+        tokens_input,
+        tokens_output,
+        tokens_total,
+        cost_usd,
+        latency_ms,
+        _routing_reason,
+        fallback_used,
+    ) = row
+    key = DailyCostKey(timestamp[:10], provider, model, task_type)
+    return key, CostAggregate(
+        requests=1,
+        tokens_input=tokens_input,
+        tokens_output=tokens_output,
+        tokens_total=tokens_total,
+        cost_usd=cost_usd,
+        latency_ms_sum=latency_ms or 0.0,
+        latency_count=0 if latency_ms is None else 1,
+        fallback_count=1 if fallback_used else 0,
+    )
+
+
+def group_aggregates(
+    aggregates: dict[DailyCostKey, CostAggregate], by: tuple[str, ...]
+) -> dict[tuple[str, ...], CostAggregate]:
+    """Re-group daily aggregates by a subset of the key fields.
+
+    Args:
+        aggregates: Output of CostTracker.get_daily_aggregates()
+        by: DailyCostKey field names, e.g. ("provider",) or ("provider", "model")
+
+    Returns:
+        Dict mapping tuples of the requested fields to summed aggregates
+    """
+    grouped: dict[tuple[str, ...], CostAggregate] = {}
+    for key, aggregate in aggregates.items():
+        group = tuple(getattr(key, field) for field in by)
+        grouped.setdefault(group, CostAggregate()).add(aggregate)
+    return grouped
+
 
 class CostTracker:
     """Persistent cost tracking for LLM requests."""
 
-    def __init__(self, db_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        write_behind: bool = False,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+    ) -> None:
         """Initialize cost tracker.
 
         Args:
             db_path: Path to SQLite database (default: data/cost_tracking.db)
+            write_behind: Buffer rows tracked on an event loop and write them in
+                batches off-loop (default: False, every row is written immediately)
+            flush_batch_size: Buffered rows that trigger a flush (default 100)
+            flush_interval_ms: Max delay before buffered rows are flushed (default 1000)
         """
         if db_path is None:
             # Default to project data directory
@@ -42,10 +218,24 @@ class CostTracker:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self.write_behind = write_behind
+        self.flush_batch_size = max(1, flush_batch_size)
+        self.flush_interval_ms = flush_interval_ms
+        self._pending: list[tuple[Any, ...]] = []
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        self._executor: ThreadPoolExecutor | None = None
+
+        # In-memory rolling aggregates (loaded from daily_summary)
+        self._aggregate_lock = threading.Lock()
+        self._daily: dict[DailyCostKey, CostAggregate] = {}
+        self._monthly_by_provider: dict[str, dict[str, float]] = {}
+
         # Initialize database
         self._init_db()
+        self._load_aggregates()
 
-        logger.info("CostTracker initialized", db_path=str(self.db_path))
+        logger.info("CostTracker initialized", db_path=str(self.db_path), write_behind=write_behind)
 
     def _init_db(self) -> None:
         """Create database tables if they don't exist."""
@@ -105,12 +295,92 @@ class CostTracker:
             """
             )
 
+            # Sprint 130: Daily summary (one row per day/provider/model/task type),
+            # updated in the same transaction as the raw rows
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS daily_summary (
+                    day TEXT NOT NULL,
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    task_type TEXT NOT NULL,
+                    requests INTEGER NOT NULL DEFAULT 0,
+                    tokens_input INTEGER NOT NULL DEFAULT 0,
+                    tokens_output INTEGER NOT NULL DEFAULT 0,
+                    tokens_total INTEGER NOT NULL DEFAULT 0,
+                    cost_usd REAL NOT NULL DEFAULT 0,
+                    latency_ms_sum REAL NOT NULL DEFAULT 0,
+                    latency_count INTEGER NOT NULL DEFAULT 0,
+                    fallback_count INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (day, provider, model, task_type)
+                )
+            """
+            )
+
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM daily_summary)")
+            if not cursor.fetchone()[0]:
+                cursor.execute(_BACKFILL_DAILY_SUMMARY_SQL)
+                if cursor.rowcount > 0:
+                    logger.info("Daily cost summary backfilled", rows=cursor.rowcount)
+
             conn.commit()
 
         logger.info(
-            "Cost tracking database initialized", tables=["llm_requests", "monthly_summary"]
+            "Cost tracking database initialized",
+            tables=["llm_requests", "monthly_summary", "daily_summary"],
         )
 
+    def _load_aggregates(self) -> None:
+        """Load persisted daily summaries into the in-memory aggregates."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT day, provider, model, task_type, requests,
+                       tokens_input, tokens_output, tokens_total, cost_usd,
+                       latency_ms_sum, latency_count, fallback_count
+                FROM daily_summary
+            """
+            ).fetchall()
+
+        with self._aggregate_lock:
+            self._daily.clear()
+            self._monthly_by_provider.clear()
+            for row in rows:
+                self._add_aggregate(DailyCostKey(*row[:4]), CostAggregate(*row[4:]))
+
+    def _add_aggregate(self, key: DailyCostKey, aggregate: CostAggregate) -> None:
+        """Add to the in-memory aggregates (caller holds _aggregate_lock)."""
+        self._daily.setdefault(key, CostAggregate()).add(aggregate)
+        monthly = self._monthly_by_provider.setdefault(key.day[:7], {})
+        monthly[key.provider] = monthly.get(key.provider, 0.0) + aggregate.cost_usd
+
+    def _write_rows(self, rows: list[tuple[Any, ...]]) -> int | None:
+        """Insert raw rows and their daily summary deltas in one transaction.
+
+        Returns:
+            Row ID of the last inserted row
+        """
+        deltas: dict[DailyCostKey, CostAggregate] = {}
+        for row in rows:
+            key, aggregate = _request_aggregate(row)
+            deltas.setdefault(key, CostAggregate()).add(aggregate)
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            if len(rows) == 1:
+                cursor.execute(_INSERT_REQUEST_SQL, rows[0])
+            else:
+                cursor.executemany(_INSERT_REQUEST_SQL, rows)
+            row_id = cursor.lastrowid
+            cursor.executemany(
+                _UPSERT_DAILY_SUMMARY_SQL,
+                [(*key, *aggregate.to_row()) for key, aggregate in deltas.items()],
+            )
+            conn.commit()
+
+        return row_id
+
     def track_request(
         self,
         provider: str,
@@ -123,9 +393,13 @@ class CostTracker:
         routing_reason: str | None = None,
         fallback_used: bool = False,
         task_id: str | None = None,
-    ) -> int:
+    ) -> int | None:
         """Track a single LLM request.
 
+        In write-behind mode (and with a running event loop) the row is buffered
+        and written by the next batched flush; the in-memory aggregates are
+        updated immediately either way.
+
         Args:
             provider: Provider name (local_ollama, alibaba_cloud, openai)
             model: Model name
@@ -139,43 +413,36 @@ class CostTracker:
             task_id: Unique task ID
 
         Returns:
-            Database row ID
+            Database row ID (None if the row was buffered)
         """
         timestamp = datetime.now().isoformat()
         tokens_total = tokens_input + tokens_output
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        row = (
+            timestamp,
+            provider,
+            model,
+            task_type,
+            task_id,
+            tokens_input,
+            tokens_output,
+            tokens_total,
+            cost_usd,
+            latency_ms,
+            routing_reason,
+            fallback_used,
+        )
 
-            cursor.execute(
-                """
-                INSERT INTO llm_requests (
-                    timestamp, provider, model, task_type, task_id,
-                    tokens_input, tokens_output, tokens_total,
-                    cost_usd, latency_ms, routing_reason, fallback_used
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    timestamp,
-                    provider,
-                    model,
-                    task_type,
-                    task_id,
-                    tokens_input,
-                    tokens_output,
-                    tokens_total,
-                    cost_usd,
-                    latency_ms,
-                    routing_reason,
-                    fallback_used,
-                ),
-            )
+        row_id = None
+        if self.write_behind and self._has_running_loop():
+            self._enqueue(row)
+        else:
+            row_id = self._write_rows([row])
+            # Assert row_id is not None (SQLite INSERT always returns lastrowid)
+            assert row_id is not None, "SQLite INSERT failed to return row ID"
 
-            row_id = cursor.lastrowid
-            conn.commit()
-
-        # Assert row_id is not None (SQLite INSERT always returns lastrowid)
-        assert row_id is not None, "SQLite INSERT failed to return row ID"
+        with self._aggregate_lock:
+            self._add_aggregate(*_request_aggregate(row))
 
         logger.debug(
             "Request tracked",
@@ -188,6 +455,131 @@ class CostTracker:
 
         return row_id
 
+    @staticmethod
+    def _has_running_loop() -> bool:
+        """Whether the caller runs on an event loop (buffering needs one to flush)."""
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+
+    def _enqueue(self, row: tuple[Any, ...]) -> None:
+        """Buffer a row for the next batched flush.
+
+        Flushes immediately once flush_batch_size rows are pending, otherwise
+        arms a timer so no row waits longer than flush_interval_ms.
+        """
+        self._pending.append(row)
+
+        if len(self._pending) >= self.flush_batch_size:
+            self._schedule_flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self.flush_interval_ms / 1000, self._schedule_flush
+            )
+
+    def _schedule_flush(self) -> None:
+        """Start a background flush task (keeps a reference until it finishes)."""
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> int:
+        """Write all buffered rows in one transaction on the worker thread.
+
+        Failed batches are put back into the buffer and retried by the next
+        flush; the in-memory aggregates already include them.
+
+        Returns:
+            Number of rows written
+
+        Example:
+            >>> tracker.track_request(...)  # buffered
+            >>> await tracker.flush()  # row is now durable
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, []
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cost-ledger")
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._write_rows, batch
+            )
+        except Exception as e:
+            logger.error("cost_ledger_flush_failed", rows=len(batch), error=str(e))
+            self._pending[:0] = batch
+            return 0
+
+        logger.debug("cost_ledger_flushed", rows=len(batch))
+        return len(batch)
+
+    def _flush_pending_sync(self) -> None:
+        """Write buffered rows from the calling thread (before raw-row queries)."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        try:
+            self._write_rows(batch)
+        except Exception:
+            self._pending[:0] = batch
+            raise
+
+    async def close(self) -> None:
+        """Drain buffered rows and stop the worker thread.
+
+        Called on application shutdown.
+
+        Example:
+            >>> await tracker.close()
+        """
+        await self.flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._pending:
+            logger.error("cost_ledger_rows_lost_on_close", rows=len(self._pending))
+
+    def get_daily_aggregates(
+        self,
+        start_day: date | None = None,
+        end_day: date | None = None,
+        provider: str | None = None,
+    ) -> dict[DailyCostKey, CostAggregate]:
+        """Get in-memory daily aggregates (includes buffered rows).
+
+        Args:
+            start_day: First day to include (default: beginning of time)
+            end_day: Last day to include (default: no limit)
+            provider: Filter by provider
+
+        Returns:
+            Dict mapping (day, provider, model, task_type) to a copy of its aggregate
+        """
+        start = start_day.isoformat() if start_day else None
+        end = end_day.isoformat() if end_day else None
+
+        with self._aggregate_lock:
+            return {
+                key: replace(aggregate)
+                for key, aggregate in self._daily.items()
+                if (start is None or key.day >= start)
+                and (end is None or key.day <= end)
+                and (provider is None or key.provider == provider)
+            }
+
     def get_monthly_spending(self, provider: str | None = None) -> dict[str, float]:
         """Get current month spending by provider.
 
@@ -199,34 +591,12 @@ class CostTracker:
         """
         current_month = datetime.now().strftime("%Y-%m")
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            if provider:
-                cursor.execute(
-                    """
-                    SELECT provider, SUM(cost_usd)
-                    FROM llm_requests
-                    WHERE strftime('%Y-%m', timestamp) = ?
-                      AND provider = ?
-                    GROUP BY provider
-                """,
-                    (current_month, provider),
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT provider, SUM(cost_usd)
-                    FROM llm_requests
-                    WHERE strftime('%Y-%m', timestamp) = ?
-                    GROUP BY provider
-                """,
-                    (current_month,),
-                )
-
-            results = cursor.fetchall()
-
-        spending = {row[0]: row[1] for row in results}
+        # O(providers): served from the in-memory monthly aggregates
+        with self._aggregate_lock:
+            monthly = self._monthly_by_provider.get(current_month, {})
+            spending = {
+                name: spent for name, spent in monthly.items() if not provider or name == provider
+            }
 
         logger.debug("Monthly spending retrieved", month=current_month, spending=spending)
 
@@ -248,6 +618,15 @@ class CostTracker:
         Returns:
             Total spending in USD
         """
+        if start_date is None and end_date is None:
+            aggregates = self.get_daily_aggregates(provider=provider)
+            total = sum(aggregate.cost_usd for aggregate in aggregates.values())
+            logger.debug("Total spending retrieved", provider=provider, total_usd=total)
+            return total
+
+        # Arbitrary timestamps need the raw rows (include buffered ones)
+        self._flush_pending_sync()
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
 
@@ -304,99 +683,47 @@ class CostTracker:
 
         Returns:
             Statistics dict with totals, averages, and breakdowns
-        """
-        start_date = datetime.now() - timedelta(days=days)
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Overall stats
-            conditions = ["timestamp >= ?"]
-            params = [start_date.isoformat()]
-
-            if provider:
-                conditions.append("provider = ?")
-                params.append(provider)
-
-            where_clause = " AND ".join(conditions)
-
-            cursor.execute(  # nosec B608 — parameterized query
-                f"""
-                SELECT
-                    COUNT(*) as total_requests,
-                    SUM(tokens_total) as total_tokens,
-                    SUM(cost_usd) as total_cost,
-                    AVG(cost_usd) as avg_cost_per_request,
-                    AVG(latency_ms) as avg_latency_ms,
-                    SUM(CASE WHEN fallback_used = 1 THEN 1 ELSE 0 END) as fallback_count
-                FROM llm_requests
-                WHERE {where_clause}
-            """,
-                tuple(params),
-            )
-
-            row = cursor.fetchone()
-
-            # Per-provider breakdown
-            cursor.execute(  # nosec B608 — parameterized query
-                f"""
-                SELECT
-                    provider,
-                    COUNT(*) as requests,
-                    SUM(tokens_total) as tokens,
-                    SUM(cost_usd) as cost
-                FROM llm_requests
-                WHERE {where_clause}
-                GROUP BY provider
-            """,
-                tuple(params),
-            )
-
-            provider_breakdown = [
-                {
-                    "provider": row[0],
-                    "requests": row[1],
-                    "tokens": row[2],
-                    "cost_usd": row[3],
-                }
-                for row in cursor.fetchall()
-            ]
-
-            # Per-task-type breakdown
-            cursor.execute(  # nosec B608 — parameterized query
-                f"""
-                SELECT
-                    task_type,
-                    COUNT(*) as requests,
-                    SUM(tokens_total) as tokens,
-                    SUM(cost_usd) as cost,
-                    AVG(latency_ms) as avg_latency
-                FROM llm_requests
-                WHERE {where_clause}
-                GROUP BY task_type
-            """,
-                tuple(params),
-            )
-
-            task_breakdown = [
-                {
-                    "task_type": row[0],
-                    "requests": row[1],
-                    "tokens": row[2],
-                    "cost_usd": row[3],
-                    "avg_latency_ms": row[4],
-                }
-                for row in cursor.fetchall()
-            ]
+        Note:
+            Served from the daily aggregates, so the window covers whole days
+            (today and the ``days`` calendar days before it).
+        """
+        start_day = (datetime.now() - timedelta(days=days)).date()
+        aggregates = self.get_daily_aggregates(start_day=start_day, provider=provider)
+
+        totals = CostAggregate()
+        for aggregate in aggregates.values():
+            totals.add(aggregate)
+
+        provider_breakdown = [
+            {
+                "provider": name,
+                "requests": aggregate.requests,
+                "tokens": aggregate.tokens_total,
+                "cost_usd": aggregate.cost_usd,
+            }
+            for (name,), aggregate in group_aggregates(aggregates, ("provider",)).items()
+        ]
+
+        task_breakdown = [
+            {
+                "task_type": task_type,
+                "requests": aggregate.requests,
+                "tokens": aggregate.tokens_total,
+                "cost_usd": aggregate.cost_usd,
+                "avg_latency_ms": aggregate.avg_latency_ms if aggregate.latency_count else None,
+            }
+            for (task_type,), aggregate in group_aggregates(aggregates, ("task_type",)).items()
+        ]
 
         stats = {
             "period_days": days,
-            "total_requests": row[0] or 0,
-            "total_tokens": row[1] or 0,
-            "total_cost_usd": row[2] or 0.0,
-            "avg_cost_per_request_usd": row[3] or 0.0,
-            "avg_latency_ms": row[4] or 0.0,
-            "fallback_count": row[5] or 0,
+            "total_requests": totals.requests,
+            "total_tokens": totals.tokens_total,
+            "total_cost_usd": totals.cost_usd,
+            "avg_cost_per_request_usd": totals.avg_cost_per_request,
+            "avg_latency_ms": totals.avg_latency_ms,
+            "fallback_count": totals.fallback_count,
             "provider_breakdown": provider_breakdown,
             "task_breakdown": task_breakdown,
         }
@@ -414,6 +741,8 @@ class CostTracker:
         """
         import csv
 
+        self._flush_pending_sync()
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
 
@@ -474,6 +803,8 @@ def get_cost_tracker() -> CostTracker:
         - Subsequent calls return the same instance
         - Uses data/cost_tracking.db by default
         - Thread-safe (SQLite handles concurrency)
+        - Write-behind: rows tracked on the event loop are flushed in batches
+          (settings.cost_ledger_flush_batch_size / cost_ledger_flush_interval_ms)
 
     See Also:
         - CostTracker: Main cost tracking class
@@ -481,8 +812,24 @@ def get_cost_tracker() -> CostTracker:
     """
     global _cost_tracker_instance
     if _cost_tracker_instance is None:
-        _cost_tracker_instance = CostTracker()
+        from src.core.config import settings
+
+        _cost_tracker_instance = CostTracker(
+            write_behind=True,
+            flush_batch_size=settings.cost_ledger_flush_batch_size,
+            flush_interval_ms=settings.cost_ledger_flush_interval_ms,
+        )
         logger.info(
             "cost_tracker_singleton_initialized", db_path=str(_cost_tracker_instance.db_path)
         )
     return _cost_tracker_instance
+
+
+async def close_cost_tracker() -> None:
+    """Drain buffered rows of the singleton tracker (application shutdown).
+
+    Example:
+        >>> await close_cost_tracker()
+    """
+    if _cost_tracker_instance is not None:
+        await _cost_tracker_instance.close()
@@ -29,6 +29,7 @@ Responsibilities:
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 from enum import Enum
@@ -86,8 +87,13 @@ except ImportError:
 
 from src.core.exceptions import LLMExecutionError
 from src.domains.llm_integration.cache import PromptCacheService
+from src.domains.llm_integration.cache.single_flight import SingleFlight, build_inflight_key
+from src.domains.llm_integration.proxy.vllm_admission import (
+    VLLMAdmissionController,
+    parse_vllm_queue_metrics,
+)
 from src.domains.llm_integration.config import LLMProxyConfig, get_llm_proxy_config
-from src.domains.llm_integration.cost import CostTracker
+from src.domains.llm_integration.cost import CostTracker, get_cost_tracker
 from src.domains.llm_integration.models import (
     Complexity,
     DataClassification,
@@ -149,13 +155,19 @@ class AegisLLMProxy:
         print(f"Provider: {response.provider}, Cost: ${response.cost_usd}")
     """
 
-    def __init__(self, config: LLMProxyConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: LLMProxyConfig | None = None,
+        cost_tracker: CostTracker | None = None,
+    ) -> None:
         """
         Initialize AegisLLMProxy with configuration.
 
         Args:
             config: Configuration for providers, budgets, routing.
                     If None, loads from config/llm_config.yml + environment.
+            cost_tracker: Cost ledger to record requests in.
+                    If None, uses the shared write-behind tracker.
 
         Raises:
             ValueError: If configuration is invalid or required providers missing
@@ -166,13 +178,18 @@ class AegisLLMProxy:
         if not self.config.is_provider_enabled("local_ollama"):
             raise ValueError("local_ollama provider is required but not configured")
 
-        # Initialize persistent cost tracker (SQLite)
-        self.cost_tracker = CostTracker()
+        # Persistent cost tracker (SQLite). Sprint 130: shared write-behind ledger,
+        # so track_request never blocks the event loop on a SQLite commit and the
+        # admin cost endpoints see the same in-memory aggregates
+        self.cost_tracker: CostTracker = cost_tracker or get_cost_tracker()
 
         # Sprint 63 Feature 63.3: Initialize prompt cache service
         self.cache_service = PromptCacheService()
         self._cache_enabled = True  # Can be disabled per-request if needed
 
+        # Sprint 130 Feature 130.6: In-flight request coalescing
+        self._single_flight = SingleFlight()
+
         # Track budgets (simplified - no ANY-LLM BudgetManager needed)
         # Load current month spending from DB
         self._monthly_spending = self.cost_tracker.get_monthly_spending()
@@ -184,6 +201,7 @@ class AegisLLMProxy:
         # Track metrics
         self._request_count = 0
         self._total_cost = 0.0
+        self._total_tokens = 0
 
         # Sprint 125 Feature 125.2: vLLM health check caching
         self._vllm_health_cache: bool = False
@@ -202,6 +220,16 @@ class AegisLLMProxy:
         self._vllm_base_url = settings.vllm_base_url
         self._vllm_model = settings.vllm_model
         self._redis_url = f"redis://{settings.redis_host}:{settings.redis_port}/0"
+        self._coalescing_enabled = settings.llm_request_coalescing_enabled
+
+        # Sprint 130 Feature 130.7: Local vLLM admission control
+        # /metrics is only read in the background (shared client) for reconciliation
+        self._vllm_metrics_client: httpx.AsyncClient | None = None
+        self._vllm_admission = VLLMAdmissionController(
+            max_concurrent=settings.vllm_max_concurrent_requests,
+            metrics_fetcher=self._scrape_vllm_metrics,
+            reconcile_interval_s=settings.vllm_metrics_reconcile_interval_s,
+        )
 
         # Sprint 125 Feature 125.3: Strict Docker profile separation
         # Load AEGIS_MODE to determine which LLM server is running
@@ -215,6 +243,7 @@ class AegisLLMProxy:
             budgets=self.config.budgets.get("monthly_limits", {}),
             current_spending=self._monthly_spending,
             cache_enabled=self._cache_enabled,
+            coalescing_enabled=self._coalescing_enabled,
             vllm_enabled=self._vllm_enabled,
             vllm_base_url=self._vllm_base_url if self._vllm_enabled else None,
             aegis_mode=self._aegis_mode,
@@ -297,73 +326,91 @@ class AegisLLMProxy:
             return False
 
     async def get_vllm_active_requests(self) -> int:
-        """Query vLLM for number of active/pending requests.
+        """Get number of active/pending vLLM requests.
 
         Sprint 128 Feature 128.2: Cascade timeout guard to prevent competing requests.
+        Sprint 130 Feature 130.7: Served from the local admission controller (in-flight +
+        abandoned + reconciled external requests). External load is re-read from /metrics
+        at most once per vllm_metrics_reconcile_interval_s instead of on every call.
 
         Returns:
-            Number of active + waiting requests in vLLM queue (0 if vLLM unreachable)
+            Number of active + waiting requests in vLLM queue (0 if vLLM disabled)
 
         Example:
             active = await proxy.get_vllm_active_requests()
             if active >= max_workers:
-                await asyncio.sleep(30)  # Wait for capacity
+                await proxy.wait_for_vllm_capacity(max_workers, timeout_s=60)
         """
         if not self._vllm_enabled:
             return 0
+        return await self._vllm_admission.refresh()
 
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                # vLLM exposes Prometheus metrics at /metrics
-                response = await client.get(f"{self._vllm_base_url}/metrics")
-
-                if response.status_code != 200:
-                    logger.debug(
-                        "vllm_metrics_unavailable",
-                        status_code=response.status_code,
-                    )
-                    return 0
-
-                # Parse Prometheus metrics for active request counts
-                # Metrics format:
-                #   vllm:num_requests_running{model="..."} 2.0
-                #   vllm:num_requests_waiting{model="..."} 1.0
-                metrics_text = response.text
-                running = 0
-                waiting = 0
-
-                for line in metrics_text.split("\n"):
-                    if line.startswith("vllm:num_requests_running"):
-                        # Extract value (last token after space)
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            try:
-                                running = int(float(parts[-1]))
-                            except ValueError:
-                                pass
-                    elif line.startswith("vllm:num_requests_waiting"):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            try:
-                                waiting = int(float(parts[-1]))
-                            except ValueError:
-                                pass
-
-                total = running + waiting
-                logger.debug(
-                    "vllm_active_requests_check",
-                    running=running,
-                    waiting=waiting,
-                    total=total,
-                )
-                return total
+    async def get_vllm_free_slots(self) -> int:
+        """Get number of vLLM requests that can be admitted without queueing.
 
-        except Exception as e:
-            logger.debug(
-                "vllm_active_requests_check_failed",
-                error=repr(e),
-            )
-            return 0  # Assume no active requests if unreachable
+        Sprint 130 Feature 130.8: Capacity signal for concurrent batch extraction.
+
+        Returns:
+            Free admission slots (0 if vLLM disabled)
+        """
+        if not self._vllm_enabled:
+            return 0
+        load = await self._vllm_admission.refresh()
+        return max(0, self._vllm_admission.max_concurrent - load)
+
+    async def wait_for_vllm_capacity(self, max_active: int, timeout_s: float | None = None) -> bool:
+        """Wait until vLLM load drops below max_active.
+
+        Sprint 130 Feature 130.7: Waiters are woken as soon as a request completes
+        (or reconciliation shows abandoned requests have finished), no sleep polling.
+
+        Args:
+            max_active: Load threshold (e.g. AEGIS_EXTRACTION_WORKERS)
+            timeout_s: Maximum time to wait (None = no limit)
+
+        Returns:
+            True if capacity is available, False if the timeout expired first
+        """
+        if not self._vllm_enabled:
+            return True
+        return await self._vllm_admission.wait_for_capacity(max_active, timeout_s=timeout_s)
+
+    async def reconcile_vllm_load(self) -> int:
+        """Reconcile local vLLM load with vLLM /metrics immediately.
+
+        Returns:
+            Reconciled vLLM load (0 if vLLM disabled)
+        """
+        if not self._vllm_enabled:
+            return 0
+        await self._vllm_admission.reconcile_now()
+        return self._vllm_admission.load
+
+    async def _scrape_vllm_metrics(self) -> tuple[int, int] | None:
+        """Read running/waiting request gauges from vLLM /metrics (shared client).
+
+        Returns:
+            Tuple of (running, waiting), or None if metrics are unavailable
+        """
+        if self._vllm_metrics_client is None:
+            self._vllm_metrics_client = httpx.AsyncClient(timeout=5.0)
+
+        # vLLM exposes Prometheus metrics at /metrics
+        #   vllm:num_requests_running{model="..."} 2.0
+        #   vllm:num_requests_waiting{model="..."} 1.0
+        response = await self._vllm_metrics_client.get(f"{self._vllm_base_url}/metrics")
+        if response.status_code != 200:
+            logger.debug("vllm_metrics_unavailable", status_code=response.status_code)
+            return None
+
+        running, waiting = parse_vllm_queue_metrics(response.text)
+        logger.debug(
+            "vllm_active_requests_reconciled",
+            running=running,
+            waiting=waiting,
+            in_flight=self._vllm_admission.in_flight,
+        )
+        return running, waiting
 
     async def _get_engine_mode(self) -> str:
         """Get LLM engine mode from Redis with 30s cache.
@@ -592,6 +639,91 @@ class AegisLLMProxy:
                     fallback_used=False,
                 )
 
+        # Sprint 130 Feature 130.6: Coalesce identical in-flight requests
+        # Concurrent cache misses for the same prompt share one provider call
+        if self._coalescing_enabled and use_cache and not stream:
+            inflight_key = build_inflight_key(
+                namespace=namespace,
+                model=model_hint,
+                prompt=task.prompt,
+                params={
+                    "task_type": task.task_type,
+                    "data_classification": task.data_classification,
+                    "quality_requirement": task.quality_requirement,
+                    "complexity": task.complexity,
+                    "model_cloud": task.model_cloud,
+                    "model_openai": task.model_openai,
+                    "max_tokens": task.max_tokens,
+                    "temperature": task.temperature,
+                },
+            )
+            result, shared = await self._single_flight.do(
+                inflight_key,
+                lambda: self._route_and_execute(
+                    task, stream, use_cache, namespace, emit_phase_event, start_time, model_hint
+                ),
+            )
+            if not shared:
+                return result
+
+            # Follower: reuse leader's content at zero cost (like a prompt cache hit)
+            from src.core.metrics import track_cache_hit
+
+            track_cache_hit("llm_inflight")
+            latency_ms = (time.time() - start_time) * 1000
+            logger.info(
+                "inflight_coalesced_returned",
+                task_id=str(task.id),
+                namespace=namespace,
+                model=model_hint,
+                latency_ms=latency_ms,
+            )
+            return result.model_copy(
+                update={
+                    "tokens_used": 0,
+                    "tokens_input": 0,
+                    "tokens_output": 0,
+                    "cost_usd": 0.0,
+                    "latency_ms": latency_ms,
+                    "routing_reason": "inflight_coalesced",
+                }
+            )
+
+        return await self._route_and_execute(
+            task, stream, use_cache, namespace, emit_phase_event, start_time, model_hint
+        )
+
+    async def _route_and_execute(
+        self,
+        task: LLMTask,
+        stream: bool,
+        use_cache: bool,
+        namespace: str,
+        emit_phase_event: bool,
+        start_time: float,
+        model_hint: str,
+    ) -> LLMResponse:
+        """
+        Route, execute (with fallback), cache and track a prompt-cache miss.
+
+        Sprint 130 Feature 130.6: Extracted from generate() so concurrent identical
+        requests can share one execution via SingleFlight.
+
+        Args:
+            task: LLM task
+            stream: Streaming flag (passed through to execution)
+            use_cache: Store the response in the prompt cache
+            namespace: Tenant namespace for cache isolation
+            emit_phase_event: Emit phase events for prompt tracing
+            start_time: Request start time (time.time()) for latency
+            model_hint: Model name used for cache keys
+
+        Returns:
+            LLMResponse from the routed provider (or local fallback)
+
+        Raises:
+            LLMExecutionError: If all providers fail
+        """
         # Step 1: AEGIS ROUTING LOGIC (custom)
         provider, reason = await self._route_task(task)
 
@@ -1001,6 +1133,17 @@ class AegisLLMProxy:
         """
         messages = [{"role": "user", "content": task.prompt}]
 
+        # Sprint 130 Feature 130.7: Admission control (queues locally when vLLM is saturated)
+        async with self._vllm_admission.slot() as slot:
+            try:
+                return await self._post_vllm_chat(messages, task)
+            except (httpx.TimeoutException, asyncio.TimeoutError):
+                # Client gave up, vLLM keeps processing the request server-side
+                slot.orphan()
+                raise
+
+    async def _post_vllm_chat(self, messages: list[dict[str, str]], task: LLMTask) -> LLMResponse:
+        """POST a chat completion to vLLM and build the LLMResponse."""
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
@@ -1574,6 +1717,7 @@ class AegisLLMProxy:
             result: Response with metrics
         """
         self._request_count += 1
+        self._total_tokens += result.tokens_used
 
         # Log structured metrics
         logger.info(
@@ -1589,7 +1733,8 @@ class AegisLLMProxy:
             fallback_used=result.fallback_used,
         )
 
-        # Persist to SQLite database (Sprint 23 - persistent cost tracking)
+        # Persist to SQLite database (Sprint 23 - persistent cost tracking,
+        # Sprint 130 - buffered and flushed in batches off the event loop)
         try:
             # Sprint 25 Feature 25.3: Extract accurate token split from response
             # Parse from result metadata if available, otherwise estimate 50/50
@@ -1679,6 +1824,8 @@ class AegisLLMProxy:
             "hit_rate": cache_stats.hit_rate,
             "total_requests": cache_stats.total_requests,
             "cached_size_bytes": cache_stats.cached_size_bytes,
+            # Sprint 130 Feature 130.6: In-flight coalescing
+            "inflight": self._single_flight.get_stats(),
         }
 
     async def invalidate_cache_namespace(self, namespace: str) -> int:
@@ -1775,6 +1922,7 @@ class AegisLLMProxy:
         return {
             "request_count": self._request_count,
             "total_cost_usd": self._total_cost,
+            "total_tokens": self._total_tokens,
             "providers_enabled": list(self.config.providers.keys()),
         }
 
@@ -0,0 +1,372 @@
+"""
+Push-based vLLM admission control.
+
+Sprint 130 Feature 130.7: vLLM Admission Controller
+
+Before this feature, vLLM load was discovered by polling: every check opened
+a new httpx client, downloaded the full Prometheus text from ``/metrics`` and
+parsed it line by line, and the extraction cascade guard slept 5-20s between
+checks. A slot that freed right after a check was only noticed up to 20s later.
+
+VLLMAdmissionController counts vLLM requests locally and wakes waiters the
+moment a slot frees:
+
+    _call_vllm ─→ acquire() ─→ [in_flight += 1] ─→ POST ─→ release() ─→ notify waiters
+                                                    │
+                                       timeout/cancel: request keeps running
+                                       server-side → counted as "orphaned"
+
+Load = in_flight (this process)
+     + orphaned  (abandoned requests likely still running in vLLM)
+     + external  (requests from other processes, e.g. API + ingestion container)
+
+``/metrics`` is scraped in the background (shared client) while orphaned or
+external load is outstanding, to reconcile the last two terms with reality.
+Load queries (``refresh()``) also reconcile when the last scrape is older than
+``reconcile_interval_s``, so load from other processes is seen from a clean
+state without a scrape per call. Orphans also expire after ``orphan_ttl_s`` in
+case metrics are unreachable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Returns (running, waiting) from vLLM /metrics, or None if unavailable
+MetricsFetcher = Callable[[], Awaitable[tuple[int, int] | None]]
+
+
+def parse_vllm_queue_metrics(metrics_text: str) -> tuple[int, int]:
+    """
+    Parse running/waiting request gauges from vLLM Prometheus text.
+
+    Args:
+        metrics_text: Body of vLLM ``/metrics``
+
+    Returns:
+        Tuple of (running, waiting); malformed values count as 0
+
+    Example:
+        >>> parse_vllm_queue_metrics('vllm:num_requests_running{model="m"} 2.0')
+        (2, 0)
+    """
+    running = 0
+    waiting = 0
+    for line in metrics_text.split("\n"):
+        if line.startswith("vllm:num_requests_running"):
+            target = "running"
+        elif line.startswith("vllm:num_requests_waiting"):
+            target = "waiting"
+        else:
+            continue
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        try:
+            value = int(float(parts[-1]))
+        except ValueError:
+            continue
+        if target == "running":
+            running = value
+        else:
+            waiting = value
+    return running, waiting
+
+
+class VLLMAdmissionController:
+    """
+    Local admission controller for vLLM requests.
+
+    Example:
+        controller = VLLMAdmissionController(max_concurrent=64, metrics_fetcher=fetch)
+
+        async with controller.slot() as slot:
+            try:
+                response = await client.post(...)
+            except httpx.TimeoutException:
+                slot.orphan()  # vLLM keeps processing server-side
+                raise
+
+        # Cascade guard: wait (event-driven) until load drops below 2
+        await controller.wait_for_capacity(max_active=2, timeout_s=60)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        metrics_fetcher: MetricsFetcher | None = None,
+        reconcile_interval_s: float = 5.0,
+        orphan_ttl_s: float = 600.0,
+    ) -> None:
+        """
+        Initialize admission controller.
+
+        Args:
+            max_concurrent: Maximum concurrent vLLM requests admitted from this process
+            metrics_fetcher: Background /metrics reader for reconciliation (None = local only)
+            reconcile_interval_s: Interval between background reconciliations
+            orphan_ttl_s: Time after which an abandoned request is assumed finished
+                (matches the vLLM request timeout)
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.metrics_fetcher = metrics_fetcher
+        self.reconcile_interval_s = reconcile_interval_s
+        self.orphan_ttl_s = orphan_ttl_s
+
+        self.in_flight = 0
+        self.external = 0
+        self._orphans: deque[float] = deque()  # monotonic timestamps, oldest first
+        self._waiters: list[asyncio.Future] = []
+        self._reconcile_task: asyncio.Task | None = None
+        self._last_reconcile_at = float("-inf")  # monotonic time of the last scrape attempt
+
+        # Stats
+        self.admitted = 0
+        self.queued = 0
+        self.reconciliations = 0
+
+    # ------------------------------------------------------------------
+    # Load
+    # ------------------------------------------------------------------
+
+    @property
+    def orphaned(self) -> int:
+        """Abandoned requests assumed to still run in vLLM."""
+        cutoff = time.monotonic() - self.orphan_ttl_s
+        while self._orphans and self._orphans[0] < cutoff:
+            self._orphans.popleft()
+        return len(self._orphans)
+
+    @property
+    def load(self) -> int:
+        """Current vLLM load (in-flight + orphaned + external)."""
+        return self.in_flight + self.orphaned + self.external
+
+    async def refresh(self) -> int:
+        """
+        Reconcile with vLLM /metrics if the last scrape is stale, then return the load.
+
+        Returns:
+            Current vLLM load including external requests
+        """
+        if (
+            self.metrics_fetcher is not None
+            and time.monotonic() - self._last_reconcile_at >= self.reconcile_interval_s
+        ):
+            await self._reconcile_once()
+            if self.external:
+                # Keep external load fresh for queued acquire() calls
+                self._ensure_reconciler()
+        return self.load
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and admit one request."""
+        if self.load >= self.max_concurrent:
+            self.queued += 1
+            await self._wait_until(lambda: self.load < self.max_concurrent, timeout_s=None)
+        self.in_flight += 1
+        self.admitted += 1
+        self._update_metrics()
+
+    def release(self, orphaned: bool = False) -> None:
+        """
+        Release a slot and wake waiters.
+
+        Args:
+            orphaned: The client gave up (timeout/cancel) but vLLM is likely still
+                processing the request; keep counting it until reconciled or expired
+        """
+        self.in_flight = max(0, self.in_flight - 1)
+        if orphaned:
+            self._orphans.append(time.monotonic())
+            self._ensure_reconciler()
+        self._update_metrics()
+        self._notify()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[_Slot]:
+        """
+        Admit one request for the duration of the context.
+
+        Cancellation (e.g. an outer ``asyncio.wait_for`` timing out) marks the
+        request as orphaned automatically.
+        """
+        await self.acquire()
+        handle = _Slot()
+        try:
+            yield handle
+        except asyncio.CancelledError:
+            handle.orphan()
+            raise
+        finally:
+            self.release(orphaned=handle.orphaned)
+
+    async def wait_for_capacity(self, max_active: int, timeout_s: float | None = None) -> bool:
+        """
+        Wait until load drops below max_active (woken on every release/reconciliation).
+
+        Args:
+            max_active: Load threshold
+            timeout_s: Maximum time to wait (None = no limit)
+
+        Returns:
+            True if capacity is available, False if the timeout expired first
+        """
+        if await self.refresh() < max_active:
+            return True
+        self._ensure_reconciler()
+        return await self._wait_until(lambda: self.load < max_active, timeout_s=timeout_s)
+
+    # ------------------------------------------------------------------
+    # Reconciliation
+    # ------------------------------------------------------------------
+
+    def reconcile(self, running: int, waiting: int) -> None:
+        """
+        Reconcile local counts with vLLM's own view.
+
+        Server load not explained by our in-flight requests is either our orphans
+        (still running) or requests from other processes.
+
+        Args:
+            running: vllm:num_requests_running
+            waiting: vllm:num_requests_waiting
+        """
+        unexplained = max(0, running + waiting - self.in_flight)
+        # Orphans beyond the unexplained server load have finished (oldest first)
+        while self.orphaned > unexplained:
+            self._orphans.popleft()
+        self.external = unexplained - len(self._orphans)
+        self.reconciliations += 1
+        self._update_metrics()
+        self._notify()
+
+    async def reconcile_now(self) -> bool:
+        """
+        Scrape vLLM metrics once and reconcile.
+
+        Returns:
+            True if metrics were available
+        """
+        if self.metrics_fetcher is None:
+            return False
+        self._last_reconcile_at = time.monotonic()
+        try:
+            result = await self.metrics_fetcher()
+        except Exception as e:
+            logger.debug("vllm_admission_reconcile_failed", error=repr(e))
+            return False
+        if result is None:
+            return False
+        self.reconcile(*result)
+        return True
+
+    def _ensure_reconciler(self) -> None:
+        if self.metrics_fetcher is None:
+            return
+        if self._reconcile_task is not None and not self._reconcile_task.done():
+            return
+        try:
+            self._reconcile_task = asyncio.get_running_loop().create_task(self._reconcile_loop())
+        except RuntimeError:
+            # No running loop (sync caller) - reconciliation starts with the next waiter
+            self._reconcile_task = None
+
+    async def _reconcile_once(self) -> None:
+        if not await self.reconcile_now():
+            # Metrics unreachable: external load is unknown, rely on orphan TTL
+            self.external = 0
+            self._notify()
+
+    async def _reconcile_loop(self) -> None:
+        """Reconcile periodically while orphaned/external load or waiters remain."""
+        while True:
+            await self._reconcile_once()
+            if not (self.orphaned or self.external or self._waiters):
+                return
+            await asyncio.sleep(self.reconcile_interval_s)
+
+    # ------------------------------------------------------------------
+    # Waiting
+    # ------------------------------------------------------------------
+
+    async def _wait_until(self, predicate: Callable[[], bool], timeout_s: float | None) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout_s is None else loop.time() + timeout_s
+        while not predicate():
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+            if self._orphans:
+                # Wake up for orphan expiry even without releases
+                ttl_left = self._orphans[0] + self.orphan_ttl_s - time.monotonic()
+                remaining = max(0.0, ttl_left) if remaining is None else min(remaining, ttl_left)
+
+            future = loop.create_future()
+            self._waiters.append(future)
+            try:
+                await asyncio.wait_for(future, timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if future in self._waiters:
+                    self._waiters.remove(future)
+        return True
+
+    def _notify(self) -> None:
+        for future in self._waiters:
+            if not future.done():
+                future.set_result(None)
+
+    def _update_metrics(self) -> None:
+        try:
+            from src.core.metrics import update_vllm_admission_metrics
+
+            update_vllm_admission_metrics(self.in_flight, self.orphaned, self.external)
+        except ImportError:
+            pass
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get admission statistics.
+
+        Returns:
+            Dict with current load breakdown and counters
+        """
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self.in_flight,
+            "orphaned": self.orphaned,
+            "external": self.external,
+            "load": self.load,
+            "waiting": len(self._waiters),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "reconciliations": self.reconciliations,
+        }
+
+
+class _Slot:
+    """Handle for one admitted vLLM request."""
+
+    def __init__(self) -> None:
+        self.orphaned = False
+
+    def orphan(self) -> None:
+        """Mark the request as abandoned client-side but still running in vLLM."""
+        self.orphaned = True
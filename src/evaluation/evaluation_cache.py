@@ -0,0 +1,213 @@
+"""On-disk checkpoint and result cache for RAG evaluation runs.
+
+Sprint 130 Feature 130.13: Resumable RAGAS Evaluation
+
+Retrieval and answer generation dominate benchmark runtime (hours for 500
+questions), and a crash used to lose every sample. EvaluationCache appends
+each finished sample to a JSONL file as soon as it completes:
+
+    {cache_dir}/{namespace}/outputs_{pipeline_hash}.jsonl
+        one line per sample: question key, contexts, answer
+    {cache_dir}/{namespace}/scores_{pipeline_hash}_{scorer_hash}.jsonl
+        one line per scored sample: question key, metric scores
+
+Outputs are keyed by (question, namespace, pipeline-config hash). The pipeline
+hash covers only what changes retrieval and generation (top_k, generation model,
+prompt version, ...), so re-running after a scorer-only change (metrics, judge
+model) reuses all outputs and only re-scores. Re-running the same config
+resumes where the previous run stopped.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Default checkpoint location (relative to the working directory)
+DEFAULT_EVALUATION_CACHE_DIR = Path("data/evaluation/cache")
+
+
+def config_hash(config: dict[str, Any]) -> str:
+    """Stable short hash of a JSON-serializable config dict.
+
+    Args:
+        config: Config values (key order does not matter)
+
+    Returns:
+        16-character hex digest
+    """
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def sample_key(question: str, namespace: str, pipeline_hash: str) -> str:
+    """Cache key of one benchmark question.
+
+    Args:
+        question: Benchmark question
+        namespace: Evaluation namespace
+        pipeline_hash: Hash of the retrieval/generation config
+
+    Returns:
+        Hex digest identifying the sample output
+    """
+    payload = json.dumps([question, namespace, pipeline_hash])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """Append-only JSONL cache of per-sample outputs and scores.
+
+    Example:
+        >>> cache = EvaluationCache("data/evaluation/cache", "eval_hotpotqa",
+        ...                         pipeline_config={"top_k": 10}, scorer_config={...})
+        >>> cache.get_output(question)  # None on first run
+        >>> cache.put_output(question, contexts, answer)
+        >>> cache.put_scores(question, {"faithfulness": 0.9})
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        namespace: str,
+        pipeline_config: dict[str, Any],
+        scorer_config: dict[str, Any],
+    ) -> None:
+        """Open (or create) the cache files for one namespace and config.
+
+        Args:
+            cache_dir: Root directory of the evaluation cache
+            namespace: Evaluation namespace
+            pipeline_config: Settings that affect retrieval and generation
+            scorer_config: Settings that affect scoring only
+        """
+        self.namespace = namespace
+        self.pipeline_hash = config_hash(pipeline_config)
+        self.scorer_hash = config_hash(scorer_config)
+
+        directory = Path(cache_dir) / namespace
+        directory.mkdir(parents=True, exist_ok=True)
+        self.outputs_path = directory / f"outputs_{self.pipeline_hash}.jsonl"
+        self.scores_path = directory / f"scores_{self.pipeline_hash}_{self.scorer_hash}.jsonl"
+
+        self._outputs = self._load(self.outputs_path)
+        self._scores = self._load(self.scores_path)
+        self._terminate_last_line(self.outputs_path)
+        self._terminate_last_line(self.scores_path)
+
+        logger.info(
+            "evaluation_cache_opened",
+            namespace=namespace,
+            pipeline_hash=self.pipeline_hash,
+            scorer_hash=self.scorer_hash,
+            cached_outputs=len(self._outputs),
+            cached_scores=len(self._scores),
+        )
+
+    @staticmethod
+    def _load(path: Path) -> dict[str, dict[str, Any]]:
+        """Load a JSONL cache file (a truncated last line from a crash is skipped)."""
+        records: dict[str, dict[str, Any]] = {}
+        if not path.exists():
+            return records
+
+        with open(path, encoding="utf-8") as f:
+            for line_num, line in enumerate(f, start=1):
+                try:
+                    record = json.loads(line)
+                    records[record["key"]] = record
+                except (ValueError, KeyError, TypeError):
+                    logger.warning("evaluation_cache_line_skipped", path=str(path), line=line_num)
+        return records
+
+    @staticmethod
+    def _terminate_last_line(path: Path) -> None:
+        """Start appends on a fresh line if a crash left a partial last line."""
+        if not path.exists() or path.stat().st_size == 0:
+            return
+        with open(path, "rb") as f:
+            f.seek(-1, 2)
+            ends_with_newline = f.read(1) == b"\n"
+        if not ends_with_newline:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("\n")
+
+    @staticmethod
+    def _append(path: Path, record: dict[str, Any]) -> None:
+        """Append one record and flush it to disk (checkpoint)."""
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+
+    def key(self, question: str) -> str:
+        """Cache key of a question in this namespace and pipeline config."""
+        return sample_key(question, self.namespace, self.pipeline_hash)
+
+    def get_output(self, question: str) -> dict[str, Any] | None:
+        """Get cached retrieval/generation output.
+
+        Args:
+            question: Benchmark question
+
+        Returns:
+            Dict with contexts and answer, or None if not cached
+        """
+        return self._outputs.get(self.key(question))
+
+    def put_output(self, question: str, contexts: list[str], answer: str) -> None:
+        """Checkpoint retrieval/generation output of one sample.
+
+        Args:
+            question: Benchmark question
+            contexts: Retrieved contexts
+            answer: Generated answer
+        """
+        record = {
+            "key": self.key(question),
+            "question": question,
+            "contexts": contexts,
+            "answer": answer,
+        }
+        self._append(self.outputs_path, record)
+        self._outputs[record["key"]] = record
+
+    def get_scores(self, question: str) -> dict[str, float] | None:
+        """Get cached metric scores of one sample.
+
+        Args:
+            question: Benchmark question
+
+        Returns:
+            Metric name → score, or None if not scored yet
+        """
+        record = self._scores.get(self.key(question))
+        return record["scores"] if record else None
+
+    def put_scores(self, question: str, scores: dict[str, float]) -> None:
+        """Checkpoint metric scores of one sample.
+
+        Args:
+            question: Benchmark question
+            scores: Metric name → score
+        """
+        record = {"key": self.key(question), "scores": scores}
+        self._append(self.scores_path, record)
+        self._scores[record["key"]] = record
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Stats dict with hashes and cached record counts
+        """
+        return {
+            "namespace": self.namespace,
+            "pipeline_hash": self.pipeline_hash,
+            "scorer_hash": self.scorer_hash,
+            "cached_outputs": len(self._outputs),
+            "cached_scores": len(self._scores),
+        }
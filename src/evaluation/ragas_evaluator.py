@@ -10,6 +10,9 @@ This module provides:
 - Per-intent metric breakdown (vector, graph, hybrid)
 - Batch evaluation support with configurable batch size
 - Integration with FourWayHybridSearch for namespace filtering
+- Concurrent, resumable runs: per-sample outputs and scores are checkpointed to
+  an on-disk cache keyed by (question, namespace, pipeline-config hash)
+  (Sprint 130 Feature 130.13)
 
 Metrics:
     - Context Precision: Relevance of retrieved contexts to the answer
@@ -57,6 +60,7 @@ from src.components.llm_proxy.aegis_llm_proxy import get_aegis_llm_proxy
 from src.components.llm_proxy.models import LLMTask, TaskType
 from src.components.retrieval.four_way_hybrid_search import get_four_way_hybrid_search
 from src.core.exceptions import EvaluationError
+from src.evaluation.evaluation_cache import DEFAULT_EVALUATION_CACHE_DIR, EvaluationCache
 
 logger = structlog.get_logger(__name__)
 
@@ -212,6 +216,9 @@ class EvaluationResults:
 
 OLLAMA_BASE_URL = "http://localhost:11434"
 
+# Bump when the answer generation prompt changes (invalidates cached outputs)
+ANSWER_PROMPT_VERSION = 1
+
 
 # =============================================================================
 # RAGAS Evaluator
@@ -253,6 +260,7 @@ class RAGASEvaluator:
         llm_model: str = "qwen3:8b",
         embedding_model: str = "bge-m3:latest",
         metrics: list[str] | None = None,
+        cache_dir: str | Path | None = DEFAULT_EVALUATION_CACHE_DIR,
     ):
         """Initialize RAGAS evaluator.
 
@@ -261,8 +269,10 @@ class RAGASEvaluator:
             llm_model: LLM model for RAGAS evaluation (default: qwen3:8b)
             embedding_model: Embedding model for RAGAS (default: bge-m3:latest)
             metrics: List of metrics to compute (default: all 4 metrics)
+            cache_dir: Directory for per-sample checkpoints (None disables caching)
         """
         self.namespace = namespace
+        self.cache_dir = cache_dir
         self.llm_model = llm_model
         self.embedding_model = embedding_model
         self.metrics_list = metrics or [
@@ -431,12 +441,43 @@ Answer: """
 
         return response.content
 
+    def open_cache(self, top_k: int = 10) -> EvaluationCache:
+        """Open the checkpoint cache for this namespace and pipeline config.
+
+        Only retrieval/generation settings go into the pipeline hash; metric and
+        judge settings go into the scorer hash, so changing them re-scores cached
+        outputs without re-running retrieval and generation.
+
+        Args:
+            top_k: Number of contexts retrieved per query
+
+        Returns:
+            EvaluationCache
+        """
+        return EvaluationCache(
+            cache_dir=self.cache_dir or DEFAULT_EVALUATION_CACHE_DIR,
+            namespace=self.namespace,
+            pipeline_config={
+                "top_k": top_k,
+                "use_reranking": True,
+                "generation_model": self.llm_model,
+                "answer_prompt_version": ANSWER_PROMPT_VERSION,
+            },
+            scorer_config={
+                "metrics": sorted(self.metrics_list),
+                "judge_model": self.llm_model,
+                "embedding_model": self.embedding_model,
+            },
+        )
+
     async def evaluate_rag_pipeline(
         self,
         dataset: list[BenchmarkSample],
         sample_size: int | None = None,
         batch_size: int = 10,
         top_k: int = 10,
+        max_concurrency: int = 4,
+        seed: int | None = None,
     ) -> EvaluationResults:
         """Evaluate complete RAG pipeline (retrieval + generation).
 
@@ -446,11 +487,19 @@ Answer: """
         3. Computes all 4 RAGAS metrics
         4. Aggregates results overall and per-intent
 
+        Sprint 130 Feature 130.13: Samples are processed concurrently (bounded by
+        ``max_concurrency``) and scored in batches of ``batch_size``. Every
+        finished output and score is checkpointed to ``cache_dir``; re-running
+        resumes from the checkpoint and skips cached retrieval/generation.
+
         Args:
             dataset: List of benchmark samples
             sample_size: Number of samples to evaluate (None = all)
-            batch_size: Batch size for evaluation
+            batch_size: Samples per RAGAS scoring batch (and checkpoint)
             top_k: Number of contexts to retrieve per query
+            max_concurrency: Max samples in retrieval/generation at once
+            seed: Random seed for ``sample_size`` sampling (set it to resume a
+                sampled run with the same subset)
 
         Returns:
             Complete evaluation results with per-intent breakdown
@@ -464,106 +513,28 @@ Answer: """
         if sample_size and sample_size < len(dataset):
             import random
 
-            dataset = random.sample(dataset, sample_size)
-            logger.info("dataset_sampled", original_size=len(dataset), sample_size=sample_size)
+            original_size = len(dataset)
+            dataset = random.Random(seed).sample(dataset, sample_size)
+            logger.info("dataset_sampled", original_size=original_size, sample_size=sample_size)
 
         logger.info(
             "starting_rag_evaluation",
             num_samples=len(dataset),
             namespace=self.namespace,
             batch_size=batch_size,
+            max_concurrency=max_concurrency,
         )
 
-        # Process samples: retrieve contexts and generate answers
-        evaluated_samples = []
-        for i, sample in enumerate(dataset):
-            logger.info(
-                "evaluating_sample",
-                sample_idx=i + 1,
-                total_samples=len(dataset),
-                question=sample.question[:50],
-            )
-
-            # ALWAYS retrieve contexts from Qdrant for RAG evaluation
-            # This tests the actual retrieval system, not pre-defined contexts
-            contexts = await self.retrieve_contexts(sample.question, top_k=top_k)
-
-            # Sprint 75: Context truncation NO LONGER NEEDED with 16K context window!
-            # OLLAMA_NUM_CTX=16384 (was 8192) + num_predict=512 (was 2048)
-            # = ~59K chars available (was ~20K) - covers all documents in corpus
-            # See: docs/sprints/SPRINT_75_RAGAS_FAILURE_ANALYSIS.md
-            # contexts = prepare_contexts_for_ragas(contexts, max_length=20000)  # DISABLED
-
-            # Log if we retrieved fewer contexts than expected
-            if len(contexts) < top_k:
-                logger.warning(
-                    "fewer_contexts_retrieved",
-                    question=sample.question[:50],
-                    expected=top_k,
-                    retrieved=len(contexts),
-                )
-
-            # Generate answer if not provided
-            if not sample.answer:
-                answer = await self.generate_answer(sample.question, contexts)
-            else:
-                answer = sample.answer
+        cache = self.open_cache(top_k) if self.cache_dir else None
 
-            # Store evaluated sample
-            evaluated_samples.append(
-                {
-                    "question": sample.question,
-                    "contexts": contexts,
-                    "answer": answer,
-                    "ground_truth": sample.ground_truth,
-                    "metadata": sample.metadata,
-                }
-            )
-
-        # Convert to RAGAS dataset format
-        ragas_dataset = Dataset.from_dict(
-            {
-                "question": [s["question"] for s in evaluated_samples],
-                "contexts": [s["contexts"] for s in evaluated_samples],
-                "answer": [s["answer"] for s in evaluated_samples],
-                "ground_truth": [s["ground_truth"] for s in evaluated_samples],
-            }
-        )
-
-        # Get RAGAS metrics
-        metrics = self._get_ragas_metrics()
-
-        logger.info("running_ragas_evaluation", num_samples=len(evaluated_samples))
-
-        # Configure RAGAS run settings with increased timeout for local Ollama
-        from ragas.run_config import RunConfig
-
-        run_config = RunConfig(
-            timeout=600,  # 10 minutes per operation (local Ollama with large contexts)
-            max_retries=2,
-            max_wait=60,
-            max_workers=1,  # Sequential execution to avoid Ollama overload
+        # Process samples: retrieve contexts and generate answers
+        evaluated_samples, cached_outputs = await self._run_samples(
+            dataset, top_k, max_concurrency, cache
         )
+        generation_seconds = time.perf_counter() - start_time
 
-        # Run RAGAS evaluation (blocking, so run in executor)
-        try:
-            loop = asyncio.get_event_loop()
-            eval_result = await loop.run_in_executor(
-                None,
-                lambda: evaluate(
-                    dataset=ragas_dataset,
-                    metrics=metrics,
-                    llm=self.llm,
-                    embeddings=self.embeddings,
-                    run_config=run_config,
-                ),
-            )
-        except Exception as e:
-            logger.error("ragas_evaluation_failed", error=str(e))
-            raise EvaluationError(f"RAGAS evaluation failed: {e}") from e
-
-        # Extract scores
-        df = eval_result.to_pandas()
+        # Score in batches (checkpointed per sample)
+        df = await self._score_samples(evaluated_samples, batch_size, cache)
 
         overall_metrics = MetricScores(
             context_precision=float(df["context_precision"].mean()),
@@ -587,6 +558,10 @@ Answer: """
                 "llm_model": self.llm_model,
                 "top_k": top_k,
                 "batch_size": batch_size,
+                "max_concurrency": max_concurrency,
+                "cached_outputs": cached_outputs,
+                "generation_seconds": round(generation_seconds, 2),
+                "pipeline_hash": cache.pipeline_hash if cache else None,
             },
         )
 
@@ -603,6 +578,199 @@ Answer: """
 
         return results
 
+    async def _run_samples(
+        self,
+        dataset: list[BenchmarkSample],
+        top_k: int,
+        max_concurrency: int,
+        cache: EvaluationCache | None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Retrieve contexts and generate answers with bounded concurrency.
+
+        Args:
+            dataset: Benchmark samples
+            top_k: Number of contexts to retrieve per query
+            max_concurrency: Max samples in flight
+            cache: Checkpoint cache (None = no caching)
+
+        Returns:
+            Tuple of (evaluated samples in dataset order, number of cache hits)
+
+        Raises:
+            EvaluationError: If any sample failed (finished samples stay checkpointed)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        total = len(dataset)
+        progress = {"completed": 0, "cached": 0}
+        run_start = time.perf_counter()
+
+        async def evaluate_sample(sample: BenchmarkSample) -> dict[str, Any]:
+            cached = cache.get_output(sample.question) if cache else None
+
+            if cached is not None:
+                contexts, answer = cached["contexts"], cached["answer"]
+                progress["cached"] += 1
+            else:
+                async with semaphore:
+                    # ALWAYS retrieve contexts from Qdrant for RAG evaluation
+                    # This tests the actual retrieval system, not pre-defined contexts
+                    contexts = await self.retrieve_contexts(sample.question, top_k=top_k)
+
+                    # Log if we retrieved fewer contexts than expected
+                    if len(contexts) < top_k:
+                        logger.warning(
+                            "fewer_contexts_retrieved",
+                            question=sample.question[:50],
+                            expected=top_k,
+                            retrieved=len(contexts),
+                        )
+
+                    # Generate answer if not provided
+                    if not sample.answer:
+                        answer = await self.generate_answer(sample.question, contexts)
+                    else:
+                        answer = sample.answer
+
+                if cache:
+                    cache.put_output(sample.question, contexts, answer)
+
+            progress["completed"] += 1
+            processed = progress["completed"] - progress["cached"]
+            elapsed = time.perf_counter() - run_start
+            samples_per_minute = processed / elapsed * 60 if elapsed > 0 else 0.0
+            remaining = total - progress["completed"]
+            logger.info(
+                "evaluation_progress",
+                completed=progress["completed"],
+                total=total,
+                cached=progress["cached"],
+                samples_per_minute=round(samples_per_minute, 2),
+                eta_seconds=(
+                    round(remaining / samples_per_minute * 60) if samples_per_minute else None
+                ),
+                question=sample.question[:50],
+            )
+
+            return {
+                "question": sample.question,
+                "contexts": contexts,
+                "answer": answer,
+                "ground_truth": sample.ground_truth,
+                "metadata": sample.metadata,
+            }
+
+        outcomes = await asyncio.gather(
+            *(evaluate_sample(sample) for sample in dataset), return_exceptions=True
+        )
+
+        failures = [o for o in outcomes if isinstance(o, BaseException)]
+        if failures:
+            logger.error(
+                "evaluation_samples_failed",
+                failed=len(failures),
+                total=total,
+                first_error=str(failures[0]),
+            )
+            raise EvaluationError(
+                f"{len(failures)}/{total} samples failed (completed samples are "
+                f"checkpointed, re-run to resume): {failures[0]}"
+            ) from failures[0]
+
+        return list(outcomes), progress["cached"]
+
+    async def _score_samples(
+        self,
+        evaluated_samples: list[dict[str, Any]],
+        batch_size: int,
+        cache: EvaluationCache | None,
+    ) -> Any:
+        """Score samples with RAGAS in batches, reusing checkpointed scores.
+
+        Args:
+            evaluated_samples: Samples with question, contexts, answer, ground_truth
+            batch_size: Samples per RAGAS evaluate() call
+            cache: Checkpoint cache (None = no caching)
+
+        Returns:
+            DataFrame with one row of metric scores per sample (dataset order)
+
+        Raises:
+            EvaluationError: If RAGAS evaluation fails
+        """
+        import pandas as pd
+
+        scores: list[dict[str, float] | None] = [
+            cache.get_scores(s["question"]) if cache else None for s in evaluated_samples
+        ]
+        pending = [i for i, sample_scores in enumerate(scores) if sample_scores is None]
+
+        # Get RAGAS metrics
+        metrics = self._get_ragas_metrics()
+
+        logger.info(
+            "running_ragas_evaluation",
+            num_samples=len(evaluated_samples),
+            pending=len(pending),
+            cached_scores=len(evaluated_samples) - len(pending),
+        )
+
+        # Configure RAGAS run settings with increased timeout for local Ollama
+        from ragas.run_config import RunConfig
+
+        run_config = RunConfig(
+            timeout=600,  # 10 minutes per operation (local Ollama with large contexts)
+            max_retries=2,
+            max_wait=60,
+            max_workers=1,  # Sequential execution to avoid Ollama overload
+        )
+
+        for batch_start in range(0, len(pending), batch_size):
+            batch = [evaluated_samples[i] for i in pending[batch_start : batch_start + batch_size]]
+
+            # Convert to RAGAS dataset format
+            ragas_dataset = Dataset.from_dict(
+                {
+                    "question": [s["question"] for s in batch],
+                    "contexts": [s["contexts"] for s in batch],
+                    "answer": [s["answer"] for s in batch],
+                    "ground_truth": [s["ground_truth"] for s in batch],
+                }
+            )
+
+            # Run RAGAS evaluation (blocking, so run in executor)
+            try:
+                loop = asyncio.get_event_loop()
+                eval_result = await loop.run_in_executor(
+                    None,
+                    lambda ragas_dataset=ragas_dataset: evaluate(
+                        dataset=ragas_dataset,
+                        metrics=metrics,
+                        llm=self.llm,
+                        embeddings=self.embeddings,
+                        run_config=run_config,
+                    ),
+                )
+            except Exception as e:
+                logger.error("ragas_evaluation_failed", error=str(e))
+                raise EvaluationError(f"RAGAS evaluation failed: {e}") from e
+
+            batch_df = eval_result.to_pandas()
+            metric_columns = [name for name in self.metrics_list if name in batch_df.columns]
+            for offset, row in enumerate(batch_df.to_dict("records")):
+                index = pending[batch_start + offset]
+                sample_scores = {name: float(row[name]) for name in metric_columns}
+                scores[index] = sample_scores
+                if cache:
+                    cache.put_scores(evaluated_samples[index]["question"], sample_scores)
+
+            logger.info(
+                "ragas_batch_scored",
+                scored=min(batch_start + batch_size, len(pending)),
+                pending=len(pending),
+            )
+
+        return pd.DataFrame(scores)
+
     def _get_ragas_metrics(self) -> list:
         """Get RAGAS metric instances.
 
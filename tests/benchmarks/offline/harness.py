@@ -0,0 +1,485 @@
+"""Offline microbenchmark harness for the retrieval hot path.
+
+Runs the real retrieval code (FourWayHybridSearch, weighted RRF, QueryCache,
+CrossEncoderReranker, AdaptiveChunker) against the stand-ins in
+``standins.py`` and reports per-stage timings and allocations as JSON.
+
+Each stage is measured in two passes so tracing does not distort timings:
+
+1. Timing pass: ``iterations`` runs after ``warmup`` runs, wall-clock only
+   (p50/p95/mean/min in ms).
+2. Allocation pass: ``alloc_iterations`` runs under tracemalloc, reporting
+   the number of memory blocks and KiB allocated per call (net of frees)
+   and the peak traced memory of a single call.
+
+A report can be compared against a stored baseline with
+``compare_to_baseline()``; stages whose fastest run, peak memory or
+allocation count grew by more than the allowed ratio are reported as
+regressions.
+
+Example:
+    >>> report = asyncio.run(run_suite(SuiteConfig(iterations=50)))
+    >>> regressions = compare_to_baseline(report, load_report(BASELINE_PATH))
+"""
+
+import asyncio
+import gc
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from tests.benchmarks.offline.standins import (
+    COLLECTION_NAME,
+    DeterministicEmbeddingService,
+    HashCrossEncoder,
+    ReplayNeo4jClient,
+    SyntheticCorpus,
+    build_corpus,
+    create_qdrant_standin,
+    synthetic_neo4j_recording,
+)
+
+REPORT_VERSION = 1
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# Deltas below these are noise (timer resolution, interpreter caches) and never gate
+MIN_GATED_DELTA_MS = 0.1
+MIN_GATED_DELTA_KIB = 4.0
+MIN_GATED_DELTA_BLOCKS = 16
+
+StageFn = Callable[[int], Awaitable[Any]]
+
+
+@dataclass
+class SuiteConfig:
+    """Offline benchmark configuration.
+
+    Attributes:
+        iterations: Timed runs per stage
+        warmup: Untimed runs per stage before timing
+        alloc_iterations: Runs per stage under tracemalloc
+        num_chunks: Synthetic corpus size (Qdrant points)
+        top_k: Results per search
+        cache_entries: Queries preloaded into the QueryCache semantic tier
+        neo4j_recording: Replay a captured Neo4j recording instead of the
+            synthetic one
+        neo4j_latency_ms: Simulated Neo4j round-trip per query
+        stages: Only run stages whose name starts with one of these prefixes
+    """
+
+    iterations: int = 50
+    warmup: int = 5
+    alloc_iterations: int = 5
+    num_chunks: int = 1000
+    top_k: int = 10
+    cache_entries: int = 500
+    neo4j_recording: str | None = None
+    neo4j_latency_ms: float = 0.0
+    stages: list[str] = field(default_factory=list)
+
+
+@dataclass
+class StageResult:
+    """Timings and allocations of one benchmark stage."""
+
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    mean_ms: float
+    min_ms: float
+    alloc_blocks: int
+    alloc_kib: float
+    peak_kib: float
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+async def measure_stage(
+    fn: StageFn, iterations: int, warmup: int, alloc_iterations: int
+) -> StageResult:
+    """Measure one stage: a timing pass, then an allocation pass.
+
+    Args:
+        fn: Async callable taking the iteration number
+        iterations: Timed runs
+        warmup: Untimed runs before timing
+        alloc_iterations: Runs under tracemalloc
+
+    Returns:
+        StageResult
+    """
+    for i in range(warmup):
+        await fn(i)
+
+    gc.collect()
+    durations = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await fn(i)
+        durations.append((time.perf_counter() - start) * 1000)
+    durations.sort()
+
+    blocks = 0
+    allocated = 0
+    peak = 0
+    tracemalloc.start()
+    try:
+        for i in range(alloc_iterations):
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            baseline_size = tracemalloc.get_traced_memory()[0]
+            await fn(iterations + i)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline_size)
+            diff = tracemalloc.take_snapshot().compare_to(before, "filename")
+            blocks += sum(stat.count_diff for stat in diff)
+            allocated += sum(stat.size_diff for stat in diff)
+    finally:
+        tracemalloc.stop()
+
+    runs = max(alloc_iterations, 1)
+    return StageResult(
+        iterations=iterations,
+        p50_ms=round(statistics.median(durations), 4),
+        p95_ms=round(_percentile(durations, 0.95), 4),
+        mean_ms=round(statistics.fmean(durations), 4),
+        min_ms=round(durations[0], 4),
+        alloc_blocks=round(blocks / runs),
+        alloc_kib=round(allocated / runs / 1024, 2),
+        peak_kib=round(peak / 1024, 2),
+    )
+
+
+class OfflineRetrievalBench:
+    """Builds the stand-in environment and the benchmark stages.
+
+    Args:
+        config: Suite configuration
+    """
+
+    def __init__(self, config: SuiteConfig) -> None:
+        """Initialize the benchmark environment (call ``setup()`` before use).
+
+        Args:
+            config: Suite configuration
+        """
+        self.config = config
+        self.embedder = DeterministicEmbeddingService()
+        self.corpus: SyntheticCorpus = build_corpus(num_chunks=config.num_chunks)
+        self.namespaces = self.corpus.namespaces
+        self.neo4j: ReplayNeo4jClient | None = None
+        self.search: Any = None
+        self._previous_embedding_service: Any = None
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="offline-bench-")
+
+    async def setup(self) -> None:
+        """Populate in-memory Qdrant, load the recording and wire up the search."""
+        from src.components.graph_rag.entity_lexicon import EntityLexicon
+        from src.components.retrieval.four_way_hybrid_search import FourWayHybridSearch
+        from src.components.shared import embedding_factory
+        from src.components.vector_search.hybrid_search import HybridSearch
+        from src.components.vector_search.multi_vector_search import MultiVectorHybridSearch
+
+        # QueryEmbeddingContext resolves the configured backend through the factory
+        self._previous_embedding_service = embedding_factory._embedding_service
+        embedding_factory._embedding_service = self.embedder
+
+        qdrant = await create_qdrant_standin(self.corpus, self.embedder)
+
+        if self.config.neo4j_recording:
+            self.neo4j = ReplayNeo4jClient.from_file(
+                self.config.neo4j_recording, latency_ms=self.config.neo4j_latency_ms
+            )
+        else:
+            self.neo4j = ReplayNeo4jClient(
+                synthetic_neo4j_recording(self.corpus, rows=self.config.top_k * 3),
+                latency_ms=self.config.neo4j_latency_ms,
+            )
+
+        multi_vector = MultiVectorHybridSearch(
+            qdrant_client=qdrant, collection_name=COLLECTION_NAME
+        )
+        multi_vector.embedding_service = self.embedder
+
+        lexicon = EntityLexicon()
+        await lexicon.ensure_loaded(self.neo4j, self.namespaces)
+
+        self.search = FourWayHybridSearch(
+            hybrid_search=HybridSearch(
+                qdrant_client=qdrant,
+                embedding_service=self.embedder,
+                collection_name=COLLECTION_NAME,
+            ),
+            multi_vector_search=multi_vector,
+            neo4j_client=self.neo4j,
+            entity_lexicon=lexicon,
+        )
+
+    def close(self) -> None:
+        """Restore the embedding service and remove temporary files."""
+        from src.components.shared import embedding_factory
+
+        if embedding_factory._embedding_service is self.embedder:
+            embedding_factory._embedding_service = self._previous_embedding_service
+        self._tmpdir.cleanup()
+
+    def query(self, i: int) -> str:
+        """Benchmark query for iteration ``i`` (cycles through the corpus queries)."""
+        return self.corpus.queries[i % len(self.corpus.queries)]
+
+    def embedding_context(self, query: str) -> Any:
+        """Request-scoped embedding context backed by the embedding stand-in."""
+        from src.components.retrieval.query_embedding import QueryEmbeddingContext
+
+        return QueryEmbeddingContext(query, embedding_service=self.embedder)
+
+    async def stages(self) -> dict[str, StageFn]:
+        """Build the stage callables (name -> async fn(iteration))."""
+        from src.components.retrieval.intent_classifier import Intent
+        from src.components.retrieval.query_cache import QueryCache
+        from src.components.retrieval.reranker import CrossEncoderReranker
+        from src.utils.fusion import weighted_reciprocal_rank_fusion
+
+        top_k = self.config.top_k
+        search = self.search
+        namespaces = self.namespaces
+
+        # Channel outputs captured once, reused as fusion/rerank input
+        query = self.query(0)
+        multivector = await search._multivector_search(
+            query, top_k * 3, namespaces, self.embedding_context(query)
+        )
+        graph_local = await search._graph_local_search(query, top_k * 3, namespaces)
+        graph_global = await search._graph_global_search(query, top_k * 3, namespaces)
+        expansion = await search._expand_via_vector_results(multivector, namespaces, top_k)
+        rankings = [multivector, graph_local, graph_global, expansion]
+
+        cache = QueryCache(exact_cache_size=1000, semantic_cache_size=self.config.cache_entries)
+        for n in range(self.config.cache_entries):
+            cached_query = f"{self.query(n)} variant {n}"
+            await cache.set(
+                cached_query,
+                results=multivector[:top_k],
+                metadata={},
+                namespaces=namespaces,
+                query_embedding=self.embedding_context(cached_query),
+            )
+        await cache.set(
+            self.query(0), results=multivector[:top_k], metadata={}, namespaces=namespaces
+        )
+
+        reranker = CrossEncoderReranker(
+            cache_dir=self._tmpdir.name, use_adaptive_weights=False, offload_inference=False
+        )
+        reranker._model = HashCrossEncoder()
+
+        async def four_way_search(i: int) -> Any:
+            return await search.search(
+                self.query(i),
+                top_k=top_k,
+                intent_override=Intent.EXPLORATORY,  # all channels active
+                allowed_namespaces=namespaces,
+                use_cache=False,
+            )
+
+        async def multivector_channel(i: int) -> Any:
+            q = self.query(i)
+            return await search._multivector_search(
+                q, top_k * 3, namespaces, self.embedding_context(q)
+            )
+
+        async def graph_local_channel(i: int) -> Any:
+            return await search._graph_local_search(self.query(i), top_k * 3, namespaces)
+
+        async def graph_global_channel(i: int) -> Any:
+            return await search._graph_global_search(self.query(i), top_k * 3, namespaces)
+
+        async def entity_expansion(i: int) -> Any:
+            return await search._expand_via_vector_results(multivector, namespaces, top_k)
+
+        async def weighted_rrf(i: int) -> Any:
+            return weighted_reciprocal_rank_fusion(
+                rankings, weights=[0.2, 0.2, 0.5, 0.1], k=60, id_field="id"
+            )
+
+        async def cache_exact_hit(i: int) -> Any:
+            return await cache.get(self.query(0), namespaces=namespaces)
+
+        async def cache_semantic_lookup(i: int) -> Any:
+            q = f"{self.query(i)} unseen {i}"
+            return await cache.get(
+                q, namespaces=namespaces, query_embedding=self.embedding_context(q)
+            )
+
+        async def rerank(i: int) -> Any:
+            return await reranker.rerank(self.query(i), multivector, top_k=top_k)
+
+        stages: dict[str, StageFn] = {
+            "four_way.search": four_way_search,
+            "four_way.multivector": multivector_channel,
+            "four_way.graph_local": graph_local_channel,
+            "four_way.graph_global": graph_global_channel,
+            "four_way.entity_expansion": entity_expansion,
+            "fusion.weighted_rrf": weighted_rrf,
+            "query_cache.exact_hit": cache_exact_hit,
+            "query_cache.semantic_lookup": cache_semantic_lookup,
+            "reranker.cross_encoder": rerank,
+        }
+        chunk = self._chunker_stage()
+        if chunk is not None:
+            stages["chunking.adaptive"] = chunk
+        return stages
+
+    def _chunker_stage(self) -> StageFn | None:
+        """AdaptiveChunker stage (skipped if llama_index is not installed)."""
+        try:
+            from llama_index.core import Document
+
+            from src.components.retrieval.chunking import AdaptiveChunker
+        except ImportError:
+            return None
+
+        chunker = AdaptiveChunker()
+        sections = [
+            f"## {chunk.topic.title()} {n}\n\n{chunk.text}\n\n{chunk.text}"
+            for n, chunk in enumerate(self.corpus.chunks[:40])
+        ]
+        documents = [
+            Document(text="\n\n".join(sections), metadata={"file_name": "guide.md"}),
+            Document(
+                text="\n\n".join(c.text for c in self.corpus.chunks[:80]),
+                metadata={"file_name": "notes.txt"},
+            ),
+        ]
+
+        async def adaptive_chunking(i: int) -> Any:
+            return chunker.chunk_documents(documents)
+
+        return adaptive_chunking
+
+
+async def run_suite(config: SuiteConfig) -> dict[str, Any]:
+    """Run the offline benchmark suite.
+
+    Args:
+        config: Suite configuration
+
+    Returns:
+        JSON-serializable report with per-stage results
+    """
+    # Hot-path info logs would dominate the timings
+    logging_config = structlog.get_config()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    bench = OfflineRetrievalBench(config)
+    try:
+        await bench.setup()
+        stages = await bench.stages()
+        results: dict[str, dict[str, Any]] = {}
+        for name, fn in stages.items():
+            if config.stages and not any(name.startswith(prefix) for prefix in config.stages):
+                continue
+            result = await measure_stage(
+                fn, config.iterations, config.warmup, config.alloc_iterations
+            )
+            results[name] = asdict(result)
+    finally:
+        bench.close()
+        structlog.configure(**logging_config)
+
+    return {
+        "version": REPORT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": sys.implementation.name,
+            "machine": platform.machine(),
+            "platform": platform.platform(terse=True),
+        },
+        "config": asdict(config),
+        "neo4j": {"calls": bench.neo4j.calls, "misses": bench.neo4j.misses} if bench.neo4j else {},
+        "stages": results,
+    }
+
+
+def load_report(path: str | Path) -> dict[str, Any]:
+    """Load a JSON report or baseline."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def save_report(report: dict[str, Any], path: str | Path) -> None:
+    """Write a JSON report or baseline."""
+    Path(path).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    max_latency_regression: float | None = 1.0,
+    max_memory_regression: float = 0.25,
+) -> list[str]:
+    """Compare a report against a baseline and list regressions.
+
+    Latency is gated on the fastest run (``min_ms``): noise from other load
+    on shared runners only ever adds time, so the minimum is far more stable
+    than p50/p95, but it still varies with machine load. Memory is gated on
+    the per-call peak and the allocated block count, which are deterministic
+    for a given configuration. Stages missing from either side are ignored.
+
+    Args:
+        report: Report from run_suite()
+        baseline: Stored baseline report
+        max_latency_regression: Allowed min latency growth ratio (1.0 = 2x),
+            None to skip the latency gate
+        max_memory_regression: Allowed peak memory / block count growth ratio
+
+    Returns:
+        Human-readable regression messages (empty if within thresholds)
+    """
+    gates = [
+        ("peak_kib", "KiB", max_memory_regression, MIN_GATED_DELTA_KIB),
+        ("alloc_blocks", " blocks", max_memory_regression, MIN_GATED_DELTA_BLOCKS),
+    ]
+    if max_latency_regression is not None:
+        gates.insert(0, ("min_ms", "ms", max_latency_regression, MIN_GATED_DELTA_MS))
+    regressions = []
+    for name, result in report["stages"].items():
+        reference = baseline.get("stages", {}).get(name)
+        if reference is None:
+            continue
+
+        for metric, unit, ratio, min_delta in gates:
+            allowed = reference[metric] * (1 + ratio)
+            if result[metric] > allowed and result[metric] - reference[metric] > min_delta:
+                regressions.append(
+                    f"{name}: {metric} {result[metric]:.3f}{unit} > {allowed:.3f}{unit} "
+                    f"(baseline {reference[metric]:.3f}{unit} +{ratio:.0%})"
+                )
+    return regressions
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a report as a table."""
+    lines = [
+        f"{'stage':<30}{'min ms':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'blocks':>10}{'alloc KiB':>12}{'peak KiB':>12}"
+    ]
+    for name, result in report["stages"].items():
+        lines.append(
+            f"{name:<30}{result['min_ms']:>10.3f}{result['p50_ms']:>10.3f}{result['p95_ms']:>10.3f}"
+            f"{result['alloc_blocks']:>10}{result['alloc_kib']:>12.1f}{result['peak_kib']:>12.1f}"
+        )
+    return "\n".join(lines)
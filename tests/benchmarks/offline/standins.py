@@ -0,0 +1,514 @@
+"""Local stand-ins for the offline retrieval benchmarks.
+
+Replaces the live services of the retrieval hot path with deterministic,
+in-process equivalents so the benchmarks run on a laptop or CI runner
+without Qdrant, Neo4j, Ollama or model downloads:
+
+- DeterministicEmbeddingService: hash-seeded BGE-M3 stand-in (dense + sparse).
+  Texts that share tokens get similar vectors, so cache hit rates and
+  Qdrant rankings behave like the real model.
+- Qdrant in-memory mode (``AsyncQdrantClient(location=":memory:")``) behind
+  the real QdrantClientWrapper, populated with a synthetic corpus.
+- ReplayNeo4jClient: answers ``execute_read`` from recorded responses.
+  Recordings are either built from the synthetic corpus or captured from a
+  live Neo4j with RecordingNeo4jClient.
+- HashCrossEncoder: token-overlap scorer with the ``CrossEncoder.predict``
+  signature.
+
+Example:
+    >>> corpus = build_corpus(num_chunks=2000)
+    >>> embedder = DeterministicEmbeddingService()
+    >>> qdrant = await create_qdrant_standin(corpus, embedder)
+    >>> neo4j = ReplayNeo4jClient(synthetic_neo4j_recording(corpus))
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    Distance,
+    PointStruct,
+    SparseVector,
+    SparseVectorParams,
+    VectorParams,
+)
+
+from src.components.graph_rag.entity_lexicon import LOAD_PAGE_SIZE
+from src.components.vector_search.qdrant_client import QdrantClientWrapper
+
+EMBEDDING_DIM = 1024
+SPARSE_VOCAB_SIZE = 250_002  # XLM-RoBERTa vocabulary used by BGE-M3
+COLLECTION_NAME = "offline_benchmark"
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c1d3e-8a4b-4f5e-9c2d-1b7a0e3f5d21")
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+_TOPICS = {
+    "retrieval": ["qdrant", "vector", "embedding", "bm25", "hybrid", "fusion", "ranking"],
+    "graph": ["neo4j", "entity", "relation", "community", "cypher", "graph", "triple"],
+    "ingestion": ["docling", "parser", "chunk", "section", "pdf", "ocr", "layout"],
+    "generation": ["ollama", "prompt", "answer", "citation", "llm", "context", "token"],
+    "memory": ["redis", "graphiti", "episode", "consolidation", "session", "recall"],
+    "evaluation": ["ragas", "faithfulness", "precision", "recall", "benchmark", "dataset"],
+}
+_FILLER = [
+    "the",
+    "system",
+    "uses",
+    "for",
+    "and",
+    "with",
+    "each",
+    "query",
+    "document",
+    "results",
+    "pipeline",
+    "stage",
+    "latency",
+    "configured",
+    "returns",
+]
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens (shared by the embedder and the cross-encoder)."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class DeterministicEmbeddingService:
+    """Hash-seeded stand-in for the BGE-M3 embedding service.
+
+    The dense vector is the normalized sum of per-token random vectors (seeded
+    by the token hash), the sparse vector maps crc32 token IDs to
+    log-scaled term frequencies. Output format matches
+    ``FlagEmbeddingService.embed_single``.
+
+    Args:
+        dim: Dense vector dimension (default: 1024, as BGE-M3)
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM) -> None:
+        """Initialize the embedding stand-in.
+
+        Args:
+            dim: Dense vector dimension
+        """
+        self.dim = dim
+        self.calls = 0
+        self._token_vectors: dict[str, np.ndarray] = {}
+
+    def _token_vector(self, token: str) -> np.ndarray:
+        vector = self._token_vectors.get(token)
+        if vector is None:
+            seed = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+            vector = np.random.default_rng(seed).standard_normal(self.dim).astype(np.float32)
+            self._token_vectors[token] = vector
+        return vector
+
+    def embed_sync(self, text: str) -> dict[str, Any]:
+        """Embed one text synchronously.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Dict with "dense" (list[float]) and "sparse" ({token_id: weight})
+        """
+        self.calls += 1
+        tokens = tokenize(text) or ["<empty>"]
+
+        dense = np.zeros(self.dim, dtype=np.float32)
+        counts: dict[int, int] = {}
+        for token in tokens:
+            dense += self._token_vector(token)
+            token_id = zlib.crc32(token.encode()) % SPARSE_VOCAB_SIZE
+            counts[token_id] = counts.get(token_id, 0) + 1
+        dense /= float(np.linalg.norm(dense)) or 1.0
+
+        sparse = {token_id: float(1.0 + np.log(count)) for token_id, count in counts.items()}
+        return {"dense": dense.tolist(), "sparse": sparse}
+
+    async def embed_single(self, text: str) -> dict[str, Any]:
+        """Embed one text (async interface of the embedding services)."""
+        return self.embed_sync(text)
+
+    async def embed_batch(self, texts: list[str]) -> list[dict[str, Any]]:
+        """Embed several texts."""
+        return [self.embed_sync(text) for text in texts]
+
+
+class HashCrossEncoder:
+    """Deterministic stand-in for ``sentence_transformers.CrossEncoder``.
+
+    Scores a (query, document) pair by query-token coverage, mapped to the
+    unbounded logit range of a real cross-encoder.
+    """
+
+    def predict(self, pairs: list[tuple[str, str]], batch_size: int = 32) -> np.ndarray:
+        """Score query-document pairs.
+
+        Args:
+            pairs: (query, document) pairs
+            batch_size: Ignored (kept for signature compatibility)
+
+        Returns:
+            Array of logits, one per pair
+        """
+        scores = np.empty(len(pairs), dtype=np.float32)
+        for i, (query, document) in enumerate(pairs):
+            query_tokens = set(tokenize(query))
+            doc_tokens = set(tokenize(document))
+            coverage = len(query_tokens & doc_tokens) / max(len(query_tokens), 1)
+            scores[i] = 8.0 * coverage - 4.0
+        return scores
+
+
+# =============================================================================
+# Synthetic corpus
+# =============================================================================
+
+
+@dataclass
+class SyntheticChunk:
+    """Chunk of the synthetic corpus (Qdrant point and Neo4j :chunk node)."""
+
+    chunk_id: str
+    text: str
+    document_id: str
+    namespace_id: str
+    topic: str
+    entity_ids: list[str]
+
+
+@dataclass
+class SyntheticEntity:
+    """Entity of the synthetic corpus (Neo4j :base node)."""
+
+    entity_id: str
+    entity_name: str
+    namespace_id: str
+    community_id: int
+    chunk_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SyntheticCorpus:
+    """Deterministic corpus shared by the Qdrant and Neo4j stand-ins."""
+
+    chunks: list[SyntheticChunk]
+    entities: dict[str, SyntheticEntity]
+    queries: list[str]
+
+    @property
+    def namespaces(self) -> list[str]:
+        """Namespaces present in the corpus."""
+        return sorted({chunk.namespace_id for chunk in self.chunks})
+
+
+def build_corpus(
+    num_chunks: int = 2000,
+    namespaces: tuple[str, ...] = ("default", "general"),
+    seed: int = 42,
+) -> SyntheticCorpus:
+    """Generate a deterministic topical corpus with entities and queries.
+
+    Args:
+        num_chunks: Number of chunks
+        namespaces: Namespaces to distribute chunks over
+        seed: Random seed
+
+    Returns:
+        SyntheticCorpus
+    """
+    rng = random.Random(seed)
+    topics = sorted(_TOPICS)
+
+    entities: dict[str, SyntheticEntity] = {}
+    for community_id, topic in enumerate(topics):
+        for namespace_id in namespaces:
+            for term in _TOPICS[topic]:
+                entity_id = f"{namespace_id}:{term}"
+                entities[entity_id] = SyntheticEntity(
+                    entity_id=entity_id,
+                    entity_name=term,
+                    namespace_id=namespace_id,
+                    community_id=community_id,
+                )
+
+    chunks = []
+    for i in range(num_chunks):
+        topic = topics[i % len(topics)]
+        namespace_id = namespaces[i % len(namespaces)]
+        terms = rng.sample(_TOPICS[topic], 3)
+        words = terms + rng.choices(_FILLER, k=40) + rng.choices(_TOPICS[rng.choice(topics)], k=2)
+        rng.shuffle(words)
+        chunk = SyntheticChunk(
+            chunk_id=str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"chunk-{i}")),
+            text=" ".join(words).capitalize() + ".",
+            document_id=f"doc-{i // 10}",
+            namespace_id=namespace_id,
+            topic=topic,
+            entity_ids=[f"{namespace_id}:{term}" for term in terms],
+        )
+        for entity_id in chunk.entity_ids:
+            entities[entity_id].chunk_ids.append(chunk.chunk_id)
+        chunks.append(chunk)
+
+    queries = [
+        f"How does {a} work with {b} in the {topic} pipeline?"
+        for topic in topics
+        for a, b in zip(_TOPICS[topic][:3], _TOPICS[topic][3:6], strict=True)
+    ]
+    return SyntheticCorpus(chunks=chunks, entities=entities, queries=queries)
+
+
+async def create_qdrant_standin(
+    corpus: SyntheticCorpus,
+    embedder: DeterministicEmbeddingService,
+    collection_name: str = COLLECTION_NAME,
+) -> QdrantClientWrapper:
+    """Create a QdrantClientWrapper backed by Qdrant in-memory mode.
+
+    The collection uses the production vector layout (named "dense" and
+    "sparse" vectors) so MultiVectorHybridSearch runs its real Query API
+    request with server-side RRF.
+
+    Args:
+        corpus: Corpus to index
+        embedder: Embedding stand-in
+        collection_name: Collection name
+
+    Returns:
+        QdrantClientWrapper whose async client is an in-memory Qdrant
+    """
+    client = AsyncQdrantClient(location=":memory:")
+    await client.create_collection(
+        collection_name=collection_name,
+        vectors_config={"dense": VectorParams(size=embedder.dim, distance=Distance.COSINE)},
+        sparse_vectors_config={"sparse": SparseVectorParams()},
+    )
+
+    points = []
+    for chunk in corpus.chunks:
+        embedding = embedder.embed_sync(chunk.text)
+        sparse = embedding["sparse"]
+        points.append(
+            PointStruct(
+                id=chunk.chunk_id,
+                vector={
+                    "dense": embedding["dense"],
+                    "sparse": SparseVector(indices=list(sparse), values=list(sparse.values())),
+                },
+                payload={
+                    "content": chunk.text,
+                    "document_id": chunk.document_id,
+                    "document_path": f"/data/{chunk.document_id}.md",
+                    "namespace_id": chunk.namespace_id,
+                    "section_id": chunk.topic,
+                },
+            )
+        )
+    for start in range(0, len(points), 256):
+        await client.upsert(collection_name=collection_name, points=points[start : start + 256])
+
+    wrapper = QdrantClientWrapper()
+    wrapper._async_client = client
+    return wrapper
+
+
+# =============================================================================
+# Neo4j replay
+# =============================================================================
+
+
+def normalize_cypher(cypher: str) -> str:
+    """Collapse whitespace and drop comments so recordings survive reformatting."""
+    lines = [line.split("//", 1)[0] for line in cypher.splitlines()]
+    return " ".join(" ".join(lines).split())
+
+
+class ReplayNeo4jClient:
+    """Neo4j stand-in that answers reads from recorded responses.
+
+    A recording is a list of entries ``{"match": str, "params": dict | None,
+    "records": list[dict]}``. A query is answered by the first entry whose
+    ``match`` is a substring of the normalized Cypher and whose ``params``
+    (if given) are a subset of the query parameters. Unmatched queries return
+    no rows and are counted in ``misses``.
+
+    Args:
+        recording: Recorded entries
+        latency_ms: Simulated round-trip time per query (default: 0)
+    """
+
+    def __init__(self, recording: list[dict[str, Any]], latency_ms: float = 0.0) -> None:
+        """Initialize the replay client.
+
+        Args:
+            recording: Recorded entries
+            latency_ms: Simulated round-trip time per query
+        """
+        self.recording = [
+            {**entry, "match": normalize_cypher(entry["match"])} for entry in recording
+        ]
+        self.latency_ms = latency_ms
+        self.calls = 0
+        self.misses = 0
+
+    @classmethod
+    def from_file(cls, path: str | Path, latency_ms: float = 0.0) -> "ReplayNeo4jClient":
+        """Load a recording saved by RecordingNeo4jClient."""
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")), latency_ms=latency_ms)
+
+    async def execute_read(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Replay the recorded rows for a query."""
+        self.calls += 1
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        cypher = normalize_cypher(query)
+        params = parameters or {}
+        for entry in self.recording:
+            expected = entry.get("params") or {}
+            if entry["match"] in cypher and all(params.get(k) == v for k, v in expected.items()):
+                return entry["records"]
+
+        self.misses += 1
+        return []
+
+    execute_query = execute_read
+
+
+class RecordingNeo4jClient:
+    """Wraps a live Neo4jClient and records every read for later replay.
+
+    Example:
+        >>> recorder = RecordingNeo4jClient(Neo4jClient())
+        >>> search = FourWayHybridSearch(neo4j_client=recorder)
+        >>> await search.search("How does RRF fusion work?")
+        >>> recorder.save("neo4j_recording.json")
+
+    Args:
+        client: Live Neo4j client
+    """
+
+    def __init__(self, client: Any) -> None:
+        """Initialize the recorder.
+
+        Args:
+            client: Live Neo4j client
+        """
+        self.client = client
+        self.entries: list[dict[str, Any]] = []
+
+    async def execute_read(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run the query against the live client and record the rows."""
+        records = await self.client.execute_read(query, parameters, database)
+        self.entries.append(
+            {"match": normalize_cypher(query), "params": parameters or {}, "records": records}
+        )
+        return records
+
+    execute_query = execute_read
+
+    def save(self, path: str | Path) -> None:
+        """Write the recording as JSON."""
+        Path(path).write_text(json.dumps(self.entries, indent=2, default=str), encoding="utf-8")
+
+
+def synthetic_neo4j_recording(corpus: SyntheticCorpus, rows: int = 30) -> list[dict[str, Any]]:
+    """Build a recording of the hot-path Cypher queries from the corpus.
+
+    Covers the entity lexicon load, graph-local (lookup and scan),
+    graph-global and entity-expansion queries of FourWayHybridSearch. Rows
+    are representative per query shape rather than per query text.
+
+    Args:
+        corpus: Corpus the Qdrant stand-in was built from
+        rows: Rows returned per chunk query (the search asks for top_k * 3)
+
+    Returns:
+        Recording entries for ReplayNeo4jClient
+    """
+    chunks = {chunk.chunk_id: chunk for chunk in corpus.chunks}
+    recording: list[dict[str, Any]] = []
+
+    for namespace_id in corpus.namespaces:
+        entities = sorted(
+            (e for e in corpus.entities.values() if e.namespace_id == namespace_id),
+            key=lambda e: e.entity_id,
+        )
+        for skip in range(0, max(len(entities), 1), LOAD_PAGE_SIZE):
+            recording.append(
+                {
+                    "match": "RETURN e.entity_id AS entity_id, e.entity_name AS entity_name",
+                    "params": {"namespace_id": namespace_id, "skip": skip},
+                    "records": [
+                        {
+                            "entity_id": e.entity_id,
+                            "entity_name": e.entity_name,
+                            "aliases": [],
+                            "created_at": "2026-01-01T00:00:00Z",
+                        }
+                        for e in entities[skip : skip + LOAD_PAGE_SIZE]
+                    ],
+                }
+            )
+
+    def chunk_row(chunk_id: str, **extra: Any) -> dict[str, Any]:
+        chunk = chunks[chunk_id]
+        return {
+            "id": chunk.chunk_id,
+            "text": chunk.text,
+            "document_id": chunk.document_id,
+            "source": f"/data/{chunk.document_id}.md",
+            "namespace_id": chunk.namespace_id,
+            **extra,
+        }
+
+    # Most-mentioned chunks first, as the graph queries order by match counts
+    mentions: dict[str, list[str]] = {}
+    for entity in corpus.entities.values():
+        for chunk_id in entity.chunk_ids:
+            mentions.setdefault(chunk_id, []).append(entity.entity_name)
+    ranked = sorted(mentions, key=lambda chunk_id: (-len(mentions[chunk_id]), chunk_id))
+
+    local_rows = [
+        chunk_row(chunk_id, relevance=len(mentions[chunk_id]), entities=mentions[chunk_id])
+        for chunk_id in ranked[:rows]
+    ]
+    recording.append({"match": "entity_matches AS relevance", "records": local_rows})
+
+    global_rows = [
+        chunk_row(chunk_id, community_id=index % 3, relevance=rows - index)
+        for index, chunk_id in enumerate(ranked[rows : 2 * rows])
+    ]
+    recording.append({"match": "community_entities AS relevance", "records": global_rows})
+
+    expansion_rows = [
+        chunk_row(chunk_id, entity_overlap=len(mentions[chunk_id]), shared_entities=[])
+        for chunk_id in ranked[2 * rows : 2 * rows + rows // 3]
+    ]
+    recording.append({"match": "entity_overlap, shared_entities", "records": expansion_rows})
+
+    return recording
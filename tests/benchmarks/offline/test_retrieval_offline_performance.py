@@ -0,0 +1,111 @@
+"""Offline microbenchmarks for the retrieval hot path.
+
+Runs FourWayHybridSearch, weighted RRF, QueryCache, CrossEncoderReranker and
+AdaptiveChunker against local stand-ins (Qdrant in-memory mode, Neo4j replay
+client, deterministic embeddings) - no Qdrant/Neo4j/Ollama needed.
+
+Regression gate: per-stage peak memory and allocation count (deterministic)
+and Neo4j replay misses are compared against ``baseline.json``. Wall-clock
+latency depends on machine load, so the fastest-run latency is only gated on
+request (AEGIS_PERF_STRICT=1, ideally on the reference machine with nothing
+else running). Refresh the baseline on the reference machine after an
+intentional change:
+
+    poetry run python scripts/benchmark_retrieval_offline.py --update-baseline
+
+Environment:
+    OFFLINE_BENCH_OUTPUT: Write the JSON report to this path
+    AEGIS_PERF_STRICT: Set to 1 to also gate on min_ms latency
+    OFFLINE_BENCH_MAX_REGRESSION: Allowed latency growth ratio in strict mode
+        (default: 1.0 = 2x)
+"""
+
+import os
+
+import pytest
+
+from tests.benchmarks.offline.harness import (
+    BASELINE_PATH,
+    SuiteConfig,
+    compare_to_baseline,
+    format_report,
+    load_report,
+    run_suite,
+    save_report,
+)
+
+HOT_PATH_STAGES = {
+    "four_way.search",
+    "four_way.multivector",
+    "four_way.graph_local",
+    "fusion.weighted_rrf",
+    "query_cache.exact_hit",
+    "query_cache.semantic_lookup",
+    "reranker.cross_encoder",
+}
+
+
+@pytest.mark.performance
+async def test_retrieval_hot_path_offline():
+    """Per-stage timings and allocations stay within the baseline thresholds."""
+    report = await run_suite(SuiteConfig())
+
+    print(f"\n📊 Offline retrieval benchmark\n{format_report(report)}")
+    if output := os.environ.get("OFFLINE_BENCH_OUTPUT"):
+        save_report(report, output)
+
+    assert HOT_PATH_STAGES.issubset(report["stages"])
+    # Every Cypher query of the hot path must be covered by the recording
+    assert report["neo4j"]["misses"] == 0
+
+    if not BASELINE_PATH.exists():
+        pytest.skip(f"No baseline at {BASELINE_PATH}")
+    max_latency_regression = None
+    if os.environ.get("AEGIS_PERF_STRICT") == "1":
+        max_latency_regression = float(os.environ.get("OFFLINE_BENCH_MAX_REGRESSION", "1.0"))
+    regressions = compare_to_baseline(
+        report, load_report(BASELINE_PATH), max_latency_regression=max_latency_regression
+    )
+    assert not regressions, "Performance regressions:\n" + "\n".join(regressions)
+
+
+def test_compare_to_baseline_flags_latency_and_memory_regressions():
+    """The gate ignores noise-level deltas and reports real regressions."""
+    stage = {"min_ms": 1.0, "peak_kib": 100.0, "alloc_blocks": 100}
+    baseline = {
+        "stages": {
+            "a": stage,
+            "b": stage,
+            "c": {"min_ms": 0.01, "peak_kib": 2.0, "alloc_blocks": 4},
+        }
+    }
+    report = {
+        "stages": {
+            # within thresholds
+            "a": {"min_ms": 1.9, "peak_kib": 120.0, "alloc_blocks": 110},
+            # all three regressed
+            "b": {"min_ms": 2.5, "peak_kib": 200.0, "alloc_blocks": 300},
+            # 5x slower and bigger, but below the noise floors
+            "c": {"min_ms": 0.05, "peak_kib": 5.0, "alloc_blocks": 12},
+            # not in baseline
+            "new": {"min_ms": 9.0, "peak_kib": 900.0, "alloc_blocks": 900},
+        }
+    }
+
+    regressions = compare_to_baseline(report, baseline)
+
+    assert [message.split(" ", 2)[:2] for message in regressions] == [
+        ["b:", "min_ms"],
+        ["b:", "peak_kib"],
+        ["b:", "alloc_blocks"],
+    ]
+
+
+def test_compare_to_baseline_without_latency_gate():
+    """With the latency gate off only memory regressions are reported."""
+    baseline = {"stages": {"a": {"min_ms": 1.0, "peak_kib": 100.0, "alloc_blocks": 100}}}
+    report = {"stages": {"a": {"min_ms": 9.0, "peak_kib": 200.0, "alloc_blocks": 100}}}
+
+    regressions = compare_to_baseline(report, baseline, max_latency_regression=None)
+
+    assert [message.split(" ", 2)[:2] for message in regressions] == [["a:", "peak_kib"]]
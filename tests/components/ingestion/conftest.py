@@ -25,6 +25,7 @@ async def job_tracker(tmp_path: Path):
 
     yield tracker
 
+    await tracker.close()
     # Database cleanup handled automatically by tmp_path
 
 
@@ -5,6 +5,7 @@ Tests job creation, status updates, event logging, file tracking, and cleanup.
 """
 
 import asyncio
+import sqlite3
 from pathlib import Path
 from typing import Any
 
@@ -865,3 +866,91 @@ async def test_get_events_limit(job_tracker: IngestionJobTracker, sample_job: st
 
     events = await job_tracker.get_events(sample_job, limit=5)
     assert len(events) <= 5
+
+
+# ============================================================================
+# Write-Behind Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_events_are_buffered_until_flush(tmp_path: Path) -> None:
+    """Test add_event is write-behind and reads see buffered rows.
+
+    Verifies:
+    - Events stay in the buffer below flush_batch_size
+    - Another connection does not see them before the flush
+    - get_events flushes first (read-your-writes)
+    """
+    db_path = tmp_path / "buffered.db"
+    tracker = IngestionJobTracker(db_path=db_path, flush_batch_size=100, flush_interval_ms=60_000)
+    job_id = await tracker.create_job("/test", True, 1)
+
+    for i in range(3):
+        await tracker.add_event(job_id, "INFO", "parsing", None, None, None, f"Event {i}")
+
+    other = sqlite3.connect(db_path)
+    assert other.execute("SELECT COUNT(*) FROM ingestion_events").fetchone()[0] == 0
+
+    events = await tracker.get_events(job_id)
+    assert [e["message"] for e in events] == ["Event 0", "Event 1", "Event 2"]
+    assert other.execute("SELECT COUNT(*) FROM ingestion_events").fetchone()[0] == 3
+
+    other.close()
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_triggered_by_batch_size_and_interval(tmp_path: Path) -> None:
+    """Test buffered rows are flushed by size and by timer.
+
+    Verifies:
+    - Reaching flush_batch_size flushes without a read
+    - A partial batch is flushed after flush_interval_ms
+    """
+    db_path = tmp_path / "triggers.db"
+    tracker = IngestionJobTracker(db_path=db_path, flush_batch_size=5, flush_interval_ms=50)
+    job_id = await tracker.create_job("/test", True, 1)
+
+    for i in range(5):
+        await tracker.add_event(job_id, "INFO", "parsing", None, None, None, f"Event {i}")
+    await asyncio.sleep(0)  # Let the size-triggered flush task run
+    await asyncio.sleep(0.01)
+    assert tracker._pending == []
+
+    await tracker.add_event(job_id, "INFO", "parsing", None, None, None, "Event 5")
+    assert len(tracker._pending) == 1
+    await asyncio.sleep(0.2)
+    assert tracker._pending == []
+
+    other = sqlite3.connect(db_path)
+    assert other.execute("SELECT COUNT(*) FROM ingestion_events").fetchone()[0] == 6
+    other.close()
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_close_drains_buffer_and_uses_wal(tmp_path: Path) -> None:
+    """Test close() persists buffered writes and the database runs in WAL mode.
+
+    Verifies:
+    - Buffered events and file updates survive close()
+    - journal_mode is WAL
+    """
+    db_path = tmp_path / "drain.db"
+    tracker = IngestionJobTracker(db_path=db_path, flush_batch_size=100, flush_interval_ms=60_000)
+    job_id = await tracker.create_job("/test", True, 1)
+    file_id = await tracker.add_file(job_id, "/test/a.pdf", "a.pdf", ".pdf", 10, "docling")
+    await tracker.add_event(job_id, "WARN", "vlm", "a.pdf", 1, None, "Slow page")
+    await tracker.update_file(file_id, status="completed", chunks_created=4)
+
+    await tracker.close()
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("SELECT COUNT(*) FROM ingestion_events").fetchone()[0] == 1
+    assert conn.execute("SELECT status, chunks_created FROM ingestion_files").fetchone() == (
+        "completed",
+        4,
+    )
+    conn.close()
@@ -0,0 +1,101 @@
+"""Tests for the resumable evaluation cache.
+
+Tests:
+1. Config hashes and sample keys
+2. Output/score round-trip and resume from disk
+3. Truncated last line after a crash
+4. Scorer-only config changes reuse cached outputs
+"""
+
+import json
+
+from src.evaluation.evaluation_cache import EvaluationCache, config_hash, sample_key
+
+PIPELINE = {"top_k": 10, "generation_model": "qwen3:8b"}
+SCORER = {"metrics": ["faithfulness"], "judge_model": "qwen3:8b"}
+
+
+def open_cache(tmp_path, pipeline=None, scorer=None, namespace="eval_test"):
+    """Open a cache under tmp_path."""
+    return EvaluationCache(tmp_path, namespace, pipeline or PIPELINE, scorer or SCORER)
+
+
+class TestHashing:
+    """Test config hashes and sample keys."""
+
+    def test_config_hash_ignores_key_order(self):
+        """Equal configs hash equally regardless of key order."""
+        assert config_hash({"a": 1, "b": 2}) == config_hash({"b": 2, "a": 1})
+        assert config_hash({"a": 1}) != config_hash({"a": 2})
+
+    def test_sample_key_depends_on_namespace_and_pipeline(self):
+        """Keys differ per question, namespace and pipeline hash."""
+        key = sample_key("q", "ns", "hash")
+
+        assert key == sample_key("q", "ns", "hash")
+        assert key != sample_key("q2", "ns", "hash")
+        assert key != sample_key("q", "ns2", "hash")
+        assert key != sample_key("q", "ns", "hash2")
+
+
+class TestEvaluationCache:
+    """Test checkpointing and resume."""
+
+    def test_round_trip_and_resume(self, tmp_path):
+        """Outputs and scores written by one run are loaded by the next."""
+        cache = open_cache(tmp_path)
+        assert cache.get_output("What is RAG?") is None
+
+        cache.put_output("What is RAG?", ["ctx1", "ctx2"], "An answer")
+        cache.put_scores("What is RAG?", {"faithfulness": 0.9})
+
+        resumed = open_cache(tmp_path)
+        output = resumed.get_output("What is RAG?")
+        assert output["contexts"] == ["ctx1", "ctx2"]
+        assert output["answer"] == "An answer"
+        assert resumed.get_scores("What is RAG?") == {"faithfulness": 0.9}
+        assert resumed.get_stats()["cached_outputs"] == 1
+
+    def test_truncated_last_line_is_skipped(self, tmp_path):
+        """A partial line from a crash is ignored and later appends stay readable."""
+        cache = open_cache(tmp_path)
+        cache.put_output("q1", ["c"], "a1")
+        with open(cache.outputs_path, "a", encoding="utf-8") as f:
+            f.write('{"key": "trunc')
+
+        resumed = open_cache(tmp_path)
+        resumed.put_output("q2", ["c"], "a2")
+
+        reloaded = open_cache(tmp_path)
+        assert reloaded.get_output("q1")["answer"] == "a1"
+        assert reloaded.get_output("q2")["answer"] == "a2"
+        assert reloaded.get_stats()["cached_outputs"] == 2
+
+    def test_scorer_change_reuses_outputs(self, tmp_path):
+        """Changing only the scorer config keeps outputs but not scores."""
+        cache = open_cache(tmp_path)
+        cache.put_output("q", ["c"], "a")
+        cache.put_scores("q", {"faithfulness": 0.5})
+
+        rescored = open_cache(tmp_path, scorer={"metrics": ["answer_relevancy"]})
+
+        assert rescored.get_output("q")["answer"] == "a"
+        assert rescored.get_scores("q") is None
+
+    def test_pipeline_change_invalidates_outputs(self, tmp_path):
+        """Changing retrieval/generation settings starts from scratch."""
+        open_cache(tmp_path).put_output("q", ["c"], "a")
+
+        changed = open_cache(tmp_path, pipeline={**PIPELINE, "top_k": 5})
+
+        assert changed.get_output("q") is None
+
+    def test_namespaces_are_separated(self, tmp_path):
+        """Each namespace has its own cache directory."""
+        cache = open_cache(tmp_path, namespace="ns_a")
+        cache.put_output("q", ["c"], "a")
+
+        assert open_cache(tmp_path, namespace="ns_b").get_output("q") is None
+        assert cache.outputs_path.parent.name == "ns_a"
+        record = json.loads(cache.outputs_path.read_text(encoding="utf-8"))
+        assert record["question"] == "q"
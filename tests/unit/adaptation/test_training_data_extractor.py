@@ -16,6 +16,7 @@ from pathlib import Path
 
 import pytest
 
+from src.adaptation.trace_telemetry import PipelineStage, TraceEvent, UnifiedTracer
 from src.adaptation.training_data_extractor import (
     RerankTrainingPair,
     _compute_quality_score,
@@ -302,6 +303,35 @@ class TestTrainingPairExtraction:
         assert len(pairs) == 1
         assert pairs[0].query == "Recent query"
 
+    @pytest.mark.asyncio
+    async def test_extract_from_tracer_segments(self, tmp_path):
+        """Test extraction reads hourly segments written by UnifiedTracer."""
+        trace_path = tmp_path / "traces.jsonl"
+        tracer = UnifiedTracer(log_path=str(trace_path))
+        await tracer.log_event(
+            TraceEvent(
+                timestamp=datetime.now() - timedelta(hours=2),
+                stage=PipelineStage.RERANKING,
+                latency_ms=150,
+                cache_hit=False,
+                metadata={
+                    "query": "Segment query",
+                    "intent": "factual",
+                    "doc_id": "doc_segment",
+                    "semantic_score": 0.85,
+                    "keyword_score": 0.75,
+                    "recency_score": 0.95,
+                    "click_through": True,
+                },
+            )
+        )
+
+        assert not trace_path.exists()
+        pairs = await extract_rerank_pairs(trace_path=str(trace_path), min_quality_score=0.7)
+
+        assert len(pairs) == 1
+        assert pairs[0].doc_id == "doc_segment"
+
     @pytest.mark.asyncio
     async def test_extract_with_output_file(self, sample_trace_file, tmp_path):
         """Test saving extracted pairs to output file."""
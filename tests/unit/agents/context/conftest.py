@@ -194,10 +194,12 @@ def mock_multi_vector_model():
         if isinstance(texts, str):
             texts = [texts]
 
-        # Return mock output with dense and sparse components
+        # Return mock output with dense, sparse and ColBERT components
+        token_vecs = [np.abs(np.random.randn(8, 1024)).astype(np.float32) for _ in texts]
         return {
             "dense_vecs": np.random.randn(len(texts), 1024).astype(np.float32),
             "sparse_vecs": [{0: 0.5, 1: 0.3, 2: 0.2} for _ in texts],
+            "colbert_vecs": [v / np.linalg.norm(v, axis=1, keepdims=True) for v in token_vecs],
         }
 
     model.encode.side_effect = encode_side_effect
@@ -205,6 +207,17 @@ def mock_multi_vector_model():
     return model
 
 
+@pytest.fixture
+def mock_model_registry(mock_multi_vector_model):
+    """Shared BGE-M3 registry serving the mock multi-vector model."""
+    from src.components.shared.bge_m3_registry import BGEM3ModelRegistry
+
+    registry = BGEM3ModelRegistry(device="cpu")
+    registry.get_model = MagicMock(return_value=mock_multi_vector_model)
+    yield registry
+    registry.shutdown()
+
+
 @pytest.fixture
 def recursive_llm_settings():
     """Default RecursiveLLMSettings for testing.
@@ -330,7 +330,7 @@ class TestScoreRelevanceMultiVector:
         mock_skill_registry,
         recursive_llm_settings,
         sample_segments,
-        mock_multi_vector_model,
+        mock_model_registry,
     ):
         """Test multi-vector (ColBERT) scoring method."""
         processor = RecursiveLLMProcessor(
@@ -339,10 +339,10 @@ class TestScoreRelevanceMultiVector:
             settings=recursive_llm_settings,
         )
 
-        # Mock BGEM3FlagModel
+        # Shared BGE-M3 registry with mock model
         with patch(
-            "src.agents.context.recursive_llm.BGEM3FlagModel",
-            return_value=mock_multi_vector_model,
+            "src.components.shared.bge_m3_registry.get_bge_m3_registry",
+            return_value=mock_model_registry,
         ):
             scored = await processor._score_relevance_multi_vector(
                 sample_segments,
@@ -360,28 +360,31 @@ class TestScoreRelevanceMultiVector:
         mock_skill_registry,
         recursive_llm_settings,
         sample_segments,
+        mock_model_registry,
         mock_multi_vector_model,
     ):
-        """Test multi-vector model is lazy-loaded (singleton)."""
+        """Test multi-vector scoring uses the shared registry and caches segments."""
         processor = RecursiveLLMProcessor(
             llm=mock_llm,
             skill_registry=mock_skill_registry,
             settings=recursive_llm_settings,
         )
 
-        assert processor._multi_vector_model is None  # Initially None
+        assert processor._model_registry is None  # Initially None
 
         with patch(
-            "src.agents.context.recursive_llm.BGEM3FlagModel",
-            return_value=mock_multi_vector_model,
+            "src.components.shared.bge_m3_registry.get_bge_m3_registry",
+            return_value=mock_model_registry,
         ):
-            await processor._score_relevance_multi_vector(
-                sample_segments,
-                "test query",
-            )
+            await processor._score_relevance_multi_vector(sample_segments, "test query")
+            await processor._score_relevance_multi_vector(sample_segments, "another query")
+
+        # Should be bound to the shared registry now
+        assert processor._model_registry is mock_model_registry
 
-        # Should be loaded now
-        assert processor._multi_vector_model is not None
+        # Second dive only encodes the new query (segment token matrices are cached)
+        second_call_texts = mock_multi_vector_model.encode.call_args_list[1].args[0]
+        assert second_call_texts == ["another query"]
 
     @pytest.mark.asyncio
     async def test_multi_vector_fallback_to_dense_sparse(
@@ -389,6 +392,7 @@ class TestScoreRelevanceMultiVector:
         mock_llm,
         mock_skill_registry,
         mock_embedding_service,
+        mock_model_registry,
         recursive_llm_settings,
         sample_segments,
     ):
@@ -399,15 +403,12 @@ class TestScoreRelevanceMultiVector:
             settings=recursive_llm_settings,
         )
 
-        with (
-            patch(
-                "src.agents.context.recursive_llm.BGEM3FlagModel",
-                side_effect=ImportError("FlagEmbedding not installed"),
-            ),
-            patch(
-                "src.agents.context.recursive_llm.get_embedding_service",
-                return_value=mock_embedding_service,
-            ),
+        processor._embedding_service = mock_embedding_service
+        mock_model_registry.get_model.side_effect = ImportError("FlagEmbedding not installed")
+
+        with patch(
+            "src.components.shared.bge_m3_registry.get_bge_m3_registry",
+            return_value=mock_model_registry,
         ):
             # Should fallback to dense+sparse instead of raising
             scored = await processor._score_relevance_multi_vector(
@@ -427,6 +428,7 @@ class TestScoreRelevanceAdaptive:
         mock_llm,
         mock_skill_registry,
         mock_embedding_service,
+        mock_model_registry,
         recursive_llm_settings,
         sample_segments,
     ):
@@ -445,20 +447,19 @@ class TestScoreRelevanceAdaptive:
             )
             mock_mapper.return_value = mapper_instance
 
+            processor._embedding_service = mock_embedding_service
+            mock_model_registry.get_model.side_effect = ImportError()  # Force fallback
+
             with patch(
-                "src.agents.context.recursive_llm.BGEM3FlagModel",
-                side_effect=ImportError(),  # Force fallback
+                "src.components.shared.bge_m3_registry.get_bge_m3_registry",
+                return_value=mock_model_registry,
             ):
-                with patch(
-                    "src.agents.context.recursive_llm.get_embedding_service",
-                    return_value=mock_embedding_service,
-                ):
-                    scored = await processor._score_relevance_adaptive(
-                        sample_segments,
-                        "What is the p-value?",
-                    )
-
-                assert len(scored) > 0
+                scored = await processor._score_relevance_adaptive(
+                    sample_segments,
+                    "What is the p-value?",
+                )
+
+            assert len(scored) > 0
 
     @pytest.mark.asyncio
     async def test_score_relevance_adaptive_holistic(
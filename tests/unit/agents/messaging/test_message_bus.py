@@ -9,6 +9,7 @@ Tests cover:
 - Priority-based message handling
 - Request-response pattern
 - Broadcast messaging
+- Event-driven delivery (pub/sub wakeups, in-process fast path)
 - Queue management
 - Error handling
 """
@@ -37,9 +38,40 @@ from src.core.exceptions import MemoryError
 
 
 @pytest.fixture
-def mock_redis():
+def mock_pipeline():
+    """Mock Redis pipeline (commands are queued, sent on execute)."""
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock(return_value=[])
+    return pipeline
+
+
+@pytest.fixture
+def notifications():
+    """Queue feeding the mock pub/sub listener."""
+    return asyncio.Queue()
+
+
+@pytest.fixture
+def mock_pubsub(notifications):
+    """Mock Redis pub/sub connection."""
+
+    async def listen():
+        while True:
+            yield await notifications.get()
+
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.listen = listen
+    pubsub.aclose = AsyncMock()
+    return pubsub
+
+
+@pytest.fixture
+def mock_redis(mock_pipeline, mock_pubsub):
     """Mock Redis client."""
     redis_mock = AsyncMock(spec=Redis)
+    redis_mock.pipeline = MagicMock(return_value=mock_pipeline)
+    redis_mock.pubsub = MagicMock(return_value=mock_pubsub)
     redis_mock.ping = AsyncMock(return_value=True)
     redis_mock.zadd = AsyncMock(return_value=1)
     redis_mock.zpopmin = AsyncMock(return_value=[])
@@ -199,13 +231,23 @@ def test_unregister_nonexistent_agent(message_bus):
     assert result is False
 
 
+def _make_message(message_id: str) -> AgentMessage:
+    return AgentMessage(
+        id=message_id,
+        sender="agent-a",
+        recipient="agent-b",
+        message_type=MessageType.TASK_REQUEST,
+        payload={"query": "test"},
+    )
+
+
 # =============================================================================
 # Test Message Sending
 # =============================================================================
 
 
 @pytest.mark.asyncio
-async def test_send_message_success(message_bus, mock_redis):
+async def test_send_message_success(message_bus, mock_pipeline):
     """Test successful message sending."""
     message_bus.register_agent("agent-a", ["agent-b"])
     message_bus.register_agent("agent-b")
@@ -222,8 +264,8 @@ async def test_send_message_success(message_bus, mock_redis):
     assert isinstance(message_id, str)
 
     # Verify Redis zadd was called
-    mock_redis.zadd.assert_called_once()
-    call_args = mock_redis.zadd.call_args
+    mock_pipeline.zadd.assert_called_once()
+    call_args = mock_pipeline.zadd.call_args
     assert "agent:queue:agent-b" in call_args[0]
 
 
@@ -271,7 +313,7 @@ async def test_send_message_to_nonexistent_recipient(message_bus):
 
 
 @pytest.mark.asyncio
-async def test_send_message_broadcast(message_bus, mock_redis):
+async def test_send_message_broadcast(message_bus, mock_pipeline):
     """Test broadcast message to all agents."""
     message_bus.register_agent("agent-a")
     message_bus.register_agent("agent-b")
@@ -286,12 +328,14 @@ async def test_send_message_broadcast(message_bus, mock_redis):
 
     assert message_id is not None
 
-    # Should have enqueued to agent-b and agent-c (not sender)
-    assert mock_redis.zadd.call_count == 2
+    # Should have enqueued to agent-b and agent-c (not sender) in one round trip
+    assert mock_pipeline.zadd.call_count == 2
+    assert mock_pipeline.publish.call_count == 2
+    mock_pipeline.execute.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_send_message_with_correlation_id(message_bus, mock_redis):
+async def test_send_message_with_correlation_id(message_bus, mock_pipeline):
     """Test sending message with correlation ID."""
     message_bus.register_agent("agent-a", ["agent-b"])
     message_bus.register_agent("agent-b")
@@ -308,7 +352,7 @@ async def test_send_message_with_correlation_id(message_bus, mock_redis):
     assert message_id is not None
 
     # Verify correlation_id in message
-    call_args = mock_redis.zadd.call_args
+    call_args = mock_pipeline.zadd.call_args
     message_json = list(call_args[0][1].keys())[0]
     message_dict = json.loads(message_json)
     assert message_dict["correlation_id"] == correlation_id
@@ -374,13 +418,113 @@ async def test_receive_message_blocking_timeout(message_bus, mock_redis):
     assert message is None
 
 
+@pytest.mark.asyncio
+async def test_receive_messages_bulk(message_bus, mock_redis):
+    """Test receiving several messages in one ZPOPMIN."""
+    message_bus.register_agent("agent-b")
+
+    mock_redis.zpopmin.return_value = [
+        (json.dumps(_make_message(f"msg-{i}").to_dict()), 100 + i) for i in range(3)
+    ]
+
+    messages = await message_bus.receive_messages("agent-b", max_messages=5, block=False)
+
+    assert [m.id for m in messages] == ["msg-0", "msg-1", "msg-2"]
+    mock_redis.zpopmin.assert_awaited_once_with("agent:queue:agent-b", count=5)
+
+
+@pytest.mark.asyncio
+async def test_blocking_receive_woken_by_notification(message_bus, mock_redis, notifications):
+    """Test that a blocked receive is woken by pub/sub instead of polling."""
+    message_bus.register_agent("agent-b")
+
+    message_json = json.dumps(_make_message("msg-remote").to_dict())
+    mock_redis.zpopmin.side_effect = [[], [(message_json, 100)]]
+
+    receiver = asyncio.create_task(message_bus.receive_message("agent-b", timeout_seconds=2.0))
+    await asyncio.sleep(0.01)
+    assert not receiver.done()
+
+    await notifications.put({"type": "message", "channel": "agent:notify:agent-b", "data": "x"})
+    message = await asyncio.wait_for(receiver, timeout=0.5)
+
+    assert message.id == "msg-remote"
+    assert mock_redis.zpopmin.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_local_fast_path_skips_redis(message_bus, mock_pipeline):
+    """Test in-memory hand-over when the recipient waits on the same bus."""
+    message_bus.register_agent("agent-a", ["agent-b"])
+    message_bus.register_agent("agent-b")
+
+    receiver = asyncio.create_task(message_bus.receive_message("agent-b", timeout_seconds=2.0))
+    await asyncio.sleep(0.01)
+
+    message_id = await message_bus.send_message(
+        sender="agent-a",
+        recipient="agent-b",
+        message_type=MessageType.TASK_REQUEST,
+        payload={"query": "test"},
+    )
+    message = await asyncio.wait_for(receiver, timeout=0.5)
+
+    assert message.id == message_id
+    assert message.payload == {"query": "test"}
+    mock_pipeline.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_local_fast_path_hands_one_message_per_waiter(message_bus, mock_pipeline):
+    """Test that messages beyond one per blocked receiver go to the Redis queue."""
+    message_bus.register_agent("agent-a", ["agent-b"])
+    message_bus.register_agent("agent-b")
+
+    receiver = asyncio.create_task(message_bus.receive_message("agent-b", timeout_seconds=2.0))
+    await asyncio.sleep(0.01)
+
+    for _ in range(2):
+        await message_bus.send_message(
+            sender="agent-a",
+            recipient="agent-b",
+            message_type=MessageType.TASK_REQUEST,
+            payload={"query": "test"},
+        )
+    await asyncio.wait_for(receiver, timeout=0.5)
+
+    mock_pipeline.execute.assert_awaited_once()
+    mock_pipeline.zadd.assert_called_once()
+    assert not message_bus._local_queues.get("agent-b")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_requeues_local_messages(message_bus, mock_pipeline):
+    """Test that a hand-over nobody picked up is moved to Redis on cancellation."""
+    message_bus.register_agent("agent-b")
+
+    receiver = asyncio.create_task(message_bus.receive_message("agent-b", timeout_seconds=2.0))
+    await asyncio.sleep(0.01)
+
+    # A hand-over the receiver has not picked up yet when it is cancelled
+    message = _make_message("msg-local")
+    message_bus._local_queues["agent-b"] = [(message.queue_score, 0, message)]
+    receiver.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await receiver
+
+    assert "agent-b" not in message_bus._local_queues
+    queue_key, mapping = mock_pipeline.zadd.call_args.args
+    assert queue_key == "agent:queue:agent-b"
+    assert json.loads(next(iter(mapping)))["id"] == "msg-local"
+
+
 # =============================================================================
 # Test Request-Response Pattern
 # =============================================================================
 
 
 @pytest.mark.asyncio
-async def test_send_response(message_bus, mock_redis):
+async def test_send_response(message_bus, mock_pipeline):
     """Test sending response to original message."""
     message_bus.register_agent("agent-a", ["agent-b"])
     message_bus.register_agent("agent-b", ["agent-a"])
@@ -403,7 +547,7 @@ async def test_send_response(message_bus, mock_redis):
     assert response_id is not None
 
     # Verify response was sent to original sender
-    call_args = mock_redis.zadd.call_args
+    call_args = mock_pipeline.zadd.call_args
     assert "agent:queue:agent-a" in call_args[0]
 
     # Verify correlation_id preserved
@@ -510,7 +654,7 @@ async def test_clear_queue_unregistered(message_bus):
 
 
 @pytest.mark.asyncio
-async def test_message_priority_ordering(message_bus, mock_redis):
+async def test_message_priority_ordering(message_bus, mock_pipeline):
     """Test that messages are enqueued with priority scores."""
     message_bus.register_agent("agent-a", ["agent-b"])
     message_bus.register_agent("agent-b")
@@ -525,7 +669,7 @@ async def test_message_priority_ordering(message_bus, mock_redis):
     )
 
     # Verify score calculation (lower score = higher priority)
-    call_args = mock_redis.zadd.call_args
+    call_args = mock_pipeline.zadd.call_args
     score = list(call_args[0][1].values())[0]
 
     # URGENT priority (3) should result in lower score
@@ -554,12 +698,12 @@ async def test_redis_connection_failure():
 
 
 @pytest.mark.asyncio
-async def test_enqueue_message_failure(message_bus, mock_redis):
+async def test_enqueue_message_failure(message_bus, mock_pipeline):
     """Test handling Redis enqueue failure."""
     message_bus.register_agent("agent-a", ["agent-b"])
     message_bus.register_agent("agent-b")
 
-    mock_redis.zadd.side_effect = Exception("Redis error")
+    mock_pipeline.execute.side_effect = Exception("Redis error")
 
     with pytest.raises(MemoryError, match="Failed to enqueue"):
         await message_bus.send_message(
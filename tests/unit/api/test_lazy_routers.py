@@ -0,0 +1,173 @@
+"""Unit tests for lazy API router registration (API_LAZY_STARTUP)."""
+
+import asyncio
+import os
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api.lazy_routers import (
+    LazyRouterMiddleware,
+    LazyRouterRegistry,
+    RouterSpec,
+    include_routers,
+)
+
+
+def _router_module(name: str, prefix: str, paths: list[str]) -> ModuleType:
+    module = ModuleType(name)
+    module.router = APIRouter(prefix=prefix)
+    for path in paths:
+
+        async def endpoint(path: str = path) -> dict[str, str]:
+            return {"module": name, "path": path}
+
+        module.router.add_api_route(path, endpoint, methods=["GET"])
+    return module
+
+
+@pytest.fixture
+def router_modules(monkeypatch):
+    """Fake router modules: two overlapping graph routers and a chat router."""
+    modules = {
+        "fake_routers.graph": _router_module("fake_routers.graph", "/graph", ["/{item_id}"]),
+        "fake_routers.graph_stats": _router_module(
+            "fake_routers.graph_stats", "/graph", ["/stats"]
+        ),
+        "fake_routers.chat": _router_module("fake_routers.chat", "/chat", ["/"]),
+    }
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    return modules
+
+
+@pytest.fixture
+def specs():
+    return [
+        RouterSpec("fake_routers.graph", prefix="/api/v1", path_prefix="/api/v1/graph"),
+        RouterSpec("fake_routers.graph_stats", prefix="/api/v1", path_prefix="/api/v1/graph"),
+        RouterSpec("fake_routers.chat", prefix="/api/v1", path_prefix="/api/v1/chat"),
+    ]
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+@pytest.fixture
+def lazy_app(app, specs, router_modules):
+    app.state.lazy_routers = LazyRouterRegistry(app, specs)
+    app.add_middleware(LazyRouterMiddleware, registry=app.state.lazy_routers)
+    return app
+
+
+def _client(app: FastAPI) -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_include_routers_eager(app, specs, router_modules):
+    include_routers(app, specs)
+
+    async with _client(app) as client:
+        graph = await client.get("/api/v1/graph/stats")
+        chat = await client.get("/api/v1/chat/")
+
+    # Registration order decides the match: the first router's catch-all wins
+    assert graph.json()["module"] == "fake_routers.graph"
+    assert chat.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_health_served_without_loading_routers(lazy_app):
+    async with _client(lazy_app) as client:
+        response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert lazy_app.state.lazy_routers.status()["loaded"] == 0
+
+
+@pytest.mark.asyncio
+async def test_first_use_loads_only_matching_routers(lazy_app):
+    async with _client(lazy_app) as client:
+        response = await client.get("/api/v1/chat/")
+
+    assert response.status_code == 200
+    assert response.json()["module"] == "fake_routers.chat"
+    status = lazy_app.state.lazy_routers.status()
+    assert status["loaded"] == 1
+    assert not status["complete"]
+
+
+@pytest.mark.asyncio
+async def test_route_order_matches_eager_mode(lazy_app, specs):
+    registry = lazy_app.state.lazy_routers
+    # Load in reverse order; the first spec's catch-all must still win
+    await registry.load(specs[1])
+    await registry.load(specs[0])
+
+    async with _client(lazy_app) as client:
+        response = await client.get("/api/v1/graph/stats")
+
+    assert response.json()["module"] == "fake_routers.graph"
+    assert lazy_app.openapi_schema is None
+
+
+@pytest.mark.asyncio
+async def test_unclaimed_path_waits_for_full_warmup(lazy_app):
+    registry = lazy_app.state.lazy_routers
+
+    async with _client(lazy_app) as client:
+        request = asyncio.create_task(client.get("/openapi.json"))
+        await asyncio.sleep(0.05)
+        assert not request.done()
+
+        await registry.load_all()
+        response = await request
+
+    assert response.status_code == 200
+    assert "/api/v1/chat/" in response.json()["paths"]
+    assert registry.complete
+
+
+@pytest.mark.asyncio
+async def test_import_failure_does_not_block_other_routers(app, specs, router_modules):
+    registry = LazyRouterRegistry(app, [RouterSpec("fake_routers.missing"), *specs])
+
+    await registry.load_all()
+
+    status = registry.status()
+    assert status["complete"]
+    assert status["loaded"] == 3
+    assert status["failed"] == ["fake_routers.missing.router"]
+
+
+def test_lazy_startup_import_skips_heavy_dependencies():
+    # Fresh interpreter: other tests may already have imported these modules
+    code = (
+        "import sys\n"
+        "import src.api.main\n"
+        "heavy = ('graphiti_core', 'sklearn', 'src.components.memory')\n"
+        "print('loaded=' + ','.join(name for name in heavy if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "API_LAZY_STARTUP": "true"},
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+
+    assert "loaded=\n" in result.stdout
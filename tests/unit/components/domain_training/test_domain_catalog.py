@@ -0,0 +1,210 @@
+"""Unit tests for DomainCatalog.
+
+Tests:
+1. Snapshot building (record fields, parsed extraction settings, match filter)
+2. Vectorized matching against the normalized embedding matrix
+3. Reloads on invalidation and TTL expiry, shared reload for concurrent callers
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.components.domain_training.domain_catalog import DomainCatalog, build_snapshot
+
+
+def domain_row(name, embedding, status="ready", **fields):
+    """Build a :Domain row as returned by the catalog load query."""
+    return {
+        "id": f"{name}-id",
+        "name": name,
+        "description": f"{name} description",
+        "entity_prompt": f"{name} entity prompt",
+        "relation_prompt": f"{name} relation prompt",
+        "status": status,
+        "description_embedding": embedding,
+        "extraction_settings": None,
+        **fields,
+    }
+
+
+def one_hot(index, dim=1024):
+    """Unit vector along one axis."""
+    vector = [0.0] * dim
+    vector[index] = 1.0
+    return vector
+
+
+class TestBuildSnapshot:
+    """Test snapshot construction from domain rows."""
+
+    def test_records_and_settings(self):
+        """Embeddings are dropped from records, settings are parsed once."""
+        snapshot = build_snapshot(
+            [
+                domain_row("tech", one_hot(0), extraction_settings='{"fast_strategy": "spacy"}'),
+                domain_row("broken", one_hot(1), extraction_settings="{not json"),
+            ],
+            version=3,
+        )
+
+        assert snapshot.version == 3
+        assert "description_embedding" not in snapshot.records["tech"]
+        assert "extraction_settings" not in snapshot.records["tech"]
+        assert snapshot.extraction_settings == {"tech": {"fast_strategy": "spacy"}, "broken": {}}
+
+    def test_match_filter(self):
+        """Only ready, non-excluded domains with a non-zero 1024-dim embedding match."""
+        snapshot = build_snapshot(
+            [
+                domain_row("tech", [2.0] + [0.0] * 1023),
+                domain_row("pending", one_hot(0), status="pending"),
+                domain_row("general", one_hot(0)),
+                domain_row("zero", [0.0] * 1024),
+                domain_row("short", [1.0] * 512),
+                domain_row("missing", None),
+            ],
+            version=0,
+            excluded_from_matching=frozenset({"general"}),
+        )
+
+        assert snapshot.match_names == ("tech",)
+        assert snapshot.match_matrix.shape == (1, 1024)
+        assert snapshot.match_matrix[0, 0] == pytest.approx(1.0)
+        assert len(snapshot.records) == 6
+
+
+class TestMatch:
+    """Test vectorized cosine matching."""
+
+    def test_best_match_above_threshold(self):
+        """Highest cosine similarity wins; scale of the query does not matter."""
+        snapshot = build_snapshot(
+            [domain_row("a", one_hot(0)), domain_row("b", one_hot(1))], version=0
+        )
+        query = [0.0] * 1024
+        query[0], query[1] = 3.0, 4.0  # cos(a) = 0.6, cos(b) = 0.8
+
+        name, score = snapshot.match(query, threshold=0.5)
+
+        assert name == "b"
+        assert score == pytest.approx(0.8)
+        assert snapshot.match(query, threshold=0.9) is None
+
+    def test_zero_query_and_empty_catalog(self):
+        """Zero queries and catalogs without matchable domains never match."""
+        snapshot = build_snapshot([domain_row("a", one_hot(0))], version=0)
+
+        assert snapshot.match([0.0] * 1024, threshold=0.0) is None
+        assert build_snapshot([], version=0).match(one_hot(0), threshold=0.0) is None
+
+
+class TestDomainCatalog:
+    """Test catalog caching and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_lookups_share_one_load(self):
+        """get/match are served from one snapshot until invalidated."""
+        load = AsyncMock(return_value=[domain_row("a", one_hot(0))])
+        catalog = DomainCatalog(load, ttl_seconds=60)
+
+        assert (await catalog.get("a"))["entity_prompt"] == "a entity prompt"
+        assert await catalog.get("missing") is None
+        domain, score = await catalog.match(one_hot(0), threshold=0.5)
+
+        assert domain["name"] == "a"
+        assert score == pytest.approx(1.0)
+        assert load.await_count == 1
+        assert catalog.get_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_returned_records_are_copies(self):
+        """Mutating a returned domain does not corrupt the snapshot."""
+        catalog = DomainCatalog(AsyncMock(return_value=[domain_row("a", one_hot(0))]))
+
+        (await catalog.get("a"))["entity_prompt"] = "mutated"
+
+        assert (await catalog.get("a"))["entity_prompt"] == "a entity prompt"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads(self):
+        """invalidate() bumps the version and forces a reload."""
+        rows = [domain_row("a", one_hot(0))]
+        load = AsyncMock(side_effect=lambda: [dict(row) for row in rows])
+        catalog = DomainCatalog(load)
+
+        await catalog.get("a")
+        rows[0]["entity_prompt"] = "retrained prompt"
+        catalog.invalidate()
+
+        assert (await catalog.get("a"))["entity_prompt"] == "retrained prompt"
+        assert catalog.version == 1
+        assert load.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_reloads(self):
+        """Snapshots older than the TTL are reloaded."""
+        load = AsyncMock(return_value=[domain_row("a", one_hot(0))])
+        catalog = DomainCatalog(load, ttl_seconds=60)
+        now = [1000.0]
+
+        with patch(
+            "src.components.domain_training.domain_catalog.time.monotonic",
+            side_effect=lambda: now[0],
+        ):
+            await catalog.get("a")
+            now[0] += 59
+            await catalog.get("a")
+            now[0] += 2
+            await catalog.get("a")
+
+        assert load.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_reload(self):
+        """A cold catalog is loaded once for many concurrent lookups."""
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [domain_row("a", one_hot(0))]
+
+        catalog = DomainCatalog(load)
+
+        results = await asyncio.gather(*(catalog.get("a") for _ in range(10)))
+
+        assert all(result["name"] == "a" for result in results)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_load(self):
+        """A write during a reload makes the next lookup reload again."""
+        catalog = None
+
+        async def load():
+            if load.calls == 0:
+                catalog.invalidate()  # write lands while the query is running
+            load.calls += 1
+            return [domain_row("a", one_hot(0))]
+
+        load.calls = 0
+        catalog = DomainCatalog(load)
+
+        await catalog.get("a")
+        await catalog.get("a")
+
+        assert load.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_load_failure_propagates(self):
+        """Load errors surface to the caller and the next lookup retries."""
+        load = AsyncMock(side_effect=[RuntimeError("neo4j down"), [domain_row("a", one_hot(0))]])
+        catalog = DomainCatalog(load)
+
+        with pytest.raises(RuntimeError, match="neo4j down"):
+            await catalog.get("a")
+
+        assert (await catalog.get("a"))["name"] == "a"
@@ -51,6 +51,52 @@ def create_mock_neo4j_client(session_results=None):
     return client
 
 
+def catalog_rows():
+    """Domain rows as loaded by the domain catalog (sample embedding = [0.1] * 1024)."""
+    base = {
+        "entity_prompt": "Extract...",
+        "relation_prompt": "Extract...",
+        "llm_model": "qwen3:32b",
+        "extraction_settings": None,
+    }
+    return [
+        # cos = 1/sqrt(2) ~ 0.707 against the sample embedding
+        {
+            **base,
+            "id": "test-id",
+            "name": "tech_docs",
+            "description": "Technical documentation",
+            "status": "ready",
+            "description_embedding": [0.1] * 512 + [0.0] * 512,
+        },
+        {
+            **base,
+            "id": "legal-id",
+            "name": "legal",
+            "description": "Legal contracts",
+            "status": "ready",
+            "description_embedding": [0.0] * 512 + [-0.1] * 512,
+        },
+        # Identical embeddings, but excluded: default domain / not trained yet
+        {
+            **base,
+            "id": "general-id",
+            "name": DEFAULT_DOMAIN_NAME,
+            "description": "General",
+            "status": "ready",
+            "description_embedding": [0.1] * 1024,
+        },
+        {
+            **base,
+            "id": "pending-id",
+            "name": "pending_domain",
+            "description": "Pending",
+            "status": "pending",
+            "description_embedding": [0.1] * 1024,
+        },
+    ]
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -264,6 +310,34 @@ async def test_list_domains(domain_repository, sample_domain_data, mock_neo4j_cl
     assert result[1]["name"] == "legal_contracts"
 
 
+@pytest.mark.asyncio
+async def test_get_domain_cached(domain_repository, mock_neo4j_client):
+    """Test cached lookups are served from the domain catalog."""
+    mock_neo4j_client.execute_read.return_value = catalog_rows()
+
+    domain = await domain_repository.get_domain("tech_docs", cached=True)
+    await domain_repository.get_domain("legal", cached=True)
+    missing = await domain_repository.get_domain("unknown", cached=True)
+
+    assert domain["entity_prompt"] == "Extract..."
+    assert "description_embedding" not in domain
+    assert missing is None
+    assert mock_neo4j_client.execute_read.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_extraction_settings_cached(domain_repository, mock_neo4j_client):
+    """Test cached extraction settings are pre-parsed from JSON."""
+    rows = catalog_rows()
+    rows[0]["extraction_settings"] = '{"fast_strategy": "spacy_ner"}'
+    mock_neo4j_client.execute_read.return_value = rows
+
+    settings = await domain_repository.get_extraction_settings("tech_docs", cached=True)
+
+    assert settings == {"fast_strategy": "spacy_ner"}
+    assert await domain_repository.get_extraction_settings("legal", cached=True) == {}
+
+
 # ============================================================================
 # Test Domain Updates
 # ============================================================================
@@ -291,6 +365,31 @@ async def test_update_domain_prompts(domain_repository, mock_neo4j_client):
     assert mock_neo4j_client.execute_write.called
 
 
+@pytest.mark.asyncio
+async def test_update_domain_prompts_invalidates_catalog(domain_repository, mock_neo4j_client):
+    """Test cached lookups see new prompts after update_domain_prompts()."""
+    rows = catalog_rows()
+    mock_neo4j_client.execute_read.return_value = rows
+    assert (await domain_repository.get_domain("tech_docs", cached=True))["entity_prompt"] == (
+        "Extract..."
+    )
+
+    await domain_repository.update_domain_prompts(
+        name="tech_docs",
+        entity_prompt="New entity prompt",
+        relation_prompt="New relation prompt",
+        entity_examples=[],
+        relation_examples=[],
+        metrics={},
+    )
+    rows[0]["entity_prompt"] = "New entity prompt"
+
+    domain = await domain_repository.get_domain("tech_docs", cached=True)
+
+    assert domain["entity_prompt"] == "New entity prompt"
+    assert mock_neo4j_client.execute_read.await_count == 2
+
+
 # ============================================================================
 # Test Domain Matching
 # ============================================================================
@@ -301,23 +400,20 @@ async def test_find_best_matching_domain_success(
     domain_repository, sample_embedding, mock_neo4j_client
 ):
     """Test finding best matching domain with cosine similarity."""
-    mock_neo4j_client.execute_read.return_value = [
-        {
-            "id": "test-id",
-            "name": "tech_docs",
-            "description": "Technical documentation",
-            "entity_prompt": "Extract...",
-            "relation_prompt": "Extract...",
-            "llm_model": "qwen3:32b",
-            "similarity": 0.85,
-        }
-    ]
+    mock_neo4j_client.execute_read.return_value = catalog_rows()
 
     result = await domain_repository.find_best_matching_domain(sample_embedding, threshold=0.5)
 
     assert result is not None
-    assert result["domain"]["name"] == "tech_docs"
-    assert result["score"] == 0.85
+    assert result["domain"] == {
+        "id": "test-id",
+        "name": "tech_docs",
+        "description": "Technical documentation",
+        "entity_prompt": "Extract...",
+        "relation_prompt": "Extract...",
+        "llm_model": "qwen3:32b",
+    }
+    assert result["score"] == pytest.approx(0.7071, abs=1e-4)
 
 
 @pytest.mark.asyncio
@@ -325,13 +421,26 @@ async def test_find_best_matching_domain_no_match(
     domain_repository, sample_embedding, mock_neo4j_client
 ):
     """Test finding domain when no match above threshold."""
-    mock_neo4j_client.execute_read.return_value = []
+    mock_neo4j_client.execute_read.return_value = catalog_rows()
 
     result = await domain_repository.find_best_matching_domain(sample_embedding, threshold=0.8)
 
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_find_best_matching_domain_uses_catalog(
+    domain_repository, sample_embedding, mock_neo4j_client
+):
+    """Test repeated matching loads the domain catalog from Neo4j only once."""
+    mock_neo4j_client.execute_read.return_value = catalog_rows()
+
+    for _ in range(5):
+        await domain_repository.find_best_matching_domain(sample_embedding)
+
+    assert mock_neo4j_client.execute_read.await_count == 1
+
+
 @pytest.mark.asyncio
 async def test_find_best_matching_domain_invalid_embedding(domain_repository):
     """Test domain matching with invalid embedding dimension."""
@@ -9,6 +9,7 @@ from src.components.graph_rag.analytics_engine import (
     GraphAnalyticsEngine,
     get_analytics_engine,
 )
+from src.components.graph_rag.graph_projection import GraphProjectionStore
 from src.core.exceptions import DatabaseConnectionError
 from src.core.models import CentralityMetrics, GraphStatistics
 
@@ -24,7 +25,9 @@ def mock_neo4j_client():
 @pytest.fixture
 def engine(mock_neo4j_client):
     """Create GraphAnalyticsEngine instance."""
-    return GraphAnalyticsEngine(neo4j_client=mock_neo4j_client)
+    return GraphAnalyticsEngine(
+        neo4j_client=mock_neo4j_client, projection_store=GraphProjectionStore()
+    )
 
 
 @pytest.fixture
@@ -151,7 +154,8 @@ class TestGraphAnalyticsEngine:
         mock_neo4j_client.execute_query.side_effect = [
             [{"entity_id": "orphan_1", "name": "Orphan"}],  # Orphans
             [{"entity_id": "sparse_1", "name": "Sparse", "degree": 1}],  # Sparse
-            [{"source": "entity_1", "target": "entity_2", "rel_type": "KNOWS"}],  # For NetworkX
+            [{"nodes": 2, "relationships": 1}],  # Projection version
+            [{"source": "entity_1", "target": "entity_2", "rel_type": "KNOWS"}],  # Projection edges
         ]
 
         gaps = await engine.detect_knowledge_gaps()
@@ -165,6 +169,7 @@ class TestGraphAnalyticsEngine:
         mock_neo4j_client.execute_query.side_effect = [
             [{"entity_id": "orphan_1", "name": "Orphan"}],
             [{"entity_id": "sparse_1", "name": "Sparse", "degree": 1}],
+            [{"nodes": 2, "relationships": 1}],
             [{"source": "entity_1", "target": "entity_2", "rel_type": "KNOWS"}],
         ]
 
@@ -208,31 +213,6 @@ class TestGraphAnalyticsEngine:
 
         assert stats1 == stats2
 
-    @pytest.mark.asyncio
-    async def test_build_networkx_graph(self, engine, mock_neo4j_client):
-        """Test NetworkX graph construction."""
-        mock_neo4j_client.execute_query.return_value = [
-            {"source": "entity_1", "target": "entity_2", "rel_type": "KNOWS"},
-            {"source": "entity_2", "target": "entity_3", "rel_type": "KNOWS"},
-        ]
-
-        G = await engine._build_networkx_graph()
-        assert isinstance(G, nx.DiGraph)
-        assert G.number_of_nodes() == 3
-        assert G.number_of_edges() == 2
-
-    @pytest.mark.asyncio
-    async def test_build_networkx_graph_caching(self, engine, mock_neo4j_client):
-        """Test that NetworkX graph is cached."""
-        mock_neo4j_client.execute_query.return_value = [
-            {"source": "entity_1", "target": "entity_2", "rel_type": "KNOWS"},
-        ]
-
-        G1 = await engine._build_networkx_graph()
-        G2 = await engine._build_networkx_graph()
-
-        assert G1 is G2
-
     @pytest.mark.asyncio
     async def test_calculate_betweenness_centrality_networkx(self, engine, mock_neo4j_client):
         """Test betweenness centrality using NetworkX."""
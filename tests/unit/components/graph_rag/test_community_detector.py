@@ -239,7 +239,15 @@ class TestStoreCommunities:
 
         await detector._store_communities(communities)
 
-        assert mock_neo4j_client.execute_write.call_count == 2
+        # Sprint 130: All memberships in one batched UNWIND
+        assert mock_neo4j_client.execute_write.call_count == 1
+        params = mock_neo4j_client.execute_write.call_args[0][1]
+        assert params["assignments"] == [
+            {"entity_id": "e1", "community_id": "comm_1"},
+            {"entity_id": "e2", "community_id": "comm_1"},
+            {"entity_id": "e3", "community_id": "comm_2"},
+            {"entity_id": "e4", "community_id": "comm_2"},
+        ]
 
 
 class TestGetCommunity:
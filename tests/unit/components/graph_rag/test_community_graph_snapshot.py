@@ -0,0 +1,170 @@
+"""Unit tests for incremental community detection (Sprint 130 Feature 130.9).
+
+Tests:
+1. Snapshot edge bookkeeping (directed edges, undirected adjacency)
+2. Local re-clustering with stable community IDs
+3. Persistence round-trip and staleness checks
+4. CommunityDetector incremental mode (delta reads, batched writes, summaries)
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.components.graph_rag.community_detector import CommunityDetector
+from src.components.graph_rag.community_graph_snapshot import CommunityGraphSnapshot
+
+
+def _cliques() -> CommunityGraphSnapshot:
+    """Three disconnected triangles assigned to communities 0, 1 and 2."""
+    edges = []
+    membership = {}
+    for community_id, prefix in enumerate("abc"):
+        nodes = [f"{prefix}{i}" for i in (1, 2, 3)]
+        edges += [(nodes[0], nodes[1]), (nodes[1], nodes[2]), (nodes[2], nodes[0])]
+        membership.update(dict.fromkeys(nodes, community_id))
+    return CommunityGraphSnapshot.from_edges(
+        edges, membership, "2026-01-01T00:00:00Z", "leiden", 1.0
+    )
+
+
+class TestCommunityGraphSnapshot:
+    """Test snapshot bookkeeping and re-clustering."""
+
+    def test_apply_edge_changes(self):
+        """Reverse and duplicate edges do not touch the undirected graph twice."""
+        snapshot = _cliques()
+
+        assert snapshot.apply_edge_changes(added=[("a1", "a2")]) == set()
+        assert snapshot.apply_edge_changes(added=[("a2", "a1")]) == set()
+        assert snapshot.edge_count == 10
+
+        # Undirected edge survives while the reverse direction exists
+        assert snapshot.apply_edge_changes(removed=[("a1", "a2")]) == set()
+        assert snapshot.apply_edge_changes(removed=[("a2", "a1")]) == {"a1", "a2"}
+        assert snapshot.edge_count == 8
+
+    def test_diff_edges(self):
+        """Full edge list is diffed into added and removed edges."""
+        snapshot = _cliques()
+        current = snapshot.edges() - {("b3", "b1")} | {("a1", "x")}
+
+        added, removed = snapshot.diff_edges(current)
+
+        assert added == [("a1", "x")]
+        assert removed == [("b3", "b1")]
+
+    def test_reoptimize_only_affected_region(self):
+        """A new entity joins its neighbor's community; other communities are untouched."""
+        snapshot = _cliques()
+        touched = snapshot.apply_edge_changes(added=[("a1", "a4"), ("a2", "a4")])
+
+        result = snapshot.reoptimize(touched)
+
+        assert result.region == {"a1", "a2", "a3", "a4"}
+        assert result.changed == {"a4": 0}
+        assert snapshot.community_members(0) == {"a1", "a2", "a3", "a4"}
+        assert snapshot.community_members(1) == {"b1", "b2", "b3"}
+
+    def test_reoptimize_keeps_ids_on_split(self):
+        """The larger half of a split keeps the old ID, the other half gets a new one."""
+        edges = [("a1", "a2"), ("a2", "a3"), ("a3", "a1"), ("a3", "c1"), ("c1", "c2")]
+        snapshot = CommunityGraphSnapshot.from_edges(
+            edges, dict.fromkeys(("a1", "a2", "a3", "c1", "c2"), 0), None, "leiden", 1.0
+        )
+        touched = snapshot.apply_edge_changes(removed=[("a3", "c1")])
+
+        result = snapshot.reoptimize(touched)
+
+        assert snapshot.community_members(0) == {"a1", "a2", "a3"}
+        assert result.changed == {"c1": 1, "c2": 1}
+
+    def test_save_and_load(self, tmp_path):
+        """Snapshot round-trips and is rejected for different parameters."""
+        path = tmp_path / "snapshot.json"
+        snapshot = _cliques()
+        snapshot.save(path)
+
+        loaded = CommunityGraphSnapshot.load(path, "leiden", 1.0)
+
+        assert loaded.edges() == snapshot.edges()
+        assert loaded.membership == snapshot.membership
+        assert loaded.cursor == "2026-01-01T00:00:00Z"
+        assert CommunityGraphSnapshot.load(path, "leiden", 2.0) is None
+
+
+class TestIncrementalDetection:
+    """Test CommunityDetector incremental mode."""
+
+    @pytest.fixture
+    def detector(self, tmp_path):
+        client = AsyncMock()
+        detector = CommunityDetector(neo4j_client=client, min_size=1, use_gds=False)
+        detector.snapshot_path = tmp_path / "snapshot.json"
+        _cliques().save(detector.snapshot_path)
+        return detector
+
+    @pytest.mark.asyncio
+    async def test_applies_delta_and_writes_once(self, detector):
+        """Only new edges are read and only changed memberships are written."""
+        detector.neo4j_client.execute_read.side_effect = [
+            [
+                {"source": "a4", "target": "a1", "created_at": "2026-01-02T00:00:00Z"},
+                {"source": "a4", "target": "a2", "created_at": "2026-01-02T00:00:01Z"},
+            ],
+            [{"edges": 11}],
+        ]
+        summarizer = AsyncMock()
+
+        with patch(
+            "src.components.graph_rag.community_summarizer.get_community_summarizer",
+            return_value=summarizer,
+        ):
+            communities = await detector.detect_communities(
+                algorithm="leiden", resolution=1.0, incremental=True
+            )
+
+        cypher, params = detector.neo4j_client.execute_read.await_args_list[0].args
+        assert "r.created_at >= datetime($since)" in cypher
+        assert params["since"] == "2026-01-01T00:00:00Z"
+
+        detector.neo4j_client.execute_write.assert_awaited_once()
+        write_params = detector.neo4j_client.execute_write.await_args.args[1]
+        assert write_params["assignments"] == [{"entity_id": "a4", "community_id": "community_0"}]
+
+        delta = summarizer.update_summaries_for_delta.await_args.args[0]
+        assert delta.get_affected_communities() == {0}
+        assert [c.id for c in communities] == ["community_0"]
+
+        saved = CommunityGraphSnapshot.load(detector.snapshot_path, "leiden", 1.0)
+        assert saved.cursor == "2026-01-02T00:00:01Z"
+        assert saved.membership["a4"] == 0
+
+    @pytest.mark.asyncio
+    async def test_edge_count_mismatch_diffs_full_edge_list(self, detector):
+        """Deleted edges are found by diffing when the edge count does not match."""
+        current = sorted(_cliques().edges() - {("b3", "b1")})
+        detector.neo4j_client.execute_read.side_effect = [
+            [],  # nothing new since cursor
+            [{"edges": 8}],
+            [{"source": s, "target": t, "created_at": None} for s, t in current],
+        ]
+
+        await detector.detect_communities(
+            algorithm="leiden", resolution=1.0, track_delta=False, incremental=True
+        )
+
+        assert detector._snapshot.edge_count == 8
+        assert detector.neo4j_client.execute_read.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_no_changes_skips_writes(self, detector):
+        """Runs without graph changes do not write to Neo4j."""
+        detector.neo4j_client.execute_read.side_effect = [[], [{"edges": 9}]]
+
+        communities = await detector.detect_communities(
+            algorithm="leiden", resolution=1.0, incremental=True
+        )
+
+        assert communities == []
+        detector.neo4j_client.execute_write.assert_not_awaited()
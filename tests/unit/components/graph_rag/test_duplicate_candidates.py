@@ -0,0 +1,123 @@
+"""Unit tests for DuplicateCandidateGenerator.
+
+Sprint 130 Feature 130.12: Scalable Duplicate Candidates
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.components.graph_rag.duplicate_candidates import (
+    DuplicateCandidateGenerator,
+    candidate_adjacency,
+    normalize_entity_name,
+)
+
+
+def filler_names(count: int) -> list[str]:
+    """Random 10-letter names (unrelated to each other and to the test names)."""
+    rng = random.Random(0)
+    return ["".join(rng.choices("bdfghjkmpqvwxz", k=10)) for _ in range(count)]
+
+
+class TestNameCandidates:
+    """Test name-based blocking."""
+
+    @pytest.fixture
+    def generator(self) -> DuplicateCandidateGenerator:
+        """Generator that never falls back to all pairs."""
+        return DuplicateCandidateGenerator(exhaustive_limit=0)
+
+    def test_normalize_entity_name(self) -> None:
+        """Case, punctuation and whitespace are normalized."""
+        assert normalize_entity_name("  Nicolas-Cage ") == "nicolas cage"
+        assert normalize_entity_name("AEGIS   RAG") == "aegis rag"
+
+    def test_small_groups_get_all_pairs(self) -> None:
+        """Groups up to exhaustive_limit are compared exhaustively."""
+        generator = DuplicateCandidateGenerator(exhaustive_limit=10)
+
+        assert generator.name_candidates(["a", "b", "c"]) == {(0, 1), (0, 2), (1, 2)}
+
+    def test_plausible_pairs_are_found(self, generator: DuplicateCandidateGenerator) -> None:
+        """Case variants, typos, abbreviations and prefixes become candidates."""
+        names = [
+            "Nicolas Cage",  # 0
+            "nicolas cage",  # 1 case variant
+            "Nicholas Cage",  # 2 typo
+            "Cage",  # 3 abbreviation
+            "TensorFlow",  # 4
+            "Tensor",  # 5 prefix
+            *filler_names(200),
+        ]
+
+        pairs = generator.name_candidates(names)
+
+        for pair in [(0, 1), (0, 2), (0, 3), (4, 5)]:
+            assert pair in pairs
+        assert all(i < j for i, j in pairs)
+
+    def test_candidates_stay_near_linear(self, generator: DuplicateCandidateGenerator) -> None:
+        """Unrelated names produce far fewer candidates than all pairs."""
+        names = filler_names(2000)
+
+        pairs = generator.name_candidates(names)
+
+        assert len(pairs) < 2000 * 10
+
+    def test_oversized_blocks_are_skipped(self) -> None:
+        """Blocks larger than max_bucket_size are skipped; exact duplicates stay linked."""
+        generator = DuplicateCandidateGenerator(exhaustive_limit=0, max_bucket_size=1)
+        names = ["University Alpha", "University Bravo", "university alpha"]
+
+        assert generator.name_candidates(names) == {(0, 2)}
+
+    def test_minhash_is_deterministic(self, generator: DuplicateCandidateGenerator) -> None:
+        """Signatures are stable across generator instances."""
+        other = DuplicateCandidateGenerator()
+
+        assert np.array_equal(
+            generator.minhash_signature("nicolas cage"), other.minhash_signature("nicolas cage")
+        )
+
+
+class TestEmbeddingCandidates:
+    """Test chunked top-k embedding neighbors."""
+
+    def test_threshold_and_chunking(self) -> None:
+        """Neighbors above threshold are found across chunk boundaries."""
+        generator = DuplicateCandidateGenerator(chunk_size=2, top_k=3)
+        embeddings = [
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0],
+            [0.99, 0.1, 0.0],  # near 0, in the second chunk
+            [0.0, 0.0, 0.0],  # zero vector never matches
+        ]
+
+        candidates = generator.embedding_candidates(embeddings, threshold=0.9)
+
+        assert list(candidates) == [(0, 3)]
+        assert candidates[(0, 3)] == pytest.approx(0.995, abs=1e-3)
+
+    def test_top_k_bounds_neighbors(self) -> None:
+        """Each entity keeps at most top_k neighbors."""
+        generator = DuplicateCandidateGenerator(top_k=1)
+        embeddings = np.ones((4, 8), dtype=np.float32)
+
+        candidates = generator.embedding_candidates(embeddings, threshold=0.5)
+
+        # 4 rows × 1 neighbor each, symmetric pairs collapse
+        assert 2 <= len(candidates) <= 4
+
+    def test_single_entity(self) -> None:
+        """Fewer than two entities have no candidates."""
+        assert DuplicateCandidateGenerator().embedding_candidates([[1.0, 0.0]], 0.5) == {}
+
+
+def test_candidate_adjacency() -> None:
+    """Pairs become a sorted forward adjacency list."""
+    adjacency = candidate_adjacency({(0, 3), (0, 1), (2, 3)})
+
+    assert adjacency == {0: [1, 3], 2: [3]}
@@ -0,0 +1,183 @@
+"""Unit tests for EntityLexicon (Sprint 130 Feature 130.5).
+
+Tests in-memory query → entity linking for graph-local retrieval:
+1. Phrase and token matching over normalized names and aliases
+2. Namespace isolation
+3. Incremental add/remove and paged loading from Neo4j
+4. FourWayHybridSearch graph-local lookup by linked entity IDs
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.components.graph_rag.entity_lexicon import EntityLexicon, normalize_tokens
+from src.components.retrieval.four_way_hybrid_search import FourWayHybridSearch
+
+
+@pytest.fixture
+def lexicon():
+    """Lexicon with a few loaded entities in two namespaces."""
+    lex = EntityLexicon()
+    lex.add_entities(
+        "default",
+        [
+            {"entity_id": "e1", "entity_name": "AEGIS RAG"},
+            {"entity_id": "e2", "entity_name": "Qdrant", "aliases": ["Qdrant DB"]},
+            {"entity_id": "e3", "entity_name": "Neo4j"},
+            {"entity_id": "e4", "entity_name": "RAG"},
+        ],
+    )
+    lex.add_entities("other", [{"entity_id": "x1", "entity_name": "Qdrant"}])
+    lex._loaded.update({"default", "other"})
+    return lex
+
+
+class TestEntityLexicon:
+    """Test EntityLexicon matching."""
+
+    def test_normalize_tokens(self):
+        """Punctuation and case are removed."""
+        assert normalize_tokens("AEGIS-RAG  System!") == ("aegis", "rag", "system")
+
+    def test_phrase_matches_longest_first(self, lexicon):
+        """Multi-token names are found in the query, most specific first."""
+        matches = lexicon.match("How does AEGIS RAG use Qdrant?", ["default"])
+
+        ids = [m.entity_id for m in matches]
+        assert ids[0] == "e1"
+        assert set(ids) == {"e1", "e2", "e4"}
+        assert all(m.match_type == "phrase" for m in matches)
+
+    def test_alias_match(self, lexicon):
+        """Aliases link to their entity."""
+        matches = lexicon.match("configure qdrant db", ["default"])
+
+        assert [m.entity_id for m in matches] == ["e2"]
+
+    def test_token_match_for_partial_names(self, lexicon):
+        """Query terms matching a name token link the entity."""
+        matches = lexicon.match("what is aegis", ["default"], terms=["aegis"])
+
+        assert [(m.entity_id, m.match_type) for m in matches] == [("e1", "token")]
+
+    def test_namespace_isolation(self, lexicon):
+        """Only requested namespaces are matched."""
+        matches = lexicon.match("Qdrant", ["other"])
+
+        assert [m.entity_id for m in matches] == ["x1"]
+
+    def test_remove_entities(self, lexicon):
+        """Removed entities are no longer linked."""
+        lexicon.remove_entities("default", ["e2"])
+
+        assert lexicon.match("qdrant db", ["default"]) == []
+
+    def test_description_match_after_name_matches(self, lexicon):
+        """Description tokens link entities after name matches (legacy CONTAINS recall)."""
+        lexicon.add_entities(
+            "default",
+            [{"entity_id": "e5", "entity_name": "BGE-M3", "description": "Dense embedding model"}],
+        )
+
+        matches = lexicon.match("rag embedding", ["default"], terms=["rag", "embedding"])
+
+        assert [(m.entity_id, m.match_type) for m in matches][-1] == ("e5", "description")
+        assert matches[0].match_type == "phrase"
+
+    def test_remove_entities_drops_description_tokens(self, lexicon):
+        """Removed entities are not linked via their description either."""
+        lexicon.add_entities(
+            "default",
+            [{"entity_id": "e5", "entity_name": "BGE-M3", "description": "Dense embedding model"}],
+        )
+        lexicon.remove_entities("default", ["e5"])
+
+        assert lexicon.match("embedding", ["default"], terms=["embedding"]) == []
+
+    def test_max_matches(self):
+        """Result count is capped."""
+        lex = EntityLexicon(max_matches=2)
+        lex.add_entities(
+            "default", [{"entity_id": f"e{i}", "entity_name": "Python"} for i in range(5)]
+        )
+
+        assert len(lex.match("python", ["default"])) == 2
+
+    @pytest.mark.asyncio
+    async def test_ensure_loaded_pages_from_neo4j(self, monkeypatch):
+        """Namespaces are loaded in pages on first use."""
+        monkeypatch.setattr("src.components.graph_rag.entity_lexicon.LOAD_PAGE_SIZE", 2)
+        neo4j_client = MagicMock()
+        neo4j_client.execute_read = AsyncMock(
+            side_effect=[
+                [
+                    {
+                        "entity_id": "e1",
+                        "entity_name": "Alpha",
+                        "created_at": "2026-01-01T00:00:00Z",
+                    },
+                    {
+                        "entity_id": "e2",
+                        "entity_name": "Beta",
+                        "created_at": "2026-01-02T00:00:00Z",
+                    },
+                ],
+                [{"entity_id": "e3", "entity_name": "Gamma", "created_at": "2026-01-03T00:00:00Z"}],
+            ]
+        )
+        lex = EntityLexicon()
+
+        await lex.ensure_loaded(neo4j_client, ["default"])
+
+        assert lex.is_loaded(["default"])
+        assert len(lex) == 3
+        assert neo4j_client.execute_read.await_count == 2
+        assert lex._cursor["default"] == "2026-01-03T00:00:00Z"
+
+
+class TestGraphLocalLexiconLookup:
+    """Test FourWayHybridSearch graph-local search via the lexicon."""
+
+    @pytest.fixture
+    def engine(self, lexicon):
+        neo4j_client = MagicMock()
+        neo4j_client.execute_read = AsyncMock(
+            return_value=[{"id": "c1", "text": "chunk", "relevance": 2, "entities": ["Qdrant"]}]
+        )
+        return FourWayHybridSearch(
+            hybrid_search=MagicMock(),
+            multi_vector_search=MagicMock(),
+            neo4j_client=neo4j_client,
+            entity_lexicon=lexicon,
+        )
+
+    @pytest.mark.asyncio
+    async def test_uses_linked_entity_ids(self, engine):
+        """Cypher starts from linked entity IDs instead of a CONTAINS scan."""
+        results = await engine._graph_local_search("Qdrant setup", 10, ["default"])
+
+        cypher, params = engine.neo4j_client.execute_read.await_args.args
+        assert "e.entity_id IN $entity_ids" in cypher
+        assert "CONTAINS" not in cypher
+        assert params["entity_ids"] == ["e2"]
+        assert results[0]["id"] == "c1"
+
+    @pytest.mark.asyncio
+    async def test_no_linked_entities_skips_neo4j(self, engine):
+        """Queries without linked entities return no graph-local results."""
+        results = await engine._graph_local_search("unrelated question", 10, ["default"])
+
+        assert results == []
+        engine.neo4j_client.execute_read.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unloaded_namespace_falls_back_to_scan(self, engine):
+        """Queries are served by the scan while the lexicon loads in the background."""
+        engine.entity_lexicon.schedule_load = MagicMock()
+
+        await engine._graph_local_search("Qdrant setup", 10, ["new_namespace"])
+
+        cypher, _ = engine.neo4j_client.execute_read.await_args.args
+        assert "CONTAINS" in cypher
+        engine.entity_lexicon.schedule_load.assert_called_once()
@@ -22,11 +22,15 @@ class TestExtractionService:
     def extraction_service(self):
         """Extraction service fixture."""
         with patch("src.components.graph_rag.extraction_service.AegisLLMProxy"):
-            return ExtractionService(
+            service = ExtractionService(
                 llm_model="llama3.2:8b",
                 temperature=0.1,
                 max_tokens=4096,
             )
+        # No vLLM capacity signal (Ollama) → sequential batch extraction
+        service.llm_proxy.get_vllm_free_slots = AsyncMock(return_value=0)
+        service.llm_proxy.get_metrics_summary.return_value = {"total_tokens": 0}
+        return service
 
     @pytest.fixture
     def mock_llm_response(self):
@@ -284,6 +288,62 @@ class TestExtractionService:
             assert result["success_count"] == 1
             assert result["failed_count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_extract_batch_concurrent_documents(self, extraction_service):
+        """Test batch extraction runs documents concurrently and keeps input order."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_extract(text, document_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02 if document_id == "doc0" else 0.01)
+            in_flight -= 1
+            return {"entities": [], "relationships": [], "entity_count": 0, "relationship_count": 0}
+
+        documents = [{"id": f"doc{i}", "text": f"Document {i}"} for i in range(6)]
+        extraction_service.extract_and_store = fake_extract
+
+        result = await extraction_service.extract_batch(documents, document_concurrency=3)
+
+        assert peak == 3
+        assert [r["document_id"] for r in result["results"]] == [d["id"] for d in documents]
+        assert result["success_count"] == 6
+        assert result["stats"]["documents_per_minute"] > 0
+
+    @pytest.mark.asyncio
+    async def test_iter_extract_batch_streams_in_completion_order(self, extraction_service):
+        """Test per-document results are yielded as soon as they finish."""
+        import asyncio
+
+        async def fake_extract(text, document_id):
+            await asyncio.sleep(0.05 if document_id == "slow" else 0.0)
+            return {"entities": [], "relationships": [], "entity_count": 0, "relationship_count": 0}
+
+        extraction_service.extract_and_store = fake_extract
+        documents = [{"id": "slow", "text": "a"}, {"id": "fast", "text": "b"}]
+
+        order = [
+            r["document_id"]
+            async for r in extraction_service.iter_extract_batch(documents, document_concurrency=2)
+        ]
+
+        assert order == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_extract_batch_auto_concurrency_from_vllm_capacity(self, extraction_service):
+        """Test auto document concurrency is derived from free vLLM slots."""
+        extraction_service.llm_proxy.get_vllm_free_slots = AsyncMock(return_value=12)
+
+        doc_workers, chunk_workers = await extraction_service._resolve_batch_concurrency(
+            document_concurrency=0, chunk_concurrency=4
+        )
+
+        assert (doc_workers, chunk_workers) == (3, 4)
+
     def test_singleton_pattern(self):
         """Test singleton pattern for global instance."""
         instance1 = get_extraction_service()
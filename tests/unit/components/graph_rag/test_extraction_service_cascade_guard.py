@@ -4,7 +4,7 @@ Sprint 128 Feature 128.2: Cascade timeout guard to prevent competing vLLM reques
 
 Tests:
 - Guard waits when vLLM is overloaded after timeout
-- Guard releases when capacity becomes available
+- Guard releases as soon as capacity becomes available (Sprint 130: event-driven)
 - Guard skips when vLLM is not enabled
 - Guard timeout after max wait
 - Guard applies to both entity and relationship extraction
@@ -85,29 +85,33 @@ class TestExtractionServiceCascadeGuard:
     async def test_wait_for_vllm_capacity_wait_then_release(
         self, extraction_service: ExtractionService, rank_config: CascadeRankConfig
     ) -> None:
-        """Test guard waits when overloaded, then releases when capacity available."""
+        """Test guard waits when overloaded, then releases as soon as a slot frees."""
         # Mock vLLM as enabled
         extraction_service.llm_proxy._vllm_enabled = True
+        admission = extraction_service.llm_proxy._vllm_admission
 
-        # Mock get_vllm_active_requests to return:
-        # - First call: 2 (at capacity)
-        # - Second call: 1 (capacity available)
-        extraction_service.llm_proxy.get_vllm_active_requests = AsyncMock(side_effect=[2, 1])
+        # Two in-flight vLLM requests (at capacity)
+        await admission.acquire()
+        await admission.acquire()
 
-        # Guard should wait once, then release
+        async def finish_one_request() -> None:
+            await asyncio.sleep(0.1)
+            admission.release()
+
+        # Guard should wait, then wake up when the request completes (no 5s polling)
         start_time = asyncio.get_event_loop().time()
+        release_task = asyncio.create_task(finish_one_request())
         await extraction_service._wait_for_vllm_capacity(
             rank_config=rank_config,
             max_workers=2,
             max_wait_s=60,
         )
         elapsed = asyncio.get_event_loop().time() - start_time
+        await release_task
+        admission.release()
 
-        # Verify active requests were checked twice (initial + after wait)
-        assert extraction_service.llm_proxy.get_vllm_active_requests.call_count == 2
-
-        # Verify guard waited at least 5 seconds (initial wait)
-        assert elapsed >= 5.0
+        # Verify guard waited for the release but not for a polling interval
+        assert 0.1 <= elapsed < 1.0
 
     @pytest.mark.asyncio
     async def test_wait_for_vllm_capacity_max_wait_exceeded(
@@ -119,21 +123,18 @@ class TestExtractionServiceCascadeGuard:
 
         # Mock get_vllm_active_requests to always return 2 (overloaded)
         extraction_service.llm_proxy.get_vllm_active_requests = AsyncMock(return_value=2)
+        extraction_service.llm_proxy.wait_for_vllm_capacity = AsyncMock(return_value=False)
 
-        # Guard should wait up to max_wait_s (10s for test), then proceed
-        start_time = asyncio.get_event_loop().time()
         await extraction_service._wait_for_vllm_capacity(
             rank_config=rank_config,
             max_workers=2,
-            max_wait_s=10,  # Short timeout for test
+            max_wait_s=10,
         )
-        elapsed = asyncio.get_event_loop().time() - start_time
-
-        # Verify guard waited approximately max_wait_s (with some tolerance for exponential backoff)
-        assert 10.0 <= elapsed < 20.0
 
-        # Verify active requests were checked multiple times
-        assert extraction_service.llm_proxy.get_vllm_active_requests.call_count >= 2
+        # Verify guard waited on the admission controller with the max wait
+        extraction_service.llm_proxy.wait_for_vllm_capacity.assert_awaited_once_with(
+            2, timeout_s=10
+        )
 
     @pytest.mark.asyncio
     @patch("src.components.graph_rag.extraction_service.get_cascade_for_domain")
@@ -46,7 +46,7 @@ async def test_domain_trained_prompts_priority(extraction_service):
         # Assertions
         assert "TRAINED ENTITY PROMPT" in entity_prompt
         assert "TRAINED RELATION PROMPT" in relation_prompt
-        mock_domain_repo.get_domain.assert_called_once_with("entertainment")
+        mock_domain_repo.get_domain.assert_called_once_with("entertainment", cached=True)
 
 
 @pytest.mark.asyncio
@@ -86,7 +86,7 @@ async def test_generic_dspy_prompts_when_no_trained(extraction_service):
         # Assertions
         assert entity_prompt == "DSPY ENTITY PROMPT"
         assert relation_prompt == "DSPY RELATION PROMPT"
-        mock_domain_repo.get_domain.assert_called_once_with("new_domain")
+        mock_domain_repo.get_domain.assert_called_once_with("new_domain", cached=True)
 
 
 @pytest.mark.asyncio
@@ -205,4 +205,4 @@ async def test_domain_not_found_fallback(extraction_service):
         # Assertions
         assert entity_prompt == "DSPY ENTITY PROMPT"
         assert relation_prompt == "DSPY RELATION PROMPT"
-        mock_domain_repo.get_domain.assert_called_once_with("nonexistent_domain")
+        mock_domain_repo.get_domain.assert_called_once_with("nonexistent_domain", cached=True)
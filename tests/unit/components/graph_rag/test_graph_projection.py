@@ -0,0 +1,174 @@
+"""Tests for the shared in-memory graph projection."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import networkx as nx
+import pytest
+
+from src.components.graph_rag.graph_projection import (
+    GraphProjection,
+    GraphProjectionStore,
+    bump_graph_write_version,
+    get_graph_write_version,
+)
+
+EDGES = [
+    ("a", "b"),
+    ("b", "c"),
+    ("c", "a"),
+    ("c", "d"),
+    ("d", "e"),
+    ("e", "c"),
+    ("f", "g"),
+]
+
+
+@pytest.fixture
+def reference_graph():
+    """Reference NetworkX graph with the same edges."""
+    graph = nx.DiGraph()
+    graph.add_edges_from(EDGES)
+    return graph
+
+
+@pytest.fixture
+def projection():
+    """Projection over EDGES."""
+    return GraphProjection(EDGES, version=(0, 7, 7), pagerank_iterations=100)
+
+
+class TestGraphProjection:
+    """Test GraphProjection metrics and traversal against NetworkX."""
+
+    def test_shape(self, projection):
+        assert projection.num_nodes == 7
+        assert projection.num_edges == 7
+        assert projection.names[projection.index["d"]] == "d"
+
+    @pytest.mark.parametrize(
+        ("metric", "reference"),
+        [
+            ("pagerank", lambda g: nx.pagerank(g, max_iter=100, tol=1.0e-6)),
+            ("closeness", nx.closeness_centrality),
+            ("betweenness", nx.betweenness_centrality),
+        ],
+    )
+    def test_metrics_match_networkx(self, projection, reference_graph, metric, reference):
+        expected = reference(reference_graph)
+        for entity_id, value in expected.items():
+            assert projection.score(metric, entity_id) == pytest.approx(value, abs=1e-4)
+
+    def test_eigenvector_matches_networkx(self):
+        edges = [("a", "b"), ("b", "c"), ("c", "a"), ("a", "c")]
+        graph = nx.DiGraph(edges)
+        expected = nx.eigenvector_centrality(graph, max_iter=100)
+
+        projection = GraphProjection(edges)
+        for entity_id, value in expected.items():
+            assert projection.score("eigenvector", entity_id) == pytest.approx(value, abs=1e-3)
+
+    def test_sampled_betweenness_is_bounded(self, reference_graph):
+        projection = GraphProjection(EDGES, betweenness_exact_max_nodes=3, betweenness_samples=4)
+        scores = projection.scores("betweenness")
+
+        assert scores.shape == (7,)
+        assert (scores >= 0).all()
+
+    def test_scores_are_computed_once(self, projection):
+        first = projection.scores("pagerank")
+        assert projection.scores("pagerank") is first
+
+    def test_unknown_entity_scores_zero(self, projection):
+        assert projection.score("closeness", "missing") == 0.0
+        assert projection.component_of("missing") is None
+
+    def test_ranked(self, projection):
+        ranked = projection.ranked("pagerank", top_k=3)
+        assert len(ranked) == 3
+        assert ranked[0][1] >= ranked[1][1] >= ranked[2][1]
+
+    def test_weak_components(self, projection):
+        assert projection.num_weak_components == 2
+        assert projection.component_of("a") == projection.component_of("e")
+        assert projection.component_of("a") != projection.component_of("f")
+
+    def test_neighbors_and_k_hop(self, projection):
+        assert sorted(projection.neighbors("c", direction="out")) == ["a", "d"]
+        assert sorted(projection.neighbors("c", direction="in")) == ["b", "e"]
+        assert projection.k_hop_neighborhood("a", hops=1) == {"b": 1, "c": 1}
+        assert projection.k_hop_neighborhood("a", hops=2, direction="out") == {
+            "b": 1,
+            "c": 2,
+        }
+
+    def test_to_networkx(self, projection, reference_graph):
+        graph = projection.to_networkx()
+        assert set(graph.edges()) == set(reference_graph.edges())
+
+
+class TestGraphProjectionStore:
+    """Test version-based reloading of the projection store."""
+
+    @pytest.fixture
+    def mock_neo4j_client(self):
+        client = MagicMock()
+        counts = {"nodes": 2, "relationships": 1}
+
+        async def execute_query(query, parameters=None):
+            if "count(n)" in query:
+                return [dict(counts)]
+            await asyncio.sleep(0)
+            return [{"source": "a", "target": "b"}]
+
+        client.execute_query = AsyncMock(side_effect=execute_query)
+        client.counts = counts
+        return client
+
+    @staticmethod
+    def _edge_loads(client) -> int:
+        return sum(
+            1 for call in client.execute_query.call_args_list if "count(n)" not in call.args[0]
+        )
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_is_served_from_memory(self, mock_neo4j_client):
+        store = GraphProjectionStore()
+
+        first = await store.get(mock_neo4j_client)
+        second = await store.get(mock_neo4j_client)
+
+        assert first is second
+        assert self._edge_loads(mock_neo4j_client) == 1
+
+    @pytest.mark.asyncio
+    async def test_reloads_when_counts_change(self, mock_neo4j_client):
+        store = GraphProjectionStore()
+        first = await store.get(mock_neo4j_client)
+
+        mock_neo4j_client.counts["relationships"] = 2
+        second = await store.get(mock_neo4j_client)
+
+        assert second is not first
+        assert self._edge_loads(mock_neo4j_client) == 2
+
+    @pytest.mark.asyncio
+    async def test_reloads_after_write_version_bump(self, mock_neo4j_client):
+        store = GraphProjectionStore()
+        first = await store.get(mock_neo4j_client)
+
+        version = get_graph_write_version()
+        assert bump_graph_write_version() == version + 1
+        second = await store.get(mock_neo4j_client)
+
+        assert second is not first
+        assert second.version[0] == version + 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_load(self, mock_neo4j_client):
+        store = GraphProjectionStore()
+
+        projections = await asyncio.gather(*(store.get(mock_neo4j_client) for _ in range(5)))
+
+        assert all(p is projections[0] for p in projections)
+        assert self._edge_loads(mock_neo4j_client) == 1
@@ -0,0 +1,231 @@
+"""Unit tests for GraphWriteBuffer.
+
+Tests:
+1. UNWIND batching, phase order and per-label throughput stats
+2. Row deduplication and entity label grouping
+3. Retry on transient errors, requeue of rows after a failed flush
+4. Neo4jClient.store_chunks_and_provenance / store_relations on top of the buffer
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from neo4j.exceptions import TransientError
+
+from src.components.graph_rag.graph_write_buffer import (
+    CHUNK_UNWIND_QUERY,
+    MENTIONED_IN_UNWIND_QUERY,
+    RELATES_TO_UNWIND_QUERY,
+    GraphWriteBuffer,
+)
+from src.components.graph_rag.neo4j_client import Neo4jClient
+from src.core.exceptions import DatabaseConnectionError
+
+
+def create_mock_client(run_side_effect=None):
+    """Create a Neo4jClient mock whose session.run echoes ``written = len(rows)``."""
+    session = AsyncMock()
+
+    async def run(query, rows):
+        result = AsyncMock()
+        result.single = AsyncMock(return_value={"written": len(rows)})
+        return result
+
+    session.run = AsyncMock(side_effect=run_side_effect or run)
+
+    session_context = MagicMock()
+    session_context.__aenter__ = AsyncMock(return_value=session)
+    session_context.__aexit__ = AsyncMock(return_value=None)
+
+    client = MagicMock()
+    client.database = "neo4j"
+    client.driver.session = MagicMock(return_value=session_context)
+    return client, session
+
+
+def chunk(chunk_id, text="text"):
+    """Build a chunk dict."""
+    return {"chunk_id": chunk_id, "text": text, "document_id": "doc1", "chunk_index": 0}
+
+
+def entity(entity_id, entity_type="CONCEPT", source_id="c1"):
+    """Build a storage entity dict."""
+    return {
+        "entity_id": entity_id,
+        "entity_name": entity_id,
+        "entity_type": entity_type,
+        "source_id": source_id,
+    }
+
+
+@pytest.fixture(autouse=True)
+def no_lexicon_updates():
+    """Keep the global entity lexicon out of these tests."""
+    lexicon = MagicMock()
+    lexicon.is_loaded.return_value = False
+    with patch("src.components.graph_rag.entity_lexicon.get_entity_lexicon", return_value=lexicon):
+        yield lexicon
+
+
+class TestFlush:
+    """Test batching and write order."""
+
+    @pytest.mark.asyncio
+    async def test_unwind_batches_and_throughput(self):
+        """Rows are written in batch_size chunks; stats are reported per label."""
+        client, session = create_mock_client()
+        buffer = GraphWriteBuffer(client, batch_size=2)
+
+        buffer.add_chunks([chunk(f"c{i}") for i in range(5)])
+        result = await buffer.flush()
+
+        batch_sizes = [len(call.kwargs["rows"]) for call in session.run.await_args_list]
+        assert batch_sizes == [2, 2, 1]
+        assert result["chunks_written"] == 5
+        assert result["throughput"]["chunk"]["batches"] == 3
+        assert result["throughput"]["chunk"]["rows"] == 5
+        assert "rows_per_second" in result["throughput"]["chunk"]
+        assert buffer.pending_rows == 0
+
+    @pytest.mark.asyncio
+    async def test_phase_order_and_entity_labels(self):
+        """Chunks, entities (per type label), mentions and relations are written in order."""
+        client, session = create_mock_client()
+        buffer = GraphWriteBuffer(client, batch_size=100)
+
+        buffer.add_chunks([chunk("c1"), chunk("c2")])
+        buffer.add_entities([entity("A"), entity("B", "PERSON", "c2"), entity("C", source_id="c2")])
+        buffer.add_relations([{"source": "A", "target": "B", "type": "USES"}], chunk_id="c1")
+        result = await buffer.flush()
+
+        queries = [call.args[0] for call in session.run.await_args_list]
+        assert queries[0] == CHUNK_UNWIND_QUERY
+        assert "base:`CONCEPT`" in queries[1]
+        assert "base:`PERSON`" in queries[2]
+        assert queries[3] == MENTIONED_IN_UNWIND_QUERY
+        assert queries[4] == RELATES_TO_UNWIND_QUERY
+        assert len(session.run.await_args_list[1].kwargs["rows"]) == 2
+
+        relation_row = session.run.await_args_list[4].kwargs["rows"][0]
+        assert relation_row["relation_type"] == "USES"
+        assert relation_row["chunk_id"] == "c1"
+        assert result["entities_written"] == 3
+        assert result["mentioned_in_written"] == 3
+        assert result["relations_written"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rows_are_deduplicated(self):
+        """Re-added chunks/entities overwrite earlier rows; invalid entities are skipped."""
+        client, session = create_mock_client()
+        buffer = GraphWriteBuffer(client, batch_size=100)
+
+        buffer.add_chunks([chunk("c1", "old"), chunk("c1", "new")])
+        queued = buffer.add_entities([entity("A"), entity("A"), {"entity_name": "no id"}])
+        await buffer.flush()
+
+        chunk_rows = session.run.await_args_list[0].kwargs["rows"]
+        assert [row["text"] for row in chunk_rows] == ["new"]
+        assert queued == 2
+        assert buffer.entities_skipped == 1
+        assert len(session.run.await_args_list[2].kwargs["rows"]) == 1  # one MENTIONED_IN
+
+    @pytest.mark.asyncio
+    async def test_empty_flush_skips_neo4j(self):
+        """Flushing an empty buffer does not open a session."""
+        client, _ = create_mock_client()
+
+        result = await GraphWriteBuffer(client).flush()
+
+        assert result["chunks_written"] == 0
+        client.driver.session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_if_full(self):
+        """flush_if_full only flushes once the threshold is reached."""
+        client, _ = create_mock_client()
+        buffer = GraphWriteBuffer(client, flush_threshold=3)
+
+        buffer.add_chunks([chunk("c1"), chunk("c2")])
+        assert await buffer.flush_if_full() is None
+
+        buffer.add_chunks([chunk("c3")])
+        assert (await buffer.flush_if_full())["chunks_written"] == 3
+
+
+class TestErrors:
+    """Test retry and failure handling."""
+
+    @pytest.mark.asyncio
+    async def test_transient_error_is_retried(self):
+        """A deadlock on one batch is retried and counted."""
+        attempts = 0
+
+        async def run(query, rows):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise TransientError("DeadlockDetected")
+            result = AsyncMock()
+            result.single = AsyncMock(return_value={"written": len(rows)})
+            return result
+
+        client, _ = create_mock_client(run)
+        buffer = GraphWriteBuffer(client)
+        buffer.add_chunks([chunk("c1")])
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            result = await buffer.flush()
+
+        assert attempts == 2
+        assert result["throughput"]["chunk"]["retries"] == 1
+        assert result["chunks_written"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues_rows(self):
+        """Non-transient errors surface and keep the rows for the next flush."""
+
+        async def run(query, rows):
+            raise RuntimeError("constraint violation")
+
+        client, _ = create_mock_client(run)
+        buffer = GraphWriteBuffer(client)
+        buffer.add_chunks([chunk("c1")])
+        buffer.add_entities([entity("A")])
+
+        with pytest.raises(DatabaseConnectionError):
+            await buffer.flush()
+
+        assert buffer.pending_rows == 3  # chunk + entity + MENTIONED_IN
+
+
+class TestNeo4jClientStorage:
+    """Test the Neo4jClient storage methods built on the buffer."""
+
+    @pytest.mark.asyncio
+    async def test_store_chunks_and_provenance(self):
+        """Counts are taken from the flushed UNWIND batches."""
+        mock_client, session = create_mock_client()
+        client = Neo4jClient(uri="bolt://test:7687", user="neo4j", password="test")
+        client._driver = mock_client.driver
+
+        stats = await client.store_chunks_and_provenance(
+            chunks=[chunk("c1"), chunk("c2")],
+            entities=[entity("A"), entity("B", source_id="c2")],
+        )
+
+        assert stats == {"chunks_created": 2, "entities_created": 2, "mentioned_in_created": 2}
+        assert session.run.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_store_relations(self):
+        """Relations of one chunk are written in one statement."""
+        mock_client, session = create_mock_client()
+        client = Neo4jClient(uri="bolt://test:7687", user="neo4j", password="test")
+        client._driver = mock_client.driver
+
+        created = await client.store_relations(
+            [{"source": "A", "target": "B"}, {"source": "B", "target": "C"}], chunk_id="c1"
+        )
+
+        assert created == 2
+        assert session.run.await_count == 1
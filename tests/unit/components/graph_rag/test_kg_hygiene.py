@@ -3,6 +3,8 @@
 Sprint 85 Feature 85.5: KG Hygiene & Deduplication
 """
 
+from unittest.mock import AsyncMock
+
 import pytest
 
 from src.components.graph_rag.kg_hygiene import (
@@ -198,3 +200,32 @@ class TestValidRelationTypes:
         assert "OWNS" in VALID_RELATION_TYPES
         assert "MANAGES" in VALID_RELATION_TYPES
         assert "LOCATED_IN" in VALID_RELATION_TYPES
+
+
+class TestFindDuplicateEntities:
+    """Test duplicate detection fallback (Sprint 130 Feature 130.12)."""
+
+    @pytest.mark.asyncio
+    async def test_name_fallback_without_vector_index(self) -> None:
+        """Without a vector index, names are compared on blocking candidates."""
+        service = KGHygieneService()
+        service.candidate_generator.exhaustive_limit = 0
+        service.neo4j_client = AsyncMock()
+        names = ["Nicolas Cage", "nicolas cage", "Cage", "Berlin", "Munich"]
+        service.neo4j_client.execute_read = AsyncMock(
+            side_effect=[
+                Exception("no such index: entity_embedding_index"),
+                [{"entity_name": name} for name in names],
+            ]
+        )
+
+        duplicates = await service.find_duplicate_entities(namespace_id="ns1", limit=10)
+
+        assert duplicates == [
+            ("Cage", "Nicolas Cage", 1.0),
+            ("Cage", "nicolas cage", 1.0),
+            ("Nicolas Cage", "nicolas cage", 1.0),
+        ]
+        fallback_query, params = service.neo4j_client.execute_read.await_args_list[1].args
+        assert "(e1:base), (e2:base)" not in fallback_query
+        assert params["namespace_id"] == "ns1"
@@ -93,3 +93,128 @@ class TestRenderPageImage:
 
             with pytest.raises(ValueError, match="Page 0 out of range"):
                 render_page_image("/path/to/test.pdf", page_no=0)
+
+
+def _make_mock_doc(num_pages: int) -> MagicMock:
+    """Mock fitz document whose pages render to b"png-<page_no>"."""
+    mock_doc = MagicMock()
+    mock_doc.__len__ = MagicMock(return_value=num_pages)
+
+    def get_page(idx):
+        page = MagicMock()
+        pix = MagicMock()
+        pix.tobytes.return_value = f"png-{idx + 1}".encode()
+        page.get_pixmap.return_value = pix
+        return page
+
+    mock_doc.__getitem__ = MagicMock(side_effect=get_page)
+    return mock_doc
+
+
+class TestStreamingPageRenderer:
+    """Tests for StreamingPageRenderer (pool replaced by a thread pool)."""
+
+    @pytest.mark.asyncio
+    async def test_streams_requested_pages_and_reports_stats(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_fitz = _make_mock_fitz()
+        mock_fitz.open.return_value = _make_mock_doc(5)
+
+        with (
+            patch.dict(sys.modules, {"fitz": mock_fitz}),
+            ThreadPoolExecutor(max_workers=2) as pool,
+        ):
+            from src.components.ingestion import page_image_renderer
+
+            with patch.object(page_image_renderer, "_get_render_pool", return_value=pool):
+                renderer = page_image_renderer.StreamingPageRenderer(
+                    "/path/to/test.pdf", page_numbers=[4, 1, 2, 9], pages_per_task=1
+                )
+                pages = {page_no: png async for page_no, png in renderer}
+
+        # Page 9 is out of range and skipped
+        assert pages == {1: b"png-1", 2: b"png-2", 4: b"png-4"}
+        assert renderer.stats.pages_rendered == 3
+        assert renderer.stats.total_bytes == sum(len(b) for b in pages.values())
+        assert renderer.stats.peak_rss_mb > 0
+        assert renderer.stats.worker_peak_rss_mb > 0
+
+    @pytest.mark.asyncio
+    async def test_renders_all_pages_by_default(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_fitz = _make_mock_fitz()
+        mock_fitz.open.return_value = _make_mock_doc(3)
+
+        with (
+            patch.dict(sys.modules, {"fitz": mock_fitz}),
+            ThreadPoolExecutor(max_workers=1) as pool,
+        ):
+            from src.components.ingestion import page_image_renderer
+
+            with patch.object(page_image_renderer, "_get_render_pool", return_value=pool):
+                renderer = page_image_renderer.StreamingPageRenderer(
+                    "/path/to/test.pdf", max_workers=1
+                )
+                page_nos = sorted([page_no async for page_no, _ in renderer])
+
+        assert page_nos == [1, 2, 3]
+
+    def test_render_pool_is_shared_and_never_resized(self):
+        """The pool is created once from settings and reused by every document."""
+        from src.components.ingestion import page_image_renderer
+
+        with (
+            patch.object(page_image_renderer, "_render_pool", None),
+            patch.object(page_image_renderer, "ProcessPoolExecutor") as pool_cls,
+        ):
+            first = page_image_renderer._get_render_pool()
+            second = page_image_renderer._get_render_pool()
+
+        assert first is second
+        pool_cls.assert_called_once()
+        first.shutdown.assert_not_called()
+
+
+class TestSelectTableCandidatePages:
+    """Tests for select_table_candidate_pages() pre-filter."""
+
+    @staticmethod
+    def _page(drawings=None, images=None, area=1000.0):
+        page = MagicMock()
+        page.get_drawings.return_value = drawings or []
+        page.get_image_info.return_value = images or []
+        page.rect = area
+        return page
+
+    def test_selects_docling_ruling_and_scanned_pages(self):
+        mock_fitz = _make_mock_fitz()
+        # Rect(bbox) -> bbox area stand-in so abs() works on plain floats
+        mock_fitz.Rect.side_effect = lambda bbox: bbox
+
+        horizontal = ("l", MagicMock(x=0, y=10), MagicMock(x=100, y=10))
+        diagonal = ("l", MagicMock(x=0, y=0), MagicMock(x=50, y=80))
+        pages = [
+            self._page(),  # 1: Docling table
+            self._page(drawings=[{"items": [horizontal, horizontal, ("re", None)] * 2}]),  # 2
+            self._page(drawings=[{"items": [diagonal] * 10}]),  # 3: no grid
+            self._page(images=[{"bbox": 800.0}]),  # 4: full-page scan
+            self._page(),  # 5: plain text
+        ]
+        mock_doc = MagicMock()
+        mock_doc.__len__ = MagicMock(return_value=len(pages))
+        mock_doc.__getitem__ = MagicMock(side_effect=lambda idx: pages[idx])
+        mock_fitz.open.return_value = mock_doc
+
+        with patch.dict(sys.modules, {"fitz": mock_fitz}):
+            from src.components.ingestion.page_image_renderer import (
+                select_table_candidate_pages,
+            )
+
+            result = select_table_candidate_pages(
+                "/path/to/test.pdf", parsed_tables=[{"page_no": 1}, {"page_no": None}]
+            )
+
+        assert result == [1, 2, 4]
+        mock_doc.close.assert_called_once()
@@ -221,3 +221,70 @@ class TestVLMPageProcessor:
         await proc.process_all_pages(pages, max_concurrent=1)
 
         assert max_active == 1  # Only 1 concurrent at a time
+
+    @pytest.mark.asyncio
+    async def test_process_page_stream(self):
+        """Pages from an async stream are processed as they arrive."""
+        proc = VLMPageProcessor()
+        proc._client.health_check = AsyncMock(return_value=True)
+        proc._client.extract_tables_from_page = AsyncMock(
+            side_effect=lambda image_bytes: [[["T"]]] if image_bytes == b"b" else []
+        )
+
+        async def stream():
+            for page_no, image in [(2, b"b"), (1, b"a")]:
+                yield page_no, image
+
+        result = await proc.process_page_stream(stream())
+
+        assert result.total_pages == 2
+        assert set(result.page_results) == {1, 2}
+        assert result.pages_with_tables == 1
+
+    @pytest.mark.asyncio
+    async def test_process_page_stream_not_consumed_when_unavailable(self):
+        """No page is pulled (rendered) when the VLM is down."""
+        proc = VLMPageProcessor()
+        proc._client.health_check = AsyncMock(return_value=False)
+        pulled = []
+
+        async def stream():
+            pulled.append(1)
+            yield 1, b"a"
+
+        result = await proc.process_page_stream(stream(), total_pages=1)
+
+        assert result.vlm_available is False
+        assert result.total_pages == 1
+        assert pulled == []
+
+    @pytest.mark.asyncio
+    async def test_process_page_stream_applies_backpressure(self):
+        """The stream is only pulled when a VLM slot is free."""
+        import asyncio
+
+        proc = VLMPageProcessor()
+        proc._client.health_check = AsyncMock(return_value=True)
+        in_flight = 0
+        max_ahead = 0
+
+        async def mock_extract(image_bytes):
+            nonlocal in_flight
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        proc._client.extract_tables_from_page = mock_extract
+
+        async def stream():
+            nonlocal in_flight, max_ahead
+            for page_no in range(1, 7):
+                in_flight += 1
+                max_ahead = max(max_ahead, in_flight)
+                yield page_no, b"x"
+
+        result = await proc.process_page_stream(stream(), max_concurrent=2)
+
+        assert result.total_pages == 6
+        # At most max_concurrent pages in VLM plus the one waiting for a slot
+        assert max_ahead <= 3
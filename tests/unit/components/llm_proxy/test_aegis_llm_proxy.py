@@ -77,7 +77,9 @@ def mock_config():
 @pytest.fixture
 def aegis_proxy(mock_config):
     """Create AegisLLMProxy instance with mocked cost tracker."""
-    with patch("src.domains.llm_integration.proxy.aegis_llm_proxy.CostTracker") as mock_tracker:
+    with patch(
+        "src.domains.llm_integration.proxy.aegis_llm_proxy.get_cost_tracker"
+    ) as mock_tracker:
         mock_tracker_instance = MagicMock()
         mock_tracker_instance.get_monthly_spending.return_value = {
             "alibaba_cloud": 0.0,
@@ -285,7 +287,9 @@ async def test_cost_calculation_with_fallback_estimation(aegis_proxy, sample_tas
 
 def test_calculate_cost_accurate_split(mock_config):
     """Test _calculate_cost method with accurate input/output split."""
-    with patch("src.domains.llm_integration.proxy.aegis_llm_proxy.CostTracker") as mock_tracker:
+    with patch(
+        "src.domains.llm_integration.proxy.aegis_llm_proxy.get_cost_tracker"
+    ) as mock_tracker:
         mock_tracker_instance = MagicMock()
         mock_tracker_instance.get_monthly_spending.return_value = {}
         mock_tracker.return_value = mock_tracker_instance
@@ -317,7 +321,9 @@ def test_calculate_cost_accurate_split(mock_config):
 
 def test_calculate_cost_fallback_legacy(mock_config):
     """Test _calculate_cost falls back to legacy pricing when split unavailable."""
-    with patch("src.domains.llm_integration.proxy.aegis_llm_proxy.CostTracker") as mock_tracker:
+    with patch(
+        "src.domains.llm_integration.proxy.aegis_llm_proxy.get_cost_tracker"
+    ) as mock_tracker:
         mock_tracker_instance = MagicMock()
         mock_tracker_instance.get_monthly_spending.return_value = {}
         mock_tracker.return_value = mock_tracker_instance
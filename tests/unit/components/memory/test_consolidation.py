@@ -11,6 +11,7 @@ Tests:
 8. test_cron_scheduler_parsing - Test cron schedule validation
 9. test_scheduler_start_stop - Test scheduler lifecycle
 10. test_consolidation_with_empty_items - Test empty data handling
+11. test_redis_to_qdrant_embeds_and_upserts_in_bulk - Test bulk embed + upsert
 """
 
 import asyncio
@@ -383,3 +384,62 @@ class TestConsolidationPipeline:
             assert result["scored"] == 0
             assert result["top_selected"] == 0
             assert result["consolidated"] == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_to_qdrant_embeds_and_upserts_in_bulk(self, mock_redis_memory):
+        """Test 11: Consolidated items are embedded in one batch and upserted together."""
+        now = datetime.now(UTC)
+        mock_redis_memory.get_frequently_accessed = AsyncMock(
+            return_value=[
+                {
+                    "key": f"item_{i}",
+                    "value": f"memory {i}" if i else {"structured": True},
+                    "access_count": 5 if i < 3 else 0,
+                    "stored_at": (now - timedelta(minutes=5)).isoformat(),
+                    "last_accessed_at": now.isoformat(),
+                }
+                for i in range(4)
+            ]
+        )
+        mock_qdrant = Mock()
+        mock_qdrant.create_collection = AsyncMock(return_value=True)
+        mock_qdrant.upsert_points = AsyncMock(return_value=True)
+        mock_embeddings = Mock()
+        mock_embeddings.embed_batch = AsyncMock(
+            side_effect=lambda texts: [{"dense": [0.1, 0.2, 0.3]} for _ in texts]
+        )
+
+        with (
+            patch(
+                "src.components.memory.consolidation.get_redis_memory",
+                return_value=mock_redis_memory,
+            ),
+            patch(
+                "src.components.memory.consolidation.get_qdrant_client", return_value=mock_qdrant
+            ),
+            patch("src.components.memory.consolidation.settings") as mock_settings,
+            patch(
+                "src.components.shared.embedding_service.get_embedding_service",
+                return_value=mock_embeddings,
+            ),
+        ):
+            mock_settings.graphiti_enabled = False
+            mock_settings.memory_consolidation_min_access_count = 3
+            mock_settings.memory_consolidation_collection = "memory_long_term"
+
+            pipeline = MemoryConsolidationPipeline()
+            result = await pipeline.consolidate_redis_to_qdrant()
+
+        assert result == {"processed": 4, "consolidated": 3, "skipped": 1}
+        mock_embeddings.embed_batch.assert_awaited_once_with(
+            ['{"structured": true}', "memory 1", "memory 2"]
+        )
+        mock_qdrant.create_collection.assert_awaited_once_with(
+            collection_name="memory_long_term", vector_size=3
+        )
+        mock_qdrant.upsert_points.assert_awaited_once()
+        points = mock_qdrant.upsert_points.call_args.kwargs["points"]
+        assert [p.payload["key"] for p in points] == ["item_0", "item_1", "item_2"]
+        assert points[0].vector == [0.1, 0.2, 0.3]
+        # Stable point IDs: re-consolidation overwrites instead of duplicating
+        assert len({p.id for p in points}) == 3
@@ -0,0 +1,301 @@
+"""Unit tests for RedisMemoryManager access index (redis_memory.py).
+
+Tests:
+1. store/retrieve/delete keep the access-count sorted set in sync
+2. get_frequently_accessed reads candidates from the index (no SCAN) and
+   fetches values/TTLs in pipelined batches
+3. Stale index entries of expired keys are pruned, on read and on store()
+4. A missing index is rebuilt once from the namespace keys
+"""
+
+import fnmatch
+import json
+import time
+
+import pytest
+
+from src.components.memory.redis_memory import (
+    RedisMemoryManager,
+    access_expiry_key,
+    access_index_key,
+)
+
+
+class FakeRedis:
+    """In-memory Redis subset that counts network round-trips."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.round_trips = 0
+        self.scans = 0
+
+    # Commands (sync implementations, shared with the pipeline)
+
+    def _get(self, key):
+        return self.values.get(key)
+
+    def _set(self, key, value, xx=False, keepttl=False):
+        if xx and key not in self.values:
+            return None
+        self.values[key] = value
+        if not keepttl:
+            self.ttls.pop(key, None)
+        return True
+
+    def _setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    def _ttl(self, key):
+        if key not in self.values:
+            return -2
+        return self.ttls.get(key, -1)
+
+    def _mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def _delete(self, key):
+        self.ttls.pop(key, None)
+        return int(self.values.pop(key, None) is not None)
+
+    def _zadd(self, key, mapping, xx=False):
+        zset = self.zsets.setdefault(key, {})
+        if xx:
+            mapping = {m: s for m, s in mapping.items() if m in zset}
+        zset.update(mapping)
+        if not zset:
+            self.zsets.pop(key, None)
+        return len(mapping)
+
+    def _zrem(self, key, *members):
+        zset = self.zsets.get(key, {})
+        removed = sum(zset.pop(member, None) is not None for member in members)
+        if not zset:
+            self.zsets.pop(key, None)
+        return removed
+
+    def _zrangebyscore(self, key, min, max, start=None, num=None):
+        ranked = sorted(
+            ((m, s) for m, s in self.zsets.get(key, {}).items() if float(min) <= s <= float(max)),
+            key=lambda pair: pair[1],
+        )
+        members = [m for m, _ in ranked]
+        return members[start : start + num] if start is not None else members
+
+    def _zrevrangebyscore(self, key, max, min, start=None, num=None):
+        ranked = sorted(
+            ((m, s) for m, s in self.zsets.get(key, {}).items() if s >= float(min)),
+            key=lambda pair: pair[1],
+            reverse=True,
+        )
+        members = [m for m, _ in ranked]
+        return members[start : start + num] if start is not None else members
+
+    def _exists(self, *keys):
+        return sum(key in self.values or key in self.zsets for key in keys)
+
+    def __getattr__(self, name):
+        command = object.__getattribute__(self, f"_{name}")
+
+        async def call(*args, **kwargs):
+            self.round_trips += 1
+            return command(*args, **kwargs)
+
+        return call
+
+    async def scan_iter(self, match, count=None):
+        self.scans += 1
+        self.round_trips += 1
+        for key in list(self.values):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them in one round-trip."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        command = getattr(self.redis, f"_{name}")
+
+        def queue(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def manager(fake_redis):
+    manager = RedisMemoryManager(redis_url="redis://fake:6379/0", default_ttl_seconds=3600)
+    manager._client = fake_redis
+    return manager
+
+
+async def _store_with_accesses(manager, key, accesses):
+    await manager.store(key=key, value=f"value of {key}")
+    for _ in range(accesses):
+        await manager.retrieve(key=key)
+
+
+class TestAccessIndex:
+    """Test the access-count sorted set."""
+
+    @pytest.mark.asyncio
+    async def test_store_and_retrieve_update_index(self, manager, fake_redis):
+        """store() indexes with 0, retrieve() mirrors the access count."""
+        await _store_with_accesses(manager, "a", accesses=2)
+
+        assert fake_redis.zsets[access_index_key("memory")] == {"a": 2}
+        data = json.loads(fake_redis.values["memory:a"])
+        assert data["access_count"] == 2
+        # TTL is preserved when the access count is updated
+        assert fake_redis.ttls["memory:a"] == 3600
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_index_entry(self, manager, fake_redis):
+        """delete() drops the key and its index entry."""
+        await _store_with_accesses(manager, "a", accesses=1)
+
+        assert await manager.delete("a") is True
+        assert access_index_key("memory") not in fake_redis.zsets
+
+    @pytest.mark.asyncio
+    async def test_retrieve_without_tracking_leaves_index(self, manager, fake_redis):
+        """track_access=False reads without touching the index."""
+        await manager.store(key="a", value="x")
+
+        assert await manager.retrieve(key="a", track_access=False) == "x"
+        assert fake_redis.zsets[access_index_key("memory")] == {"a": 0}
+
+
+class TestGetFrequentlyAccessed:
+    """Test index-driven consolidation reads."""
+
+    @pytest.mark.asyncio
+    async def test_reads_from_index_in_pipelined_batches(self, manager, fake_redis):
+        """Candidates come from the index, values/TTLs in one round-trip per batch."""
+        for i in range(10):
+            await _store_with_accesses(manager, f"k{i}", accesses=i)
+        fake_redis.round_trips = 0
+
+        items = await manager.get_frequently_accessed(
+            min_access_count=3, limit=100, read_batch_size=4
+        )
+
+        assert [item["key"] for item in items] == [f"k{i}" for i in range(9, 2, -1)]
+        assert items[0]["value"] == "value of k9"
+        assert items[0]["access_count"] == 9
+        assert items[0]["ttl_seconds"] == 3600
+        assert fake_redis.scans == 0
+        # exists + 2 pages x (zrevrangebyscore + pipelined MGET/TTL) for 7 candidates
+        assert fake_redis.round_trips == 1 + 2 * 2
+
+    @pytest.mark.asyncio
+    async def test_respects_limit(self, manager):
+        """Only the top `limit` items by access count are returned."""
+        for i in range(5):
+            await _store_with_accesses(manager, f"k{i}", accesses=i + 3)
+
+        items = await manager.get_frequently_accessed(min_access_count=3, limit=2)
+
+        assert [item["key"] for item in items] == ["k4", "k3"]
+
+    @pytest.mark.asyncio
+    async def test_prunes_expired_keys(self, manager, fake_redis):
+        """Index entries of expired keys are removed and skipped."""
+        for i in range(4):
+            await _store_with_accesses(manager, f"k{i}", accesses=3 + i)
+        # Simulate expiry: key is gone, index entry remains
+        del fake_redis.values["memory:k3"]
+
+        items = await manager.get_frequently_accessed(
+            min_access_count=3, limit=10, read_batch_size=2
+        )
+
+        assert [item["key"] for item in items] == ["k2", "k1", "k0"]
+        assert "k3" not in fake_redis.zsets[access_index_key("memory")]
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_missing_index(self, manager, fake_redis):
+        """Keys stored before the index existed are indexed once."""
+        for i, count in enumerate([5, 1, 4]):
+            fake_redis.values[f"memory:k{i}"] = json.dumps(
+                {"value": i, "stored_at": None, "access_count": count}
+            )
+            fake_redis.ttls[f"memory:k{i}"] = 100
+        fake_redis.values["context:other"] = json.dumps({"value": 0, "access_count": 9})
+
+        items = await manager.get_frequently_accessed(min_access_count=3)
+
+        assert [item["key"] for item in items] == ["k0", "k2"]
+        assert fake_redis.zsets[access_index_key("memory")] == {"k0": 5, "k1": 1, "k2": 4}
+
+        await manager.get_frequently_accessed(min_access_count=3)
+        assert fake_redis.scans == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_namespace_is_scanned_once(self, manager, fake_redis):
+        """The rebuild marker stops repeated SCANs while the index stays empty."""
+        assert await manager.get_frequently_accessed(namespace="conversation") == []
+        assert await manager.get_frequently_accessed(namespace="conversation") == []
+
+        assert fake_redis.scans == 1
+
+
+class TestIndexExpiry:
+    """Test that index entries of expired keys do not accumulate."""
+
+    @pytest.mark.asyncio
+    async def test_store_records_expire_at(self, manager, fake_redis):
+        """store() scores the key by its expire-at time in the expiry set."""
+        await manager.store(key="a", value="x", ttl_seconds=60)
+
+        expire_at = fake_redis.zsets[access_expiry_key("memory")]["a"]
+        assert expire_at == pytest.approx(time.time() + 60, abs=5)
+
+    @pytest.mark.asyncio
+    async def test_store_prunes_expired_entries(self, manager, fake_redis):
+        """Entries of keys that expired are dropped by the next store()."""
+        await manager.store(key="old", value="x", namespace="conversation")
+        # Simulate expiry: key is gone, expire-at lies in the past
+        del fake_redis.values["conversation:old"]
+        fake_redis.zsets[access_expiry_key("conversation")]["old"] = 0
+
+        await manager.store(key="new", value="y", namespace="conversation")
+
+        assert fake_redis.zsets[access_index_key("conversation")] == {"new": 0}
+        assert list(fake_redis.zsets[access_expiry_key("conversation")]) == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_expiry_entry(self, manager, fake_redis):
+        """delete() drops the key from the expiry set too."""
+        await manager.store(key="a", value="x")
+
+        await manager.delete("a")
+
+        assert access_expiry_key("memory") not in fake_redis.zsets
@@ -0,0 +1,218 @@
+"""Unit tests for ConversationSessionIndex (sorted-set chat session index)."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.components.memory.session_index import (
+    SESSION_INDEX_KEY,
+    ConversationSessionIndex,
+)
+
+
+class _FakePipeline:
+    """Queues calls against a _FakeRedis and runs them on execute()."""
+
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._calls: list = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        results = []
+        for name, args, kwargs in self._calls:
+            results.append(await getattr(self._redis, name)(*args, **kwargs))
+        self._calls = []
+        return results
+
+
+class _FakeRedis:
+    """Minimal async Redis double covering the commands the index uses."""
+
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.ttls: dict[str, int] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key, *members):
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    async def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    async def zrevrange(self, key, start, end):
+        ordered = sorted(self.zsets.get(key, {}).items(), key=lambda kv: kv[1], reverse=True)
+        return [member for member, _ in ordered[start : end + 1]]
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        target = self.hashes.setdefault(key, {})
+        if mapping:
+            target.update({k: str(v) for k, v in mapping.items()})
+        if field is not None:
+            target[field] = str(value)
+
+    async def hmget(self, key, *fields):
+        data = self.hashes.get(key)
+        return [data.get(f) if data else None for f in fields]
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.strings.pop(key, None)
+
+    async def exists(self, key):
+        return int(key in self.strings or key in self.hashes)
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def ttl(self, key):
+        return self.ttls.get(key, -1)
+
+    async def scan(self, cursor=0, match=None, count=None):
+        prefix = match.rstrip("*") if match else ""
+        return 0, [k for k in self.strings if k.startswith(prefix)]
+
+
+@pytest.fixture
+def fake_redis():
+    return _FakeRedis()
+
+
+@pytest.fixture
+def index(fake_redis):
+    redis_memory = MagicMock()
+
+    async def _client():
+        return fake_redis
+
+    type(redis_memory).client = property(lambda self: _client())
+    return ConversationSessionIndex(redis_memory=redis_memory, ttl_seconds=600)
+
+
+async def _save(index, fake_redis, session_id: str, conversation: dict) -> None:
+    """Store the conversation document and index it, as save_conversation_turn does."""
+    fake_redis.strings[f"conversation:{session_id}"] = json.dumps({"value": conversation})
+    await index.record(session_id, conversation)
+
+
+def _conversation(updated_at: str, title: str | None = None, message_count: int = 2) -> dict:
+    return {
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": updated_at,
+        "message_count": message_count,
+        "title": title,
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_orders_by_last_activity_and_paginates(index, fake_redis):
+    await _save(index, fake_redis, "old", _conversation("2026-01-01T10:00:00+00:00", title="Old"))
+    await _save(index, fake_redis, "new", _conversation("2026-01-03T10:00:00+00:00"))
+    await _save(
+        index, fake_redis, "mid", _conversation("2026-01-02T10:00:00+00:00", message_count=4)
+    )
+
+    sessions, total = await index.list_sessions(limit=2, offset=0)
+
+    assert total == 3
+    assert [s.session_id for s in sessions] == ["new", "mid"]
+    assert sessions[0].title is None
+    assert sessions[1].message_count == 4
+
+    sessions, _ = await index.list_sessions(limit=2, offset=2)
+    assert [s.session_id for s in sessions] == ["old"]
+    assert sessions[0].title == "Old"
+
+
+@pytest.mark.asyncio
+async def test_record_bumps_existing_session_to_top(index, fake_redis):
+    await _save(index, fake_redis, "a", _conversation("2026-01-01T10:00:00+00:00"))
+    await _save(index, fake_redis, "b", _conversation("2026-01-02T10:00:00+00:00"))
+    await _save(index, fake_redis, "a", _conversation("2026-01-05T10:00:00+00:00", message_count=4))
+
+    sessions, total = await index.list_sessions(limit=10)
+
+    assert total == 2
+    assert [s.session_id for s in sessions] == ["a", "b"]
+    assert sessions[0].message_count == 4
+
+
+@pytest.mark.asyncio
+async def test_expired_summaries_are_pruned_lazily(index, fake_redis):
+    await _save(index, fake_redis, "alive", _conversation("2026-01-02T10:00:00+00:00"))
+    await _save(index, fake_redis, "expired", _conversation("2026-01-03T10:00:00+00:00"))
+    del fake_redis.hashes["conversation_index:summary:expired"]
+
+    sessions, total = await index.list_sessions(limit=10)
+
+    assert [s.session_id for s in sessions] == ["alive"]
+    assert total == 1
+    assert "expired" not in fake_redis.zsets[SESSION_INDEX_KEY]
+
+
+@pytest.mark.asyncio
+async def test_archived_conversations_are_pruned_with_their_summary(index, fake_redis):
+    await _save(index, fake_redis, "kept", _conversation("2026-01-02T10:00:00+00:00"))
+    await _save(index, fake_redis, "archived", _conversation("2026-01-03T10:00:00+00:00"))
+    del fake_redis.strings["conversation:archived"]
+
+    sessions, total = await index.list_sessions(limit=10)
+
+    assert [s.session_id for s in sessions] == ["kept"]
+    assert total == 1
+    assert "archived" not in fake_redis.zsets[SESSION_INDEX_KEY]
+    assert "conversation_index:summary:archived" not in fake_redis.hashes
+
+
+@pytest.mark.asyncio
+async def test_update_title_and_remove(index, fake_redis):
+    await _save(index, fake_redis, "s1", _conversation("2026-01-01T10:00:00+00:00"))
+
+    await index.update_title("s1", "Renamed")
+    sessions, _ = await index.list_sessions(limit=10)
+    assert sessions[0].title == "Renamed"
+
+    await index.remove("s1")
+    sessions, total = await index.list_sessions(limit=10)
+    assert sessions == []
+    assert total == 0
+
+
+@pytest.mark.asyncio
+async def test_backfill_indexes_existing_conversations(index, fake_redis):
+    fake_redis.strings["conversation:s1"] = json.dumps(
+        {"value": _conversation("2026-01-01T10:00:00+00:00", title="First")}
+    )
+    fake_redis.strings["conversation:s2"] = json.dumps(
+        {"value": _conversation("2026-01-02T10:00:00+00:00")}
+    )
+    fake_redis.strings["conversation:broken"] = "not-json"
+    fake_redis.ttls["conversation:s1"] = 120
+
+    indexed = await index.backfill()
+
+    assert indexed == 2
+    sessions, total = await index.list_sessions(limit=10)
+    assert total == 2
+    assert [s.session_id for s in sessions] == ["s2", "s1"]
+    assert fake_redis.ttls["conversation_index:summary:s1"] == 120
+    assert fake_redis.ttls["conversation_index:summary:s2"] == 600
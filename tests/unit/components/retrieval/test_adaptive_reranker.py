@@ -149,6 +149,31 @@ class TestCrossEncoderRerankerAdaptive:
         # doc3 should rank highest (high semantic + recent)
         assert results[0].doc_id == "doc3"
 
+    @pytest.mark.asyncio
+    async def test_adaptive_reranking_reuses_intent_result(
+        self, mock_intent_classifier, sample_documents
+    ):
+        """Test a caller-provided intent result skips re-classification."""
+        reranker = CrossEncoderReranker(use_adaptive_weights=True)
+        reranker._intent_classifier = mock_intent_classifier
+
+        mock_model = MagicMock()
+        mock_model.predict.return_value = [0.5, 0.6, 0.4, 0.3]
+        reranker._model = mock_model
+
+        intent_result = await mock_intent_classifier.classify("BM25 error 404")
+        mock_intent_classifier.classify.reset_mock()
+
+        results = await reranker.rerank(
+            query="BM25 error 404",
+            documents=sample_documents,
+            top_k=4,
+            intent_result=intent_result,
+        )
+
+        mock_intent_classifier.classify.assert_not_called()
+        assert all(r.adaptive_score is not None for r in results)
+
     @pytest.mark.asyncio
     async def test_adaptive_reranking_keyword_query(self, mock_intent_classifier, sample_documents):
         """Test adaptive reranking for keyword queries."""
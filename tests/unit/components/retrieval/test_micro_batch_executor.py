@@ -0,0 +1,64 @@
+"""Unit tests for MicroBatchExecutor.
+
+Tests the generic micro-batching core shared by RerankExecutor and the
+SetFit intent classifier:
+1. Results keep their type and are split back per request in input order
+2. Empty requests never reach the model
+3. Batching statistics
+"""
+
+import asyncio
+
+import pytest
+
+from src.components.retrieval.micro_batch_executor import MicroBatchExecutor
+
+
+def _upper(items):
+    """Deterministic fake model returning non-float results."""
+    return [(item, item.upper()) for item in items]
+
+
+class TestMicroBatchExecutor:
+    """Test MicroBatchExecutor batching behavior."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_share_one_batch(self):
+        """Concurrent single-item requests become one predict call."""
+        calls = []
+
+        def predict(items):
+            calls.append(list(items))
+            return _upper(items)
+
+        executor = MicroBatchExecutor(predict, batch_window_ms=20, name="test")
+
+        results = await asyncio.gather(*(executor.submit([q]) for q in ["a", "b", "c"]))
+
+        assert results == [[("a", "A")], [("b", "B")], [("c", "C")]]
+        assert calls == [["a", "b", "c"]]
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_empty_submit_skips_model(self):
+        """Empty request returns immediately without inference."""
+        executor = MicroBatchExecutor(_upper, batch_window_ms=1)
+
+        assert await executor.submit([]) == []
+        assert executor.batches == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        """Stats report batch and item counts."""
+        executor = MicroBatchExecutor(_upper, batch_window_ms=20, max_batch_items=8)
+
+        await asyncio.gather(executor.submit(["a", "b"]), executor.submit(["c"]))
+
+        stats = executor.get_stats()
+        assert stats["batches"] == 1
+        assert stats["requests"] == 2
+        assert stats["items_processed"] == 3
+        assert stats["avg_items_per_batch"] == 3.0
+        assert stats["max_batch_items"] == 8
+        executor.shutdown()
@@ -11,6 +11,7 @@ Tests cover:
 - Edge cases (empty documents, invalid responses)
 """
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -24,6 +25,10 @@ def mock_settings():
     with patch("src.components.retrieval.ollama_reranker.settings") as mock:
         mock.ollama_base_url = "http://localhost:11434"
         mock.reranker_ollama_model = "bge-reranker-v2-m3"  # Fixed: use correct attribute name
+        mock.reranker_ollama_mode = "concurrent"
+        mock.reranker_ollama_max_concurrency = 8
+        mock.reranker_ollama_batch_size = 5
+        mock.reranker_ollama_deadline_ms = 0
         yield mock
 
 
@@ -304,3 +309,97 @@ class TestOllamaRerankerIntegration:
             assert ranked[0][1] == 0.9
             assert ranked[1][1] == 0.7
             assert ranked[2][1] == 0.4
+
+
+class TestOllamaRerankerScoringModes:
+    """Test concurrent, batch and deadline behavior (Sprint 130 Feature 130.3)."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_mode_bounds_in_flight_calls(self, mock_settings):
+        """Concurrent mode overlaps calls up to max_concurrency."""
+        reranker = OllamaReranker(mode="concurrent", max_concurrency=3)
+        in_flight = 0
+        peak = 0
+
+        async def slow_score(q, d):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return int(d[-1]) / 10
+
+        documents = [f"doc{i}" for i in range(9)]
+        with patch.object(reranker, "_score_document", side_effect=slow_score):
+            ranked = await reranker.rerank("query", documents, top_k=9)
+
+        assert peak == 3
+        assert [idx for idx, _ in ranked] == list(range(8, -1, -1))
+        assert reranker.last_rerank_stats["ollama_calls"] == 9
+        assert reranker.last_rerank_stats["per_document_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_runs_one_call_at_a_time(self, mock_settings):
+        """Sequential mode keeps the legacy one-at-a-time behavior."""
+        reranker = OllamaReranker(mode="sequential", max_concurrency=8)
+        in_flight = 0
+        peak = 0
+
+        async def slow_score(q, d):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return 0.5
+
+        with patch.object(reranker, "_score_document", side_effect=slow_score):
+            await reranker.rerank("query", ["a", "b", "c"])
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_returns_partial_ranking(self, mock_settings):
+        """Documents not scored before the deadline follow the scored ones."""
+        reranker = OllamaReranker(mode="concurrent", max_concurrency=4, deadline_ms=50)
+
+        async def score(q, d):
+            if d == "slow":
+                await asyncio.sleep(5)
+            return 0.9 if d == "best" else 0.4
+
+        with patch.object(reranker, "_score_document", side_effect=score):
+            ranked = await reranker.rerank("query", ["slow", "ok", "best"], top_k=3)
+
+        assert ranked == [(2, 0.9), (1, 0.4), (0, 0.0)]
+        assert reranker.last_rerank_stats["deadline_exceeded"] is True
+        assert reranker.last_rerank_stats["scored_documents"] == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_mode_scores_several_documents_per_call(self, mock_settings):
+        """Batch mode sends batch_size passages per Ollama call."""
+        reranker = OllamaReranker(mode="batch", batch_size=2)
+        responses = {2: "[1]: 3\n[2]: 9", 1: "[1]: 6"}
+
+        async def generate(prompt, num_predict):
+            return responses[prompt.count("\n[")]
+
+        with patch.object(reranker, "_generate", side_effect=generate) as mock_generate:
+            ranked = await reranker.rerank("query", ["a", "b", "c"], top_k=3)
+
+        assert mock_generate.call_count == 2
+        assert ranked == [(1, 0.9), (2, 0.6), (0, 0.3)]
+
+    def test_parse_batch_scores_missing_passage(self, reranker):
+        """Passages missing from the response get the neutral score."""
+        scores = reranker._parse_batch_scores("[1]: 8\n[3]: 11\n[7]: 2", 3)
+
+        assert scores == [0.8, 0.5, 1.0]
+
+    def test_build_batch_rerank_prompt_numbers_passages(self, reranker):
+        """Batch prompt contains every passage with 1-based numbering."""
+        prompt = reranker._build_batch_rerank_prompt("q", ["first", "second"])
+
+        assert "[1] first" in prompt
+        assert "[2] second" in prompt
+        assert "Query: q" in prompt
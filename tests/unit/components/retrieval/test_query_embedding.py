@@ -0,0 +1,92 @@
+"""Unit tests for QueryEmbeddingContext (Sprint 130 Feature 130.2).
+
+Verifies that one retrieval request embeds its query exactly once across
+cache lookup, retrieval channels and cache store.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.components.retrieval.query_cache import QueryCache
+from src.components.retrieval.query_embedding import QueryEmbeddingContext
+
+
+@pytest.fixture
+def flag_service():
+    """Mock FlagEmbedding-style service returning dense + sparse."""
+    service = MagicMock()
+    service.embed_single = AsyncMock(return_value={"dense": [1.0, 0.0, 0.0], "sparse": {42: 0.8}})
+    return service
+
+
+class TestQueryEmbeddingContext:
+    """Test QueryEmbeddingContext functionality."""
+
+    @pytest.mark.asyncio
+    async def test_embeds_once(self, flag_service):
+        """Repeated access reuses the first embedding pass."""
+        ctx = QueryEmbeddingContext("What is RAG?", embedding_service=flag_service)
+
+        first = await ctx.get()
+        second = await ctx.get()
+
+        assert first is second
+        assert first.dense == [1.0, 0.0, 0.0]
+        assert first.sparse == {42: 0.8}
+        assert ctx.embed_calls == 1
+        flag_service.embed_single.assert_awaited_once_with("What is RAG?")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_consumers_share_one_pass(self, flag_service):
+        """Parallel channels awaiting the context trigger a single embedding."""
+        ctx = QueryEmbeddingContext("What is RAG?", embedding_service=flag_service)
+
+        results = await asyncio.gather(*(ctx.get_dense() for _ in range(5)))
+
+        assert all(r == [1.0, 0.0, 0.0] for r in results)
+        assert ctx.embed_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_dense_only_backend(self):
+        """List-returning backends yield dense vector without sparse weights."""
+        service = MagicMock()
+        service.embed_single = AsyncMock(return_value=[0.5, 0.5])
+        ctx = QueryEmbeddingContext("query", embedding_service=service)
+
+        embedding = await ctx.get()
+
+        assert embedding.dense == [0.5, 0.5]
+        assert embedding.sparse is None
+
+    @pytest.mark.asyncio
+    async def test_query_cache_miss_and_store_share_embedding(self, flag_service):
+        """Cache miss + cache store cost one embedding when sharing a context."""
+        cache = QueryCache(ttl_seconds=60)
+        ctx = QueryEmbeddingContext("What is RAG?", embedding_service=flag_service)
+
+        assert await cache.get("What is RAG?", ["default"], query_embedding=ctx) is None
+        await cache.set("What is RAG?", [{"id": "1"}], {}, ["default"], query_embedding=ctx)
+
+        assert ctx.embed_calls == 1
+        assert len(cache.semantic_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_skips_embedding(self, flag_service):
+        """Exact cache hits never compute the embedding."""
+        cache = QueryCache(ttl_seconds=60)
+        await cache.set(
+            "What is RAG?",
+            [{"id": "1"}],
+            {},
+            ["default"],
+            query_embedding=QueryEmbeddingContext("What is RAG?", embedding_service=flag_service),
+        )
+        ctx = QueryEmbeddingContext("What is RAG?", embedding_service=flag_service)
+
+        cached = await cache.get("What is RAG?", ["default"], query_embedding=ctx)
+
+        assert cached["cache_hit"] == "exact"
+        assert ctx.embed_calls == 0
+        assert not ctx.is_computed
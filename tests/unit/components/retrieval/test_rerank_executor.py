@@ -0,0 +1,147 @@
+"""Unit tests for RerankExecutor (Sprint 130 Feature 130.4).
+
+Tests off-event-loop, micro-batched cross-encoder scoring:
+1. Concurrent requests are coalesced into shared batches
+2. Scores are split back per request in input order
+3. The event loop keeps running during inference
+4. Inference errors propagate to every waiting request
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.components.retrieval.rerank_executor import RerankExecutor
+from src.components.retrieval.reranker import CrossEncoderReranker
+
+
+def _length_scores(pairs):
+    """Deterministic fake model: score = len(document)."""
+    return [float(len(doc)) for _, doc in pairs]
+
+
+class TestRerankExecutor:
+    """Test RerankExecutor batching behavior."""
+
+    @pytest.mark.asyncio
+    async def test_scores_in_input_order(self):
+        """Single request gets one score per pair in order."""
+        executor = RerankExecutor(_length_scores, batch_window_ms=1)
+
+        scores = await executor.score([("q", "a"), ("q", "abc"), ("q", "ab")])
+
+        assert scores == [1.0, 3.0, 2.0]
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self):
+        """Requests arriving within the window share one predict call."""
+        calls: list[int] = []
+
+        def predict(pairs):
+            calls.append(len(pairs))
+            return _length_scores(pairs)
+
+        executor = RerankExecutor(predict, batch_window_ms=50)
+
+        results = await asyncio.gather(
+            executor.score([("q", "a"), ("q", "aa")]),
+            executor.score([("q", "aaa")]),
+            executor.score([("q", "aaaa"), ("q", "aaaaa"), ("q", "aaaaaa")]),
+        )
+
+        assert results == [[1.0, 2.0], [3.0], [4.0, 5.0, 6.0]]
+        assert calls == [6]
+        stats = executor.get_stats()
+        assert stats["batches"] == 1
+        assert stats["avg_requests_per_batch"] == 3
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_max_batch_pairs_flushes_early(self):
+        """A full batch is dispatched without waiting for the window."""
+        calls: list[int] = []
+
+        def predict(pairs):
+            calls.append(len(pairs))
+            return _length_scores(pairs)
+
+        executor = RerankExecutor(predict, batch_window_ms=10_000, max_batch_pairs=2)
+
+        start = time.perf_counter()
+        await executor.score([("q", "a"), ("q", "b")])
+
+        assert time.perf_counter() - start < 1.0
+        assert calls == [2]
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_inference_runs_off_event_loop(self):
+        """The event loop keeps ticking while the model is busy."""
+        loop_thread = threading.get_ident()
+        predict_threads: list[int] = []
+
+        def slow_predict(pairs):
+            predict_threads.append(threading.get_ident())
+            time.sleep(0.1)
+            return _length_scores(pairs)
+
+        executor = RerankExecutor(slow_predict, batch_window_ms=0)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        await executor.score([("q", "doc")])
+        ticker_task.cancel()
+
+        assert predict_threads and predict_threads[0] != loop_thread
+        assert ticks >= 5
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_requests(self):
+        """A failing batch raises in every coalesced request."""
+
+        def failing_predict(pairs):
+            raise RuntimeError("CUDA OOM")
+
+        executor = RerankExecutor(failing_predict, batch_window_ms=20)
+
+        results = await asyncio.gather(
+            executor.score([("q", "a")]),
+            executor.score([("q", "b")]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        executor.shutdown()
+
+
+class TestCrossEncoderRerankerOffload:
+    """Test CrossEncoderReranker integration with the executor."""
+
+    @pytest.mark.asyncio
+    async def test_rerank_uses_executor(self, tmp_path):
+        """Rerank scores through the executor when offloading is enabled."""
+        reranker = CrossEncoderReranker(
+            cache_dir=str(tmp_path), use_adaptive_weights=False, offload_inference=True
+        )
+        reranker._model = MagicMock()
+        reranker._model.predict.side_effect = lambda pairs, batch_size: _length_scores(pairs)
+
+        results = await reranker.rerank(
+            "query",
+            [{"id": "short", "text": "a"}, {"id": "long", "text": "aaaa"}],
+        )
+
+        assert [r.doc_id for r in results] == ["long", "short"]
+        assert reranker.get_model_info()["executor"]["batches"] == 1
+        reranker.executor.shutdown()
@@ -0,0 +1,165 @@
+"""Unit tests for SemanticCacheIndex (Sprint 130 Feature 130.1).
+
+Tests the vectorized semantic tier of QueryCache:
+1. Top-1 matrix-vector lookup per namespace-set
+2. Slot reuse on overwrite, TTL expiry and LRU eviction
+3. QueryCache integration via the embedding service
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.components.retrieval.query_cache import QueryCache
+from src.components.retrieval.semantic_cache_index import SemanticCacheIndex
+
+
+def _unit(*values: float) -> list[float]:
+    vec = np.asarray(values, dtype=np.float32)
+    return (vec / np.linalg.norm(vec)).tolist()
+
+
+class TestSemanticCacheIndex:
+    """Test SemanticCacheIndex functionality."""
+
+    def test_best_match_returns_most_similar(self):
+        """Top-1 lookup returns the most similar entry with its cosine score."""
+        index = SemanticCacheIndex(maxsize=10, ttl=60)
+        index.put("a|default", "default", [1.0, 0.0, 0.0], "A")
+        index.put("b|default", "default", [0.0, 1.0, 0.0], "B")
+
+        match = index.best_match("default", [0.9, 0.1, 0.0])
+
+        assert match is not None
+        assert match.key == "a|default"
+        assert match.value == "A"
+        assert match.similarity == pytest.approx(0.9 / np.sqrt(0.82), rel=1e-5)
+
+    def test_embeddings_are_prenormalized(self):
+        """Un-normalized inputs yield cosine similarity, not raw dot product."""
+        index = SemanticCacheIndex(maxsize=10, ttl=60)
+        index.put("a|default", "default", [10.0, 0.0], "A")
+
+        match = index.best_match("default", [3.0, 0.0])
+
+        assert match.similarity == pytest.approx(1.0)
+
+    def test_namespace_partitions_are_isolated(self):
+        """Lookups only see entries from the same namespace-set."""
+        index = SemanticCacheIndex(maxsize=10, ttl=60)
+        index.put("a|default", "default", [1.0, 0.0], "A")
+
+        assert index.best_match("general", [1.0, 0.0]) is None
+        assert index.best_match("default", [1.0, 0.0]).value == "A"
+
+    def test_overwrite_reuses_slot(self):
+        """Re-inserting an existing key updates it in place."""
+        index = SemanticCacheIndex(maxsize=10, ttl=60)
+        index.put("a|default", "default", [1.0, 0.0], "A1")
+        index.put("a|default", "default", [0.0, 1.0], "A2")
+
+        assert len(index) == 1
+        match = index.best_match("default", [0.0, 1.0])
+        assert match.value == "A2"
+        assert match.similarity == pytest.approx(1.0)
+
+    def test_lru_eviction_reuses_slot(self):
+        """When full, the least recently used entry is evicted and its row reused."""
+        index = SemanticCacheIndex(maxsize=2, ttl=60)
+        index.put("a|default", "default", _unit(1, 0, 0), "A")
+        index.put("b|default", "default", _unit(0, 1, 0), "B")
+
+        # Touch A so B becomes least recently used
+        index.best_match("default", _unit(1, 0, 0))
+        index.put("c|default", "default", _unit(0, 0, 1), "C")
+
+        assert len(index) == 2
+        assert "b|default" not in index
+        assert "a|default" in index
+        assert index.get_stats()["evictions_lru"] == 1
+        assert index.get_stats()["allocated_rows"] == 2
+
+    def test_below_threshold_match_does_not_touch_lru(self):
+        """A near miss is not returned and does not protect its entry from eviction."""
+        index = SemanticCacheIndex(maxsize=2, ttl=60)
+        index.put("a|default", "default", _unit(1, 0, 0), "A")
+        index.put("b|default", "default", _unit(0, 1, 0), "B")
+
+        assert index.best_match("default", _unit(1, 0.5, 0), min_similarity=0.95) is None
+        index.put("c|default", "default", _unit(0, 0, 1), "C")
+
+        assert "a|default" not in index
+        assert "b|default" in index
+
+    def test_ttl_expiry_masks_and_frees_rows(self):
+        """Expired entries are never returned and their rows are reclaimed."""
+        index = SemanticCacheIndex(maxsize=10, ttl=60)
+        with patch("src.components.retrieval.semantic_cache_index.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            index.put("a|default", "default", [1.0, 0.0], "A")
+            clock.return_value = 1030.0
+            index.put("b|default", "default", [0.0, 1.0], "B")
+
+            clock.return_value = 1070.0
+            match = index.best_match("default", [1.0, 0.0])
+
+        assert match.value == "B"
+        assert len(index) == 1
+        assert index.get_stats()["evictions_ttl"] == 1
+
+    def test_matrix_grows_beyond_initial_capacity(self):
+        """Partitions grow by doubling and keep earlier rows intact."""
+        index = SemanticCacheIndex(maxsize=1000, ttl=60)
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(200, 16)).astype(np.float32)
+        for i, vec in enumerate(vectors):
+            index.put(f"q{i}|default", "default", vec, i)
+
+        assert len(index) == 200
+        assert index.best_match("default", vectors[7]).value == 7
+        assert index.best_match("default", vectors[199]).value == 199
+
+    def test_clear(self):
+        """Clear drops all partitions."""
+        index = SemanticCacheIndex(maxsize=10, ttl=60)
+        index.put("a|default", "default", [1.0, 0.0], "A")
+        index.clear()
+
+        assert len(index) == 0
+        assert index.best_match("default", [1.0, 0.0]) is None
+
+    def test_zero_maxsize_disables_index(self):
+        """maxsize=0 stores nothing instead of looping on eviction."""
+        index = SemanticCacheIndex(maxsize=0, ttl=60)
+        index.put("a|default", "default", [1.0, 0.0], "A")
+
+        assert len(index) == 0
+        assert index.best_match("default", [1.0, 0.0]) is None
+
+
+class TestQueryCacheSemanticTier:
+    """Test QueryCache semantic hits through the matrix index."""
+
+    @pytest.mark.asyncio
+    async def test_semantic_hit_for_similar_query(self):
+        """A paraphrased query with a near-identical embedding hits the semantic tier."""
+        embeddings = {
+            "What is AEGIS RAG?": [1.0, 0.0, 0.0],
+            "Explain AEGIS RAG": [0.99, 0.01, 0.0],
+        }
+        service = MagicMock()
+        service.embed_single = AsyncMock(side_effect=lambda q: {"dense": embeddings[q]})
+
+        cache = QueryCache(ttl_seconds=60)
+        with patch(
+            "src.components.shared.embedding_service.get_embedding_service",
+            return_value=service,
+        ):
+            await cache.set("What is AEGIS RAG?", [{"id": "1"}], {}, namespaces=["default"])
+            cached = await cache.get("Explain AEGIS RAG", namespaces=["default"])
+
+        assert cached is not None
+        assert cached["cache_hit"] == "semantic"
+        assert cached["results"] == [{"id": "1"}]
+        assert cache.get_stats()["semantic_cache_size"] == 1
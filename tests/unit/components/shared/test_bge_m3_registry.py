@@ -0,0 +1,106 @@
+"""Unit tests for the shared BGE-M3 model registry."""
+
+import sys
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.components.shared.bge_m3_registry import BGEM3ModelRegistry, TokenMatrixCache
+
+
+def _colbert_output(texts, **kwargs):
+    return {"colbert_vecs": [np.ones((len(text), 4), dtype=np.float32) for text in texts]}
+
+
+@pytest.fixture
+def mock_model():
+    model = MagicMock()
+    model.encode.side_effect = _colbert_output
+    return model
+
+
+@pytest.fixture
+def flag_embedding_module(mock_model):
+    """Fake FlagEmbedding package whose BGEM3FlagModel returns mock_model."""
+    model_class = MagicMock(return_value=mock_model)
+    with patch.dict(sys.modules, {"FlagEmbedding": SimpleNamespace(BGEM3FlagModel=model_class)}):
+        yield model_class
+
+
+@pytest.fixture
+def registry():
+    registry = BGEM3ModelRegistry(device="cpu", colbert_cache_mb=1)
+    yield registry
+    registry.shutdown()
+
+
+def test_get_model_loads_once(registry, flag_embedding_module, mock_model):
+    first = registry.get_model()
+    second = registry.get_model("BAAI/bge-m3", device="cpu", use_fp16=True)
+
+    assert first is second is mock_model
+    flag_embedding_module.assert_called_once_with("BAAI/bge-m3", use_fp16=True, device="cpu")
+
+
+def test_get_model_import_error(registry):
+    with patch.dict(sys.modules, {"FlagEmbedding": None}):
+        with pytest.raises(ImportError):
+            registry.get_model()
+
+
+@pytest.mark.asyncio
+async def test_run_executes_off_event_loop(registry):
+    loop_thread = threading.get_ident()
+
+    worker_thread = await registry.run(threading.get_ident)
+
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_colbert_vectors_encodes_only_cache_misses(
+    registry, flag_embedding_module, mock_model
+):
+    first = await registry.colbert_vectors(["query", "segment one"])
+    second = await registry.colbert_vectors(["other", "segment one"])
+
+    assert [m.shape for m in first] == [(5, 4), (11, 4)]
+    assert first[0].dtype == np.float16
+    assert second[1] is first[1]
+    assert mock_model.encode.call_args_list[1].args[0] == ["other"]
+    assert registry.colbert_cache.stats()["hits"] == 1
+
+
+def test_token_matrix_cache_evicts_by_bytes():
+    cache = TokenMatrixCache(max_bytes=100)
+    cache.set("a", np.zeros(10, dtype=np.float32))  # 40 bytes
+    cache.set("b", np.zeros(10, dtype=np.float32))
+    cache.get("a")  # a is now most recently used
+    cache.set("c", np.zeros(10, dtype=np.float32))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["bytes"] == 80
+
+
+def test_token_matrix_cache_skips_oversized_entries():
+    cache = TokenMatrixCache(max_bytes=10)
+    cache.set("big", np.zeros(10, dtype=np.float32))
+
+    assert cache.get("big") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_flag_embedding_service_uses_shared_model(registry, flag_embedding_module, mock_model):
+    from src.components.shared.flag_embedding_service import FlagEmbeddingService
+
+    service = FlagEmbeddingService(device="cpu")
+    with patch(
+        "src.components.shared.flag_embedding_service.get_bge_m3_registry",
+        return_value=registry,
+    ):
+        assert service._load_model() is registry.get_model()
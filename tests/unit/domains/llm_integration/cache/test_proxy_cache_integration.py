@@ -66,7 +66,7 @@ def proxy_with_cache(mock_cache_service, mock_config):
             "src.domains.llm_integration.proxy.aegis_llm_proxy.get_llm_proxy_config",
             return_value=mock_config,
         ),
-        patch("src.domains.llm_integration.proxy.aegis_llm_proxy.CostTracker"),
+        patch("src.domains.llm_integration.proxy.aegis_llm_proxy.get_cost_tracker"),
         patch(
             "src.domains.llm_integration.proxy.aegis_llm_proxy.PromptCacheService",
             return_value=mock_cache_service,
@@ -403,3 +403,75 @@ class TestCacheErrorHandling:
                 result = await proxy.generate(task, use_cache=True)
 
                 assert result.content == "response from LLM"
+
+
+class TestInflightCoalescing:
+    """Test in-flight request coalescing (Sprint 130 Feature 130.6)."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_prompts_share_one_call(self, proxy_with_cache):
+        """Concurrent cache misses for the same prompt execute once."""
+        import asyncio
+
+        proxy, cache_service = proxy_with_cache
+        cache_service.get_cached_response.return_value = None
+        proxy._coalescing_enabled = True
+
+        llm_response = LLMResponse(
+            content="shared answer",
+            provider="local_ollama",
+            model="test",
+            tokens_used=10,
+            cost_usd=0.01,
+        )
+
+        async def slow_execute(**kwargs):
+            await asyncio.sleep(0.05)
+            return llm_response.model_copy()
+
+        task = LLMTask(task_type=TaskType.GENERATION, prompt="What is RAG?")
+
+        with (
+            patch.object(proxy, "_execute_with_any_llm", side_effect=slow_execute) as mock_execute,
+            patch.object(proxy, "_track_metrics"),
+        ):
+            results = await asyncio.gather(*(proxy.generate(task) for _ in range(3)))
+
+        assert mock_execute.call_count == 1
+        assert all(r.content == "shared answer" for r in results)
+        assert sorted(r.routing_reason == "inflight_coalesced" for r in results) == [
+            False,
+            True,
+            True,
+        ]
+        assert sum(r.cost_usd for r in results) == pytest.approx(0.01)
+
+        stats = await proxy.get_cache_stats()
+        assert stats["inflight"]["leaders"] == 1
+        assert stats["inflight"]["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_not_coalesced(self, proxy_with_cache):
+        """Requests with different generation params execute separately."""
+        import asyncio
+
+        proxy, cache_service = proxy_with_cache
+        cache_service.get_cached_response.return_value = None
+        proxy._coalescing_enabled = True
+
+        async def slow_execute(**kwargs):
+            await asyncio.sleep(0.01)
+            return LLMResponse(
+                content="answer", provider="local_ollama", model="test", tokens_used=1, cost_usd=0.0
+            )
+
+        with (
+            patch.object(proxy, "_execute_with_any_llm", side_effect=slow_execute) as mock_execute,
+            patch.object(proxy, "_track_metrics"),
+        ):
+            await asyncio.gather(
+                proxy.generate(LLMTask(task_type=TaskType.GENERATION, prompt="Q", temperature=0.1)),
+                proxy.generate(LLMTask(task_type=TaskType.GENERATION, prompt="Q", temperature=0.9)),
+            )
+
+        assert mock_execute.call_count == 2
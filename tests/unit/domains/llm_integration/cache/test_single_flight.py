@@ -0,0 +1,105 @@
+"""
+Unit tests for SingleFlight request coalescing.
+
+Sprint 130 Feature 130.6: Request Coalescing
+
+Tests cover:
+    - Concurrent calls with the same key share one execution
+    - Errors propagate to all waiters
+    - Cancelling one waiter does not cancel the shared call
+    - Deterministic in-flight keys
+"""
+
+import asyncio
+
+import pytest
+
+from src.domains.llm_integration.cache.single_flight import SingleFlight, build_inflight_key
+
+
+class TestSingleFlight:
+    """Test SingleFlight deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Followers await the leader's call."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(4)))
+
+        assert calls == 1
+        assert [r for r, _ in results] == ["result"] * 4
+        assert sorted(shared for _, shared in results) == [False, True, True, True]
+        assert flight.get_stats()["coalesced"] == 3
+        assert flight.inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self):
+        """Completed calls are released; the next call runs again."""
+        flight = SingleFlight()
+
+        async def work():
+            return 1
+
+        await flight.do("k", work)
+        _, shared = await flight.do("k", work)
+
+        assert shared is False
+        assert flight.leaders == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_followers(self):
+        """Every waiter sees the leader's exception."""
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(
+            flight.do("k", failing), flight.do("k", failing), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """A disconnecting leader leaves the shared call running."""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == ("done", True)
+
+
+class TestInflightKey:
+    """Test in-flight key generation."""
+
+    def test_key_is_deterministic(self):
+        key1 = build_inflight_key("default", "m", "prompt", {"temperature": 0.1, "max_tokens": 5})
+        key2 = build_inflight_key("default", "m", "prompt", {"max_tokens": 5, "temperature": 0.1})
+
+        assert key1 == key2
+        assert key1.startswith("default:m:")
+
+    def test_key_varies_by_namespace_and_params(self):
+        base = build_inflight_key("default", "m", "prompt", {"temperature": 0.1})
+
+        assert build_inflight_key("tenant", "m", "prompt", {"temperature": 0.1}) != base
+        assert build_inflight_key("default", "m", "prompt", {"temperature": 0.2}) != base
@@ -3,7 +3,7 @@
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -30,6 +30,16 @@ def cost_tracker(temp_db_path: Path) -> CostTracker:
     return CostTracker(db_path=temp_db_path)
 
 
+@pytest.fixture(autouse=True)
+def isolated_cost_tracker(cost_tracker: CostTracker) -> Generator[CostTracker, None, None]:
+    """Keep AegisLLMProxy instances off the shared cost ledger (data/cost_tracking.db)."""
+    with patch(
+        "src.domains.llm_integration.proxy.aegis_llm_proxy.get_cost_tracker",
+        return_value=cost_tracker,
+    ):
+        yield cost_tracker
+
+
 @pytest.fixture
 def mock_llm_config() -> LLMProxyConfig:
     """Create mock LLMProxyConfig for testing."""
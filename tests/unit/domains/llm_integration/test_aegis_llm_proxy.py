@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.core.exceptions import LLMExecutionError
+from src.domains.llm_integration.cost import CostTracker
 from src.domains.llm_integration.models import (
     Complexity,
     DataClassification,
@@ -579,6 +580,18 @@ class TestConfigValidation:
         with pytest.raises(ValueError, match="local_ollama provider is required"):
             AegisLLMProxy(config=mock_llm_config)
 
+    def test_init_uses_injected_cost_tracker(self, mock_llm_config, temp_db_path) -> None:
+        """Test an injected cost tracker replaces the shared ledger."""
+        tracker = CostTracker(db_path=temp_db_path)
+
+        with patch(
+            "src.domains.llm_integration.proxy.aegis_llm_proxy.get_cost_tracker"
+        ) as mock_get_tracker:
+            proxy = AegisLLMProxy(config=mock_llm_config, cost_tracker=tracker)
+
+        assert proxy.cost_tracker is tracker
+        mock_get_tracker.assert_not_called()
+
 
 # ============================================================================
 # Fixtures for tests
@@ -588,7 +601,9 @@ class TestConfigValidation:
 @pytest.fixture
 def aegis_proxy_with_config(mock_llm_config):
     """Create AegisLLMProxy instance with mock config and cost tracker."""
-    with patch("src.domains.llm_integration.proxy.aegis_llm_proxy.CostTracker") as mock_tracker:
+    with patch(
+        "src.domains.llm_integration.proxy.aegis_llm_proxy.get_cost_tracker"
+    ) as mock_tracker:
         mock_tracker_instance = MagicMock()
         mock_tracker_instance.get_monthly_spending.return_value = {
             "alibaba_cloud": 0.0,
@@ -609,10 +624,20 @@ class TestVLLMActiveRequests:
     """Test vLLM active request monitoring for cascade guard.
 
     Sprint 128 Feature 128.2: Cascade timeout guard.
+    Sprint 130 Feature 130.7: Load comes from the local admission controller;
+    /metrics is only read for reconciliation (shared client).
     """
 
+    @staticmethod
+    def _metrics_client(mock_httpx_client: MagicMock, response: MagicMock) -> AsyncMock:
+        """Configure the patched shared httpx client to return a metrics response."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.get = AsyncMock(return_value=response)
+        mock_httpx_client.return_value = mock_client_instance
+        return mock_client_instance
+
     @pytest.mark.asyncio
-    async def test_get_vllm_active_requests_success(self) -> None:
+    async def test_reconcile_vllm_load_success(self) -> None:
         """Test parsing vLLM Prometheus metrics for active requests."""
         # Mock vLLM metrics response
         mock_response = MagicMock()
@@ -631,17 +656,14 @@ vllm:num_requests_waiting{model="nemotron-3-nano:128k"} 1.0
         proxy._vllm_enabled = True
         proxy._vllm_base_url = "http://localhost:8001"
 
-        # Mock httpx client with AsyncMock for async context manager
         with patch("httpx.AsyncClient") as mock_httpx_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_httpx_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_instance = self._metrics_client(mock_httpx_client, mock_response)
 
-            # Get active requests
-            active = await proxy.get_vllm_active_requests()
+            active = await proxy.reconcile_vllm_load()
 
             # Assertions
-            assert active == 3  # 2 running + 1 waiting
+            assert active == 3  # 2 running + 1 waiting (all external to this process)
+            assert await proxy.get_vllm_active_requests() == 3
             mock_client_instance.get.assert_called_once_with("http://localhost:8001/metrics")
 
     @pytest.mark.asyncio
@@ -656,11 +678,53 @@ vllm:num_requests_waiting{model="nemotron-3-nano:128k"} 1.0
 
         # Assertions
         assert active == 0
-        # No need to check httpx - it's not called
 
     @pytest.mark.asyncio
-    async def test_get_vllm_active_requests_metrics_unavailable(self) -> None:
-        """Test get_vllm_active_requests returns 0 when metrics endpoint fails."""
+    async def test_get_vllm_active_requests_rate_limits_scrapes(self) -> None:
+        """Test /metrics is read at most once per reconcile interval."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = 'vllm:num_requests_running{model="m"} 1.0'
+
+        proxy = AegisLLMProxy()
+        proxy._vllm_enabled = True
+        proxy._vllm_admission.reconcile_interval_s = 60.0
+
+        with patch("httpx.AsyncClient") as mock_httpx_client:
+            mock_client_instance = self._metrics_client(mock_httpx_client, mock_response)
+            await proxy._vllm_admission.acquire()
+            first = await proxy.get_vllm_active_requests()
+            second = await proxy.get_vllm_active_requests()
+            proxy._vllm_admission.release()
+
+            assert first == second == 1
+            mock_client_instance.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_external_load_seen_without_local_requests(self) -> None:
+        """Test load from other processes is visible from a clean state (no waiters)."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = """
+vllm:num_requests_running{model="m"} 2.0
+vllm:num_requests_waiting{model="m"} 1.0
+"""
+
+        proxy = AegisLLMProxy()
+        proxy._vllm_enabled = True
+
+        with patch("httpx.AsyncClient") as mock_httpx_client:
+            self._metrics_client(mock_httpx_client, mock_response)
+
+            active = await proxy.get_vllm_active_requests()
+            free_slots = await proxy.get_vllm_free_slots()
+
+        assert active == 3
+        assert free_slots == proxy._vllm_admission.max_concurrent - 3
+
+    @pytest.mark.asyncio
+    async def test_reconcile_vllm_load_metrics_unavailable(self) -> None:
+        """Test reconciliation keeps local load when metrics endpoint fails."""
         # Mock vLLM metrics response with error status
         mock_response = MagicMock()
         mock_response.status_code = 404
@@ -671,19 +735,16 @@ vllm:num_requests_waiting{model="nemotron-3-nano:128k"} 1.0
         proxy._vllm_base_url = "http://localhost:8001"
 
         with patch("httpx.AsyncClient") as mock_httpx_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_httpx_client.return_value.__aenter__.return_value = mock_client_instance
+            self._metrics_client(mock_httpx_client, mock_response)
 
-            # Get active requests
-            active = await proxy.get_vllm_active_requests()
+            active = await proxy.reconcile_vllm_load()
 
             # Assertions
-            assert active == 0  # Default to 0 on error
+            assert active == 0  # Default to local count (no requests) on error
 
     @pytest.mark.asyncio
-    async def test_get_vllm_active_requests_connection_error(self) -> None:
-        """Test get_vllm_active_requests returns 0 when connection fails."""
+    async def test_reconcile_vllm_load_connection_error(self) -> None:
+        """Test reconciliation tolerates connection failures."""
         # Create proxy with vLLM enabled
         proxy = AegisLLMProxy()
         proxy._vllm_enabled = True
@@ -693,17 +754,16 @@ vllm:num_requests_waiting{model="nemotron-3-nano:128k"} 1.0
             # Mock httpx client to raise exception
             mock_client_instance = AsyncMock()
             mock_client_instance.get = AsyncMock(side_effect=Exception("Connection refused"))
-            mock_httpx_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_httpx_client.return_value = mock_client_instance
 
-            # Get active requests
-            active = await proxy.get_vllm_active_requests()
+            active = await proxy.reconcile_vllm_load()
 
             # Assertions
             assert active == 0  # Default to 0 on error
 
     @pytest.mark.asyncio
-    async def test_get_vllm_active_requests_malformed_metrics(self) -> None:
-        """Test get_vllm_active_requests handles malformed metrics gracefully."""
+    async def test_reconcile_vllm_load_malformed_metrics(self) -> None:
+        """Test reconciliation handles malformed metrics gracefully."""
         # Mock vLLM metrics response with malformed data
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -719,20 +779,16 @@ vllm:num_requests_waiting{model="nemotron-3-nano:128k"} also_invalid
         proxy._vllm_base_url = "http://localhost:8001"
 
         with patch("httpx.AsyncClient") as mock_httpx_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_httpx_client.return_value.__aenter__.return_value = mock_client_instance
+            self._metrics_client(mock_httpx_client, mock_response)
 
-            # Get active requests
-            active = await proxy.get_vllm_active_requests()
+            active = await proxy.reconcile_vllm_load()
 
             # Assertions
             assert active == 0  # Falls back to 0 on parse error
 
     @pytest.mark.asyncio
-    async def test_get_vllm_active_requests_zero_active(self) -> None:
-        """Test get_vllm_active_requests correctly returns 0 when no requests active."""
-        # Mock vLLM metrics response with zero active requests
+    async def test_metrics_client_is_shared(self) -> None:
+        """Test repeated reconciliations reuse one httpx client."""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = """
@@ -740,18 +796,17 @@ vllm:num_requests_running{model="nemotron-3-nano:128k"} 0.0
 vllm:num_requests_waiting{model="nemotron-3-nano:128k"} 0.0
 """
 
-        # Create proxy with vLLM enabled
         proxy = AegisLLMProxy()
         proxy._vllm_enabled = True
         proxy._vllm_base_url = "http://localhost:8001"
 
         with patch("httpx.AsyncClient") as mock_httpx_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_httpx_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_instance = self._metrics_client(mock_httpx_client, mock_response)
 
-            # Get active requests
-            active = await proxy.get_vllm_active_requests()
+            await proxy.reconcile_vllm_load()
+            active = await proxy.reconcile_vllm_load()
 
             # Assertions
             assert active == 0
+            assert mock_httpx_client.call_count == 1
+            assert mock_client_instance.get.call_count == 2
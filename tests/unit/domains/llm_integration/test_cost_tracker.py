@@ -9,6 +9,7 @@ Tests cover:
 - Edge cases and error handling
 """
 
+import asyncio
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -724,3 +725,179 @@ class TestCostTrackerEdgeCases:
 
         # Sum should be approximately 0.123 (10 * 0.0123)
         assert spending["alibaba_cloud"] == pytest.approx(0.123, rel=1e-4)
+
+
+class TestDailyAggregates:
+    """Test in-memory daily aggregates and the daily_summary table."""
+
+    def test_aggregates_persisted_and_reloaded(self, cost_tracker: CostTracker) -> None:
+        """Summary rows are written with the raw rows and loaded by new instances."""
+        cost_tracker.track_request(
+            provider="alibaba_cloud",
+            model="qwen-turbo",
+            task_type="extraction",
+            tokens_input=500,
+            tokens_output=200,
+            cost_usd=0.035,
+            latency_ms=40.0,
+        )
+        cost_tracker.track_request(
+            provider="alibaba_cloud",
+            model="qwen-turbo",
+            task_type="extraction",
+            tokens_input=500,
+            tokens_output=200,
+            cost_usd=0.035,
+            fallback_used=True,
+        )
+
+        reloaded = CostTracker(db_path=cost_tracker.db_path)
+        aggregates = reloaded.get_daily_aggregates()
+
+        assert len(aggregates) == 1
+        key, aggregate = next(iter(aggregates.items()))
+        assert key.provider == "alibaba_cloud"
+        assert key.day == datetime.now().date().isoformat()
+        assert aggregate.requests == 2
+        assert aggregate.tokens_total == 1400
+        assert aggregate.avg_latency_ms == 40.0
+        assert aggregate.fallback_count == 1
+        assert reloaded.get_monthly_spending() == {"alibaba_cloud": 0.07}
+
+    def test_summary_backfilled_from_raw_rows(self, cost_tracker: CostTracker) -> None:
+        """Databases without daily_summary rows are backfilled on startup."""
+        cost_tracker.track_request(
+            provider="openai",
+            model="gpt-4o",
+            task_type="generation",
+            tokens_input=1000,
+            tokens_output=500,
+            cost_usd=0.0375,
+        )
+        with sqlite3.connect(cost_tracker.db_path) as conn:
+            conn.execute("DROP TABLE daily_summary")
+
+        reloaded = CostTracker(db_path=cost_tracker.db_path)
+
+        assert reloaded.get_monthly_spending() == {"openai": 0.0375}
+        assert reloaded.get_request_stats()["total_requests"] == 1
+
+    def test_aggregates_filter_by_day_and_provider(self, cost_tracker: CostTracker) -> None:
+        """get_daily_aggregates filters on day range and provider."""
+        cost_tracker.track_request(
+            provider="openai",
+            model="gpt-4o",
+            task_type="generation",
+            tokens_input=10,
+            tokens_output=10,
+            cost_usd=0.01,
+        )
+        tomorrow = (datetime.now() + timedelta(days=1)).date()
+
+        assert cost_tracker.get_daily_aggregates(start_day=tomorrow) == {}
+        assert cost_tracker.get_daily_aggregates(provider="alibaba_cloud") == {}
+        assert len(cost_tracker.get_daily_aggregates(end_day=tomorrow)) == 1
+
+
+class TestWriteBehind:
+    """Test buffered (write-behind) cost ledger."""
+
+    @pytest.mark.asyncio
+    async def test_rows_buffered_until_flush(self, temp_db_path: Path) -> None:
+        """Rows tracked on the event loop are buffered; aggregates update immediately."""
+        tracker = CostTracker(db_path=temp_db_path, write_behind=True, flush_interval_ms=60000)
+
+        row_id = tracker.track_request(
+            provider="openai",
+            model="gpt-4o",
+            task_type="generation",
+            tokens_input=1000,
+            tokens_output=500,
+            cost_usd=0.0375,
+        )
+
+        assert row_id is None
+        assert tracker.get_monthly_spending() == {"openai": 0.0375}
+        with sqlite3.connect(temp_db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM llm_requests").fetchone()[0] == 0
+
+        assert await tracker.flush() == 1
+
+        with sqlite3.connect(temp_db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM llm_requests").fetchone()[0] == 1
+            assert conn.execute("SELECT SUM(requests) FROM daily_summary").fetchone()[0] == 1
+        await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_size_triggers_flush(self, temp_db_path: Path) -> None:
+        """Reaching flush_batch_size writes the buffered rows in the background."""
+        tracker = CostTracker(
+            db_path=temp_db_path, write_behind=True, flush_batch_size=3, flush_interval_ms=60000
+        )
+
+        for _ in range(3):
+            tracker.track_request(
+                provider="local_ollama",
+                model="llama3.2:3b",
+                task_type="generation",
+                tokens_input=10,
+                tokens_output=10,
+                cost_usd=0.0,
+            )
+        await asyncio.gather(*tracker._flush_tasks)
+
+        with sqlite3.connect(temp_db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM llm_requests").fetchone()[0] == 3
+        await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_close_drains_buffer(self, temp_db_path: Path) -> None:
+        """close() writes pending rows, and a new instance sees them."""
+        tracker = CostTracker(db_path=temp_db_path, write_behind=True, flush_interval_ms=60000)
+        tracker.track_request(
+            provider="alibaba_cloud",
+            model="qwen-turbo",
+            task_type="extraction",
+            tokens_input=500,
+            tokens_output=200,
+            cost_usd=0.035,
+        )
+
+        await tracker.close()
+
+        assert CostTracker(db_path=temp_db_path).get_monthly_spending() == {"alibaba_cloud": 0.035}
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues_rows(self, temp_db_path: Path) -> None:
+        """A failed batch stays buffered for the next flush."""
+        tracker = CostTracker(db_path=temp_db_path, write_behind=True, flush_interval_ms=60000)
+        tracker.track_request(
+            provider="openai",
+            model="gpt-4o",
+            task_type="generation",
+            tokens_input=10,
+            tokens_output=10,
+            cost_usd=0.01,
+        )
+
+        with patch.object(tracker, "_write_rows", side_effect=sqlite3.OperationalError("locked")):
+            assert await tracker.flush() == 0
+
+        assert len(tracker._pending) == 1
+        assert await tracker.flush() == 1
+        await tracker.close()
+
+    def test_without_event_loop_writes_immediately(self, temp_db_path: Path) -> None:
+        """Write-behind trackers used outside an event loop write synchronously."""
+        tracker = CostTracker(db_path=temp_db_path, write_behind=True)
+
+        row_id = tracker.track_request(
+            provider="openai",
+            model="gpt-4o",
+            task_type="generation",
+            tokens_input=10,
+            tokens_output=10,
+            cost_usd=0.01,
+        )
+
+        assert row_id is not None
@@ -0,0 +1,154 @@
+"""Unit tests for VLLMAdmissionController.
+
+Sprint 130 Feature 130.7: Push-based vLLM admission control.
+
+Tests:
+- Requests beyond max_concurrent queue and wake on release
+- Cancelled/timed-out requests are counted as orphaned
+- Reconciliation with vLLM /metrics clears finished orphans and tracks external load
+- wait_for_capacity timeout
+- Rate-limited refresh of external load
+- Prometheus metrics parsing
+"""
+
+import asyncio
+
+import pytest
+
+from src.domains.llm_integration.proxy.vllm_admission import (
+    VLLMAdmissionController,
+    parse_vllm_queue_metrics,
+)
+
+
+class TestVLLMAdmissionController:
+    """Test suite for local vLLM admission control."""
+
+    @pytest.mark.asyncio
+    async def test_queued_request_wakes_on_release(self) -> None:
+        """A request beyond capacity is admitted right after a slot frees."""
+        controller = VLLMAdmissionController(max_concurrent=1)
+        await controller.acquire()
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        controller.release()
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert controller.in_flight == 1
+        assert controller.get_stats()["queued"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_is_orphaned(self) -> None:
+        """Cancelling inside a slot keeps the request counted until reconciled."""
+        controller = VLLMAdmissionController(max_concurrent=4)
+
+        async def call() -> None:
+            async with controller.slot():
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(call())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert controller.in_flight == 0
+        assert controller.orphaned == 1
+        assert controller.load == 1
+
+    @pytest.mark.asyncio
+    async def test_reconcile_clears_finished_orphans(self) -> None:
+        """Server load below the orphan count means orphans have finished."""
+        controller = VLLMAdmissionController(max_concurrent=4)
+        await controller.acquire()
+        controller.release(orphaned=True)
+        await controller.acquire()
+        controller.release(orphaned=True)
+        assert controller.orphaned == 2
+
+        controller.reconcile(running=1, waiting=0)
+        assert controller.orphaned == 1
+        assert controller.external == 0
+
+        controller.reconcile(running=3, waiting=1)
+        assert controller.orphaned == 1
+        assert controller.external == 3
+        assert controller.load == 4
+
+    @pytest.mark.asyncio
+    async def test_orphans_expire(self) -> None:
+        """Orphans are dropped after the TTL when metrics are unavailable."""
+        controller = VLLMAdmissionController(max_concurrent=1, orphan_ttl_s=0.05)
+        await controller.acquire()
+        controller.release(orphaned=True)
+
+        assert await controller.wait_for_capacity(max_active=1, timeout_s=1.0)
+        assert controller.orphaned == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_capacity_timeout(self) -> None:
+        """wait_for_capacity returns False when load stays high."""
+        controller = VLLMAdmissionController(max_concurrent=4)
+        await controller.acquire()
+        await controller.acquire()
+
+        assert not await controller.wait_for_capacity(max_active=2, timeout_s=0.05)
+        assert await controller.wait_for_capacity(max_active=3, timeout_s=0.05)
+
+    @pytest.mark.asyncio
+    async def test_background_reconciliation_releases_waiters(self) -> None:
+        """Waiters blocked on orphans are released once metrics show vLLM drained."""
+        server_load = [(1, 0), (0, 0)]
+
+        async def fetch():
+            return server_load.pop(0) if len(server_load) > 1 else server_load[0]
+
+        controller = VLLMAdmissionController(
+            max_concurrent=4, metrics_fetcher=fetch, reconcile_interval_s=0.02
+        )
+        await controller.acquire()
+        controller.release(orphaned=True)
+
+        assert await controller.wait_for_capacity(max_active=1, timeout_s=1.0)
+        assert controller.orphaned == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_sees_external_load_without_waiters(self) -> None:
+        """External load is reconciled on demand, at most once per interval."""
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return (2, 1)
+
+        controller = VLLMAdmissionController(
+            max_concurrent=4, metrics_fetcher=fetch, reconcile_interval_s=60.0
+        )
+
+        assert await controller.refresh() == 3
+        assert await controller.refresh() == 3
+        assert controller.external == 3
+        assert calls == 1
+        assert not await controller.wait_for_capacity(max_active=2, timeout_s=0.05)
+
+        controller._reconcile_task.cancel()
+
+
+class TestParseVLLMQueueMetrics:
+    """Test Prometheus text parsing."""
+
+    def test_parse_running_and_waiting(self) -> None:
+        text = """
+# TYPE vllm:num_requests_running gauge
+vllm:num_requests_running{model="m"} 2.0
+vllm:num_requests_waiting{model="m"} 5.0
+"""
+        assert parse_vllm_queue_metrics(text) == (2, 5)
+
+    def test_parse_malformed(self) -> None:
+        text = 'vllm:num_requests_running{model="m"} invalid\n'
+        assert parse_vllm_queue_metrics(text) == (0, 0)
@@ -30,6 +30,8 @@ def mock_settings():
         mock_settings.vllm_enabled = True
         mock_settings.vllm_base_url = "http://localhost:8001"
         mock_settings.vllm_model = "nvidia/NVIDIA-Nemotron-3-Nano-30B-A3B-NVFP4"
+        mock_settings.vllm_max_concurrent_requests = 256
+        mock_settings.vllm_metrics_reconcile_interval_s = 5.0
         yield mock_settings
 
 
@@ -135,6 +137,8 @@ async def test_vllm_routing_disabled(mock_config):
         mock_settings.vllm_enabled = False
         mock_settings.vllm_base_url = "http://localhost:8001"
         mock_settings.vllm_model = "nvidia/NVIDIA-Nemotron-3-Nano-30B-A3B-NVFP4"
+        mock_settings.vllm_max_concurrent_requests = 256
+        mock_settings.vllm_metrics_reconcile_interval_s = 5.0
 
         proxy = AegisLLMProxy(config=mock_config)
 
@@ -38,6 +38,14 @@ from src.components.retrieval.intent_classifier import (
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def disable_entity_lexicon(monkeypatch):
+    """Use the Cypher scan path for graph local (lexicon is tested separately)."""
+    from src.core.config import settings
+
+    monkeypatch.setattr(settings, "entity_lexicon_enabled", False)
+
+
 @pytest.fixture
 def mock_hybrid_search():
     """Create mock HybridSearch instance."""
@@ -13,18 +13,23 @@ Test Coverage:
 - Embedding-based classification
 - LLM-based classification with mocked Ollama API
 - Fallback from SetFit → Embedding → Rule-based on error
-- Caching mechanism and cache eviction
+- Caching mechanism, LRU/TTL eviction and single-flight classification
+- Micro-batched SetFit inference off the event loop
 - IntentWeights validation (sum = 1.0)
 - Edge cases (empty queries, special characters, etc.)
 """
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+from cachetools import TTLCache
 
 from src.components.retrieval.intent_classifier import (
     INTENT_WEIGHT_PROFILES,
+    CLARAIntent,
     Intent,
     IntentClassificationResult,
     IntentClassifier,
@@ -410,6 +415,65 @@ class TestSetFitClassification:
         assert result.confidence == 0.92
         assert result.latency_ms > 0
 
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_predict_call(
+        self, classifier_setfit, mock_setfit_model
+    ):
+        """Test concurrent classifications are micro-batched into one SetFit call."""
+        classifier_setfit.batch_window_ms = 20
+        mock_setfit_model.predict.side_effect = lambda queries: [
+            "navigation" if "find" in q.lower() else "factual" for q in queries
+        ]
+        mock_setfit_model.predict_proba.side_effect = lambda queries: [[0.9, 0.1] for _ in queries]
+
+        results = await asyncio.gather(
+            classifier_setfit.classify("What is RAG?"),
+            classifier_setfit.classify("Find the setup guide"),
+            classifier_setfit.classify("What is BM25?"),
+        )
+
+        mock_setfit_model.predict.assert_called_once_with(
+            ["What is RAG?", "Find the setup guide", "What is BM25?"]
+        )
+        assert [r.clara_intent for r in results] == [
+            CLARAIntent.FACTUAL,
+            CLARAIntent.NAVIGATION,
+            CLARAIntent.FACTUAL,
+        ]
+        assert all(r.method == "setfit" for r in results)
+        await classifier_setfit.close()
+
+    @pytest.mark.asyncio
+    async def test_setfit_runs_off_event_loop(self, classifier_setfit, mock_setfit_model):
+        """Test SetFit predict runs in the worker thread, not on the event loop."""
+        predict_threads = []
+
+        def predict(queries):
+            predict_threads.append(threading.current_thread())
+            return [0] * len(queries)
+
+        mock_setfit_model.predict.side_effect = predict
+
+        await classifier_setfit.classify("What is the answer?")
+
+        assert predict_threads
+        assert predict_threads[0] is not threading.main_thread()
+        await classifier_setfit.close()
+
+    @pytest.mark.asyncio
+    async def test_same_query_classified_once(self, classifier_setfit, mock_setfit_model):
+        """Test concurrent calls for one query share a single classification."""
+        results = await asyncio.gather(
+            classifier_setfit.classify("What is the answer?"),
+            classifier_setfit.classify("  what is the answer?"),
+        )
+
+        mock_setfit_model.predict.assert_called_once()
+        assert [r.method for r in results] == ["setfit", "cache"]
+        assert results[0].intent == results[1].intent
+        assert classifier_setfit._inflight == {}
+        await classifier_setfit.close()
+
     @pytest.mark.asyncio
     async def test_setfit_fallback_to_embedding(self):
         """Test fallback from SetFit to embedding on error."""
@@ -609,9 +673,9 @@ class TestCaching:
         assert result2.method == "cache"
 
     @pytest.mark.asyncio
-    async def test_cache_max_size_eviction(self, classifier):
+    async def test_cache_max_size_eviction(self):
         """Test LRU cache eviction when max size exceeded."""
-        classifier._cache_max_size = 3
+        classifier = IntentClassifier(method="rule_based", cache_max_size=3)
 
         # Fill cache with 3 items
         query1 = "What is one?"
@@ -633,6 +697,43 @@ class TestCaching:
         result1 = await classifier.classify(query1)
         assert result1.method == "rule_based"  # Cache miss
 
+    @pytest.mark.asyncio
+    async def test_cache_eviction_is_least_recently_used(self):
+        """Test a recently read entry survives eviction."""
+        classifier = IntentClassifier(method="rule_based", cache_max_size=2)
+
+        await classifier.classify("What is one?")
+        await classifier.classify("What is two?")
+        await classifier.classify("What is one?")  # touch
+        await classifier.classify("What is three?")  # evicts "two"
+
+        assert (await classifier.classify("What is one?")).method == "cache"
+        assert (await classifier.classify("What is two?")).method == "rule_based"
+
+    @pytest.mark.asyncio
+    async def test_cache_entries_expire(self):
+        """Test cached classifications expire after the TTL."""
+        classifier = IntentClassifier(method="rule_based")
+        now = [1000.0]
+        classifier._cache = TTLCache(maxsize=10, ttl=60, timer=lambda: now[0])
+
+        await classifier.classify("What is X?")
+        assert (await classifier.classify("What is X?")).method == "cache"
+
+        now[0] += 61
+        assert (await classifier.classify("What is X?")).method == "rule_based"
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_keeps_confidence(self):
+        """Test cache hits report the confidence of the original classification."""
+        classifier = IntentClassifier(method="rule_based")
+
+        result1 = await classifier.classify("What is X?")
+        result2 = await classifier.classify("What is X?")
+
+        assert result2.confidence == result1.confidence
+        assert result2.weights == result1.weights
+
     def test_clear_cache(self):
         """Test cache can be cleared."""
         classifier = IntentClassifier(method="rule_based")